@@ -1,8 +1,11 @@
 import math
 import threading
 import time
+from array import array
+from concurrent.futures import Future
 from enum import Enum
 
+import numpy as np
 import serial
 import serial.tools.list_ports
 
@@ -70,6 +73,9 @@ DEFAULT_POLI_VALUE = 200
 AMPLITUDE_MULTIPLIER = 1456.0
 PHASE_MULTIPLIER = 182
 
+# The data of these tags isn't logged, it's useless.
+NOT_LOGGED_TAGS = ["SRNO", "XLS ", "XRTU", "XLA ", "XTRA", "SOFT", "SYNC"]
+
 
 class Xeryon:
     axis_list = None  # A list storing all the axis in the system.
@@ -149,6 +155,7 @@ class Xeryon:
             axis.sendCommand("ZERO=0")
             axis.sendCommand("STOP=0")
             axis.was_valid_DPOS = False
+            axis.cancelMotions("Communication closed.")
         self.getCommunication().closeCommunication()  # Close communication
         outputConsole("Program stopped running.")
 
@@ -159,6 +166,7 @@ class Xeryon:
         for axis in self.getAllAxis():
             axis.sendCommand("STOP=0")
             axis.was_valid_DPOS = False
+            axis.cancelMotions("Movement stopped.")
 
     def reset(self):
         """
@@ -349,6 +357,144 @@ class Units(Enum):
         return None
 
 
+class AxisLog:
+    """
+    This class stores the logged data of an axis.
+    Each tag gets its own growable typed array (64-bit ints, SSPD as doubles),
+    so logging at POLI=1 doesn't build up lists of Python int objects.
+    The logs can be read while logging is still running (see view()),
+    e.g. to plot the position live during a scan.
+    """
+
+    FLOAT_TAGS = ["SSPD"]  # These tags are stored as doubles, all others as integers.
+
+    def __init__(self):
+        self.__lock = threading.Lock()  # receiveData() runs on the communication thread.
+        self.__data = {}
+
+    def append(self, tag, value):
+        """
+        :param tag: The tag of the received data (e.g. "EPOS").
+        :param value: The received value.
+        :return: None
+        """
+        with self.__lock:
+            samples = self.__data.get(tag)
+            if samples is None:
+                samples = array("d" if tag in self.FLOAT_TAGS else "q")
+                self.__data[tag] = samples
+            samples.append(value)
+
+    def length(self, tag):
+        """
+        :param tag: The tag requested.
+        :return: The number of samples logged for this tag.
+        """
+        with self.__lock:
+            samples = self.__data.get(tag)
+            return 0 if samples is None else len(samples)
+
+    def view(self, tag, start_index=0):
+        """
+        :param tag: The tag requested.
+        :param start_index: Index of the first sample to return. Pass the length of the previous view
+                            to only get the new samples.
+        :return: A numpy array with a copy of the samples logged so far (empty if nothing is logged).
+        """
+        with self.__lock:
+            samples = self.__data.get(tag)
+            if samples is None:
+                return np.zeros(0, dtype=np.float64 if tag in self.FLOAT_TAGS else np.int64)
+            return np.array(samples[start_index:])
+
+    def tags(self):
+        """
+        :return: A list of all logged tags.
+        """
+        with self.__lock:
+            return list(self.__data.keys())
+
+    def toDict(self):
+        """
+        :return: A dictionary {tag: numpy array} with all logged data.
+        """
+        return dict((tag, self.view(tag)) for tag in self.tags())
+
+    def clear(self):
+        """
+        Removes all logged data.
+        """
+        with self.__lock:
+            self.__data = {}
+
+
+class MotionResult:
+    """
+    The result of a non-blocking movement (setDPOSAsync, stepAsync, findIndexAsync, scanUntilLimitAsync).
+    success: True if the movement completed.
+    error: None if successful, otherwise one of the error codes below.
+    message: Description of the error (the text the blocking functions print to the console).
+    epos: The EPOS (in the current units) when the movement finished.
+    A MotionResult is "truthy" if the movement was successful.
+    """
+
+    OUT_OF_RANGE = "OUT_OF_RANGE"  # Stage hit the left or right end.
+    ERROR_LIMIT = "ERROR_LIMIT"  # ELIM triggered (status bit 16).
+    SAFETY_TIMEOUT = "SAFETY_TIMEOUT"  # TOU2 triggered (status bit 18).
+    POSITION_FAIL = "POSITION_FAIL"  # TOU3 triggered (status bit 21).
+    AMPLIFIER_ERROR = "AMPLIFIER_ERROR"  # Thermal protection 1 or 2 (status bit 2 or 3).
+    INDEX_NOT_FOUND = "INDEX_NOT_FOUND"  # Stopped searching before the index was found.
+    CANCELLED = "CANCELLED"  # Movement stopped, or communication closed.
+
+    def __init__(self, success, error=None, message="", epos=None):
+        self.success = success
+        self.error = error
+        self.message = message
+        self.epos = epos
+
+    def __bool__(self):
+        return self.success
+
+    def __repr__(self):
+        if self.success:
+            return "MotionResult(success, EPOS=" + str(self.epos) + ")"
+        return "MotionResult(" + str(self.error) + ": " + str(self.message) + ")"
+
+
+class MotionWaiter:
+    """
+    A movement that is waiting for its status bits.
+    The check function is called from the communication thread each time a new STAT or EPOS value arrives.
+    It returns a MotionResult when the movement is done, otherwise None.
+    """
+
+    def __init__(self, check, min_updates=0, grace_time=0):
+        """
+        :param check: Function that returns a MotionResult when done, otherwise None.
+        :param min_updates: Number of updates to skip first, so status bits of the previous command are ignored.
+        :param grace_time: Time (seconds) to wait before the first check.
+        """
+        self.check = check
+        self.min_updates = min_updates
+        self.not_before = time.time() + grace_time
+        self.future = Future()
+        self.future.set_running_or_notify_cancel()  # A running future can't be cancelled by the caller.
+
+
+def unwrapTime(time_samples):
+    """
+    :param time_samples: The raw "TIME" samples (16 bit counter, in 0.1 ms).
+    :return: A numpy array with the timestamps in ms, relative to the first sample.
+    The controller's TIME counter wraps around at 2**16, this is unwrapped for each sample.
+    """
+    time_samples = np.asarray(time_samples, dtype=np.int64)
+    if len(time_samples) == 0:
+        return np.zeros(0)
+    dT = np.diff(time_samples)
+    dT[dT < 0] += 2**16  # unwrap
+    return np.round(np.concatenate(([0.0], np.cumsum(dT) / 10)), 2)  # /10 to convert to ms
+
+
 class Axis:
     axis_letter = None  # Stores the axis letter for this specific axis.
     xeryon_object = None  # Stores the "Xeryon" object.
@@ -361,13 +507,12 @@ class Axis:
     def_poli_value = str(DEFAULT_POLI_VALUE)
 
     isLogging = False  # Stores if this axis is currently "Logging": it's storing its axis_data.
-    logs = {}  # This stores all the data. It's a dictionary of the form:
+    logs = None  # This stores all the data. It's an AxisLog with one array per tag:
+    # { "EPOS": [...,...,...], "DPOS": [...,...,...], "STAT":[...,...,...],...}
 
     previous_epos = [0, 0]  # Two samples to calculate speed
     previous_time = [0, 0]
 
-    # { "EPOS": [...,...,...], "DPOS": [...,...,...], "STAT":[...,...,...],...}
-
     def findIndex(self, forceWaiting=False, direction=0):
         """
         :return: None
@@ -573,20 +718,7 @@ class Axis:
         This function makes use of sendCommand, which blocks the program until the desired position is reached.
         """
         step = self.convertUnitsToEncoder(value, self.units)
-        if self.was_valid_DPOS:
-            # If the previous DPOS was valid, DPOS is taken as a refrence.
-            new_DPOS = int(self.getData("DPOS")) + step
-        else:
-            new_DPOS = int(self.getData("EPOS")) + step
-
-        if not self.stage.isLineair:  # Rotating Stage
-            # Below is the amount of encoder units in one revolution.
-            # From -180 => +180
-            # -180 *(val // 180 % 2) + (val % 180)
-            encoderUnitsPerRevolution = self.convertUnitsToEncoder(360, Units.deg)
-            new_DPOS = -encoderUnitsPerRevolution / 2 * (
-                new_DPOS // (encoderUnitsPerRevolution / 2) % 2
-            ) + (new_DPOS % (encoderUnitsPerRevolution / 2))
+        new_DPOS = self.__stepTarget(step)
 
         self.setDPOS(
             new_DPOS, Units.enc, False, forceWaiting=forceWaiting
@@ -602,6 +734,28 @@ class Axis:
                 + getDposEposString(self.getDPOS(), self.getEPOS(), self.units)
             )
 
+    def __stepTarget(self, step):
+        """
+        :param step: The step in encoder units.
+        :return: The new DPOS (in encoder units) after this step.
+        If this axis has a rotating stage, this function handles the "wrapping". (Going around in a full circle)
+        """
+        if self.was_valid_DPOS:
+            # If the previous DPOS was valid, DPOS is taken as a refrence.
+            new_DPOS = int(self.getData("DPOS")) + step
+        else:
+            new_DPOS = int(self.getData("EPOS")) + step
+
+        if not self.stage.isLineair:  # Rotating Stage
+            # Below is the amount of encoder units in one revolution.
+            # From -180 => +180
+            # -180 *(val // 180 % 2) + (val % 180)
+            encoderUnitsPerRevolution = self.convertUnitsToEncoder(360, Units.deg)
+            new_DPOS = -encoderUnitsPerRevolution / 2 * (
+                new_DPOS // (encoderUnitsPerRevolution / 2) % 2
+            ) + (new_DPOS % (encoderUnitsPerRevolution / 2))
+        return new_DPOS
+
     def getEPOS(self):
         """
         :return: Returns the EPOS in the correct units this axis is working in.
@@ -615,11 +769,191 @@ class Axis:
         """
         self.units = units
 
+    def setDPOSAsync(self, value, differentUnits=None):
+        """
+        :param value: The new value DPOS has to become.
+        :param differentUnits: If the value isn't specified in the current units, specify the correct units.
+        :type differentUnits: Units
+        :return: A Future that resolves to a MotionResult.
+        Non-blocking version of setDPOS().
+        The Future is completed from the communication thread as soon as the status frame arrives in which
+        EPOS is within PTO2 of DPOS and the "position reached" bit is set, or an error bit goes high.
+        Callbacks added with future.add_done_callback() also run on the communication thread.
+        """
+        unit = self.units
+        if differentUnits is not None:
+            unit = differentUnits
+
+        DPOS = int(self.convertUnitsToEncoder(value, unit))  # Convert into encoder units.
+        self.__sendCommand("DPOS=" + str(DPOS))
+        self.was_valid_DPOS = True
+
+        if DEBUG_MODE:  # Position isn't checked in DEBUG mode.
+            future = Future()
+            future.set_result(MotionResult(True, epos=self.getEPOS()))
+            return future
+
+        return self.__addWaiter(lambda: self.__checkDPOS(DPOS, value, unit))
+
+    def stepAsync(self, value):
+        """
+        :param value: The amount it needs to step (specified in the current units)
+        :return: A Future that resolves to a MotionResult.
+        Non-blocking version of step(), see setDPOSAsync().
+        """
+        step = self.convertUnitsToEncoder(value, self.units)
+        return self.setDPOSAsync(self.__stepTarget(step), Units.enc)
+
+    def findIndexAsync(self, direction=0):
+        """
+        :param direction: The direction to search the index (0: default).
+        :return: A Future that resolves to a MotionResult.
+        Non-blocking version of findIndex().
+        The status bits of the previous command are ignored for a short grace period
+        (same as findIndex(), the STAT register needs time to show the "searching index" bit).
+        """
+        self.__sendCommand("INDX=" + str(direction))
+        self.was_valid_DPOS = False
+        return self.__addWaiter(self.__checkIndex, min_updates=2, grace_time=0.5)
+
+    def scanUntilLimitAsync(self, direction):
+        """
+        :param direction: Positive or negative number.
+        :return: A Future that resolves to a MotionResult.
+        Non-blocking version of startScan(direction, untilLimit=True).
+        The Future is completed as soon as the stage reports it is at the end it's scanning towards.
+        """
+        self.__sendCommand("SCAN=" + str(int(direction)))
+        self.was_valid_DPOS = False
+        return self.__addWaiter(lambda: self.__checkLimit(int(direction)), min_updates=1)
+
+    def cancelMotions(self, message="Movement cancelled."):
+        """
+        :param message: The reason, stored in the MotionResult.
+        :return: None
+        Completes all pending non-blocking movements with a CANCELLED result.
+        """
+        with self.__waiters_lock:
+            waiters = self.__waiters
+            self.__waiters = []
+        for waiter in waiters:
+            waiter.future.set_result(MotionResult(False, MotionResult.CANCELLED, message))
+
+    def hasPendingMotions(self):
+        """
+        :return: True if a non-blocking movement is still waiting for completion.
+        """
+        return len(self.__waiters) > 0
+
+    def __addWaiter(self, check, min_updates=0, grace_time=0):
+        """
+        Registers a MotionWaiter and checks it once with the current status.
+        :return: The Future of the waiter.
+        """
+        waiter = MotionWaiter(
+            check, min_updates=self.update_nb + min_updates, grace_time=grace_time
+        )
+        with self.__waiters_lock:
+            self.__waiters.append(waiter)
+        self.__checkWaiters()
+        return waiter.future
+
+    def __checkWaiters(self):
+        """
+        Checks all pending movements. Called from the communication thread on every STAT and EPOS update.
+        """
+        now = time.time()
+        done = []
+        with self.__waiters_lock:
+            for waiter in list(self.__waiters):
+                if self.update_nb < waiter.min_updates or now < waiter.not_before:
+                    continue
+                result = waiter.check()
+                if result is not None:
+                    self.__waiters.remove(waiter)
+                    done.append((waiter, result))
+        for waiter, result in done:  # Outside of the lock: callbacks may start a new movement.
+            waiter.future.set_result(result)
+
+    def __motionError(self):
+        """
+        :return: A failed MotionResult if an error status bit is set, otherwise None.
+        The checks are the same as in the setDPOS() loop.
+        """
+        if self.isErrorLimit():
+            return MotionResult(
+                False,
+                MotionResult.ERROR_LIMIT,
+                "Position not reached. (5) ELIM Triggered.",
+                self.getEPOS(),
+            )
+        if self.isSafetyTimeoutTriggered():
+            return MotionResult(
+                False,
+                MotionResult.SAFETY_TIMEOUT,
+                "Position not reached. (6) TOU2 (Timeout 2) triggered.",
+                self.getEPOS(),
+            )
+        if self.isPositionFailTriggered():
+            return MotionResult(
+                False,
+                MotionResult.POSITION_FAIL,
+                "Position not reached. (8) TOU3 (Timeout 3) triggered, 'position fail' status bit 21 went high. ",
+                self.getEPOS(),
+            )
+        if self.isThermalProtection1() or self.isThermalProtection2():
+            return MotionResult(
+                False,
+                MotionResult.AMPLIFIER_ERROR,
+                "Position not reached. (7) amplifier error.",
+                self.getEPOS(),
+            )
+        return None
+
+    def __checkDPOS(self, DPOS, value, unit):
+        """
+        :return: The MotionResult of a setDPOSAsync() movement, or None if still moving.
+        """
+        if self.__isWithinTol(DPOS) and self.isPositionReached():
+            return MotionResult(True, epos=self.getEPOS())
+        if self.isAtLeftEnd() or self.isAtRightEnd():
+            return MotionResult(
+                False,
+                MotionResult.OUT_OF_RANGE,
+                "DPOS is out or range. (1) " + getDposEposString(value, self.getEPOS(), unit),
+                self.getEPOS(),
+            )
+        return self.__motionError()
+
+    def __checkIndex(self):
+        """
+        :return: The MotionResult of a findIndexAsync() movement, or None if still searching.
+        """
+        if self.isEncoderValid():
+            return MotionResult(True, epos=self.getEPOS())
+        if not self.isSearchingIndex():
+            return MotionResult(
+                False,
+                MotionResult.INDEX_NOT_FOUND,
+                "Index is not found, but stopped searching for index.",
+                self.getEPOS(),
+            )
+        return None
+
+    def __checkLimit(self, direction):
+        """
+        :return: The MotionResult of a scanUntilLimitAsync() movement, or None if still scanning.
+        """
+        if (direction > 0 and self.isAtRightEnd()) or (direction <= 0 and self.isAtLeftEnd()):
+            return MotionResult(True, epos=self.getEPOS())
+        return self.__motionError()
+
     def startLogging(self, increase_poli=True):
         """
         This function starts logging all data that the controller sends.
         It updates the POLI (Polling Interval) to get more data.
         """
+        self.logs.clear()
         self.isLogging = True
         if increase_poli:
             self.xeryon_object.getAllAxis()[0].setSetting(
@@ -633,27 +967,18 @@ class Axis:
         """
         This function stops the logging of all the data.
         It updates the POLI (Polling Interval) back to the default value.
+        :param convertTimeAndEpos: If True, "TIME" is converted into ms (unwrapped, starting at 0)
+                                   and "EPOS" into the current units.
+        :return: A dictionary {tag: numpy array} with all logged data.
         """
         self.isLogging = False
-        logs = self.logs  # Store logs
-        self.logs = {}  # Reset logs
+        logs = self.logs.toDict()  # Store logs
+        self.logs.clear()  # Reset logs
 
         # Process time & epos logs
         if convertTimeAndEpos:
-            timestamps = [0]
-            for i in range(1, len(logs["TIME"])):
-                t = logs["TIME"][i]
-                if t < logs["TIME"][i - 1]:
-                    t += 2**16
-
-                dT = (t - logs["TIME"][i - 1]) / 10  # /10 to convert to ms
-
-                timestamps.append(round(timestamps[-1] + dT, 2))
-
-            epos_in_units = [self.convertEncoderUnitsToUnits(pos) for pos in logs["EPOS"]]
-
-            logs["TIME"] = timestamps
-            logs["EPOS"] = epos_in_units
+            logs["TIME"] = unwrapTime(logs.get("TIME", []))
+            logs["EPOS"] = self.convertEncoderArrayToUnits(logs.get("EPOS", []))
 
         self.setSetting("POLI", str(self.def_poli_value))  # Restore POLI back to default value.
         self.xeryon_object.getAllAxis()[0].setSetting(
@@ -661,6 +986,31 @@ class Axis:
         )  # also adapt it for the master
         return logs
 
+    def getLogView(self, tag, start_index=0, convertTimeAndEpos=False):
+        """
+        This function returns the data logged so far, without stopping the logging.
+        Use this to plot e.g. the position live during a scan.
+        :param tag: The tag requested (e.g. "EPOS").
+        :param start_index: Index of the first sample to return (the number of samples already read).
+        :param convertTimeAndEpos: If True, "EPOS" is converted into the current units and
+                                   "TIME" into ms (relative to the first sample of this view).
+        :return: A numpy array with the samples from start_index.
+        """
+        samples = self.logs.view(tag, start_index)
+        if convertTimeAndEpos:
+            if tag == "TIME":
+                return unwrapTime(samples)
+            if tag == "EPOS":
+                return self.convertEncoderArrayToUnits(samples)
+        return samples
+
+    def getLogLength(self, tag):
+        """
+        :param tag: The tag requested.
+        :return: The number of samples logged so far for this tag.
+        """
+        return self.logs.length(tag)
+
     def getFrequency(self):
         return self.getData("FREQ")
 
@@ -947,6 +1297,9 @@ class Axis:
         self.stage = stage
         self.axis_data = dict({"EPOS": 0, "DPOS": 0, "STAT": 0, "SSPD": 0, "TIME": 0})
         self.settings = dict({})
+        self.logs = AxisLog()
+        self.__waiters = []  # Pending non-blocking movements (MotionWaiter).
+        self.__waiters_lock = threading.Lock()
         if self.stage.isLineair:
             self.units = Units.mm
         else:
@@ -1084,19 +1437,8 @@ class Axis:
                     self.update_nb += 1  # This update_nb is for the function __waitForUpdate
 
                 if self.isLogging:  # Log all received data if logging is enabled.
-                    if tag not in [
-                        "SRNO",
-                        "XLS ",
-                        "XRTU",
-                        "XLA ",
-                        "XTRA",
-                        "SOFT",
-                        "SYNC",
-                    ]:  # This data is useless.
-                        if self.logs.get(tag) is None:
-                            self.logs[tag] = []
-
-                        self.logs[tag].append(int(val))
+                    if tag not in NOT_LOGGED_TAGS:
+                        self.logs.append(tag, int(val))
 
                 if "TIME" in tag:
                     # CALCULATE SPEED
@@ -1117,12 +1459,14 @@ class Axis:
                             )  # encoder units / ms
 
                             if self.isLogging:
-                                if self.logs.get("SSPD") is None:
-                                    self.logs["SSPD"] = []
-                                self.logs["SSPD"].append(self.axis_data["SSPD"])
+                                self.logs.append("SSPD", self.axis_data["SSPD"])
 
                     pass
 
+                if self.__waiters and ("STAT" in tag or "EPOS" in tag):
+                    # Complete non-blocking movements within the status frame they finish in.
+                    self.__checkWaiters()
+
     def getData(self, TAG):
         """
         :param TAG: The tag requested.
@@ -1211,6 +1555,15 @@ class Axis:
             self.xeryon_object.stop()
             raise ("Unexpected unit")
 
+    def convertEncoderArrayToUnits(self, values, units=None):
+        """
+        :param values: A sequence of values (in encoder units) that need to be converted.
+        :param units:  The output unit.
+        :return:  A numpy array with the values converted into the output unit.
+        The conversion is linear, so the factor is calculated once and applied to all values.
+        """
+        return np.asarray(values, dtype=np.float64) * self.convertEncoderUnitsToUnits(1, units)
+
     def __sendCommand(self, command):
         """
         :param command: The command that needs to be send.
@@ -0,0 +1,305 @@
+#!/usr/bin/env python
+"""
+SQLite storage profile micro-benchmark for TOSCA.
+
+Compares the database as it was configured before the storage profile
+(legacy: synchronous=FULL, default cache, no mmap, SQLite auto-checkpoint,
+one ORM session plus refresh() per safety event) with the tuned profile
+(synchronous=NORMAL, larger cache, mmap, background checkpoints, Core
+inserts on a long-lived connection). Each profile runs on a fresh
+database file:
+
+- inserts/sec for single info events, single durable (critical) events
+  and, for the tuned profile, batched inserts
+- query latency of the safety log, session history page and subject
+  search on the populated database
+- for the tuned profile, log_safety_event() latency with and without an
+  online backup running on another thread
+
+Usage:
+    python scripts/db_benchmark.py --events 2000 --output db.json
+    python scripts/db_benchmark.py --profiles tuned --batch-size 500
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+# Add src to path (same as src/main.py does)
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from database.backup import backup_database  # noqa: E402
+from database.db_manager import DatabaseManager  # noqa: E402
+from database.models import SafetyLog, Session, Subject  # noqa: E402
+from utils.latency_histogram import LatencyHistogram  # noqa: E402
+
+logger = logging.getLogger("db_benchmark")
+
+REPORT_VERSION = 1
+
+PROFILES: dict[str, dict[str, Any]] = {
+    # DatabaseManager settings before the storage profile existed
+    "legacy": {
+        "synchronous": "FULL",
+        "cache_size_mb": 2,  # SQLite default (-2000 KiB)
+        "mmap_size_mb": 0,
+        "temp_store_memory": False,
+        "checkpoint_interval_s": 0.0,
+    },
+    "tuned": {},  # DatabaseManager defaults
+}
+
+
+@dataclass
+class DbBenchmarkConfig:
+    """Benchmark parameters."""
+
+    events: int = 2000  # Single-event inserts per measurement
+    durable_events: int = 200  # Critical (fsync) inserts per measurement
+    batch_size: int = 500  # Rows per batched insert (tuned profile)
+    subjects: int = 2000
+    sessions: int = 5000
+    queries: int = 200  # Samples per query measurement
+    profiles: tuple[str, ...] = field(default=tuple(PROFILES))
+
+
+def _legacy_log_event(db: DatabaseManager, event_type: str, severity: str) -> SafetyLog:
+    """Safety event insert as DatabaseManager did it before (ORM session + refresh)."""
+    with db.get_session() as session:
+        log_entry = SafetyLog(
+            timestamp=datetime.now(),
+            event_type=event_type,
+            severity=severity,
+            description="benchmark event",
+        )
+        session.add(log_entry)
+        session.commit()
+        session.refresh(log_entry)
+        return log_entry
+
+
+def _rate(count: int, insert: Callable[[int], None]) -> float:
+    """Rows per second inserting count rows with insert(i)."""
+    start = time.perf_counter()
+    for i in range(count):
+        insert(i)
+    return count / (time.perf_counter() - start)
+
+
+def _latency(samples: int, query: Callable[[int], Any]) -> dict[str, Any]:
+    """Latency histogram of samples calls of query(i)."""
+    histogram = LatencyHistogram()
+    for i in range(samples):
+        start = time.perf_counter()
+        query(i)
+        histogram.record((time.perf_counter() - start) * 1000.0)
+    return histogram.snapshot()
+
+
+def _populate(db: DatabaseManager, config: DbBenchmarkConfig) -> None:
+    """Subjects and sessions for the query measurements (not timed)."""
+    start = datetime(2025, 1, 1)
+    with db.get_session() as session:
+        session.add_all(
+            Subject(subject_code=f"P-2025-{n:05d}", created_date=start + timedelta(minutes=n))
+            for n in range(config.subjects)
+        )
+        session.flush()
+        session.add_all(
+            Session(
+                subject_id=1 + n % config.subjects,
+                tech_id=1,
+                start_time=start + timedelta(minutes=n),
+                status="completed",
+                protocol_data_snapshot="x" * 4096,
+            )
+            for n in range(config.sessions)
+        )
+        session.commit()
+
+
+def _backup_impact(db: DatabaseManager, config: DbBenchmarkConfig, directory: Path) -> dict:
+    """log_safety_event() latency idle and while backups run back to back."""
+    idle = _latency(config.queries, lambda i: db.log_safety_event("idle", "info", "idle"))
+
+    stop = threading.Event()
+    backups = [0]
+
+    def _backup_loop() -> None:
+        while not stop.is_set():
+            backup_database(db.db_path, directory / "backup_impact.db")
+            backups[0] += 1
+
+    thread = threading.Thread(target=_backup_loop, name="benchmark-backup")
+    thread.start()
+    try:
+        during = _latency(
+            config.queries, lambda i: db.log_safety_event("busy", "info", "during backup")
+        )
+    finally:
+        stop.set()
+        thread.join()
+    return {"log_event_idle": idle, "log_event_during_backup": during, "backups": backups[0]}
+
+
+def run_profile(name: str, config: DbBenchmarkConfig, directory: Path) -> dict[str, Any]:
+    """
+    Measure one storage profile on a fresh database.
+
+    Args:
+        name: Key of PROFILES
+        config: Benchmark parameters
+        directory: Directory for the database file
+
+    Returns:
+        Insert rates (rows/s) and query latency snapshots
+    """
+    db = DatabaseManager(str(directory / f"{name}.db"), **PROFILES[name])
+    db.initialize()
+    legacy = name == "legacy"
+    batch = [{"event_type": "benchmark", "severity": "info", "description": "benchmark event"}]
+    batch *= config.batch_size
+
+    def insert(severity: str) -> None:
+        if legacy:
+            _legacy_log_event(db, "benchmark", severity)
+        else:
+            db.log_safety_event("benchmark", severity, "benchmark event")
+
+    try:
+        inserts = {
+            "single_info_per_s": _rate(config.events, lambda i: insert("info")),
+            "single_critical_per_s": _rate(config.durable_events, lambda i: insert("critical")),
+        }
+        if not legacy:
+            batches = max(1, config.events // config.batch_size)
+            batch_rate = _rate(batches, lambda i: db.log_safety_events(batch))
+            inserts["batched_info_per_s"] = batch_rate * config.batch_size
+
+        _populate(db, config)
+        queries = {
+            "safety_logs_100": _latency(config.queries, lambda i: db.get_safety_logs(limit=100)),
+            "session_page_100": _latency(
+                config.queries, lambda i: db.get_session_summaries(limit=100)
+            ),
+            "subject_search": _latency(
+                config.queries, lambda i: db.search_subjects(f"P-2025-{i % 100:03d}")
+            ),
+        }
+        result = {"settings": PROFILES[name], "inserts": inserts, "queries": queries}
+        if not legacy:
+            result["backup"] = _backup_impact(db, config, directory)
+    finally:
+        db.close()
+
+    return result
+
+
+def run_benchmark(config: DbBenchmarkConfig, directory: Optional[Path] = None) -> dict[str, Any]:
+    """
+    Run the database benchmark.
+
+    Args:
+        config: Benchmark parameters
+        directory: Directory for the database files (default: a temporary directory)
+
+    Returns:
+        Report dictionary
+    """
+    with tempfile.TemporaryDirectory(prefix="tosca_db_benchmark_") as temp_dir:
+        work_dir = directory or Path(temp_dir)
+        profiles = {}
+        for name in config.profiles:
+            profiles[name] = run_profile(name, config, work_dir)
+            logger.info(f"{name}: {profiles[name]['inserts']}")
+
+    return {
+        "benchmark": "tosca_database",
+        "version": REPORT_VERSION,
+        "timestamp": datetime.now().isoformat(),
+        "config": asdict(config),
+        "platform": {
+            "python": platform.python_version(),
+            "system": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "profiles": profiles,
+    }
+
+
+def print_summary(report: dict[str, Any]) -> None:
+    """Print a human-readable summary of a report."""
+    print("TOSCA Database Benchmark")
+    print("=" * 60)
+    for name, result in report["profiles"].items():
+        print(f"{name}:")
+        for metric, rate in result["inserts"].items():
+            print(f"  {metric:<24} {rate:12,.0f} rows/s")
+        for metric, stats in result["queries"].items():
+            print(
+                f"  {metric:<24} p50 {stats['p50_ms']:7.2f}ms  p99 {stats['p99_ms']:7.2f}ms  "
+                f"max {stats['max_ms']:7.2f}ms"
+            )
+        if "backup" in result:
+            backup = result["backup"]
+            for metric in ("log_event_idle", "log_event_during_backup"):
+                stats = backup[metric]
+                print(
+                    f"  {metric:<24} p50 {stats['p50_ms']:7.2f}ms  p99 {stats['p99_ms']:7.2f}ms  "
+                    f"max {stats['max_ms']:7.2f}ms"
+                )
+            print(f"  {'backups completed':<24} {backup['backups']:12d}")
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="TOSCA SQLite storage profile benchmark")
+    parser.add_argument("--events", type=int, default=DbBenchmarkConfig.events)
+    parser.add_argument("--durable-events", type=int, default=DbBenchmarkConfig.durable_events)
+    parser.add_argument("--batch-size", type=int, default=DbBenchmarkConfig.batch_size)
+    parser.add_argument("--subjects", type=int, default=DbBenchmarkConfig.subjects)
+    parser.add_argument("--sessions", type=int, default=DbBenchmarkConfig.sessions)
+    parser.add_argument("--queries", type=int, default=DbBenchmarkConfig.queries)
+    parser.add_argument("--profiles", nargs="+", choices=list(PROFILES), default=list(PROFILES))
+    parser.add_argument("--dir", type=Path, help="Directory for the database files")
+    parser.add_argument("--output", type=Path, help="Write the JSON report to this file")
+    parser.add_argument("--verbose", action="store_true", help="Show application logging")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+    logger.setLevel(logging.INFO)
+
+    config = DbBenchmarkConfig(
+        events=args.events,
+        durable_events=args.durable_events,
+        batch_size=args.batch_size,
+        subjects=args.subjects,
+        sessions=args.sessions,
+        queries=args.queries,
+        profiles=tuple(args.profiles),
+    )
+    report = run_benchmark(config, args.dir)
+
+    print_summary(report)
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"\nReport written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,342 @@
+#!/usr/bin/env python
+"""
+Safety interlock latency benchmark for TOSCA.
+
+Runs the real GPIOController and SafetyManager against the digital twin and
+toggles the smoothing-device interlock (accelerometer lost / restored) while
+the GUI thread is flooded with blocking work. Each toggle is timed twice:
+
+- input-to-decision: from the moment the GPIO poll observed the interlock
+  input to the moment the SafetyManager published its decision
+- toggle-to-decision: from the physical change on the twin to the decision
+  (includes polling and debouncing)
+
+Evaluation paths compared:
+- timer:  GPIO polled by a QTimer on the GUI thread (legacy wiring)
+- queued: GPIO polled on its own thread, decision queued to the GUI thread
+- direct: GPIO polled on its own thread, decision made there (fast path)
+
+Usage:
+    python scripts/interlock_latency_benchmark.py --cycles 10 --output interlock.json
+    python scripts/interlock_latency_benchmark.py --modes direct --budget-ms 50
+
+Exit code 1 if the direct path exceeds the latency budget (p99) or a toggle
+is never decided. Requires POSIX pseudo-terminals (Linux/macOS).
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+# Headless Qt (must be set before PyQt6 is imported)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# Add project root (tests.mocks) and src to path (same as src/main.py does)
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "src"))
+
+from PyQt6.QtCore import QEventLoop, Qt, QTimer  # noqa: E402
+from PyQt6.QtWidgets import QApplication  # noqa: E402
+
+from utils.latency_histogram import LatencyHistogram  # noqa: E402
+
+logger = logging.getLogger("interlock_latency_benchmark")
+
+REPORT_VERSION = 1
+
+MODES: tuple[str, ...] = ("timer", "queued", "direct")
+
+# Mode whose input-to-decision latency must stay within the budget
+GATED_MODE = "direct"
+
+
+@dataclass
+class InterlockBenchmarkConfig:
+    """Benchmark parameters."""
+
+    cycles: int = 10  # Interlock lost + restored pairs per mode
+    modes: tuple[str, ...] = field(default=MODES)
+    budget_ms: float = 50.0
+    gui_block_ms: float = 30.0  # Each GUI flood tick blocks the event loop this long
+    poll_interval_ms: int = 100
+    toggle_timeout_s: float = 10.0
+    seed: int = 0
+
+
+def _wait(seconds: float) -> None:
+    """Keep the Qt event loop running for a while (like the GUI does)."""
+    loop = QEventLoop()
+    QTimer.singleShot(max(0, int(seconds * 1000)), loop.quit)
+    loop.exec()
+
+
+def _wait_until(predicate: Callable[[], bool], timeout_s: float, poll_s: float = 0.01) -> bool:
+    """Run the event loop until predicate() is true or the timeout expires."""
+    deadline = time.monotonic() + timeout_s
+    while not predicate():
+        if time.monotonic() >= deadline:
+            return False
+        _wait(poll_s)
+    return True
+
+
+class GuiFlood:
+    """
+    Keep the GUI thread busy.
+
+    A zero-interval timer blocks the event loop for block_ms on every tick,
+    standing in for heavy widget updates (camera frames, plots, tables).
+    """
+
+    def __init__(self, block_ms: float) -> None:
+        self.block_ms = block_ms
+        self.ticks = 0
+        self._timer = QTimer()
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._on_tick)
+
+    def start(self) -> None:
+        """Start flooding (no-op if block_ms is 0)."""
+        if self.block_ms > 0:
+            self._timer.start()
+
+    def stop(self) -> None:
+        """Stop flooding."""
+        self._timer.stop()
+
+    def _on_tick(self) -> None:
+        self.ticks += 1
+        deadline = time.perf_counter() + self.block_ms / 1000.0
+        while time.perf_counter() < deadline:
+            pass
+
+
+class InterlockLatencyBenchmark:
+    """Toggle the GPIO interlock on the digital twin and time the safety decisions."""
+
+    def __init__(self, config: InterlockBenchmarkConfig) -> None:
+        self.config = config
+
+    def _build(self, mode: str) -> tuple[Any, Any]:
+        """Create a GPIO controller and safety manager wired for the given mode."""
+        from core.safety import SafetyManager
+        from hardware.gpio_controller import GPIOController
+
+        gpio_controller = GPIOController()
+        gpio_controller.monitor_timer.setInterval(self.config.poll_interval_ms)
+        gpio_controller.poll_in_background = mode != "timer"
+
+        safety_manager = SafetyManager(latency_budget_ms=self.config.budget_ms)
+        connection = {
+            "timer": Qt.ConnectionType.AutoConnection,
+            "queued": Qt.ConnectionType.QueuedConnection,
+            "direct": Qt.ConnectionType.DirectConnection,
+        }[mode]
+        gpio_controller.interlock_input.connect(
+            safety_manager.set_gpio_interlock_status, connection
+        )
+        # Session and power inputs satisfied: the GPIO interlock alone decides laser permission
+        safety_manager.set_session_valid(True)
+        return gpio_controller, safety_manager
+
+    def _toggle(
+        self, twin: Any, safety_manager: Any, ok: bool, histograms: dict[str, LatencyHistogram]
+    ) -> bool:
+        """
+        Change the interlock on the twin and time the resulting decision.
+
+        Returns:
+            True if the decision was made within the toggle timeout
+        """
+        decisions_before = len(safety_manager.recent_decisions)
+        toggled_at = time.monotonic()
+        twin.gpio.accelerometer_present = ok
+        if not _wait_until(
+            lambda: safety_manager.gpio_interlock_ok == ok, self.config.toggle_timeout_s
+        ):
+            logger.warning(f"Interlock {'restore' if ok else 'loss'} not decided in time")
+            return False
+
+        decisions = list(safety_manager.recent_decisions)[decisions_before:]
+        decision = next((d for d in decisions if d.input_name == "gpio_interlock"), None)
+        if decision is None:
+            return False
+        histograms["input_to_decision"].record(decision.latency_ms)
+        histograms["toggle_to_decision"].record((decision.decided_at - toggled_at) * 1000.0)
+        return True
+
+    def _run_mode(self, mode: str, twin: Any, port: str) -> dict[str, Any]:
+        """Run all toggle cycles for one evaluation path."""
+        histograms = {
+            "input_to_decision": LatencyHistogram(),
+            "toggle_to_decision": LatencyHistogram(),
+        }
+        flood = GuiFlood(self.config.gui_block_ms)
+        gpio_controller, safety_manager = self._build(mode)
+        twin.gpio.accelerometer_present = True
+        timeouts = 0
+
+        try:
+            if not gpio_controller.connect(port=port):
+                raise RuntimeError("GPIO connection failed")
+            gpio_controller.start_smoothing_motor()
+            if not _wait_until(lambda: safety_manager.gpio_interlock_ok, 10.0):
+                raise RuntimeError("Interlock never satisfied (motor vibration not detected)")
+
+            flood.start()
+            for _ in range(self.config.cycles):
+                for ok in (False, True):
+                    if not self._toggle(twin, safety_manager, ok, histograms):
+                        timeouts += 1
+        finally:
+            flood.stop()
+            twin.gpio.accelerometer_present = True
+            gpio_controller.disconnect()
+
+        input_stats = histograms["input_to_decision"].snapshot()
+        within_budget = (
+            timeouts == 0
+            and input_stats["count"] > 0
+            and input_stats["p99_ms"] <= self.config.budget_ms
+        )
+        return {
+            "input_to_decision": input_stats,
+            "toggle_to_decision": histograms["toggle_to_decision"].snapshot(),
+            "transitions": input_stats["count"],
+            "timeouts": timeouts,
+            "budget_overruns": safety_manager.budget_overruns,
+            "gui_flood_ticks": flood.ticks,
+            "within_budget": within_budget,
+        }
+
+    def run(self) -> dict[str, Any]:
+        """Run the benchmark and return the report."""
+        from tests.mocks.digital_twin import DigitalTwin
+
+        twin = DigitalTwin(seed=self.config.seed)
+        ports = twin.start()
+        modes: dict[str, Any] = {}
+        try:
+            for mode in self.config.modes:
+                modes[mode] = self._run_mode(mode, twin, ports.gpio)
+                logger.info(f"{mode}: {modes[mode]['input_to_decision']}")
+        finally:
+            twin.stop()
+
+        gated = modes.get(GATED_MODE)
+        return {
+            "benchmark": "tosca_interlock_latency",
+            "version": REPORT_VERSION,
+            "timestamp": datetime.now().isoformat(),
+            "config": asdict(self.config),
+            "platform": {
+                "python": platform.python_version(),
+                "system": platform.platform(),
+                "cpu_count": os.cpu_count(),
+            },
+            "modes": modes,
+            "passed": gated["within_budget"] if gated is not None else None,
+        }
+
+
+def print_summary(report: dict[str, Any]) -> None:
+    """Print a human-readable summary of a report."""
+    config = report["config"]
+    print("TOSCA Interlock Latency Benchmark")
+    print("=" * 60)
+    print(
+        f"Budget {config['budget_ms']:.0f}ms, {config['cycles']} cycles per mode, "
+        f"GUI blocked {config['gui_block_ms']:.0f}ms per tick"
+    )
+    for mode, result in report["modes"].items():
+        decision = result["input_to_decision"]
+        toggle = result["toggle_to_decision"]
+        status = "OK  " if result["within_budget"] else "OVER"
+        print(
+            f"  [{status}] {mode:<7} input->decision p50 {decision['p50_ms']:7.2f}ms  "
+            f"p99 {decision['p99_ms']:7.2f}ms  max {decision['max_ms']:7.2f}ms"
+        )
+        print(
+            f"           toggle->decision p50 {toggle['p50_ms']:7.1f}ms  "
+            f"p99 {toggle['p99_ms']:7.1f}ms  ({result['timeouts']} timeouts)"
+        )
+    if report["passed"] is not None:
+        print()
+        print(f"{GATED_MODE} path within budget: {'yes' if report['passed'] else 'NO'}")
+
+
+def run_benchmark(config: InterlockBenchmarkConfig) -> dict[str, Any]:
+    """
+    Run the interlock latency benchmark.
+
+    Args:
+        config: Benchmark parameters
+
+    Returns:
+        Report dictionary
+    """
+    app = QApplication.instance() or QApplication([])  # Keep a reference while running
+    report = InterlockLatencyBenchmark(config).run()
+    app.processEvents()
+    return report
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="TOSCA safety interlock latency benchmark")
+    parser.add_argument("--cycles", type=int, default=InterlockBenchmarkConfig.cycles)
+    parser.add_argument(
+        "--modes", nargs="+", choices=MODES, default=list(MODES), help="Evaluation paths to run"
+    )
+    parser.add_argument("--budget-ms", type=float, default=InterlockBenchmarkConfig.budget_ms)
+    parser.add_argument(
+        "--gui-block-ms",
+        type=float,
+        default=InterlockBenchmarkConfig.gui_block_ms,
+        help="GUI flood: milliseconds the event loop is blocked per tick",
+    )
+    parser.add_argument("--poll-ms", type=int, default=InterlockBenchmarkConfig.poll_interval_ms)
+    parser.add_argument("--seed", type=int, default=InterlockBenchmarkConfig.seed)
+    parser.add_argument("--output", type=Path, help="Write the JSON report to this file")
+    parser.add_argument("--verbose", action="store_true", help="Show application logging")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+    logger.setLevel(logging.INFO)
+
+    if sys.platform == "win32":
+        print("ERROR: The interlock benchmark needs POSIX pseudo-terminals (run on Linux/macOS)")
+        return 2
+
+    config = InterlockBenchmarkConfig(
+        cycles=args.cycles,
+        modes=tuple(args.modes),
+        budget_ms=args.budget_ms,
+        gui_block_ms=args.gui_block_ms,
+        poll_interval_ms=args.poll_ms,
+        seed=args.seed,
+    )
+    report = run_benchmark(config)
+
+    print_summary(report)
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"\nReport written to {args.output}")
+
+    return 1 if report["passed"] is False else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,874 @@
+#!/usr/bin/env python
+"""
+End-to-end soak/throughput benchmark for TOSCA treatment sessions.
+
+Runs the MainWindow wiring headless (EventLogger, DatabaseManager,
+SessionManager, SafetyManager, SafetyWatchdog, LineBasedProtocolEngine and
+all hardware controllers) against the digital twin, and executes N
+back-to-back treatment sessions with video recording and live telemetry.
+
+Reports:
+- CPU time per thread (requires psutil)
+- GUI-thread stall histogram (lateness of a 10 ms timer on the Qt event loop)
+- Event-log latency (duration of EventLogger.log_event: DB insert + JSONL write)
+- Database and event-log growth
+- Memory high-water mark
+- Camera frames captured / dropped
+
+Usage:
+    python scripts/soak_benchmark.py --sessions 5 --session-seconds 30 --output soak.json
+    python scripts/soak_benchmark.py --baseline soak.json  # Exit code 1 on regression
+
+Requires POSIX pseudo-terminals (Linux/macOS) for the simulated serial devices.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+# Headless Qt (must be set before PyQt6 is imported)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# Add project root (tests.mocks) and src to path (same as src/main.py does)
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "src"))
+
+from PyQt6.QtCore import QEventLoop, QObject, Qt, QTimer  # noqa: E402
+from PyQt6.QtWidgets import QApplication  # noqa: E402
+
+from utils.latency_histogram import LatencyHistogram  # noqa: E402
+
+try:
+    import psutil  # type: ignore[import-untyped]
+except ImportError:
+    psutil = None
+
+logger = logging.getLogger("soak_benchmark")
+
+REPORT_VERSION = 1
+
+# GUI stall histogram bins (upper edges, ms); 16 ms = one frame at 60 Hz
+STALL_BINS_MS: tuple[float, ...] = (16.0, 50.0, 100.0, 250.0, 1000.0)
+
+# Metrics compared against a baseline report: (dotted path, absolute slack).
+# A metric regresses when it grows by more than the relative tolerance AND by
+# more than the slack, so that noise on near-zero values is not flagged.
+BASELINE_METRICS: tuple[tuple[str, float], ...] = (
+    ("gui_stalls.p99_ms", 5.0),
+    ("gui_stalls.max_ms", 50.0),
+    ("event_log_latency.p99_ms", 2.0),
+    ("cpu.application_s_per_session", 0.5),
+    ("database.growth_bytes_per_session", 16 * 1024),
+    ("memory.rss_high_water_bytes", 32 * 1024 * 1024),
+    ("camera.drop_rate", 0.01),
+    ("connect.total_s", 0.5),
+)
+
+# Threads of the simulator and the benchmark itself, reported apart from the application
+HARNESS_THREAD_PREFIXES: tuple[str, ...] = ("Twin", "PtySerialDevice", "SoakSampler")
+
+
+@dataclass
+class SoakConfig:
+    """Benchmark parameters."""
+
+    sessions: int = 3
+    session_seconds: float = 20.0  # Approximate protocol duration per session
+    laser_power_w: float = 1.0
+    seed: int = 0
+    stall_probe_interval_ms: int = 10
+    sample_interval_s: float = 0.5
+
+
+def _wait(seconds: float) -> None:
+    """Keep the Qt event loop running for a while (like the GUI does)."""
+    loop = QEventLoop()
+    QTimer.singleShot(max(0, int(seconds * 1000)), loop.quit)
+    loop.exec()
+
+
+def _wait_until(predicate: Callable[[], bool], timeout_s: float, poll_s: float = 0.05) -> bool:
+    """Run the event loop until predicate() is true or the timeout expires."""
+    deadline = time.monotonic() + timeout_s
+    while not predicate():
+        if time.monotonic() >= deadline:
+            return False
+        _wait(poll_s)
+    return True
+
+
+def _file_size(path: Path) -> int:
+    """File size in bytes (0 if missing)."""
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+def _get_path(report: dict[str, Any], dotted: str) -> Optional[float]:
+    """Look up a numeric value by dotted path (None if missing)."""
+    value: Any = report
+    for key in dotted.split("."):
+        if not isinstance(value, dict) or key not in value:
+            return None
+        value = value[key]
+    return float(value) if isinstance(value, (int, float)) else None
+
+
+class GuiStallProbe:
+    """
+    Measure GUI-thread responsiveness.
+
+    A precise timer fires every interval_ms on the Qt event loop; the time by
+    which each tick is late is how long the GUI thread was blocked.
+    """
+
+    def __init__(self, interval_ms: int = 10) -> None:
+        self.interval_ms = interval_ms
+        self.histogram = LatencyHistogram()
+        self.bins = [0] * (len(STALL_BINS_MS) + 1)
+        self._last_tick = 0.0
+        self._timer = QTimer()
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self._on_tick)
+
+    def start(self) -> None:
+        """Start probing."""
+        self._last_tick = time.perf_counter()
+        self._timer.start()
+
+    def stop(self) -> None:
+        """Stop probing."""
+        self._timer.stop()
+
+    def _on_tick(self) -> None:
+        now = time.perf_counter()
+        lateness_ms = max(0.0, (now - self._last_tick) * 1000.0 - self.interval_ms)
+        self._last_tick = now
+        self.histogram.record(lateness_ms)
+        index = next(
+            (i for i, edge in enumerate(STALL_BINS_MS) if lateness_ms < edge), len(STALL_BINS_MS)
+        )
+        self.bins[index] += 1
+
+    def report(self) -> dict[str, Any]:
+        """Stall statistics and histogram."""
+        labels = []
+        lower = 0.0
+        for edge in STALL_BINS_MS:
+            labels.append(f"{lower:g}-{edge:g}ms")
+            lower = edge
+        labels.append(f">={lower:g}ms")
+        result: dict[str, Any] = {"interval_ms": self.interval_ms}
+        result.update(self.histogram.snapshot())
+        result["histogram"] = dict(zip(labels, self.bins))
+        return result
+
+
+class ResourceSampler(threading.Thread):
+    """
+    Periodically sample per-thread CPU time and process memory.
+
+    Threads are identified by native thread id and named from
+    threading.enumerate() (Python threads) or /proc (Qt threads on Linux).
+    Threads that start and exit between two samples are not seen.
+    """
+
+    def __init__(self, interval_s: float = 0.5) -> None:
+        super().__init__(name="SoakSampler", daemon=True)
+        self.interval_s = interval_s
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+        self._process = psutil.Process() if psutil else None
+        self._baseline: dict[int, float] = {}
+        self._latest: dict[int, float] = {}
+        self._names: dict[int, str] = {}
+        self._cpu_start = 0.0
+        self.rss_start_bytes = 0
+        self.rss_high_water_bytes = 0
+
+    @property
+    def available(self) -> bool:
+        """True if per-thread CPU and RSS can be measured."""
+        return self._process is not None
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self.interval_s):
+            self.sample()
+
+    def begin(self) -> None:
+        """Take the baseline sample and start the sampling thread."""
+        if self._process is not None:
+            self._cpu_start = sum(self._process.cpu_times()[:2])
+            self.rss_start_bytes = self._process.memory_info().rss
+            self.sample()
+            with self._lock:
+                self._baseline = dict(self._latest)
+        self.start()
+
+    def finish(self) -> None:
+        """Take the final sample and stop."""
+        self._stop_event.set()
+        self.join(2.0)
+        self.sample()
+
+    def sample(self) -> None:
+        """Record CPU per thread and RSS once."""
+        if self._process is None:
+            return
+        try:
+            threads = self._process.threads()
+            rss = self._process.memory_info().rss
+        except Exception as e:  # Process state can change mid-sample
+            logger.debug(f"Resource sample failed: {e}")
+            return
+        python_names = {t.native_id: t.name for t in threading.enumerate()}
+        with self._lock:
+            self.rss_high_water_bytes = max(self.rss_high_water_bytes, rss)
+            for thread in threads:
+                self._latest[thread.id] = thread.user_time + thread.system_time
+                if thread.id not in self._names:
+                    self._names[thread.id] = python_names.get(thread.id) or self._os_name(thread.id)
+
+    @staticmethod
+    def _os_name(tid: int) -> str:
+        """Kernel thread name (Linux), e.g. the class name of a QThread."""
+        try:
+            return Path(f"/proc/self/task/{tid}/comm").read_text().strip() or f"thread-{tid}"
+        except OSError:
+            return f"thread-{tid}"
+
+    def report(self, wall_time_s: float, sessions: int) -> dict[str, Any]:
+        """CPU per thread name (seconds and % of one core) and process totals."""
+        if self._process is None:
+            return {"available": False, "reason": "psutil not installed"}
+
+        process_s = sum(self._process.cpu_times()[:2]) - self._cpu_start
+        per_name: dict[str, float] = {}
+        with self._lock:
+            for tid, cpu_s in self._latest.items():
+                used = cpu_s - self._baseline.get(tid, 0.0)
+                if used <= 0.0:
+                    continue
+                name = self._names.get(tid, f"thread-{tid}")
+                per_name[name] = per_name.get(name, 0.0) + used
+
+        def percent(cpu_s: float) -> float:
+            return round(100.0 * cpu_s / wall_time_s, 1) if wall_time_s else 0.0
+
+        threads: dict[str, dict[str, float]] = {}
+        harness: dict[str, dict[str, float]] = {}
+        for name, cpu_s in sorted(per_name.items(), key=lambda item: -item[1]):
+            target = harness if name.startswith(HARNESS_THREAD_PREFIXES) else threads
+            target[name] = {"cpu_s": round(cpu_s, 3), "percent": percent(cpu_s)}
+
+        # Application CPU = process CPU minus the simulator's threads
+        application_s = max(0.0, process_s - sum(per_name.get(name, 0.0) for name in harness))
+        return {
+            "available": True,
+            "process_s": round(process_s, 3),
+            "process_percent": percent(process_s),
+            "application_s": round(application_s, 3),
+            "application_percent": percent(application_s),
+            "application_s_per_session": round(application_s / sessions, 3) if sessions else 0.0,
+            "threads": threads,
+            "harness_threads": harness,
+        }
+
+
+class SoakBenchmark(QObject):
+    """
+    Headless TOSCA system running back-to-back sessions on the digital twin.
+
+    Components are created and wired the way MainWindow does it; the GUI
+    widgets are replaced by counters on the signals they would consume.
+    """
+
+    def __init__(self, config: SoakConfig, workdir: Path) -> None:
+        super().__init__()
+        self.config = config
+        self.workdir = workdir
+        self.signal_counts: dict[str, int] = {}
+        self.event_latency = LatencyHistogram()
+        self.startup_report: Any = None
+
+    # ------------------------------------------------------------------
+    # System setup (mirrors MainWindow.__init__ / _connect_safety_system)
+    # ------------------------------------------------------------------
+
+    def _build_system(self) -> None:
+        from core.event_logger import EventLogger
+        from core.line_protocol_engine import LineBasedProtocolEngine
+        from core.safety import SafetyManager
+        from core.safety_watchdog import SafetyWatchdog
+        from core.session_manager import SessionManager
+        from database.db_manager import DatabaseManager
+        from hardware.actuator_controller import ActuatorController
+        from hardware.camera_controller import CameraController
+        from hardware.gpio_controller import GPIOController
+        from hardware.laser_controller import LaserController
+        from hardware.tec_controller import TECController
+
+        data_dir = self.workdir / "data"
+        self.db_path = data_dir / "tosca.db"
+        self.db_manager = DatabaseManager(str(self.db_path))
+        self.db_manager.initialize()
+        self.session_manager = SessionManager(self.db_manager)
+        self.event_logger = EventLogger(
+            self.db_manager, log_file=data_dir / "logs" / "events.jsonl"
+        )
+        self._instrument_event_logger()
+
+        self.actuator_controller = ActuatorController()
+        self.laser_controller = LaserController()
+        self.tec_controller = TECController()
+        self.gpio_controller = GPIOController()
+        self.camera_controller = CameraController(event_logger=self.event_logger)
+
+        self.safety_watchdog = SafetyWatchdog(gpio_controller=None, event_logger=self.event_logger)
+        self.safety_manager = SafetyManager()
+        self.line_protocol_engine = LineBasedProtocolEngine(
+            laser_controller=self.laser_controller,
+            actuator_controller=self.actuator_controller,
+            safety_manager=self.safety_manager,
+        )
+
+        self.gpio_controller.safety_interlock_changed.connect(
+            self.safety_manager.set_gpio_interlock_status
+        )
+        self.gpio_controller.connection_changed.connect(self._on_gpio_connection_changed)
+        self.safety_watchdog.heartbeat_failed.connect(
+            lambda msg: logger.error(f"Watchdog heartbeat failed: {msg}")
+        )
+        self.session_manager.session_started.connect(self._on_session_started)
+        self.session_manager.session_ended.connect(self._on_session_ended)
+
+        # Stand-ins for the widgets consuming live data on the GUI thread
+        telemetry = {
+            "camera.pixmap_ready": self.camera_controller.pixmap_ready,
+            "camera.fps_update": self.camera_controller.fps_update,
+            "laser.power_changed": self.laser_controller.power_changed,
+            "tec.temperature_changed": self.tec_controller.temperature_changed,
+            "gpio.vibration_level_changed": self.gpio_controller.vibration_level_changed,
+            "gpio.photodiode_power_changed": self.gpio_controller.photodiode_power_changed,
+            "actuator.position_changed": self.actuator_controller.position_changed,
+            "event_logger.event_logged": self.event_logger.event_logged,
+        }
+        for name, signal in telemetry.items():
+            self.signal_counts[name] = 0
+            signal.connect(lambda *_args, _name=name: self._count_signal(_name))
+
+    def _instrument_event_logger(self) -> None:
+        """Time every log_event call (the convenience methods go through it too)."""
+        log_event = self.event_logger.log_event
+
+        def timed_log_event(*args: Any, **kwargs: Any) -> None:
+            start = time.perf_counter()
+            try:
+                log_event(*args, **kwargs)
+            finally:
+                self.event_latency.record((time.perf_counter() - start) * 1000.0)
+
+        self.event_logger.log_event = timed_log_event  # type: ignore[method-assign]
+
+    def _count_signal(self, name: str) -> None:
+        self.signal_counts[name] += 1
+
+    def _on_gpio_connection_changed(self, connected: bool) -> None:
+        if connected:
+            self.safety_watchdog.gpio_controller = self.gpio_controller
+            if not self.safety_watchdog.start():
+                logger.error("Safety watchdog failed to start")
+        else:
+            self.safety_watchdog.stop()
+
+    def _on_session_started(self, session_id: int) -> None:
+        from core.event_logger import EventType
+
+        session = self.session_manager.get_current_session()
+        if session:
+            self.event_logger.set_session(session_id, session.tech_id)
+            self.event_logger.log_treatment_event(
+                EventType.TREATMENT_SESSION_START,
+                f"Treatment session {session_id} started for subject {session.subject_id}",
+            )
+
+    def _on_session_ended(self, session_id: int) -> None:
+        from core.event_logger import EventType
+
+        self.event_logger.log_treatment_event(
+            EventType.TREATMENT_SESSION_END, f"Treatment session {session_id} ended"
+        )
+        self.event_logger.clear_session()
+
+    def _connect_all(self, ports: Any) -> bool:
+        """Connect every device concurrently (Hardware > Connect All)."""
+        from hardware.connection_orchestrator import ConnectionOrchestrator
+
+        orchestrator = ConnectionOrchestrator(parent=self)
+        orchestrator.add_device("gpio", lambda: self.gpio_controller.connect(port=ports.gpio))
+        orchestrator.add_device(
+            "laser", lambda: self.laser_controller.connect(ports.laser), depends_on=["gpio"]
+        )
+        orchestrator.add_device("tec", lambda: self.tec_controller.connect(ports.tec))
+        orchestrator.add_device(
+            "actuator", lambda: self.actuator_controller.connect(ports.actuator, auto_home=True)
+        )
+        orchestrator.add_device("camera", self.camera_controller.connect)
+        orchestrator.start()
+
+        _wait_until(lambda: orchestrator.report is not None, timeout_s=60.0)
+        self.startup_report = orchestrator.report
+        return bool(self.startup_report and self.startup_report.all_connected)
+
+    def _shutdown(self) -> None:
+        """Disconnect in the order MainWindow.closeEvent uses."""
+        self.safety_watchdog.stop()
+        for controller in (
+            self.camera_controller,
+            self.actuator_controller,
+            self.laser_controller,
+            self.tec_controller,
+            self.gpio_controller,
+        ):
+            try:
+                controller.disconnect()
+            except Exception as e:
+                logger.warning(f"Disconnect failed: {e}")
+        self.db_manager.close()
+
+    # ------------------------------------------------------------------
+    # Sessions
+    # ------------------------------------------------------------------
+
+    def _build_protocol(self) -> Any:
+        """Scan out, treat, ramp down and home; sized to session_seconds."""
+        from core.protocol_line import (
+            DwellParams,
+            HomeParams,
+            LaserRampParams,
+            LaserSetParams,
+            LineBasedProtocol,
+            MoveParams,
+            ProtocolLine,
+        )
+
+        treat_s = max(1.0, self.config.session_seconds * 0.4)
+        ramp_s = max(1.0, self.config.session_seconds * 0.2)
+        return LineBasedProtocol(
+            protocol_name="Soak",
+            version="1.0",
+            lines=[
+                ProtocolLine(line_number=1, movement=MoveParams(5.0, 5.0)),
+                ProtocolLine(
+                    line_number=2,
+                    movement=MoveParams(15.0, 5.0),
+                    laser=LaserSetParams(self.config.laser_power_w),
+                    dwell=DwellParams(treat_s),
+                ),
+                ProtocolLine(
+                    line_number=3,
+                    laser=LaserRampParams(self.config.laser_power_w, 0.0, ramp_s),
+                ),
+                ProtocolLine(line_number=4, movement=HomeParams(speed_mm_per_s=5.0)),
+            ],
+        )
+
+    def _run_protocol(self, protocol: Any) -> tuple[bool, str]:
+        """Execute on a worker thread (like LineProtocolWorker) while the GUI loop runs."""
+        result: list[tuple[bool, str]] = []
+
+        def worker() -> None:
+            try:
+                result.append(
+                    asyncio.run(
+                        self.line_protocol_engine.execute_protocol(
+                            protocol, record=True, stop_on_error=True
+                        )
+                    )
+                )
+            except Exception as e:
+                result.append((False, f"Protocol worker exception: {e}"))
+
+        thread = threading.Thread(target=worker, name="LineProtocolWorker", daemon=True)
+        thread.start()
+        timeout_s = protocol.calculate_total_duration() * 3 + 30.0
+        if not _wait_until(lambda: bool(result), timeout_s=timeout_s, poll_s=0.1):
+            self.line_protocol_engine.stop()
+            thread.join(5.0)
+            return False, "Protocol timed out"
+        return result[0]
+
+    def _run_session(self, index: int, twin: Any) -> dict[str, Any]:  # noqa: C901
+        """One treatment session from subject creation to completion."""
+        from sqlalchemy import func, select
+
+        from database.models import SafetyLog
+
+        start = time.perf_counter()
+        db_before = _file_size(self.db_path) + _file_size(Path(f"{self.db_path}-wal"))
+        captured_before = twin.camera.frames_captured
+        dropped_before = twin.camera.dropped_frames
+        events_before = self.event_latency.count
+
+        subject = self.db_manager.create_subject(f"SOAK-{index + 1:04d}", tech_id=1)
+        session = self.session_manager.create_session(subject, tech_id=1)
+        if session is None:
+            raise RuntimeError("Session creation failed")
+        self.safety_manager.set_session_valid(True)
+        self.safety_manager.set_power_limit_ok(True)
+
+        self.tec_controller.set_temperature(25.0)
+        self.tec_controller.set_output(True)
+        self.gpio_controller.start_smoothing_motor()
+        self.gpio_controller.start_aiming_laser()
+        interlocks_ok = _wait_until(self.safety_manager.is_laser_enable_permitted, timeout_s=10.0)
+
+        self.camera_controller.start_streaming()
+        self.camera_controller.start_recording(
+            f"session_{session.session_id}", output_dir=self.session_manager.get_session_folder()
+        )
+
+        success, message = False, "Interlocks not satisfied"
+        if interlocks_ok and self.safety_manager.arm_system():
+            self.safety_manager.start_treatment()
+            self.laser_controller.set_output(True)
+            success, message = self._run_protocol(self._build_protocol())
+            self.laser_controller.set_output(False)
+            self.laser_controller.set_current(0.0)
+            self.safety_manager.stop_treatment()
+            self.safety_manager.disarm_system()
+
+        folder = self.session_manager.get_session_folder()
+        if folder is not None:
+            self.line_protocol_engine.save_motion_traces(folder)
+        self.camera_controller.stop_recording()
+        self.camera_controller.stop_streaming()
+        self.gpio_controller.stop_aiming_laser()
+        self.gpio_controller.stop_smoothing_motor()
+        self.tec_controller.set_output(False)
+        session_id = session.session_id
+        self.session_manager.complete_session(post_treatment_notes=f"Soak session {index + 1}")
+        self.safety_manager.set_session_valid(False)
+        _wait(0.2)  # Let queued signals drain before measuring
+
+        with self.db_manager.get_session() as db_session:
+            log_rows = db_session.execute(select(func.count(SafetyLog.log_id))).scalar_one()
+
+        captured = twin.camera.frames_captured - captured_before
+        dropped = twin.camera.dropped_frames - dropped_before
+        db_after = _file_size(self.db_path) + _file_size(Path(f"{self.db_path}-wal"))
+        return {
+            "index": index + 1,
+            "session_id": session_id,
+            "duration_s": round(time.perf_counter() - start, 3),
+            "protocol_success": success,
+            "message": message,
+            "events_logged": self.event_latency.count - events_before,
+            "safety_log_rows": log_rows,
+            "db_growth_bytes": db_after - db_before,
+            "frames_captured": captured,
+            "frames_dropped": dropped,
+        }
+
+    # ------------------------------------------------------------------
+    # Run
+    # ------------------------------------------------------------------
+
+    def run(self) -> dict[str, Any]:
+        """Run the benchmark and return the report."""
+        from tests.mocks.digital_twin import DigitalTwin
+
+        twin = DigitalTwin(seed=self.config.seed)
+        ports = twin.start()
+        sampler = ResourceSampler(self.config.sample_interval_s)
+        probe = GuiStallProbe(self.config.stall_probe_interval_ms)
+        sessions: list[dict[str, Any]] = []
+        event_file = self.workdir / "data" / "logs" / "events.jsonl"
+
+        try:
+            with twin.patch_vmbpy():
+                self._build_system()
+                db_start = _file_size(self.db_path) + _file_size(Path(f"{self.db_path}-wal"))
+                sampler.begin()
+                probe.start()
+                run_start = time.perf_counter()
+
+                connected = self._connect_all(ports)
+                if not connected:
+                    raise RuntimeError("Hardware connection failed")
+
+                for index in range(self.config.sessions):
+                    sessions.append(self._run_session(index, twin))
+                    logger.info(
+                        f"Session {index + 1}/{self.config.sessions}: "
+                        f"{sessions[-1]['message']} ({sessions[-1]['duration_s']:.1f}s)"
+                    )
+
+                wall_time_s = time.perf_counter() - run_start
+                probe.stop()
+                sampler.finish()
+                db_end = _file_size(self.db_path) + _file_size(Path(f"{self.db_path}-wal"))
+                watchdog_stats = self.safety_watchdog.get_statistics()
+                self._shutdown()
+        finally:
+            probe.stop()
+            twin.stop()
+
+        count = len(sessions) or 1
+        captured = twin.camera.frames_captured
+        return {
+            "benchmark": "tosca_soak",
+            "version": REPORT_VERSION,
+            "timestamp": datetime.now().isoformat(),
+            "config": asdict(self.config),
+            "platform": {
+                "python": platform.python_version(),
+                "system": platform.platform(),
+                "cpu_count": os.cpu_count(),
+            },
+            "wall_time_s": round(wall_time_s, 3),
+            "connect": {
+                "total_s": round(self.startup_report.total_s, 3),
+                "serial_s": round(self.startup_report.serial_s, 3),
+            },
+            "sessions": sessions,
+            "cpu": sampler.report(wall_time_s, len(sessions)),
+            "gui_stalls": probe.report(),
+            "event_log_latency": self.event_latency.snapshot(),
+            "database": {
+                "start_bytes": db_start,
+                "end_bytes": db_end,
+                "growth_bytes": db_end - db_start,
+                "growth_bytes_per_session": (db_end - db_start) // count,
+                "event_file_bytes": _file_size(event_file),
+            },
+            "memory": {
+                "available": sampler.available,
+                "rss_start_bytes": sampler.rss_start_bytes,
+                "rss_high_water_bytes": sampler.rss_high_water_bytes,
+            },
+            "camera": {
+                "frames_captured": captured,
+                "frames_delivered": twin.camera.frames_delivered,
+                "dropped_frames": twin.camera.dropped_frames,
+                "drop_rate": round(twin.camera.dropped_frames / captured, 4) if captured else 0.0,
+            },
+            "watchdog": {
+                key: watchdog_stats.get(key)
+                for key in (
+                    "heartbeat_count",
+                    "failed_heartbeats",
+                    "skipped_gui_stalled",
+                    "max_heartbeat_gap_ms",
+                )
+            },
+            "signals": dict(self.signal_counts),
+        }
+
+
+def compare_to_baseline(
+    report: dict[str, Any], baseline: dict[str, Any], tolerance: float = 0.2
+) -> list[dict[str, Any]]:
+    """
+    Compare a report against a baseline report.
+
+    Args:
+        report: Current report
+        baseline: Earlier report from the same machine
+        tolerance: Allowed relative increase (0.2 = 20%)
+
+    Returns:
+        Regressions as {"metric", "baseline", "current", "change_pct"} (empty if none)
+    """
+    regressions = []
+    for metric, slack in BASELINE_METRICS:
+        old = _get_path(baseline, metric)
+        new = _get_path(report, metric)
+        if old is None or new is None:
+            continue
+        if new > old * (1.0 + tolerance) and new - old > slack:
+            change_pct = 100.0 * (new - old) / old if old else float("inf")
+            regressions.append(
+                {
+                    "metric": metric,
+                    "baseline": old,
+                    "current": new,
+                    "change_pct": round(change_pct, 1),
+                }
+            )
+    return regressions
+
+
+def print_summary(report: dict[str, Any]) -> None:
+    """Print a human-readable summary of a report."""
+    print("TOSCA Soak Benchmark")
+    print("=" * 60)
+    print(f"Sessions:        {len(report['sessions'])} in {report['wall_time_s']:.1f}s")
+    print(f"Hardware connect: {report['connect']['total_s']:.2f}s")
+    for session in report["sessions"]:
+        status = "OK  " if session["protocol_success"] else "FAIL"
+        print(
+            f"  [{status}] #{session['index']}: {session['duration_s']:.1f}s, "
+            f"{session['events_logged']} events, +{session['db_growth_bytes'] / 1024:.0f} KiB DB, "
+            f"{session['frames_dropped']}/{session['frames_captured']} frames dropped"
+        )
+    print()
+
+    stalls = report["gui_stalls"]
+    print(
+        f"GUI stalls:      p50 {stalls['p50_ms']:.1f}ms  p99 {stalls['p99_ms']:.1f}ms  "
+        f"max {stalls['max_ms']:.1f}ms"
+    )
+    for label, count in stalls["histogram"].items():
+        print(f"  {label:>12}: {count}")
+    events = report["event_log_latency"]
+    print(
+        f"Event logging:   {events['count']} events, p50 {events['p50_ms']:.2f}ms  "
+        f"p99 {events['p99_ms']:.2f}ms  max {events['max_ms']:.2f}ms"
+    )
+    database = report["database"]
+    print(
+        f"Database:        +{database['growth_bytes'] / 1024:.0f} KiB "
+        f"({database['growth_bytes_per_session'] / 1024:.0f} KiB/session), "
+        f"event log {database['event_file_bytes'] / 1024:.0f} KiB"
+    )
+    camera = report["camera"]
+    print(
+        f"Camera:          {camera['dropped_frames']}/{camera['frames_captured']} dropped "
+        f"({100 * camera['drop_rate']:.1f}%)"
+    )
+
+    cpu = report["cpu"]
+    if cpu.get("available"):
+        memory = report["memory"]
+        print(
+            f"Memory:          high water {memory['rss_high_water_bytes'] / 2**20:.0f} MiB "
+            f"(start {memory['rss_start_bytes'] / 2**20:.0f} MiB)"
+        )
+        print(
+            f"CPU:             {cpu['application_s']:.1f}s application "
+            f"({cpu['application_percent']:.0f}% of a core), "
+            f"{cpu['process_s'] - cpu['application_s']:.1f}s simulator"
+        )
+        for name, usage in list(cpu["threads"].items())[:10]:
+            print(f"  {name:<32} {usage['cpu_s']:7.2f}s  {usage['percent']:5.1f}%")
+    else:
+        print(f"CPU/memory:      unavailable ({cpu.get('reason')})")
+
+    regressions = report.get("regressions")
+    if regressions is not None:
+        print()
+        if regressions:
+            print("REGRESSIONS vs baseline:")
+            for item in regressions:
+                print(
+                    f"  {item['metric']}: {item['baseline']:g} -> {item['current']:g} "
+                    f"(+{item['change_pct']:.0f}%)"
+                )
+        else:
+            print("No regressions vs baseline")
+
+
+def run_benchmark(config: SoakConfig, workdir: Optional[Path] = None) -> dict[str, Any]:
+    """
+    Run the soak benchmark in a scratch working directory.
+
+    Session folders, the database and the event log are relative to the
+    working directory, so the benchmark runs in its own directory and never
+    touches the real data/ folder.
+
+    Args:
+        config: Benchmark parameters
+        workdir: Working directory (default: a temporary directory, removed afterwards)
+
+    Returns:
+        Report dictionary
+    """
+    app = QApplication.instance() or QApplication([])  # Keep a reference while running
+
+    cleanup = workdir is None
+    workdir = Path(workdir or tempfile.mkdtemp(prefix="tosca_soak_")).resolve()
+    workdir.mkdir(parents=True, exist_ok=True)
+    previous_cwd = Path.cwd()
+    os.chdir(workdir)
+    try:
+        report = SoakBenchmark(config, workdir).run()
+        app.processEvents()
+        return report
+    finally:
+        os.chdir(previous_cwd)
+        if cleanup:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="TOSCA end-to-end soak/throughput benchmark")
+    parser.add_argument("--sessions", type=int, default=SoakConfig.sessions)
+    parser.add_argument(
+        "--session-seconds",
+        type=float,
+        default=SoakConfig.session_seconds,
+        help="Approximate protocol duration per session",
+    )
+    parser.add_argument("--laser-power", type=float, default=SoakConfig.laser_power_w)
+    parser.add_argument("--seed", type=int, default=SoakConfig.seed)
+    parser.add_argument("--output", type=Path, help="Write the JSON report to this file")
+    parser.add_argument("--baseline", type=Path, help="Compare against an earlier JSON report")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.2, help="Allowed relative regression (default 0.2)"
+    )
+    parser.add_argument("--workdir", type=Path, help="Keep database, logs and videos here")
+    parser.add_argument("--verbose", action="store_true", help="Show application logging")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+    logger.setLevel(logging.INFO)
+
+    if sys.platform == "win32":
+        print("ERROR: The soak benchmark needs POSIX pseudo-terminals (run on Linux/macOS)")
+        return 2
+
+    config = SoakConfig(
+        sessions=args.sessions,
+        session_seconds=args.session_seconds,
+        laser_power_w=args.laser_power,
+        seed=args.seed,
+    )
+    report = run_benchmark(config, args.workdir)
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        report["regressions"] = compare_to_baseline(report, baseline, args.tolerance)
+
+    print_summary(report)
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"\nReport written to {args.output}")
+
+    failed = [s for s in report["sessions"] if not s["protocol_success"]]
+    if failed or report.get("regressions"):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,6 +6,7 @@ Provides type-safe configuration with validation.
 """
 
 import logging
+from typing import Optional
 
 from pydantic import BaseModel, Field, model_validator
 
@@ -44,6 +45,59 @@ class CameraConfig(BaseModel):
         default="MJPG", description="Fallback codec if primary codec unavailable"
     )
 
+    # Raw (Lossless, Full Frame Rate) Recording Settings
+    video_record_raw: bool = Field(
+        default=False, description="Record raw frames at full rate instead of encoded video"
+    )
+    raw_max_seconds: float = Field(
+        default=120.0, gt=0.0, description="Raw recording length preallocated on disk (s)"
+    )
+    raw_transcode: bool = Field(
+        default=True, description="Transcode raw recordings to video in the background"
+    )
+    raw_delete_after_transcode: bool = Field(
+        default=False, description="Delete the raw file once its video is written"
+    )
+    raw_retention_days: Optional[float] = Field(
+        default=None,
+        ge=0.0,
+        description="Delete transcoded raw files older than this (None = keep)",
+    )
+
+    # Software Auto Exposure/Gain Settings
+    auto_exposure_target: float = Field(
+        default=110.0, ge=1.0, le=254.0, description="Target brightness of the ROI (0-255)"
+    )
+    auto_exposure_percentile: float = Field(
+        default=50.0, ge=0.0, le=100.0, description="ROI brightness percentile controlled"
+    )
+    auto_exposure_hysteresis: float = Field(
+        default=0.1, ge=0.0, le=1.0, description="Relative deadband before exposure changes"
+    )
+    auto_exposure_roi: list[float] = Field(
+        default=[0.25, 0.25, 0.5, 0.5],
+        min_length=4,
+        max_length=4,
+        description="Auto exposure region (x, y, width, height) as fractions of the frame",
+    )
+    auto_exposure_max_us: float = Field(
+        default=30000.0, gt=0.0, description="Auto exposure upper limit (µs)"
+    )
+    auto_gain_max_db: float = Field(default=24.0, ge=0.0, description="Auto gain upper limit (dB)")
+
+    # Still Image Capture Settings
+    still_image_format: str = Field(
+        default="png",
+        pattern="^(png|tiff|npy)$",
+        description="Still image format (png, tiff = uncompressed, npy)",
+    )
+    still_png_compression: int = Field(
+        default=1, ge=0, le=9, description="PNG compression level (higher = smaller, slower)"
+    )
+    still_capture_workers: int = Field(
+        default=2, ge=1, le=8, description="Background threads encoding still images"
+    )
+
 
 class ActuatorConfig(BaseModel):
     """Actuator hardware configuration."""
@@ -65,6 +119,10 @@ class ActuatorConfig(BaseModel):
     position_check_loop_ms: int = Field(
         default=50, ge=10, le=500, description="Position loop check delay (ms)"
     )
+    motion_trace_capture: bool = Field(
+        default=False,
+        description="Record a high-rate position trace of every protocol move (adds settle time)",
+    )
 
 
 class LaserConfig(BaseModel):
@@ -143,6 +201,16 @@ class SafetyConfig(BaseModel):
     laser_enable_requires_interlocks: bool = Field(
         default=True, description="Laser cannot enable without valid interlocks"
     )
+    interlock_latency_budget_ms: float = Field(
+        default=50.0,
+        gt=0.0,
+        le=1000.0,
+        description="Interlock input-to-decision latency budget (overruns are logged)",
+    )
+    interlock_fast_path: bool = Field(
+        default=True,
+        description="Poll GPIO interlocks on a dedicated thread and evaluate them there",
+    )
 
 
 class GUIConfig(BaseModel):
@@ -181,6 +249,56 @@ class LoggingConfig(BaseModel):
     )
 
 
+class DatabaseConfig(BaseModel):
+    """SQLite storage profile."""
+
+    synchronous: str = Field(
+        default="NORMAL",
+        pattern="^(OFF|NORMAL|FULL|EXTRA)$",
+        description="SQLite synchronous level (warning+ safety events always commit with FULL)",
+    )
+    cache_size_mb: int = Field(
+        default=16, ge=1, le=1024, description="Page cache per connection (MB)"
+    )
+    mmap_size_mb: int = Field(
+        default=64, ge=0, le=4096, description="Memory-mapped I/O size (MB, 0 = disabled)"
+    )
+    temp_store_memory: bool = Field(
+        default=True, description="Keep temporary tables and indices in memory"
+    )
+    checkpoint_interval_s: float = Field(
+        default=30.0,
+        ge=0.0,
+        le=3600.0,
+        description="Background WAL checkpoint period (s, 0 = SQLite auto-checkpoint)",
+    )
+    backup_enabled: bool = Field(
+        default=True, description="Back up the database and event logs on a schedule"
+    )
+    backup_dir: str = Field(default="data/backups", description="Backup directory")
+    backup_interval_h: float = Field(
+        default=6.0, ge=0.1, le=168.0, description="Time between scheduled backups (hours)"
+    )
+    backup_keep: int = Field(default=7, ge=1, le=365, description="Database snapshots kept")
+
+
+class DiagnosticsConfig(BaseModel):
+    """Performance instrumentation configuration (developer diagnostics)."""
+
+    instrumentation_enabled: bool = Field(
+        default=False, description="Time hot paths and detect GUI stalls from startup"
+    )
+    stall_threshold_ms: int = Field(
+        default=100, ge=20, le=5000, description="Event loop lateness that counts as a GUI stall"
+    )
+    stall_history: int = Field(
+        default=20, ge=1, le=500, description="Number of recent GUI stalls kept with stacks"
+    )
+    histogram_window_s: float = Field(
+        default=60.0, ge=1.0, le=3600.0, description="Rolling window of latency histograms (s)"
+    )
+
+
 class TOSCAConfig(BaseModel):
     """Root configuration for TOSCA system."""
 
@@ -188,6 +306,8 @@ class TOSCAConfig(BaseModel):
     safety: SafetyConfig = Field(default_factory=SafetyConfig)
     gui: GUIConfig = Field(default_factory=GUIConfig)
     logging: LoggingConfig = Field(default_factory=LoggingConfig)
+    database: DatabaseConfig = Field(default_factory=DatabaseConfig)
+    diagnostics: DiagnosticsConfig = Field(default_factory=DiagnosticsConfig)
 
     @model_validator(mode="after")
     def validate_heartbeat_against_timeout(self) -> "TOSCAConfig":
@@ -5,4 +5,4 @@ Includes safety management, session management, protocol execution,
 and event logging.
 """
 
-__all__ = ["protocol", "protocol_engine", "session", "event_logger"]
+__all__ = ["protocol", "protocol_engine", "session", "event_logger", "event_log_index"]
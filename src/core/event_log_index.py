@@ -0,0 +1,467 @@
+"""
+Module: event_log_index
+Project: TOSCA Laser Control System
+
+Purpose: Sidecar indexes and queries over the JSONL event logs written by
+EventLogger (events.jsonl plus rotated events_<timestamp>.jsonl segments).
+
+Each segment has a sidecar (<segment>.idx, JSON) that splits the file into
+blocks of about 1 MB and records, per block, its byte range, time range,
+severities, event types and session IDs. A query skips every block (and so
+every segment) whose summary cannot match, scans only the remaining byte
+ranges, in parallel, and streams the matching events in log order.
+
+EventLogger keeps the active segment's index up to date in memory as it
+appends (saving the sidecar whenever a block fills) and completes it when
+the segment rotates. Readers scan whatever tail the active sidecar does
+not cover yet, and build sidecars for older segments that have none.
+Safety Critical: No (read-only access to the audit trail)
+"""
+
+import json
+import logging
+import os
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+INDEX_SUFFIX = ".idx"
+INDEX_VERSION = 1
+DEFAULT_BLOCK_BYTES = 1024 * 1024
+
+# Largest byte range handed to one scan worker
+SCAN_CHUNK_BYTES = 4 * 1024 * 1024
+
+SEVERITY_ORDER = {"info": 0, "warning": 1, "critical": 2, "emergency": 3}
+
+
+def index_path(segment: Path) -> Path:
+    """Sidecar index path of a log segment."""
+    return segment.with_name(segment.name + INDEX_SUFFIX)
+
+
+@dataclass
+class IndexBlock:
+    """Summary of a contiguous run of complete lines in a segment."""
+
+    offset: int
+    end: int
+    count: int = 0
+    first_time: Optional[str] = None  # ISO timestamps (compare as strings)
+    last_time: Optional[str] = None
+    severities: set[str] = field(default_factory=set)
+    event_types: set[str] = field(default_factory=set)
+    session_ids: set[int] = field(default_factory=set)
+
+    def add(self, event: dict[str, Any], end: int) -> None:
+        """Include one event whose line ends at byte end."""
+        self.end = end
+        self.count += 1
+        timestamp = event.get("timestamp")
+        if isinstance(timestamp, str):
+            if self.first_time is None or timestamp < self.first_time:
+                self.first_time = timestamp
+            if self.last_time is None or timestamp > self.last_time:
+                self.last_time = timestamp
+        if event.get("severity") is not None:
+            self.severities.add(str(event["severity"]))
+        if event.get("event_type") is not None:
+            self.event_types.add(str(event["event_type"]))
+        if isinstance(event.get("session_id"), int):
+            self.session_ids.add(event["session_id"])
+
+    def to_json(self) -> dict[str, Any]:
+        """Serializable form."""
+        return {
+            "offset": self.offset,
+            "end": self.end,
+            "count": self.count,
+            "first_time": self.first_time,
+            "last_time": self.last_time,
+            "severities": sorted(self.severities),
+            "event_types": sorted(self.event_types),
+            "session_ids": sorted(self.session_ids),
+        }
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> "IndexBlock":
+        """Inverse of to_json()."""
+        return cls(
+            offset=data["offset"],
+            end=data["end"],
+            count=data["count"],
+            first_time=data["first_time"],
+            last_time=data["last_time"],
+            severities=set(data["severities"]),
+            event_types=set(data["event_types"]),
+            session_ids=set(data["session_ids"]),
+        )
+
+
+@dataclass(frozen=True)
+class EventQuery:
+    """
+    Event log query criteria (all given criteria must match).
+
+    Args:
+        start: Earliest event time (inclusive)
+        end: Latest event time (inclusive)
+        min_severity: Minimum severity (info, warning, critical, emergency)
+        event_types: Event type values (EventType.value)
+        session_ids: Session IDs
+    """
+
+    start: Optional[datetime] = None
+    end: Optional[datetime] = None
+    min_severity: Optional[str] = None
+    event_types: Optional[frozenset[str]] = None
+    session_ids: Optional[frozenset[int]] = None
+
+    # Derived once: matches() runs for every scanned line
+    severities: Optional[frozenset[str]] = field(init=False, repr=False, compare=False)
+    _start_iso: Optional[str] = field(init=False, repr=False, compare=False)
+    _end_iso: Optional[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Accept any iterable for the set criteria
+        for name in ("event_types", "session_ids"):
+            value = getattr(self, name)
+            if value is not None and not isinstance(value, frozenset):
+                object.__setattr__(self, name, frozenset(value))
+
+        # Severities at or above min_severity (None = any)
+        severities = None
+        if self.min_severity is not None:
+            minimum = SEVERITY_ORDER.get(self.min_severity.lower(), 0)
+            severities = frozenset(sev for sev, level in SEVERITY_ORDER.items() if level >= minimum)
+        object.__setattr__(self, "severities", severities)
+        object.__setattr__(self, "_start_iso", self.start.isoformat() if self.start else None)
+        object.__setattr__(self, "_end_iso", self.end.isoformat() if self.end else None)
+
+    def may_match(self, block: IndexBlock) -> bool:
+        """False if no event in the block can match."""
+        if block.count == 0:
+            return False
+        start, end = self._start_iso, self._end_iso
+        if start and block.last_time and block.last_time < start:
+            return False
+        if end and block.first_time and block.first_time > end:
+            return False
+        if self.severities is not None and not self.severities & block.severities:
+            return False
+        if self.event_types is not None and not self.event_types & block.event_types:
+            return False
+        if self.session_ids is not None and not self.session_ids & block.session_ids:
+            return False
+        return True
+
+    def matches(self, event: dict[str, Any]) -> bool:
+        """True if an event matches every criterion."""
+        timestamp = event.get("timestamp") or ""
+        start, end = self._start_iso, self._end_iso
+        if start and timestamp < start:
+            return False
+        if end and timestamp > end:
+            return False
+        if self.severities is not None and event.get("severity") not in self.severities:
+            return False
+        if self.event_types is not None and event.get("event_type") not in self.event_types:
+            return False
+        if self.session_ids is not None and event.get("session_id") not in self.session_ids:
+            return False
+        return True
+
+    def line_tokens(self) -> list[list[bytes]]:
+        """
+        Byte strings a matching line must contain (one of each group).
+
+        A cheap pre-filter before JSON parsing; EventLogger writes with
+        json.dumps default separators.
+        """
+        groups = []
+        if self.severities is not None and len(self.severities) < len(SEVERITY_ORDER):
+            groups.append([f'"severity": "{sev}"'.encode() for sev in self.severities])
+        if self.event_types is not None:
+            groups.append([f'"event_type": {json.dumps(t)}'.encode() for t in self.event_types])
+        if self.session_ids is not None:
+            groups.append([f'"session_id": {int(s)},'.encode() for s in self.session_ids])
+        return groups
+
+
+class SegmentIndex:
+    """
+    Block index of one JSONL segment.
+
+    Usage:
+        index = SegmentIndex.for_segment(Path("data/logs/events.jsonl"))
+        ranges = index.ranges(EventQuery(min_severity="critical"))
+    """
+
+    def __init__(self, segment: Path, block_bytes: int = DEFAULT_BLOCK_BYTES) -> None:
+        """
+        Create an empty index.
+
+        Args:
+            segment: JSONL log segment
+            block_bytes: Target block size
+        """
+        self.segment = Path(segment)
+        self.block_bytes = block_bytes
+        self.blocks: list[IndexBlock] = []
+
+    @property
+    def size(self) -> int:
+        """Bytes of the segment covered by the index."""
+        return self.blocks[-1].end if self.blocks else 0
+
+    @classmethod
+    def load(cls, segment: Path) -> Optional["SegmentIndex"]:
+        """
+        Load a segment's sidecar.
+
+        Returns:
+            Index, or None if there is no usable sidecar (missing, other
+            version, or covering more bytes than the segment has)
+        """
+        try:
+            data = json.loads(index_path(segment).read_text(encoding="utf-8"))
+            if data.get("version") != INDEX_VERSION:
+                return None
+            index = cls(segment, data["block_bytes"])
+            index.blocks = [IndexBlock.from_json(b) for b in data["blocks"]]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if index.size > segment.stat().st_size:
+            return None  # Segment was replaced
+        return index
+
+    @classmethod
+    def for_segment(
+        cls, segment: Path, save: bool = False, block_bytes: int = DEFAULT_BLOCK_BYTES
+    ) -> "SegmentIndex":
+        """
+        Load a segment's sidecar (or start a new index) and index any lines it does not cover.
+
+        Args:
+            segment: JSONL log segment
+            save: Write the sidecar if lines were added
+            block_bytes: Block size for a new index
+        """
+        index = cls.load(segment) or cls(segment, block_bytes)
+        if index.catch_up() and save:
+            index.save()
+        return index
+
+    def save(self) -> None:
+        """Write the sidecar atomically (temp file + rename)."""
+        data = {
+            "version": INDEX_VERSION,
+            "segment": self.segment.name,
+            "block_bytes": self.block_bytes,
+            "blocks": [block.to_json() for block in self.blocks],
+        }
+        path = index_path(self.segment)
+        temp = path.with_name(path.name + ".tmp")
+        temp.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(temp, path)
+
+    def add(self, offset: int, end: int, event: dict[str, Any]) -> bool:
+        """
+        Index one line appended at [offset, end).
+
+        Args:
+            offset: Byte offset of the line (must equal size)
+            end: Byte offset after the line's newline
+            event: Parsed event
+
+        Returns:
+            True if this line completed a block
+        """
+        block = self.blocks[-1] if self.blocks else None
+        if block is None or block.end - block.offset >= self.block_bytes:
+            block = IndexBlock(offset, offset)
+            self.blocks.append(block)
+        block.add(event, end)
+        return block.end - block.offset >= self.block_bytes
+
+    def catch_up(self) -> int:
+        """
+        Index complete lines appended since the index was last updated.
+
+        Returns:
+            Number of lines indexed
+        """
+        try:
+            f = open(self.segment, "rb")
+        except FileNotFoundError:
+            return 0
+        added = 0
+        with f:
+            f.seek(self.size)
+            offset = self.size
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # Partial line still being written
+                end = offset + len(line)
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    event = {}  # Unparseable line: covered, but matches nothing in the summary
+                self.add(offset, end, event if isinstance(event, dict) else {})
+                offset = end
+                added += 1
+        return added
+
+    def ranges(self, query: EventQuery, max_bytes: int = SCAN_CHUNK_BYTES) -> list[tuple[int, int]]:
+        """
+        Byte ranges that may hold matching events (adjacent blocks merged).
+
+        Args:
+            query: Query criteria
+            max_bytes: Stop merging blocks into a range at this size
+
+        Returns:
+            [(start, end), ...] in file order
+        """
+        ranges: list[tuple[int, int]] = []
+        for block in self.blocks:
+            if not query.may_match(block):
+                continue
+            if ranges and ranges[-1][1] == block.offset and block.end - ranges[-1][0] <= max_bytes:
+                ranges[-1] = (ranges[-1][0], block.end)
+            else:
+                ranges.append((block.offset, block.end))
+        return ranges
+
+
+def _scan(
+    segment: Path, start: int, end: int, query: EventQuery, tokens: list[list[bytes]]
+) -> list[dict[str, Any]]:
+    """Parse the events in [start, end) of a segment that match (scan worker)."""
+    with open(segment, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    results = []
+    for line in data.splitlines():
+        if any(not any(token in line for token in group) for group in tokens):
+            continue
+        try:
+            event = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(event, dict) and query.matches(event):
+            results.append(event)
+    return results
+
+
+class EventLogQuery:
+    """
+    Query engine over an event log (active segment plus rotated segments).
+
+    Usage:
+        logs = EventLogQuery(Path("data/logs/events.jsonl"))
+        for event in logs.query(EventQuery(min_severity="critical", session_ids={123})):
+            ...
+    """
+
+    def __init__(self, log_file: Path, max_workers: int = 4) -> None:
+        """
+        Create the query engine.
+
+        Args:
+            log_file: Active log file (rotated segments are found next to it)
+            max_workers: Parallel range scans
+        """
+        self.log_file = Path(log_file)
+        self.max_workers = max(1, max_workers)
+        # Indexes kept between queries, keyed by path (with the file's inode)
+        self._indexes: dict[Path, tuple[int, SegmentIndex]] = {}
+        self._lock = threading.Lock()
+
+    def segments(self) -> list[Path]:
+        """Log segments, oldest first (rotated names sort by rotation time)."""
+        directory = self.log_file.parent
+        rotated = sorted(directory.glob(f"{self.log_file.stem}_*{self.log_file.suffix}"))
+        active = [self.log_file] if self.log_file.exists() else []
+        return rotated + active
+
+    def index(self, segment: Path) -> SegmentIndex:
+        """
+        Up-to-date index of a segment.
+
+        Rotated segments without a sidecar are indexed (and the sidecar
+        saved). The active segment's sidecar belongs to EventLogger, so its
+        unindexed tail is indexed in memory only. Indexes are kept, and only
+        caught up on later queries, until the file at the path is replaced.
+        """
+        inode = segment.stat().st_ino
+        with self._lock:
+            cached = self._indexes.get(segment)
+            if cached and cached[0] == inode and cached[1].size <= segment.stat().st_size:
+                cached[1].catch_up()
+                return cached[1]
+            index = SegmentIndex.for_segment(segment, save=segment != self.log_file)
+            self._indexes[segment] = (inode, index)
+            return index
+
+    def plan(self, query: EventQuery) -> list[tuple[Path, int, int]]:
+        """
+        Byte ranges to scan, in log order.
+
+        Args:
+            query: Query criteria
+
+        Returns:
+            [(segment, start, end), ...], each range whole lines
+        """
+        plan: list[tuple[Path, int, int]] = []
+        for segment in self.segments():
+            try:
+                index = self.index(segment)
+            except FileNotFoundError:
+                continue  # Deleted by log cleanup
+            plan.extend((segment, start, end) for start, end in index.ranges(query))
+        return plan
+
+    def query(self, query: Optional[EventQuery] = None, **criteria: Any) -> Iterator[dict]:
+        """
+        Stream matching events in log order.
+
+        Args:
+            query: Query criteria (or pass EventQuery fields as keywords)
+
+        Yields:
+            Parsed events (dicts as written by EventLogger)
+        """
+        query = query or EventQuery(**criteria)
+        plan = self.plan(query)
+        tokens = query.line_tokens()
+        pending: deque[Future] = deque()
+        scans = iter(plan)
+
+        with ThreadPoolExecutor(self.max_workers, thread_name_prefix="event-log-scan") as pool:
+            # Keep a bounded window of scans in flight; yield them in order
+            for segment, start, end in scans:
+                pending.append(pool.submit(_scan, segment, start, end, query, tokens))
+                if len(pending) >= 2 * self.max_workers:
+                    break
+            while pending:
+                yield from pending.popleft().result()
+                next_scan = next(scans, None)
+                if next_scan is not None:
+                    pending.append(pool.submit(_scan, *next_scan, query, tokens))
+
+    def count(self, query: Optional[EventQuery] = None, **criteria: Any) -> int:
+        """Number of matching events."""
+        return sum(1 for _ in self.query(query, **criteria))
+
+
+def query_events(log_file: Path, **criteria: Any) -> Iterator[dict]:
+    """Shortcut: EventLogQuery(log_file).query(**criteria)."""
+    return EventLogQuery(log_file).query(**criteria)
@@ -32,14 +32,17 @@ Current implementation is appropriate for single-process medical device software
 
 import json
 import logging
+import threading
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 from PyQt6.QtCore import QObject, pyqtSignal
 
+from core.event_log_index import EventLogQuery, EventQuery, SegmentIndex, index_path
 from database.db_manager import DatabaseManager
+from utils.instrumentation import instrumented
 
 logger = logging.getLogger(__name__)
 
@@ -153,6 +156,16 @@ class EventLogger(QObject):
         # Ensure log directory exists
         self.log_file.parent.mkdir(parents=True, exist_ok=True)
 
+        # Serializes file appends, rotation and index updates across threads
+        self._file_lock = threading.Lock()
+
+        # Block index of the active log file, updated as events are appended
+        try:
+            self._index = SegmentIndex.for_segment(self.log_file, save=True)
+        except Exception as e:
+            logger.error(f"Failed to load event log index: {e}")
+            self._index = SegmentIndex(self.log_file)
+
         # Perform rotation and cleanup on initialization
         if self.enable_rotation:
             self._check_and_rotate_log()
@@ -182,6 +195,7 @@ class EventLogger(QObject):
         self.current_tech_id = None
         logger.info("Event logger session cleared")
 
+    @instrumented("event_logger.log_event")
     def log_event(
         self,
         event_type: EventType,
@@ -210,10 +224,6 @@ class EventLogger(QObject):
             action_taken: Optional action taken in response
             details: Optional additional details (will be JSON-encoded)
         """
-        # Check and rotate log file if needed (before writing)
-        if self.enable_rotation:
-            self._check_and_rotate_log()
-
         # Log to database
         try:
             self.db_manager.log_safety_event(
@@ -248,8 +258,15 @@ class EventLogger(QObject):
                 "action_taken": action_taken,
                 "details": details,
             }
-            with open(self.log_file, "a", encoding="utf-8") as f:
-                f.write(json.dumps(event_data) + "\n")
+            line = (json.dumps(event_data) + "\n").encode("utf-8")
+            with self._file_lock:
+                # Check and rotate log file if needed (before writing)
+                if self.enable_rotation:
+                    self._check_and_rotate_log()
+                with open(self.log_file, "ab") as f:
+                    offset = f.tell()
+                    f.write(line)
+                self._index_event(offset, offset + len(line), event_data)
         except Exception as e:
             logger.error(f"Failed to log event to file: {e}")
 
@@ -394,8 +411,50 @@ class EventLogger(QObject):
             details=details,
         )
 
+    # Event Log Queries
+
+    def query_events(self, query: Optional[EventQuery] = None, **criteria: Any) -> Iterator[dict]:
+        """
+        Query the JSONL event log (active and rotated files) using the block indexes.
+
+        Args:
+            query: Query criteria (or pass EventQuery fields as keywords:
+                start, end, min_severity, event_types, session_ids)
+
+        Returns:
+            Iterator over matching events, oldest first
+        """
+        return EventLogQuery(self.log_file).query(query, **criteria)
+
     # Log Rotation and Cleanup Methods
 
+    def _index_event(self, offset: int, end: int, event_data: dict[str, Any]) -> None:
+        """
+        Add an appended event to the active file's index.
+
+        Saves the index sidecar each time a block fills, so readers only
+        scan the unindexed tail. Indexing never fails the log write.
+        """
+        try:
+            if offset != self._index.size:
+                # File was appended to elsewhere (or a previous update failed)
+                self._index.catch_up()
+            elif self._index.add(offset, end, event_data):
+                self._index.save()
+        except Exception as e:
+            logger.error(f"Failed to index event: {e}")
+
+    def _rotate_index(self, rotated_path: Path) -> None:
+        """Complete the index of a rotated file and start one for the new file."""
+        try:
+            self._index.segment = rotated_path
+            self._index.catch_up()
+            self._index.save()
+            index_path(self.log_file).unlink(missing_ok=True)
+        except Exception as e:
+            logger.error(f"Failed to save index for rotated log {rotated_path.name}: {e}")
+        self._index = SegmentIndex(self.log_file)
+
     def _check_and_rotate_log(self) -> None:
         """
         Check if log file needs rotation and rotate if necessary.
@@ -428,6 +487,7 @@ class EventLogger(QObject):
                 logger.info(
                     f"Log file rotated: {self.log_file.name} -> {rotated_name} ({size_mb:.1f}MB)"
                 )
+                self._rotate_index(rotated_path)
 
                 # Create new empty log file
                 self.log_file.touch()
@@ -484,6 +544,7 @@ class EventLogger(QObject):
                         # Delete if older than retention period
                         if file_date < cutoff_date:
                             log_path.unlink()
+                            index_path(log_path).unlink(missing_ok=True)
                             deleted_count += 1
                             age_days = (datetime.now() - file_date).days
                             logger.info(
@@ -8,11 +8,20 @@ Safety Critical: Yes
 """
 
 import asyncio
+import concurrent.futures
 import logging
 from datetime import datetime
 from enum import Enum
+from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
 
+from core.motion_trace import (
+    MotionMetrics,
+    MotionTrace,
+    analyze_motion_trace,
+    save_motion_traces,
+)
+from core.protocol_clock import ProtocolClock
 from core.protocol_line import (
     DwellParams,
     HomeParams,
@@ -29,6 +38,7 @@ logger = logging.getLogger(__name__)
 MAX_RETRIES = 3  # Maximum number of retries for hardware operations
 RETRY_DELAY = 1.0  # Delay between retries in seconds
 LINE_TIMEOUT = 120.0  # Maximum time for any single line in seconds
+MOTION_TRACE_SETTLE_TIME = 0.25  # Extra trace capture after a move to observe settling (seconds)
 
 
 class ExecutionState(Enum):
@@ -55,6 +65,7 @@ class LineBasedProtocolEngine:
         laser_controller: Optional[Any] = None,
         actuator_controller: Optional[Any] = None,
         safety_manager: Optional[Any] = None,
+        clock: Optional[ProtocolClock] = None,
     ) -> None:
         """
         Initialize line-based protocol engine.
@@ -63,10 +74,13 @@ class LineBasedProtocolEngine:
             laser_controller: Laser hardware controller (optional for testing)
             actuator_controller: Actuator hardware controller (optional for testing)
             safety_manager: Safety system manager (optional for testing)
+            clock: Clock for log timestamps (default: wall clock). Pass a
+                VirtualClock and run with run_in_virtual_time() for dry runs.
         """
         self.laser = laser_controller
         self.actuator = actuator_controller
         self.safety_manager = safety_manager
+        self.clock = clock or ProtocolClock()
 
         # SAFETY-CRITICAL: Connect to real-time safety monitoring
         # If laser enable permission is revoked during execution, stop immediately
@@ -96,6 +110,13 @@ class LineBasedProtocolEngine:
         # Current actuator position tracking (for duration estimation)
         self.current_position_mm: float = 0.0
 
+        # Motion trace capture (per-line tracking error, settling time, overshoot).
+        # Opt-in: traced lines wait MOTION_TRACE_SETTLE_TIME longer, which changes
+        # protocol timing (see hardware.actuator.motion_trace_capture)
+        self.capture_motion_traces: bool = False
+        self.motion_traces: List[MotionTrace] = []
+        self.motion_metrics: List[MotionMetrics] = []
+
     async def execute_protocol(
         self, protocol: LineBasedProtocol, record: bool = False, stop_on_error: bool = True
     ) -> tuple[bool, str]:
@@ -126,7 +147,9 @@ class LineBasedProtocolEngine:
         # Initialize execution
         self.current_protocol = protocol
         self.execution_log = []
-        self.start_time = datetime.now()
+        self.motion_traces = []
+        self.motion_metrics = []
+        self.start_time = self.clock.now()
         self.end_time = None
         self._stop_requested = False
         self.stop_on_error = stop_on_error
@@ -155,7 +178,7 @@ class LineBasedProtocolEngine:
                     break
 
             # Execution completed
-            self.end_time = datetime.now()
+            self.end_time = self.clock.now()
 
             # Determine final state based on failures
             if failed_lines and stop_on_error:
@@ -183,7 +206,7 @@ class LineBasedProtocolEngine:
                 return True, "Protocol completed successfully"
 
         except Exception as e:
-            self.end_time = datetime.now()
+            self.end_time = self.clock.now()
             self._set_state(ExecutionState.ERROR)
             error_msg = f"Protocol execution error: {str(e)}"
             logger.error(error_msg)
@@ -255,7 +278,7 @@ class LineBasedProtocolEngine:
             {
                 "line_number": line.line_number,
                 "loop_iteration": loop_iteration,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": self.clock.now().isoformat(),
                 "event": "start",
             }
         )
@@ -269,7 +292,7 @@ class LineBasedProtocolEngine:
                 {
                     "line_number": line.line_number,
                     "loop_iteration": loop_iteration,
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": self.clock.now().isoformat(),
                     "event": "complete",
                 }
             )
@@ -285,7 +308,7 @@ class LineBasedProtocolEngine:
                 {
                     "line_number": line.line_number,
                     "loop_iteration": loop_iteration,
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": self.clock.now().isoformat(),
                     "event": "timeout",
                     "error": error_msg,
                 }
@@ -298,7 +321,7 @@ class LineBasedProtocolEngine:
                 {
                     "line_number": line.line_number,
                     "loop_iteration": loop_iteration,
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": self.clock.now().isoformat(),
                     "event": "error",
                     "error": str(e),
                 }
@@ -392,19 +415,30 @@ class LineBasedProtocolEngine:
                 raise RuntimeError(f"Failed to set actuator speed to {speed_um_per_s}µm/s")
 
             # Move to position
-            success = self.actuator.set_position(target_um)
-            if not success:
-                raise RuntimeError(f"Failed to move actuator to {target_um}µm")
-
-            # Calculate movement time for async sleep
-            distance_mm = abs(absolute_target_mm - self.current_position_mm)
-            move_time = distance_mm / speed_mm_per_s if speed_mm_per_s > 0 else 1.0
-
-            # Update current position
-            self.current_position_mm = absolute_target_mm
-
-            # Wait for movement to complete
-            await asyncio.sleep(move_time)
+            start_um = self.current_position_mm * 1000
+            tracing = self._start_motion_trace()
+            try:
+                success = self.actuator.set_position(target_um)
+                if not success:
+                    raise RuntimeError(f"Failed to move actuator to {target_um}µm")
+
+                # Calculate movement time for async sleep
+                distance_mm = abs(absolute_target_mm - self.current_position_mm)
+                move_time = distance_mm / speed_mm_per_s if speed_mm_per_s > 0 else 1.0
+
+                # Update current position
+                self.current_position_mm = absolute_target_mm
+
+                # Wait for movement to complete
+                await asyncio.sleep(move_time)
+                await self._wait_for_actuator_motion()
+                if tracing:
+                    await asyncio.sleep(MOTION_TRACE_SETTLE_TIME)
+                    tracing = False
+                    self._finish_motion_trace(start_um, target_um, speed_um_per_s)
+            finally:
+                # Failed, timed out or cancelled (stop/E-stop) moves end the trace too
+                self._discard_motion_trace(tracing)
         else:
             # Simulate movement when no hardware
             distance_mm = abs(absolute_target_mm - self.current_position_mm)
@@ -428,19 +462,29 @@ class LineBasedProtocolEngine:
                 raise RuntimeError(f"Failed to set actuator speed to {speed_um_per_s}µm/s")
 
             # Home (move to position 0)
-            success = self.actuator.set_position(0)
-            if not success:
-                raise RuntimeError("Failed to home actuator")
-
-            # Estimate homing time
-            distance_mm = abs(self.current_position_mm)
-            home_time = distance_mm / speed_mm_per_s if speed_mm_per_s > 0 else 2.0
-
-            # Update current position
-            self.current_position_mm = 0.0
-
-            # Wait for homing to complete
-            await asyncio.sleep(home_time)
+            start_um = self.current_position_mm * 1000
+            tracing = self._start_motion_trace()
+            try:
+                success = self.actuator.set_position(0)
+                if not success:
+                    raise RuntimeError("Failed to home actuator")
+
+                # Estimate homing time
+                distance_mm = abs(self.current_position_mm)
+                home_time = distance_mm / speed_mm_per_s if speed_mm_per_s > 0 else 2.0
+
+                # Update current position
+                self.current_position_mm = 0.0
+
+                # Wait for homing to complete
+                await asyncio.sleep(home_time)
+                await self._wait_for_actuator_motion()
+                if tracing:
+                    await asyncio.sleep(MOTION_TRACE_SETTLE_TIME)
+                    tracing = False
+                    self._finish_motion_trace(start_um, 0.0, speed_um_per_s)
+            finally:
+                self._discard_motion_trace(tracing)
         else:
             # Simulate homing
             distance_mm = abs(self.current_position_mm)
@@ -448,6 +492,98 @@ class LineBasedProtocolEngine:
             self.current_position_mm = 0.0
             await asyncio.sleep(home_time)
 
+    async def _wait_for_actuator_motion(self) -> None:
+        """
+        Wait until the actuator reports the current move complete.
+
+        Controllers with non-blocking motion expose the move as motion_future
+        (resolving to a Xeryon MotionResult); controllers without it are
+        assumed to have arrived after the estimated move time.
+        """
+        future = getattr(self.actuator, "motion_future", None)
+        if not isinstance(future, concurrent.futures.Future):
+            return
+
+        result = await asyncio.wrap_future(future)
+        if not result:
+            raise RuntimeError(f"Actuator move failed: {result.message}")
+
+    def _start_motion_trace(self) -> bool:
+        """Start actuator trace capture for the current line (if supported)."""
+        if not self.capture_motion_traces or not hasattr(self.actuator, "start_motion_trace"):
+            return False
+        try:
+            return bool(self.actuator.start_motion_trace())
+        except Exception as e:
+            logger.warning(f"Motion trace capture unavailable: {e}")
+            return False
+
+    def _discard_motion_trace(self, tracing: bool) -> None:
+        """Stop trace capture without analysing it (failed or cancelled movement)."""
+        if not tracing:
+            return
+        try:
+            self.actuator.stop_motion_trace()
+        except Exception as e:
+            logger.warning(f"Failed to stop motion trace: {e}")
+
+    def _finish_motion_trace(
+        self, start_um: float, target_um: float, speed_um_per_s: float
+    ) -> None:
+        """Stop trace capture, analyse it against the planned move and log the metrics."""
+        samples = self.actuator.stop_motion_trace()
+        if samples is None:
+            logger.debug(f"No motion trace recorded for line {self.current_line_number}")
+            return
+
+        time_ms, position_um = samples
+        trace = MotionTrace(
+            line_number=self.current_line_number or 0,
+            loop_iteration=self.current_loop_iteration,
+            start_um=start_um,
+            target_um=float(target_um),
+            speed_um_per_s=float(speed_um_per_s),
+            tolerance_um=getattr(self.actuator, "position_tolerance_um", 5.0),
+            time_ms=time_ms,
+            position_um=position_um,
+        )
+        metrics = analyze_motion_trace(trace)
+        self.motion_traces.append(trace)
+        self.motion_metrics.append(metrics)
+
+        settling = (
+            f"{metrics.settling_time_ms:.0f}ms"
+            if metrics.settling_time_ms is not None
+            else "not settled"
+        )
+        logger.info(
+            f"Line {trace.line_number} motion: max tracking error "
+            f"{metrics.max_tracking_error_um:.1f}µm, settling {settling} "
+            f"(planned {metrics.planned_duration_ms:.0f}ms), "
+            f"overshoot {metrics.overshoot_um:.1f}µm"
+        )
+        self.execution_log.append(
+            {
+                "line_number": trace.line_number,
+                "loop_iteration": trace.loop_iteration,
+                "timestamp": self.clock.now().isoformat(),
+                "event": "motion_trace",
+                "metrics": metrics.to_dict(),
+            }
+        )
+
+    def save_motion_traces(self, folder: Path) -> Optional[Path]:
+        """
+        Save motion traces from the last execution to a session folder.
+
+        Args:
+            folder: Session data folder
+
+        Returns:
+            Path to the saved metrics file, or None if no traces were captured
+        """
+        return save_motion_traces(self.motion_traces, self.motion_metrics, folder)
+
     async def _execute_laser(self, laser: LaserSetParams | LaserRampParams) -> None:
         """Execute laser operation (set or ramp)."""
         if isinstance(laser, LaserSetParams):
@@ -645,5 +781,6 @@ class LineBasedProtocolEngine:
                 [log for log in self.execution_log if log["event"] == "complete"]
             ),
             "loop_iterations": self.current_loop_iteration,
+            "motion_metrics": [m.to_dict() for m in self.motion_metrics],
             "execution_log": self.execution_log,
         }
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+"""
+Module: motion_trace
+Project: TOSCA Laser Control System
+
+Purpose: Actuator motion trace capture results and analysis.
+Compares the high-rate EPOS/time trace recorded during a protocol movement
+against the planned constant-speed trajectory and reports tracking error,
+settling time and overshoot. Traces are saved with the session data so
+line speeds can be tuned and stage degradation compared across sessions.
+Safety Critical: No (diagnostics only)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MOTION_TRACE_FILENAME = "motion_traces.npz"
+MOTION_METRICS_FILENAME = "motion_metrics.json"
+
+
+@dataclass
+class MotionTrace:
+    """Position trace recorded during one protocol movement."""
+
+    line_number: int
+    loop_iteration: int
+    start_um: float
+    target_um: float
+    speed_um_per_s: float
+    tolerance_um: float
+    time_ms: np.ndarray  # Relative to the first sample
+    position_um: np.ndarray
+
+    @property
+    def planned_duration_ms(self) -> float:
+        """Duration of the planned constant-speed move."""
+        if self.speed_um_per_s <= 0:
+            return 0.0
+        return abs(self.target_um - self.start_um) / self.speed_um_per_s * 1000.0
+
+
+@dataclass
+class MotionMetrics:
+    """Tracking quality of one movement against its planned trajectory."""
+
+    line_number: int
+    loop_iteration: int
+    samples: int
+    distance_um: float
+    planned_duration_ms: float
+    trace_duration_ms: float
+    max_tracking_error_um: float
+    rms_tracking_error_um: float
+    settling_time_ms: Optional[float]  # None if never within tolerance at end of trace
+    overshoot_um: float
+    overshoot_percent: float
+    final_error_um: float
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to JSON-serializable dictionary."""
+        return asdict(self)
+
+
+def planned_trajectory(
+    time_ms: np.ndarray, start_um: float, target_um: float, speed_um_per_s: float
+) -> np.ndarray:
+    """
+    Planned position at each sample time for a constant-speed move.
+
+    Acceleration is not modelled, so tracking error includes the
+    acceleration/deceleration lag of the stage.
+
+    Args:
+        time_ms: Sample times relative to the start of the move (ms)
+        start_um: Start position (µm)
+        target_um: Target position (µm)
+        speed_um_per_s: Commanded speed (µm/s)
+
+    Returns:
+        Planned positions (µm), same shape as time_ms
+    """
+    time_ms = np.asarray(time_ms, dtype=np.float64)
+    distance_um = target_um - start_um
+    if speed_um_per_s <= 0 or distance_um == 0:
+        return np.full(time_ms.shape, float(target_um))
+
+    travelled_um = np.minimum(time_ms * speed_um_per_s / 1000.0, abs(distance_um))
+    return np.asarray(start_um + np.sign(distance_um) * travelled_um, dtype=np.float64)
+
+
+def analyze_motion_trace(trace: MotionTrace) -> MotionMetrics:
+    """
+    Compute tracking error, settling time and overshoot for a trace.
+
+    Settling time is the time from the start of the trace until the position
+    enters the tolerance band around the target and stays there for the rest
+    of the trace.
+
+    Args:
+        trace: Recorded motion trace
+
+    Returns:
+        MotionMetrics for the trace
+    """
+    time_ms = np.asarray(trace.time_ms, dtype=np.float64)
+    position_um = np.asarray(trace.position_um, dtype=np.float64)
+    distance_um = trace.target_um - trace.start_um
+
+    if position_um.size == 0:
+        return MotionMetrics(
+            line_number=trace.line_number,
+            loop_iteration=trace.loop_iteration,
+            samples=0,
+            distance_um=abs(distance_um),
+            planned_duration_ms=trace.planned_duration_ms,
+            trace_duration_ms=0.0,
+            max_tracking_error_um=0.0,
+            rms_tracking_error_um=0.0,
+            settling_time_ms=None,
+            overshoot_um=0.0,
+            overshoot_percent=0.0,
+            final_error_um=0.0,
+        )
+
+    planned_um = planned_trajectory(time_ms, trace.start_um, trace.target_um, trace.speed_um_per_s)
+    tracking_error_um = position_um - planned_um
+    target_error_um = position_um - trace.target_um
+
+    # Settled from the sample after the last one outside the tolerance band
+    outside = np.flatnonzero(np.abs(target_error_um) > trace.tolerance_um)
+    if outside.size == 0:
+        settling_time_ms: Optional[float] = float(time_ms[0])
+    elif outside[-1] == position_um.size - 1:
+        settling_time_ms = None
+    else:
+        settling_time_ms = float(time_ms[outside[-1] + 1])
+
+    # Overshoot: furthest excursion past the target in the direction of travel
+    direction = np.sign(distance_um) if distance_um != 0 else 1.0
+    overshoot_um = max(0.0, float(np.max(target_error_um * direction)))
+    overshoot_percent = overshoot_um / abs(distance_um) * 100.0 if distance_um != 0 else 0.0
+
+    return MotionMetrics(
+        line_number=trace.line_number,
+        loop_iteration=trace.loop_iteration,
+        samples=int(position_um.size),
+        distance_um=abs(distance_um),
+        planned_duration_ms=trace.planned_duration_ms,
+        trace_duration_ms=float(time_ms[-1] - time_ms[0]),
+        max_tracking_error_um=float(np.max(np.abs(tracking_error_um))),
+        rms_tracking_error_um=float(np.sqrt(np.mean(tracking_error_um**2))),
+        settling_time_ms=settling_time_ms,
+        overshoot_um=overshoot_um,
+        overshoot_percent=overshoot_percent,
+        final_error_um=float(target_error_um[-1]),
+    )
+
+
+def save_motion_traces(
+    traces: Sequence[MotionTrace], metrics: Sequence[MotionMetrics], folder: Path
+) -> Optional[Path]:
+    """
+    Save motion traces (npz) and their metrics (json) to a session folder.
+
+    Array names in the npz file are "line{N}_loop{M}_time_ms" and
+    "line{N}_loop{M}_position_um".
+
+    Args:
+        traces: Recorded traces
+        metrics: Metrics for each trace
+        folder: Session data folder
+
+    Returns:
+        Path to the metrics file, or None if there was nothing to save
+    """
+    if not traces:
+        return None
+
+    folder = Path(folder)
+    folder.mkdir(parents=True, exist_ok=True)
+
+    arrays: dict[str, np.ndarray] = {}
+    for trace in traces:
+        prefix = f"line{trace.line_number}_loop{trace.loop_iteration}"
+        arrays[f"{prefix}_time_ms"] = np.asarray(trace.time_ms)
+        arrays[f"{prefix}_position_um"] = np.asarray(trace.position_um)
+    np.savez_compressed(folder / MOTION_TRACE_FILENAME, **arrays)  # type: ignore[arg-type]
+
+    metrics_path = folder / MOTION_METRICS_FILENAME
+    with open(metrics_path, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "traces": [
+                    {
+                        "line_number": trace.line_number,
+                        "loop_iteration": trace.loop_iteration,
+                        "start_um": trace.start_um,
+                        "target_um": trace.target_um,
+                        "speed_um_per_s": trace.speed_um_per_s,
+                        "tolerance_um": trace.tolerance_um,
+                    }
+                    for trace in traces
+                ],
+                "metrics": [m.to_dict() for m in metrics],
+            },
+            f,
+            indent=2,
+        )
+
+    logger.info(f"Saved {len(traces)} motion traces to {folder}")
+    return metrics_path
@@ -0,0 +1,288 @@
+# -*- coding: utf-8 -*-
+"""
+Module: protocol_dry_run
+Project: TOSCA Laser Control System
+
+Purpose: Execute protocols against simulated hardware in virtual time.
+The unmodified protocol engines drive a simulated actuator and laser that
+record every command against the virtual clock, so a whole protocol runs
+in a fraction of a second and reports its timing, delivered laser energy
+and any position/speed/power limit violations reached during execution
+(e.g. relative moves accumulating past the travel range).
+Safety Critical: No (never touches hardware)
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any, Optional, Union
+
+from core.line_protocol_engine import LineBasedProtocolEngine
+from core.protocol import Protocol
+from core.protocol_clock import VirtualClock, run_in_virtual_time
+from core.protocol_engine import ProtocolEngine
+from core.protocol_line import LineBasedProtocol
+
+logger = logging.getLogger(__name__)
+
+# Engines convert power to drive current as 1 W = 1000 mA (placeholder calibration)
+MA_PER_WATT = 1000.0
+
+
+@dataclass
+class DryRunLimits:
+    """Limits checked while the protocol runs (µm, µm/s, W)."""
+
+    min_position_um: float
+    max_position_um: float
+    max_speed_um_per_s: float
+    max_power_watts: float
+
+    @staticmethod
+    def from_protocol(protocol: Union[LineBasedProtocol, Protocol]) -> "DryRunLimits":
+        """Build limits from a protocol's own safety limits."""
+        limits = protocol.safety_limits
+        if isinstance(protocol, LineBasedProtocol):
+            return DryRunLimits(
+                min_position_um=limits.min_actuator_position_mm * 1000.0,
+                max_position_um=limits.max_actuator_position_mm * 1000.0,
+                max_speed_um_per_s=limits.max_actuator_speed_mm_per_s * 1000.0,
+                max_power_watts=limits.max_power_watts,
+            )
+        return DryRunLimits(
+            min_position_um=limits.min_actuator_position_um,
+            max_position_um=limits.max_actuator_position_um,
+            max_speed_um_per_s=limits.max_actuator_speed_um_per_sec,
+            max_power_watts=limits.max_power_watts,
+        )
+
+
+@dataclass
+class LimitViolation:
+    """A command that exceeded a limit during the dry run."""
+
+    time_s: float  # Virtual time since start of execution
+    line_number: Optional[int]
+    kind: str  # "position", "speed" or "power"
+    value: float
+    limit: float
+    message: str
+
+
+class SimulatedActuator:
+    """Actuator stand-in recording commands against the engine clock."""
+
+    def __init__(self, clock: VirtualClock, limits: DryRunLimits, engine: Any = None) -> None:
+        self.clock = clock
+        self.limits = limits
+        self.engine = engine  # For the current line number in violations
+        self.is_connected = True
+        self.position_um = 0.0
+        self.speed_um_per_s = 0.0
+        self.commands: list[tuple[float, str, float]] = []  # (time_s, command, value)
+        self.violations: list[LimitViolation] = []
+
+    def set_speed(self, speed_um_per_s: float) -> bool:
+        """Record speed command."""
+        self.speed_um_per_s = float(speed_um_per_s)
+        self.commands.append((self.clock.time(), "speed", self.speed_um_per_s))
+        if self.speed_um_per_s > self.limits.max_speed_um_per_s:
+            self._violation(
+                "speed", self.speed_um_per_s, self.limits.max_speed_um_per_s, "µm/s above limit"
+            )
+        return True
+
+    def set_position(self, position_um: float) -> bool:
+        """Record move command; the move itself is timed by the engine."""
+        self.position_um = float(position_um)
+        self.commands.append((self.clock.time(), "position", self.position_um))
+        if self.position_um > self.limits.max_position_um:
+            self._violation(
+                "position", self.position_um, self.limits.max_position_um, "µm above maximum"
+            )
+        elif self.position_um < self.limits.min_position_um:
+            self._violation(
+                "position", self.position_um, self.limits.min_position_um, "µm below minimum"
+            )
+        return True
+
+    def _violation(self, kind: str, value: float, limit: float, text: str) -> None:
+        line_number = getattr(self.engine, "current_line_number", None)
+        message = f"{kind.capitalize()} {value:.1f}{text} {limit:.1f}"
+        self.violations.append(
+            LimitViolation(self.clock.time(), line_number, kind, value, limit, message)
+        )
+
+
+class SimulatedLaser:
+    """Laser stand-in integrating commanded power over virtual time."""
+
+    def __init__(self, clock: VirtualClock, limits: DryRunLimits, engine: Any = None) -> None:
+        self.clock = clock
+        self.limits = limits
+        self.engine = engine
+        self.is_connected = True
+        self.output_enabled = True
+        self.power_watts = 0.0
+        self.peak_power_watts = 0.0
+        self.energy_joules = 0.0
+        self._last_change_s = clock.time()
+        self.violations: list[LimitViolation] = []
+
+    def set_current(self, current_ma: float) -> bool:
+        """Record drive current change (converted back to watts)."""
+        self._accumulate()
+        self.power_watts = float(current_ma) / MA_PER_WATT
+        self.peak_power_watts = max(self.peak_power_watts, self.power_watts)
+        if self.power_watts > self.limits.max_power_watts:
+            self.violations.append(
+                LimitViolation(
+                    self.clock.time(),
+                    getattr(self.engine, "current_line_number", None),
+                    "power",
+                    self.power_watts,
+                    self.limits.max_power_watts,
+                    f"Power {self.power_watts:.2f}W above limit "
+                    f"{self.limits.max_power_watts:.2f}W",
+                )
+            )
+        return True
+
+    def set_output(self, enabled: bool) -> bool:
+        """Record output enable/disable."""
+        self._accumulate()
+        self.output_enabled = bool(enabled)
+        return True
+
+    def finish(self) -> None:
+        """Account energy up to the current time (end of execution)."""
+        self._accumulate()
+
+    def _accumulate(self) -> None:
+        now = self.clock.time()
+        if self.output_enabled:
+            self.energy_joules += self.power_watts * (now - self._last_change_s)
+        self._last_change_s = now
+
+
+@dataclass
+class DryRunReport:
+    """Result of a virtual-time protocol run."""
+
+    protocol_name: str
+    success: bool
+    message: str
+    duration_s: float  # Virtual execution time
+    planned_duration_s: Optional[float]  # From the protocol's own estimate, if available
+    real_time_s: float  # Wall time the dry run took
+    energy_joules: float
+    planned_energy_joules: Optional[float]
+    peak_power_watts: float
+    line_durations_s: dict[str, float] = field(default_factory=dict)  # "loop.line" -> seconds
+    violations: list[LimitViolation] = field(default_factory=list)
+
+    @property
+    def passed(self) -> bool:
+        """True if execution succeeded without limit violations."""
+        return self.success and not self.violations
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to JSON-serializable dictionary."""
+        data = asdict(self)
+        data["passed"] = self.passed
+        return data
+
+    def summary(self) -> str:
+        """Human-readable report."""
+        lines = [
+            f"Dry run: {self.protocol_name} - {'PASS' if self.passed else 'FAIL'}",
+            f"  {self.message}",
+            f"  Duration: {self.duration_s:.1f}s"
+            + (
+                f" (planned {self.planned_duration_s:.1f}s)"
+                if self.planned_duration_s is not None
+                else ""
+            ),
+            f"  Laser energy: {self.energy_joules:.2f}J, peak power {self.peak_power_watts:.2f}W",
+            f"  Simulated in {self.real_time_s * 1000:.0f}ms",
+        ]
+        if self.violations:
+            lines.append(f"  Limit violations ({len(self.violations)}):")
+            for violation in self.violations:
+                where = f"line {violation.line_number}" if violation.line_number else "action"
+                lines.append(f"    t={violation.time_s:.2f}s {where}: {violation.message}")
+        return "\n".join(lines)
+
+
+def dry_run_protocol(
+    protocol: Union[LineBasedProtocol, Protocol], limits: Optional[DryRunLimits] = None
+) -> DryRunReport:
+    """
+    Execute a protocol against simulated hardware in virtual time.
+
+    Must not be called from a thread with a running asyncio loop.
+
+    Args:
+        protocol: Line-based or action-based protocol
+        limits: Limits to check (default: the protocol's safety limits)
+
+    Returns:
+        DryRunReport with timing, energy and limit violations
+    """
+    limits = limits or DryRunLimits.from_protocol(protocol)
+    clock = VirtualClock()
+
+    engine: Union[LineBasedProtocolEngine, ProtocolEngine]
+    if isinstance(protocol, LineBasedProtocol):
+        engine = LineBasedProtocolEngine(clock=clock)
+        planned_duration: Optional[float] = protocol.calculate_total_duration()
+        planned_energy: Optional[float] = protocol.calculate_total_energy()
+    else:
+        engine = ProtocolEngine(clock=clock)
+        planned_duration = None
+        planned_energy = None
+
+    actuator = SimulatedActuator(clock, limits, engine)
+    laser = SimulatedLaser(clock, limits, engine)
+    engine.actuator = actuator
+    engine.laser = laser
+
+    real_start = time.perf_counter()
+    success, message = run_in_virtual_time(engine.execute_protocol(protocol), clock)
+    laser.finish()
+
+    violations = sorted(actuator.violations + laser.violations, key=lambda v: v.time_s)
+    report = DryRunReport(
+        protocol_name=protocol.protocol_name,
+        success=success,
+        message=message,
+        duration_s=clock.time(),
+        planned_duration_s=planned_duration,
+        real_time_s=time.perf_counter() - real_start,
+        energy_joules=laser.energy_joules,
+        planned_energy_joules=planned_energy,
+        peak_power_watts=laser.peak_power_watts,
+        line_durations_s=_line_durations(engine.execution_log),
+        violations=violations,
+    )
+    logger.info(report.summary())
+    return report
+
+
+def _line_durations(execution_log: list[dict[str, Any]]) -> dict[str, float]:
+    """Per-line durations ("loop.line" -> seconds) from start/complete log entries."""
+    starts: dict[str, datetime] = {}
+    durations: dict[str, float] = {}
+    for entry in execution_log:
+        if "line_number" not in entry:
+            continue
+        key = f"{entry.get('loop_iteration', 1)}.{entry['line_number']}"
+        timestamp = datetime.fromisoformat(entry["timestamp"])
+        if entry["event"] == "start":
+            starts[key] = timestamp
+        elif entry["event"] == "complete" and key in starts:
+            durations[key] = (timestamp - starts[key]).total_seconds()
+    return durations
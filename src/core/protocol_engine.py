@@ -19,6 +19,7 @@ from core.protocol import (
     SetLaserPowerParams,
     WaitParams,
 )
+from core.protocol_clock import ProtocolClock
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +52,7 @@ class ProtocolEngine:
         laser_controller: Optional[Any] = None,
         actuator_controller: Optional[Any] = None,
         safety_manager: Optional[Any] = None,
+        clock: Optional[ProtocolClock] = None,
     ) -> None:
         """
         Initialize protocol engine.
@@ -59,10 +61,13 @@ class ProtocolEngine:
             laser_controller: Laser hardware controller (optional for testing)
             actuator_controller: Actuator hardware controller (optional for testing)
             safety_manager: Safety system manager (optional for testing)
+            clock: Clock for log timestamps (default: wall clock). Pass a
+                VirtualClock and run with run_in_virtual_time() for dry runs.
         """
         self.laser = laser_controller
         self.actuator = actuator_controller
         self.safety_manager = safety_manager
+        self.clock = clock or ProtocolClock()
 
         # SAFETY-CRITICAL: Connect to real-time safety monitoring
         # If laser enable permission is revoked during execution, stop immediately
@@ -118,7 +123,7 @@ class ProtocolEngine:
         # Initialize execution
         self.current_protocol = protocol
         self.execution_log = []
-        self.start_time = datetime.now()
+        self.start_time = self.clock.now()
         self.end_time = None
         self._stop_requested = False
         self._set_state(ExecutionState.RUNNING)
@@ -132,7 +137,7 @@ class ProtocolEngine:
             failed_actions = await self._execute_actions_with_recovery(protocol.actions)
 
             # Execution completed
-            self.end_time = datetime.now()
+            self.end_time = self.clock.now()
 
             # Determine final state based on failures
             if failed_actions and stop_on_error:
@@ -160,7 +165,7 @@ class ProtocolEngine:
                 return True, "Protocol completed successfully"
 
         except Exception as e:
-            self.end_time = datetime.now()
+            self.end_time = self.clock.now()
             self._set_state(ExecutionState.ERROR)
             error_msg = f"Protocol execution error: {str(e)}"
             logger.error(error_msg)
@@ -217,7 +222,7 @@ class ProtocolEngine:
             {
                 "action_id": action.action_id,
                 "action_type": action.action_type.value,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": self.clock.now().isoformat(),
                 "event": "start",
             }
         )
@@ -231,7 +236,7 @@ class ProtocolEngine:
                 {
                     "action_id": action.action_id,
                     "action_type": action.action_type.value,
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": self.clock.now().isoformat(),
                     "event": "complete",
                 }
             )
@@ -247,7 +252,7 @@ class ProtocolEngine:
                 {
                     "action_id": action.action_id,
                     "action_type": action.action_type.value,
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": self.clock.now().isoformat(),
                     "event": "timeout",
                     "error": error_msg,
                 }
@@ -260,7 +265,7 @@ class ProtocolEngine:
                 {
                     "action_id": action.action_id,
                     "action_type": action.action_type.value,
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": self.clock.now().isoformat(),
                     "event": "error",
                     "error": str(e),
                 }
@@ -3,13 +3,29 @@
 Safety system manager for TOSCA laser control.
 
 Coordinates all safety interlocks and enforces laser enable/disable.
+
+Interlock inputs are timestamped when observed; every evaluation records the
+input-to-decision latency against a budget, and laser permission changes are
+written to the event log (on a background thread, off the decision path)
+together with the latency that produced them.
 """
 
 import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from enum import Enum
+from typing import Any, Optional
 
 from PyQt6.QtCore import QObject, pyqtSignal
 
+from utils import instrumentation
+from utils.latency_histogram import LatencyHistogram
+from utils.signal_outbox import SignalOutbox
+from utils.state_snapshot import SnapshotField, publish
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,6 +39,38 @@ class SafetyState(Enum):
     EMERGENCY_STOP = "EMERGENCY_STOP"
 
 
+@dataclass(frozen=True, slots=True)
+class SafetySnapshot:
+    """Immutable view of the safety manager state (see utils.state_snapshot)."""
+
+    version: int = 0
+    state: SafetyState = SafetyState.UNSAFE
+    emergency_stop_active: bool = False
+    gpio_interlock_ok: bool = False
+    session_valid: bool = False
+    power_limit_ok: bool = True
+    laser_enable_permitted: bool = False
+    developer_mode_bypass_enabled: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class InterlockDecision:
+    """A safety transition and the input that caused it."""
+
+    input_name: str  # gpio_interlock, session_valid, power_limit, emergency_stop, ...
+    input_value: Optional[bool]
+    input_timestamp: float  # time.monotonic() when the input was observed
+    decided_at: float  # time.monotonic() when the new state was published
+    previous_state: SafetyState
+    state: SafetyState
+    laser_enable_permitted: bool
+
+    @property
+    def latency_ms(self) -> float:
+        """Input-to-decision latency in milliseconds."""
+        return (self.decided_at - self.input_timestamp) * 1000.0
+
+
 class SafetyManager(QObject):
     """
     Central safety manager for TOSCA system.
@@ -33,8 +81,31 @@ class SafetyManager(QObject):
     - Software safety checks
 
     Enforces laser enable/disable based on safety state.
+
+    State is published as an immutable SafetySnapshot: the attributes below
+    read from and write to the current snapshot, so readers on any thread
+    get a consistent view without locking.
+
+    Inputs are thread-safe: the GPIO interlock can be delivered straight
+    from the GPIO polling thread (high-priority path) so the decision does
+    not wait behind the GUI event loop. Evaluation is serialized by one
+    re-entrant lock; signals are queued under it and emitted, in evaluation
+    order, after it is released, so no receiver runs with the lock held.
     """
 
+    DEFAULT_LATENCY_BUDGET_MS = 50.0
+    DECISION_HISTORY = 100
+
+    # Published state (stored in the current SafetySnapshot)
+    _snapshot = SafetySnapshot()
+    state = SnapshotField()
+    emergency_stop_active = SnapshotField()
+    gpio_interlock_ok = SnapshotField()
+    session_valid = SnapshotField()
+    power_limit_ok = SnapshotField()
+    laser_enable_permitted = SnapshotField()
+    developer_mode_bypass_enabled = SnapshotField()
+
     # Signals
     safety_state_changed = pyqtSignal(SafetyState)  # Overall safety state
     laser_enable_changed = pyqtSignal(bool)  # Laser enable permission
@@ -42,26 +113,50 @@ class SafetyManager(QObject):
     developer_mode_changed = pyqtSignal(bool)  # Developer mode bypass status
     interlock_status_changed = pyqtSignal()  # Emitted when any interlock status changes
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        event_logger: Optional[Any] = None,
+        latency_budget_ms: float = DEFAULT_LATENCY_BUDGET_MS,
+    ) -> None:
+        """
+        Initialize safety manager.
+
+        Args:
+            event_logger: Optional EventLogger for laser permission transitions
+            latency_budget_ms: Input-to-decision latency budget (overruns are logged)
+        """
         super().__init__()
+        self.event_logger = event_logger
 
-        # Safety state
-        self.state = SafetyState.UNSAFE
-        self.emergency_stop_active = False
+        # Safety state, interlock status and laser enable permission start UNSAFE;
+        # developer mode bypass (CRITICAL: for calibration/testing ONLY) starts off
+        self._snapshot = SafetySnapshot()
 
-        # Interlock status
-        self.gpio_interlock_ok = False
-        self.session_valid = False
-        self.power_limit_ok = True
+        # Serializes input -> evaluation (inputs may arrive on any thread)
+        self._evaluation_lock = threading.RLock()
 
-        # Laser enable permission
-        self.laser_enable_permitted = False
+        # Signals queued during evaluation, emitted in order once the lock is released
+        self._outbox = SignalOutbox()
 
-        # Developer mode bypass (CRITICAL: For calibration/testing ONLY)
-        self.developer_mode_bypass_enabled = False
+        # Input-to-decision latency (every evaluation) and recent transitions
+        self.latency_budget_ms = latency_budget_ms
+        self.decision_latency = LatencyHistogram()
+        self.recent_decisions: deque[InterlockDecision] = deque(maxlen=self.DECISION_HISTORY)
+        self.budget_overruns = 0
+        self._stats_lock = threading.Lock()
+
+        # Event log writes (database + file I/O) happen on this thread, not the caller's
+        self._decision_log = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="safety-decision-log"
+        )
 
         logger.info("Safety manager initialized")
 
+    @property
+    def snapshot(self) -> SafetySnapshot:
+        """Current immutable safety state (lock-free; compare versions to detect change)."""
+        return self._snapshot
+
     def set_developer_mode_bypass(self, enabled: bool) -> None:
         """
         Enable/disable developer mode safety bypass.
@@ -80,56 +175,81 @@ class SafetyManager(QObject):
         else:
             logger.info("Developer mode safety bypass disabled")
 
-        self.developer_mode_bypass_enabled = enabled
-        self.developer_mode_changed.emit(enabled)
+        timestamp = time.monotonic()
+        with self._evaluation_lock:
+            self.developer_mode_bypass_enabled = enabled
+            self._outbox.queue(self.developer_mode_changed, enabled)
 
-        # Force safety state update
-        self._update_safety_state()
+            # Force safety state update
+            decision = self._update_safety_state("developer_mode_bypass", enabled, timestamp)
+        self._outbox.flush()
+        self._log_decision(decision)
 
-    def set_gpio_interlock_status(self, ok: bool) -> None:
+    def set_gpio_interlock_status(self, ok: bool, timestamp: Optional[float] = None) -> None:
         """
         Update GPIO interlock status.
 
+        Thread-safe; connect GPIOController.interlock_input with a direct
+        connection to evaluate on the GPIO polling thread.
+
         Args:
             ok: True if GPIO interlocks satisfied (motor ON + vibration detected)
+            timestamp: time.monotonic() when the input was observed (default: now)
         """
-        if ok != self.gpio_interlock_ok:
+        timestamp = time.monotonic() if timestamp is None else timestamp
+        with self._evaluation_lock:
+            if ok == self.gpio_interlock_ok:
+                return
             self.gpio_interlock_ok = ok
             status = "SATISFIED" if ok else "NOT SATISFIED"
             logger.info(f"GPIO interlock status: {status}")
-            self.safety_event.emit("interlock_gpio", status)
-            self.interlock_status_changed.emit()  # Notify UI of interlock change
-            self._update_safety_state()
+            self._outbox.queue(self.safety_event, "interlock_gpio", status)
+            self._outbox.queue(self.interlock_status_changed)  # Notify UI of interlock change
+            decision = self._update_safety_state("gpio_interlock", ok, timestamp)
+        self._outbox.flush()
+        self._log_decision(decision)
 
-    def set_session_valid(self, valid: bool) -> None:
+    def set_session_valid(self, valid: bool, timestamp: Optional[float] = None) -> None:
         """
         Update session validity status.
 
         Args:
             valid: True if valid session active
+            timestamp: time.monotonic() when the input was observed (default: now)
         """
-        if valid != self.session_valid:
+        timestamp = time.monotonic() if timestamp is None else timestamp
+        with self._evaluation_lock:
+            if valid == self.session_valid:
+                return
             self.session_valid = valid
             status = "VALID" if valid else "INVALID"
             logger.info(f"Session status: {status}")
-            self.safety_event.emit("session", status)
-            self.interlock_status_changed.emit()  # Notify UI of interlock change
-            self._update_safety_state()
+            self._outbox.queue(self.safety_event, "session", status)
+            self._outbox.queue(self.interlock_status_changed)  # Notify UI of interlock change
+            decision = self._update_safety_state("session_valid", valid, timestamp)
+        self._outbox.flush()
+        self._log_decision(decision)
 
-    def set_power_limit_ok(self, ok: bool) -> None:
+    def set_power_limit_ok(self, ok: bool, timestamp: Optional[float] = None) -> None:
         """
         Update power limit status.
 
         Args:
             ok: True if power within limits
+            timestamp: time.monotonic() when the input was observed (default: now)
         """
-        if ok != self.power_limit_ok:
+        timestamp = time.monotonic() if timestamp is None else timestamp
+        with self._evaluation_lock:
+            if ok == self.power_limit_ok:
+                return
             self.power_limit_ok = ok
             status = "OK" if ok else "EXCEEDED"
             logger.warning(f"Power limit status: {status}")
-            self.safety_event.emit("power_limit", status)
-            self.interlock_status_changed.emit()  # Notify UI of interlock change
-            self._update_safety_state()
+            self._outbox.queue(self.safety_event, "power_limit", status)
+            self._outbox.queue(self.interlock_status_changed)  # Notify UI of interlock change
+            decision = self._update_safety_state("power_limit", ok, timestamp)
+        self._outbox.flush()
+        self._log_decision(decision)
 
     def arm_system(self) -> bool:
         """
@@ -143,18 +263,20 @@ class SafetyManager(QObject):
         Returns:
             True if system successfully armed, False otherwise
         """
-        if self.state != SafetyState.SAFE:
-            logger.warning(f"Cannot arm system from state: {self.state.value}")
-            return False
-
-        if not (self.gpio_interlock_ok and self.session_valid and self.power_limit_ok):
-            logger.warning("Cannot arm system: not all interlocks satisfied")
-            return False
-
-        self.state = SafetyState.ARMED
-        self.safety_state_changed.emit(self.state)
-        self.safety_event.emit("state_change", "ARMED")
-        logger.info("System armed - ready for treatment")
+        with self._evaluation_lock:
+            if self.state != SafetyState.SAFE:
+                logger.warning(f"Cannot arm system from state: {self.state.value}")
+                return False
+
+            if not (self.gpio_interlock_ok and self.session_valid and self.power_limit_ok):
+                logger.warning("Cannot arm system: not all interlocks satisfied")
+                return False
+
+            self.state = SafetyState.ARMED
+            self._outbox.queue(self.safety_state_changed, self.state)
+            self._outbox.queue(self.safety_event, "state_change", "ARMED")
+            logger.info("System armed - ready for treatment")
+        self._outbox.flush()
         return True
 
     def start_treatment(self) -> bool:
@@ -166,14 +288,16 @@ class SafetyManager(QObject):
         Returns:
             True if treatment started successfully, False otherwise
         """
-        if self.state != SafetyState.ARMED:
-            logger.warning(f"Cannot start treatment from state: {self.state.value}")
-            return False
-
-        self.state = SafetyState.TREATING
-        self.safety_state_changed.emit(self.state)
-        self.safety_event.emit("state_change", "TREATING")
-        logger.info("Treatment started")
+        with self._evaluation_lock:
+            if self.state != SafetyState.ARMED:
+                logger.warning(f"Cannot start treatment from state: {self.state.value}")
+                return False
+
+            self.state = SafetyState.TREATING
+            self._outbox.queue(self.safety_state_changed, self.state)
+            self._outbox.queue(self.safety_event, "state_change", "TREATING")
+            logger.info("Treatment started")
+        self._outbox.flush()
         return True
 
     def stop_treatment(self) -> bool:
@@ -185,14 +309,16 @@ class SafetyManager(QObject):
         Returns:
             True if treatment stopped successfully, False otherwise
         """
-        if self.state != SafetyState.TREATING:
-            logger.warning(f"Cannot stop treatment from state: {self.state.value}")
-            return False
-
-        self.state = SafetyState.ARMED
-        self.safety_state_changed.emit(self.state)
-        self.safety_event.emit("state_change", "ARMED (treatment stopped)")
-        logger.info("Treatment stopped - system still armed")
+        with self._evaluation_lock:
+            if self.state != SafetyState.TREATING:
+                logger.warning(f"Cannot stop treatment from state: {self.state.value}")
+                return False
+
+            self.state = SafetyState.ARMED
+            self._outbox.queue(self.safety_state_changed, self.state)
+            self._outbox.queue(self.safety_event, "state_change", "ARMED (treatment stopped)")
+            logger.info("Treatment stopped - system still armed")
+        self._outbox.flush()
         return True
 
     def disarm_system(self) -> bool:
@@ -204,30 +330,44 @@ class SafetyManager(QObject):
         Returns:
             True if system successfully disarmed, False otherwise
         """
-        if self.state not in (SafetyState.ARMED, SafetyState.TREATING):
-            logger.warning(f"Cannot disarm system from state: {self.state.value}")
-            return False
-
-        self.state = SafetyState.SAFE
-        self.safety_state_changed.emit(self.state)
-        self.safety_event.emit("state_change", "SAFE (disarmed)")
-        logger.info("System disarmed - returned to safe state")
+        with self._evaluation_lock:
+            if self.state not in (SafetyState.ARMED, SafetyState.TREATING):
+                logger.warning(f"Cannot disarm system from state: {self.state.value}")
+                return False
+
+            self.state = SafetyState.SAFE
+            self._outbox.queue(self.safety_state_changed, self.state)
+            self._outbox.queue(self.safety_event, "state_change", "SAFE (disarmed)")
+            logger.info("System disarmed - returned to safe state")
+        self._outbox.flush()
         return True
 
-    def trigger_emergency_stop(self) -> None:
+    def trigger_emergency_stop(self, timestamp: Optional[float] = None) -> None:
         """
         Trigger emergency stop.
 
         Immediately disables laser and sets emergency stop state.
+
+        Args:
+            timestamp: time.monotonic() when the stop was requested (default: now)
         """
+        timestamp = time.monotonic() if timestamp is None else timestamp
         logger.critical("EMERGENCY STOP ACTIVATED")
-        self.emergency_stop_active = True
-        self.state = SafetyState.EMERGENCY_STOP
-        self.laser_enable_permitted = False
+        with self._evaluation_lock:
+            previous = self._snapshot
+            publish(
+                self,
+                emergency_stop_active=True,
+                state=SafetyState.EMERGENCY_STOP,
+                laser_enable_permitted=False,
+            )
+            decision = self._record_decision("emergency_stop", True, timestamp, previous)
 
-        self.safety_state_changed.emit(self.state)
-        self.laser_enable_changed.emit(False)
-        self.safety_event.emit("emergency_stop", "ACTIVATED")
+            self._outbox.queue(self.safety_state_changed, SafetyState.EMERGENCY_STOP)
+            self._outbox.queue(self.laser_enable_changed, False)
+            self._outbox.queue(self.safety_event, "emergency_stop", "ACTIVATED")
+        self._outbox.flush()
+        self._log_decision(decision)
 
     def clear_emergency_stop(self) -> None:
         """
@@ -235,10 +375,47 @@ class SafetyManager(QObject):
 
         Returns to normal safety evaluation.
         """
+        timestamp = time.monotonic()
         logger.info("Emergency stop cleared")
-        self.emergency_stop_active = False
-        self.safety_event.emit("emergency_stop", "CLEARED")
-        self._update_safety_state()
+        with self._evaluation_lock:
+            self.emergency_stop_active = False
+            self._outbox.queue(self.safety_event, "emergency_stop", "CLEARED")
+            decision = self._update_safety_state("emergency_stop", False, timestamp)
+        self._outbox.flush()
+        self._log_decision(decision)
+
+    def get_latency_statistics(self) -> dict[str, Any]:
+        """
+        Get input-to-decision latency statistics.
+
+        Returns:
+            LatencyHistogram snapshot plus budget_ms and budget_overruns
+        """
+        stats = self.decision_latency.snapshot()
+        stats["budget_ms"] = self.latency_budget_ms
+        with self._stats_lock:
+            stats["budget_overruns"] = self.budget_overruns
+        return stats
+
+    def flush_decision_log(self, timeout: float = 5.0) -> bool:
+        """
+        Wait until decisions logged so far have been written to the event log.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if the log caught up within the timeout
+        """
+        try:
+            self._decision_log.submit(lambda: None).result(timeout)
+        except Exception:
+            return False
+        return True
+
+    def shutdown(self) -> None:
+        """Write any queued decisions to the event log and stop the logging thread."""
+        self._decision_log.shutdown(wait=True)
 
     def is_laser_enable_permitted(self) -> bool:
         """
@@ -247,13 +424,15 @@ class SafetyManager(QObject):
         Returns:
             True if all safety conditions met (or developer mode bypass active)
         """
+        snapshot = self._snapshot
+
         # DEVELOPER MODE BYPASS (early return)
-        if self.developer_mode_bypass_enabled:
+        if snapshot.developer_mode_bypass_enabled:
             logger.warning("Safety check BYPASSED (developer mode)")
             return True
 
         # Normal safety logic (unchanged)
-        return self.laser_enable_permitted
+        return snapshot.laser_enable_permitted
 
     def get_safety_status_text(self) -> str:
         """
@@ -262,18 +441,19 @@ class SafetyManager(QObject):
         Returns:
             Status text describing current safety state
         """
-        if self.state == SafetyState.EMERGENCY_STOP:
+        snapshot = self._snapshot
+        if snapshot.state == SafetyState.EMERGENCY_STOP:
             return "EMERGENCY STOP ACTIVE - LASER DISABLED"
-        elif self.state == SafetyState.SAFE:
+        elif snapshot.state == SafetyState.SAFE:
             return "ALL INTERLOCKS SATISFIED - LASER ENABLED"
         else:
             # Build detailed message about why unsafe
             reasons = []
-            if not self.gpio_interlock_ok:
+            if not snapshot.gpio_interlock_ok:
                 reasons.append("GPIO interlocks not satisfied")
-            if not self.session_valid:
+            if not snapshot.session_valid:
                 reasons.append("No valid session")
-            if not self.power_limit_ok:
+            if not snapshot.power_limit_ok:
                 reasons.append("Power limit exceeded")
 
             if reasons:
@@ -288,13 +468,14 @@ class SafetyManager(QObject):
         Returns:
             Dictionary with all interlock states
         """
+        snapshot = self._snapshot
         return {
-            "state": self.state.value,
-            "emergency_stop": self.emergency_stop_active,
-            "gpio_interlock": self.gpio_interlock_ok,
-            "session_valid": self.session_valid,
-            "power_limit_ok": self.power_limit_ok,
-            "laser_enable_permitted": self.laser_enable_permitted,
+            "state": snapshot.state.value,
+            "emergency_stop": snapshot.emergency_stop_active,
+            "gpio_interlock": snapshot.gpio_interlock_ok,
+            "session_valid": snapshot.session_valid,
+            "power_limit_ok": snapshot.power_limit_ok,
+            "laser_enable_permitted": snapshot.laser_enable_permitted,
         }
 
     def get_interlock_status(self) -> dict:
@@ -311,38 +492,56 @@ class SafetyManager(QObject):
         """
         # Use combined GPIO interlock status for all GPIO-based interlocks
         # (footpedal, smoothing, photodiode, watchdog)
+        gpio_interlock_ok = self._snapshot.gpio_interlock_ok
         return {
-            "footpedal": self.gpio_interlock_ok,
-            "smoothing": self.gpio_interlock_ok,
-            "photodiode": self.gpio_interlock_ok,
-            "watchdog": self.gpio_interlock_ok,
+            "footpedal": gpio_interlock_ok,
+            "smoothing": gpio_interlock_ok,
+            "photodiode": gpio_interlock_ok,
+            "watchdog": gpio_interlock_ok,
         }
 
-    def _update_safety_state(self) -> None:
+    def _update_safety_state(
+        self,
+        input_name: str = "reevaluate",
+        input_value: Optional[bool] = None,
+        timestamp: Optional[float] = None,
+    ) -> Optional[InterlockDecision]:
         """
         Evaluate all safety conditions and update state.
 
-        Called whenever any safety input changes.
+        Called whenever any safety input changes (with the evaluation lock held;
+        signals are queued on the outbox for the caller to flush).
 
         Note: ARMED and TREATING states require explicit transitions via
         arm_system() and start_treatment(). This method only handles
         safety violations (transitions to UNSAFE or EMERGENCY_STOP).
+
+        Args:
+            input_name: Input that triggered the evaluation
+            input_value: New value of that input
+            timestamp: time.monotonic() when the input was observed (default: now)
+
+        Returns:
+            The decision if state or laser permission changed, else None
         """
+        timestamp = time.monotonic() if timestamp is None else timestamp
+        current = self._snapshot
+
         # Emergency stop overrides everything
-        if self.emergency_stop_active:
+        if current.emergency_stop_active:
             new_state = SafetyState.EMERGENCY_STOP
             new_enable = False
         else:
             # Check all safety conditions
             all_conditions_met = (
-                self.gpio_interlock_ok and self.session_valid and self.power_limit_ok
+                current.gpio_interlock_ok and current.session_valid and current.power_limit_ok
             )
 
             if all_conditions_met:
                 # If interlocks satisfied, maintain current state
                 # (don't automatically transition to SAFE from ARMED/TREATING)
-                if self.state in (SafetyState.ARMED, SafetyState.TREATING):
-                    new_state = self.state  # Stay in ARMED or TREATING
+                if current.state in (SafetyState.ARMED, SafetyState.TREATING):
+                    new_state = current.state  # Stay in ARMED or TREATING
                     new_enable = True
                 else:
                     # From UNSAFE -> SAFE when interlocks are satisfied
@@ -353,17 +552,122 @@ class SafetyManager(QObject):
                 new_state = SafetyState.UNSAFE
                 new_enable = False
 
+        # Publish state and laser permission together (readers never see one without the other)
+        changed = publish(self, state=new_state, laser_enable_permitted=new_enable)
+        decision = self._record_decision(
+            input_name, input_value, timestamp, current, transition=changed
+        )
+        if decision is None:
+            return None
+
         # Update state if changed
-        if new_state != self.state:
-            logger.info(f"Safety state changed: {self.state.value} → {new_state.value}")
-            self.state = new_state
-            self.safety_state_changed.emit(new_state)
-            self.safety_event.emit("state_change", new_state.value)
+        if new_state != current.state:
+            logger.info(f"Safety state changed: {current.state.value} → {new_state.value}")
+            self._outbox.queue(self.safety_state_changed, new_state)
+            self._outbox.queue(self.safety_event, "state_change", new_state.value)
 
         # Update laser enable permission if changed
-        if new_enable != self.laser_enable_permitted:
-            self.laser_enable_permitted = new_enable
-            self.laser_enable_changed.emit(new_enable)
+        if new_enable != current.laser_enable_permitted:
+            self._outbox.queue(self.laser_enable_changed, new_enable)
             status = "PERMITTED" if new_enable else "DENIED"
-            logger.info(f"Laser enable: {status}")
-            self.safety_event.emit("laser_enable", status)
+            logger.info(f"Laser enable: {status} ({decision.latency_ms:.2f} ms after input)")
+            self._outbox.queue(self.safety_event, "laser_enable", status)
+
+        return decision
+
+    def _record_decision(
+        self,
+        input_name: str,
+        input_value: Optional[bool],
+        timestamp: float,
+        previous: SafetySnapshot,
+        transition: bool = True,
+    ) -> Optional[InterlockDecision]:
+        """
+        Record the input-to-decision latency of an evaluation.
+
+        Args:
+            input_name: Input that triggered the evaluation
+            input_value: New value of that input
+            timestamp: time.monotonic() when the input was observed
+            previous: Snapshot before the evaluation
+            transition: Whether the evaluation changed state or laser permission
+
+        Returns:
+            The decision for a transition, else None
+        """
+        decided_at = time.monotonic()
+        latency_ms = (decided_at - timestamp) * 1000.0
+        self.decision_latency.record(latency_ms)
+        if instrumentation.is_enabled():
+            instrumentation.record("safety.interlock_decision", latency_ms)
+
+        if latency_ms > self.latency_budget_ms:
+            with self._stats_lock:
+                self.budget_overruns += 1
+            logger.warning(
+                f"Safety decision for {input_name} took {latency_ms:.1f} ms "
+                f"(budget {self.latency_budget_ms:.0f} ms)"
+            )
+
+        if not transition:
+            return None
+
+        current = self._snapshot
+        decision = InterlockDecision(
+            input_name=input_name,
+            input_value=input_value,
+            input_timestamp=timestamp,
+            decided_at=decided_at,
+            previous_state=previous.state,
+            state=current.state,
+            laser_enable_permitted=current.laser_enable_permitted,
+        )
+        self.recent_decisions.append(decision)
+        return decision
+
+    def _log_decision(self, decision: Optional[InterlockDecision]) -> None:
+        """
+        Queue a laser permission transition for the event log.
+
+        The write (database and file I/O) happens on the decision log
+        thread, so it adds nothing to the caller's decision latency.
+
+        Args:
+            decision: Decision returned by the evaluation (None: nothing to log)
+        """
+        if decision is None or self.event_logger is None:
+            return
+        try:
+            self._decision_log.submit(self._write_decision, decision)
+        except RuntimeError:
+            self._write_decision(decision)  # After shutdown()
+
+    def _write_decision(self, decision: InterlockDecision) -> None:
+        """Write a decision to the event log (decision log thread)."""
+        from core.event_logger import EventSeverity, EventType
+
+        permitted = decision.laser_enable_permitted
+        try:
+            self.event_logger.log_event(
+                event_type=(
+                    EventType.SAFETY_INTERLOCK_OK if permitted else EventType.SAFETY_INTERLOCK_FAIL
+                ),
+                description=(
+                    f"Safety state {decision.previous_state.value} -> {decision.state.value}: "
+                    f"laser {'permitted' if permitted else 'denied'} "
+                    f"({decision.input_name} input, {decision.latency_ms:.2f} ms to decision)"
+                ),
+                severity=EventSeverity.INFO if permitted else EventSeverity.WARNING,
+                system_state=decision.state.value,
+                details={
+                    "input": decision.input_name,
+                    "input_value": decision.input_value,
+                    "input_timestamp": decision.input_timestamp,
+                    "decided_at": decision.decided_at,
+                    "latency_ms": round(decision.latency_ms, 3),
+                    "latency_budget_ms": self.latency_budget_ms,
+                },
+            )
+        except Exception as e:
+            logger.error(f"Failed to log safety decision: {e}")
@@ -7,10 +7,14 @@ heartbeat stops, watchdog expires, hardware performs emergency shutdown.
 """
 
 import logging
+import threading
+import time
 from typing import Any, Optional
 
 from PyQt6.QtCore import QObject, QTimer, pyqtSignal
 
+from utils.latency_histogram import LatencyHistogram
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,15 +23,28 @@ class SafetyWatchdog(QObject):
     Software watchdog that sends heartbeat to hardware watchdog timer.
 
     Architecture:
-    - Python sends heartbeat every 500ms (QTimer)
+    - Python sends heartbeat every 500ms from a dedicated heartbeat thread
+    - Heartbeats use the SAFETY lane of the GPIO serial transport, so they are
+      sent ahead of any queued sensor polls or motor/aiming commands
     - Arduino has 1000ms timeout (AVR hardware watchdog)
-    - If GUI freezes → heartbeat stops → watchdog expires → emergency shutdown
+    - The GUI thread stamps itself alive from a 100ms liveness timer and
+      from a probe the heartbeat thread posts when a heartbeat falls due
+    - A heartbeat is only sent once the GUI has stamped after it fell due,
+      waiting at most GUI_LIVENESS_TIMEOUT_MS (hardware timeout minus
+      heartbeat interval, so the gap between heartbeats of a slow but live
+      GUI stays within the hardware timeout)
+    - If GUI freezes → no fresh stamp → heartbeat withheld → watchdog
+      expires → emergency shutdown
 
     Safety Margin:
     - Heartbeat interval: 500ms
     - Watchdog timeout: 1000ms
     - Safety margin: 500ms (50%)
     - Tolerance: 1 missed heartbeat before timeout
+    - Freeze to trip: ≤1000ms (plus heartbeat thread wake-up and send time);
+      no heartbeat is sent on liveness proved before the freeze
+    - Heartbeat send latency/jitter and worst-case margin are measured
+      (see get_statistics())
 
     Emergency Shutdown (on watchdog timeout):
     - All GPIO outputs LOW (motor OFF, lasers OFF)
@@ -41,11 +58,22 @@ class SafetyWatchdog(QObject):
         watchdog.stop()  # Stop heartbeat before shutdown
     """
 
+    HEARTBEAT_INTERVAL_MS = 500
+    HARDWARE_TIMEOUT_MS = 1000
+    LIVENESS_INTERVAL_MS = 100
+    # Longest wait for GUI liveness after a heartbeat falls due
+    GUI_LIVENESS_TIMEOUT_MS = HARDWARE_TIMEOUT_MS - HEARTBEAT_INTERVAL_MS
+
     # Signals
     watchdog_timeout_detected = pyqtSignal()  # Watchdog expired (external detection)
     heartbeat_sent = pyqtSignal()  # Heartbeat successfully sent
     heartbeat_failed = pyqtSignal(str)  # Heartbeat failed (error message)
 
+    # Internal: critical failure raised on heartbeat thread, handled on GUI thread
+    _critical_failure = pyqtSignal()
+    # Internal: posted by heartbeat thread when a heartbeat falls due (stamps GUI alive)
+    _liveness_probe = pyqtSignal()
+
     def __init__(
         self, gpio_controller: Optional[Any] = None, event_logger: Optional[Any] = None
     ) -> None:
@@ -61,18 +89,36 @@ class SafetyWatchdog(QObject):
         self.gpio_controller = gpio_controller
         self.event_logger = event_logger
 
-        # Heartbeat timer (500ms interval)
+        # GUI liveness timer: proves the Qt event loop is still running.
+        # Heartbeats are timed by their own thread, not by this timer.
+        self.liveness_timer = QTimer()
+        self.liveness_timer.setInterval(self.LIVENESS_INTERVAL_MS)
+        self.liveness_timer.timeout.connect(self._mark_gui_alive)
+        self._liveness_probe.connect(self._mark_gui_alive)  # Queued from heartbeat thread
+        self._gui_alive_at = 0.0
+        self._gui_alive = threading.Event()  # Set on every stamp (wakes heartbeat thread)
+        self._freeze_simulated = False  # simulate_freeze(): ignore liveness stamps
+
+        # Heartbeat thread (500ms interval, absolute deadlines)
         # 50% safety margin before 1000ms hardware timeout
-        self.heartbeat_timer = QTimer()
-        self.heartbeat_timer.setInterval(500)  # ms
-        self.heartbeat_timer.timeout.connect(self._send_heartbeat)
+        self._heartbeat_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._critical_failure.connect(self._handle_critical_failure)
 
-        # Tracking
+        # Tracking (written by heartbeat thread, read from GUI thread)
+        self._stats_lock = threading.Lock()
         self.heartbeat_count = 0
         self.failed_heartbeats = 0
         self.consecutive_failures = 0
+        self.skipped_gui_stalled = 0
         self.is_running = False
 
+        # Timing measurements
+        self._send_latency = LatencyHistogram()  # WDT_RESET request -> OK response
+        self._jitter = LatencyHistogram()  # Actual send time - scheduled time
+        self._success_interval = LatencyHistogram()  # Gap between successful heartbeats
+        self._last_success_at: Optional[float] = None
+
         logger.info(
             "Safety watchdog initialized (heartbeat: 500ms, "
             "hardware timeout: 1000ms, margin: 500ms)"
@@ -106,12 +152,32 @@ class SafetyWatchdog(QObject):
             )
             return False
 
-        # Start heartbeat timer
-        self.heartbeat_timer.start()
+        if self.is_running:
+            logger.debug("Watchdog already running")
+            return True
+
+        with self._stats_lock:
+            self.heartbeat_count = 0
+            self.failed_heartbeats = 0
+            self.consecutive_failures = 0
+            self.skipped_gui_stalled = 0
+            self._last_success_at = None
+        self._send_latency.reset()
+        self._jitter.reset()
+        self._success_interval.reset()
+
+        # Mark GUI alive before the first heartbeat, then keep stamping
+        self._freeze_simulated = False
+        self._mark_gui_alive()
+        self.liveness_timer.start()
+
+        # Start heartbeat thread
+        self._stop_event.clear()
         self.is_running = True
-        self.heartbeat_count = 0
-        self.failed_heartbeats = 0
-        self.consecutive_failures = 0
+        self._heartbeat_thread = threading.Thread(
+            target=self._heartbeat_loop, name="SafetyWatchdogHeartbeat", daemon=True
+        )
+        self._heartbeat_thread.start()
 
         logger.info("Safety watchdog started - heartbeat active")
 
@@ -142,7 +208,8 @@ class SafetyWatchdog(QObject):
             logger.debug("Watchdog already stopped")
             return
 
-        self.heartbeat_timer.stop()
+        self._stop_heartbeat_thread()
+        self.liveness_timer.stop()
         self.is_running = False
 
         logger.info(
@@ -166,60 +233,142 @@ class SafetyWatchdog(QObject):
             except Exception as e:
                 logger.warning(f"Failed to log watchdog stop event: {e}")
 
+    def _stop_heartbeat_thread(self) -> None:
+        """Signal the heartbeat thread to exit and wait for it."""
+        self._stop_event.set()
+        thread = self._heartbeat_thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(2.0)
+        self._heartbeat_thread = None
+
+    def _mark_gui_alive(self) -> None:
+        """Record that the GUI event loop is running (liveness timer and probe)."""
+        if self._freeze_simulated:
+            return
+        self._gui_alive_at = time.perf_counter()
+        self._gui_alive.set()
+
+    def _heartbeat_loop(self) -> None:
+        """
+        Heartbeat thread main loop.
+
+        Schedules heartbeats on absolute deadlines so a slow send does not
+        accumulate drift. A due heartbeat is sent as soon as the GUI stamps
+        itself alive after the due time, so a heartbeat never extends the
+        hardware deadline past the moment the GUI froze. If no stamp arrives
+        within GUI_LIVENESS_TIMEOUT_MS the heartbeat is withheld and the
+        next one falls due an interval later.
+        """
+        interval_s = self.HEARTBEAT_INTERVAL_MS / 1000.0
+        liveness_timeout_s = self.GUI_LIVENESS_TIMEOUT_MS / 1000.0
+        poll_s = self.LIVENESS_INTERVAL_MS / 1000.0
+        next_due = time.perf_counter()
+        probed_due: Optional[float] = None
+        gui_stalled = False
+
+        while not self._stop_event.is_set():
+            now = time.perf_counter()
+            if now < next_due:
+                self._stop_event.wait(next_due - now)
+                continue
+
+            # Wait for proof the GUI ran after this heartbeat fell due
+            self._gui_alive.clear()
+            if self._gui_alive_at < next_due:
+                if now - next_due > liveness_timeout_s:
+                    # GUI frozen: withhold heartbeat so the hardware watchdog trips
+                    with self._stats_lock:
+                        self.skipped_gui_stalled += 1
+                    if not gui_stalled:
+                        gui_stalled = True
+                        logger.critical(
+                            f"GUI thread unresponsive for {(now - self._gui_alive_at) * 1000:.0f}ms"
+                            " - withholding watchdog heartbeat"
+                        )
+                    next_due += interval_s
+                    continue
+                if probed_due != next_due:
+                    probed_due = next_due
+                    self._liveness_probe.emit()
+                self._gui_alive.wait(poll_s)
+                continue
+            gui_stalled = False
+
+            self._jitter.record((now - next_due) * 1000.0)
+            next_due += interval_s
+            if next_due <= now:
+                next_due = now + interval_s
+
+            self._send_heartbeat()
+
     def _send_heartbeat(self) -> None:
         """
-        Send heartbeat to hardware watchdog (internal, called by timer).
+        Send heartbeat to hardware watchdog (internal, called by heartbeat thread).
 
         Calls GPIO controller's send_watchdog_heartbeat() method.
-        Tracks success/failure statistics.
+        Tracks success/failure statistics and send latency.
         """
         try:
             # Send heartbeat to hardware
+            started = time.perf_counter()
             success = self.gpio_controller.send_watchdog_heartbeat()
+            finished = time.perf_counter()
+            self._send_latency.record((finished - started) * 1000.0)
 
             if success:
                 # Heartbeat sent successfully
-                self.heartbeat_count += 1
-                self.consecutive_failures = 0
+                with self._stats_lock:
+                    self.heartbeat_count += 1
+                    self.consecutive_failures = 0
+                    if self._last_success_at is not None:
+                        self._success_interval.record((finished - self._last_success_at) * 1000.0)
+                    self._last_success_at = finished
+                    count = self.heartbeat_count
+                    failed = self.failed_heartbeats
                 self.heartbeat_sent.emit()
 
                 # Log every 100 heartbeats (every 50 seconds)
-                if self.heartbeat_count % 100 == 0:
-                    logger.debug(
-                        f"Watchdog heartbeat #{self.heartbeat_count} "
-                        f"(failures: {self.failed_heartbeats})"
-                    )
+                if count % 100 == 0:
+                    logger.debug(f"Watchdog heartbeat #{count} (failures: {failed})")
 
             else:
                 # Heartbeat failed
-                self.failed_heartbeats += 1
-                self.consecutive_failures += 1
+                with self._stats_lock:
+                    self.failed_heartbeats += 1
+                    self.consecutive_failures += 1
+                    consecutive = self.consecutive_failures
+                    failed = self.failed_heartbeats
 
-                error_msg = (
-                    f"Heartbeat send failed (consecutive: {self.consecutive_failures}, "
-                    f"total: {self.failed_heartbeats})"
-                )
+                error_msg = f"Heartbeat send failed (consecutive: {consecutive}, total: {failed})"
                 logger.error(error_msg)
                 self.heartbeat_failed.emit(error_msg)
 
                 # CRITICAL: If 3 consecutive failures, assume connection lost
-                if self.consecutive_failures >= 3:
+                if consecutive >= 3:
                     logger.critical(
                         "Watchdog heartbeat failed 3 consecutive times - "
                         "GPIO connection may be lost!"
                     )
-                    self._handle_critical_failure()
+                    self._raise_critical_failure()
 
         except Exception as e:
-            self.failed_heartbeats += 1
-            self.consecutive_failures += 1
+            with self._stats_lock:
+                self.failed_heartbeats += 1
+                self.consecutive_failures += 1
+                consecutive = self.consecutive_failures
 
             error_msg = f"Watchdog heartbeat exception: {e}"
             logger.error(error_msg)
             self.heartbeat_failed.emit(error_msg)
 
-            if self.consecutive_failures >= 3:
-                self._handle_critical_failure()
+            if consecutive >= 3:
+                self._raise_critical_failure()
+
+    def _raise_critical_failure(self) -> None:
+        """Stop sending and hand the critical failure to the GUI thread."""
+        # Stop the loop immediately; timers and signals are handled on the GUI thread
+        self._stop_event.set()
+        self._critical_failure.emit()
 
     def _handle_critical_failure(self) -> None:
         """
@@ -232,6 +381,8 @@ class SafetyWatchdog(QObject):
 
         self.stop()
         self.watchdog_timeout_detected.emit()
+        with self._stats_lock:
+            consecutive = self.consecutive_failures
 
         # Log critical event
         if self.event_logger:
@@ -241,7 +392,7 @@ class SafetyWatchdog(QObject):
                 self.event_logger.log_event(
                     event_type=EventType.SYSTEM_ERROR,
                     description=(
-                        f"Safety watchdog stopped due to {self.consecutive_failures} "
+                        f"Safety watchdog stopped due to {consecutive} "
                         "consecutive heartbeat failures - GPIO connection lost"
                     ),
                     severity=EventSeverity.EMERGENCY,
@@ -253,8 +404,9 @@ class SafetyWatchdog(QObject):
         """
         Simulate GUI freeze for testing.
 
-        Stops heartbeat timer to trigger hardware watchdog timeout.
-        Hardware should perform emergency shutdown after 1000ms.
+        Stops the GUI liveness timer and probe. The heartbeat thread gets no
+        fresh liveness stamp and withholds heartbeats, so the hardware
+        watchdog expires exactly as it would for a real freeze.
 
         WARNING:  WARNING: TESTING ONLY - DO NOT USE IN PRODUCTION
         WARNING:  This will cause hardware watchdog to expire and halt Arduino
@@ -262,16 +414,16 @@ class SafetyWatchdog(QObject):
 
         Usage:
             watchdog.simulate_freeze()
-            # Wait 1000ms → hardware watchdog triggers
+            # Wait ≤1000ms → hardware watchdog triggers
             # → Emergency shutdown (all outputs LOW)
             # → Arduino halts (requires power cycle)
         """
-        logger.warning("WARNING:  SIMULATING GUI FREEZE - WATCHDOG SHOULD TRIGGER IN 1000ms")
+        logger.warning("WARNING:  SIMULATING GUI FREEZE - WATCHDOG SHOULD TRIGGER IN ≤1000ms")
         logger.warning("WARNING:  Hardware will halt - power cycle required to recover")
 
-        # Stop heartbeat timer (simulates frozen GUI)
-        self.heartbeat_timer.stop()
-        self.is_running = False
+        # Stop liveness stamps (simulates frozen GUI event loop)
+        self.liveness_timer.stop()
+        self._freeze_simulated = True
 
         # Log test event
         if self.event_logger:
@@ -291,21 +443,46 @@ class SafetyWatchdog(QObject):
         Get watchdog statistics.
 
         Returns:
-            Dictionary with heartbeat statistics
+            Dictionary with heartbeat statistics, including:
+            - heartbeat_latency_ms: send latency {p50, p99, max}
+            - heartbeat_jitter_ms: scheduling lateness {p50, p99, max}
+            - max_heartbeat_gap_ms: longest gap between successful heartbeats
+            - min_margin_ms: hardware timeout minus longest gap (must stay > 0)
         """
+        with self._stats_lock:
+            heartbeat_count = self.heartbeat_count
+            failed_heartbeats = self.failed_heartbeats
+            consecutive_failures = self.consecutive_failures
+            skipped_gui_stalled = self.skipped_gui_stalled
+
         success_rate = 0.0
-        if self.heartbeat_count + self.failed_heartbeats > 0:
-            success_rate = (
-                self.heartbeat_count / (self.heartbeat_count + self.failed_heartbeats) * 100
-            )
+        if heartbeat_count + failed_heartbeats > 0:
+            success_rate = heartbeat_count / (heartbeat_count + failed_heartbeats) * 100
+
+        latency = self._send_latency.snapshot()
+        jitter = self._jitter.snapshot()
+        max_gap_ms = self._success_interval.snapshot()["max_ms"]
 
         return {
             "is_running": self.is_running,
-            "heartbeat_count": self.heartbeat_count,
-            "failed_heartbeats": self.failed_heartbeats,
-            "consecutive_failures": self.consecutive_failures,
+            "heartbeat_count": heartbeat_count,
+            "failed_heartbeats": failed_heartbeats,
+            "consecutive_failures": consecutive_failures,
+            "skipped_gui_stalled": skipped_gui_stalled,
             "success_rate": success_rate,
-            "heartbeat_interval_ms": 500,
-            "hardware_timeout_ms": 1000,
-            "safety_margin_ms": 500,
+            "heartbeat_interval_ms": self.HEARTBEAT_INTERVAL_MS,
+            "hardware_timeout_ms": self.HARDWARE_TIMEOUT_MS,
+            "safety_margin_ms": self.HARDWARE_TIMEOUT_MS - self.HEARTBEAT_INTERVAL_MS,
+            "heartbeat_latency_ms": {
+                "p50": latency["p50_ms"],
+                "p99": latency["p99_ms"],
+                "max": latency["max_ms"],
+            },
+            "heartbeat_jitter_ms": {
+                "p50": jitter["p50_ms"],
+                "p99": jitter["p99_ms"],
+                "max": jitter["max_ms"],
+            },
+            "max_heartbeat_gap_ms": max_gap_ms,
+            "min_margin_ms": self.HARDWARE_TIMEOUT_MS - max_gap_ms if max_gap_ms else None,
         }
@@ -0,0 +1,409 @@
+"""
+Online backup of the TOSCA database and event logs.
+
+The database is copied with SQLite's online backup API on its own
+connection, a few hundred pages per step with a pause between steps, so
+the copy never holds the GIL or the disk for long and the application
+keeps writing (under WAL a backup step is only a reader). If writes keep
+restarting the copy it is finished in one step, which under WAL still
+only holds a read transaction. The copy is integrity-checked before it
+replaces anything.
+
+JSONL event logs are copied per rotation segment. A manifest records the
+SHA-256 of every file in the backup, so unchanged segments (all rotated
+ones, once copied) are skipped and a backup can be verified, or a
+database restored, against the recorded hashes.
+
+Layout of a backup directory:
+    manifest.json
+    db/tosca_YYYYMMDD_HHMMSS.db
+    logs/events.jsonl, logs/events_YYYY-MM-DD_HH-MM-SS-ffffff.jsonl, ...
+"""
+
+import hashlib
+import json
+import logging
+import shutil
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+# Copies restarted by concurrent writes before the rest is copied in one step
+MAX_BACKUP_RESTARTS = 3
+
+
+def file_sha256(path: Path, chunk_size: int = 1024 * 1024) -> str:
+    """SHA-256 of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def integrity_check(db_path: Path) -> str:
+    """
+    Run PRAGMA integrity_check on a database file (read-only).
+
+    Returns:
+        "ok", or SQLite's description of the first problems found
+    """
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        rows = conn.execute("PRAGMA integrity_check").fetchall()
+        return "; ".join(str(row[0]) for row in rows)
+    finally:
+        conn.close()
+
+
+class _TooManyRestarts(Exception):
+    """Raised from the progress callback to stop a copy that keeps restarting."""
+
+
+def backup_database(
+    source_path: Path,
+    dest_path: Path,
+    pages_per_step: int = 256,
+    step_pause_s: float = 0.005,
+) -> int:
+    """
+    Copy a live database with the online backup API in page steps.
+
+    Args:
+        source_path: Database in use
+        dest_path: Backup file to create (replaced if it exists)
+        pages_per_step: Pages copied per step
+        step_pause_s: Pause between steps
+
+    Returns:
+        Pages in the copy
+    """
+    dest_path.unlink(missing_ok=True)
+    source = sqlite3.connect(source_path)
+    dest = sqlite3.connect(dest_path)
+    restarts = 0
+    last_remaining: Optional[int] = None
+
+    def _progress(_status: int, remaining: int, _total: int) -> None:
+        nonlocal restarts, last_remaining
+        if last_remaining is not None and remaining > last_remaining:
+            # Another connection wrote to the source, so the copy started over
+            restarts += 1
+            if restarts > MAX_BACKUP_RESTARTS:
+                raise _TooManyRestarts
+        last_remaining = remaining
+        time.sleep(step_pause_s)  # Yield to writers and the GUI thread
+
+    try:
+        # Pin a read snapshot: under WAL, commits from other connections are then
+        # invisible to the copy instead of restarting it, and writers are not blocked
+        source.execute("BEGIN")
+        source.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
+        try:
+            source.backup(dest, pages=max(1, pages_per_step), progress=_progress)
+        except _TooManyRestarts:
+            logger.info("Database backup kept restarting under writes; copying in one step")
+            source.backup(dest, pages=-1)
+        # Self-contained single file (the copy inherits WAL mode from the source)
+        dest.execute("PRAGMA journal_mode = DELETE")
+        return int(dest.execute("PRAGMA page_count").fetchone()[0])
+    finally:
+        dest.close()
+        source.close()
+
+
+@dataclass
+class BackupResult:
+    """Outcome of one backup run."""
+
+    success: bool
+    message: str
+    database_file: Optional[str] = None
+    pages: int = 0
+    logs_copied: list[str] = field(default_factory=list)
+    logs_unchanged: int = 0
+    duration_s: float = 0.0
+
+
+class BackupManifest:
+    """
+    Hashes of the files in a backup directory (manifest.json).
+
+    Entries are keyed by path relative to the backup directory and hold
+    sha256, size and, for copied log segments, the source size and mtime
+    used to skip rehashing unchanged segments.
+    """
+
+    def __init__(self, backup_dir: Path) -> None:
+        self.path = backup_dir / MANIFEST_NAME
+        self.files: dict[str, dict[str, Any]] = {}
+        self.databases: list[str] = []  # Database snapshots, oldest first
+        if self.path.exists():
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            self.files = data.get("files", {})
+            self.databases = data.get("databases", [])
+
+    def save(self) -> None:
+        """Write the manifest atomically (temp file + rename)."""
+        data = {
+            "version": MANIFEST_VERSION,
+            "updated": datetime.now().isoformat(),
+            "databases": self.databases,
+            "files": self.files,
+        }
+        temp = self.path.with_suffix(".tmp")
+        temp.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        temp.replace(self.path)
+
+
+def verify_backup(backup_dir: Path) -> tuple[bool, list[str]]:
+    """
+    Check every file in a backup against the manifest.
+
+    Hashes are recomputed and each database snapshot is integrity-checked.
+
+    Args:
+        backup_dir: Backup directory
+
+    Returns:
+        (ok, problems)
+    """
+    manifest = BackupManifest(backup_dir)
+    if not manifest.path.exists():
+        return False, [f"No manifest in {backup_dir}"]
+
+    problems = []
+    for name, entry in manifest.files.items():
+        path = backup_dir / name
+        if not path.exists():
+            problems.append(f"{name}: missing")
+        elif file_sha256(path) != entry["sha256"]:
+            problems.append(f"{name}: hash mismatch")
+    for name in manifest.databases:
+        path = backup_dir / name
+        if path.exists():
+            result = integrity_check(path)
+            if result != "ok":
+                problems.append(f"{name}: integrity check failed ({result})")
+    return not problems, problems
+
+
+def restore_database(backup_dir: Path, target_path: Path, snapshot: Optional[str] = None) -> Path:
+    """
+    Restore a database snapshot after verifying it.
+
+    The snapshot's hash and integrity are checked before the target is
+    touched, the copy is written next to the target and renamed over it,
+    and the restored file is checked again. The application must not
+    have the target open.
+
+    Args:
+        backup_dir: Backup directory
+        target_path: Database file to replace
+        snapshot: Snapshot name from the manifest (default: newest)
+
+    Returns:
+        target_path
+
+    Raises:
+        ValueError: If there is no snapshot or it fails verification
+    """
+    manifest = BackupManifest(backup_dir)
+    if not manifest.databases:
+        raise ValueError(f"No database snapshot in {backup_dir}")
+    name = snapshot or manifest.databases[-1]
+    entry = manifest.files.get(name)
+    source = backup_dir / name
+    if entry is None or not source.exists() or file_sha256(source) != entry["sha256"]:
+        raise ValueError(f"Snapshot {name} does not match the manifest")
+    result = integrity_check(source)
+    if result != "ok":
+        raise ValueError(f"Snapshot {name} failed integrity check: {result}")
+
+    temp = target_path.with_name(target_path.name + ".restore")
+    shutil.copyfile(source, temp)
+    if file_sha256(temp) != entry["sha256"]:
+        temp.unlink()
+        raise ValueError(f"Restored copy of {name} does not match the manifest")
+    for suffix in ("-wal", "-shm"):
+        target_path.with_name(target_path.name + suffix).unlink(missing_ok=True)
+    temp.replace(target_path)
+    logger.info(f"Database restored from {name} to {target_path}")
+    return target_path
+
+
+class BackupService:
+    """
+    Scheduled online backup of the database and event logs.
+
+    Usage:
+        service = BackupService(Path("data/tosca.db"), Path("data/logs"), Path("data/backups"))
+        service.start()       # Backs up every interval_s on a background thread
+        service.run_once()    # Or run a backup now (blocking)
+        service.stop()
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        log_dir: Path,
+        backup_dir: Path,
+        interval_s: float = 6 * 3600.0,
+        keep_databases: int = 7,
+        pages_per_step: int = 256,
+        step_pause_s: float = 0.005,
+        log_pattern: str = "events*.jsonl",
+    ) -> None:
+        """
+        Create the service.
+
+        Args:
+            db_path: Database file in use
+            log_dir: Directory of the JSONL event logs
+            backup_dir: Backup directory (created if needed)
+            interval_s: Time between scheduled backups
+            keep_databases: Database snapshots kept (older ones deleted)
+            pages_per_step: Database pages copied per backup step
+            step_pause_s: Pause between backup steps
+            log_pattern: Glob of the log segments to copy
+        """
+        self.db_path = Path(db_path)
+        self.log_dir = Path(log_dir)
+        self.backup_dir = Path(backup_dir)
+        self.interval_s = interval_s
+        self.keep_databases = max(1, keep_databases)
+        self.pages_per_step = pages_per_step
+        self.step_pause_s = step_pause_s
+        self.log_pattern = log_pattern
+        self.last_result: Optional[BackupResult] = None
+
+        self._run_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start scheduled backups (first one after interval_s)."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="db-backup", daemon=True)
+        self._thread.start()
+        logger.info(f"Backup service started: every {self.interval_s / 3600:.1f}h")
+
+    def stop(self, timeout_s: float = 30.0) -> None:
+        """Stop scheduled backups (waits for a backup in progress)."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join(timeout=timeout_s)
+        self._thread = None
+
+    def _loop(self) -> None:
+        """Run backups until stopped (backup thread)."""
+        while not self._stop.wait(self.interval_s):
+            self.run_once()
+
+    def run_once(self) -> BackupResult:
+        """
+        Back up the database and any changed log segments now.
+
+        Returns:
+            BackupResult (success False with a message if anything failed)
+        """
+        with self._run_lock:
+            start = time.monotonic()
+            try:
+                result = self._run()
+            except Exception as e:
+                logger.error(f"Backup failed: {e}")
+                result = BackupResult(False, f"Backup failed: {e}")
+            result.duration_s = time.monotonic() - start
+            self.last_result = result
+            return result
+
+    def _run(self) -> BackupResult:
+        """One backup run (caller holds _run_lock)."""
+        (self.backup_dir / "db").mkdir(parents=True, exist_ok=True)
+        (self.backup_dir / "logs").mkdir(parents=True, exist_ok=True)
+        manifest = BackupManifest(self.backup_dir)
+
+        # Database snapshot: copy to a partial file, check, then publish
+        name = f"db/{self.db_path.stem}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.db"
+        partial = self.backup_dir / (name + ".partial")
+        pages = backup_database(self.db_path, partial, self.pages_per_step, self.step_pause_s)
+        check = integrity_check(partial)
+        if check != "ok":
+            partial.unlink(missing_ok=True)
+            return BackupResult(False, f"Backup copy failed integrity check: {check}")
+        partial.replace(self.backup_dir / name)
+        manifest.files[name] = {
+            "sha256": file_sha256(self.backup_dir / name),
+            "size": (self.backup_dir / name).stat().st_size,
+        }
+        if name not in manifest.databases:
+            manifest.databases.append(name)
+        self._prune_databases(manifest)
+
+        copied, unchanged = self._copy_logs(manifest)
+        manifest.save()
+
+        message = (
+            f"Backup complete: {name} ({pages} pages), "
+            f"{len(copied)} log segments copied, {unchanged} unchanged"
+        )
+        logger.info(message)
+        return BackupResult(True, message, name, pages, copied, unchanged)
+
+    def _copy_logs(self, manifest: BackupManifest) -> tuple[list[str], int]:
+        """Copy log segments whose content changed since the last backup."""
+        copied: list[str] = []
+        unchanged = 0
+        if not self.log_dir.exists():
+            return copied, unchanged
+
+        for segment in sorted(self.log_dir.glob(self.log_pattern)):
+            name = f"logs/{segment.name}"
+            stat = segment.stat()
+            entry = manifest.files.get(name)
+            if (
+                entry is not None
+                and entry.get("source_size") == stat.st_size
+                and entry.get("source_mtime") == stat.st_mtime
+            ):
+                unchanged += 1  # Rotated segments never change after rotation
+                continue
+
+            sha256 = file_sha256(segment)
+            if entry is not None and entry["sha256"] == sha256:
+                entry["source_mtime"] = stat.st_mtime  # Touched but identical
+                unchanged += 1
+                continue
+
+            # Copy, then hash the copy (the active segment may grow meanwhile)
+            dest = self.backup_dir / name
+            shutil.copyfile(segment, dest)
+            manifest.files[name] = {
+                "sha256": file_sha256(dest),
+                "size": dest.stat().st_size,
+                "source_size": stat.st_size,
+                "source_mtime": stat.st_mtime,
+            }
+            copied.append(name)
+        return copied, unchanged
+
+    def _prune_databases(self, manifest: BackupManifest) -> None:
+        """Delete the oldest snapshots beyond keep_databases."""
+        while len(manifest.databases) > self.keep_databases:
+            old = manifest.databases.pop(0)
+            (self.backup_dir / old).unlink(missing_ok=True)
+            manifest.files.pop(old, None)
+            logger.info(f"Old database backup removed: {old}")
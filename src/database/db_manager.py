@@ -2,14 +2,36 @@
 Database manager for TOSCA.
 
 Handles database initialization, connection management, and CRUD operations.
+
+Storage profile: WAL with synchronous=NORMAL (a commit no longer waits
+for an fsync; the WAL is synced at checkpoints), a larger page cache,
+memory-mapped reads and in-memory temp tables, applied to every pooled
+connection. Safety events of warning severity and above are committed
+with synchronous=FULL so they are on disk before log_safety_event()
+returns. The WAL is checkpointed on a background thread rather than by
+whichever commit crosses the auto-checkpoint threshold. Append-only
+safety log writes use SQLAlchemy Core on one long-lived connection,
+shared by all threads under a lock (SQLite serializes writers anyway),
+instead of an ORM session per event.
 """
 
 import logging
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
-
-from sqlalchemy import create_engine, select, text
+from typing import Any, Iterable, NamedTuple, Optional
+
+from sqlalchemy import (
+    Connection,
+    CursorResult,
+    create_engine,
+    event,
+    func,
+    insert,
+    select,
+    text,
+    tuple_,
+)
 from sqlalchemy.orm import Session, joinedload, sessionmaker
 
 from database.models import Base, SafetyLog
@@ -18,6 +40,46 @@ from database.models import Subject, TechUser
 
 logger = logging.getLogger(__name__)
 
+# Safety log severities committed with a full fsync (durability point)
+DURABLE_SEVERITIES = frozenset({"warning", "critical", "emergency"})
+
+SYNCHRONOUS_LEVELS = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+# Auto-checkpoint threshold left as a backstop when checkpoints run in the background
+BACKGROUND_AUTOCHECKPOINT_PAGES = 10000
+
+
+class SubjectSummary(NamedTuple):
+    """Subject row for lookup lists (plain columns, no ORM object)."""
+
+    subject_id: int
+    subject_code: str
+    created_date: datetime
+
+
+class SessionSummary(NamedTuple):
+    """Session row for history lists (no protocol snapshot, no ORM objects)."""
+
+    session_id: int
+    subject_id: int
+    subject_code: Optional[str]
+    technician_name: Optional[str]
+    start_time: datetime
+    end_time: Optional[datetime]
+    status: str
+    protocol_name: Optional[str]
+    duration_seconds: Optional[int]
+
+    @property
+    def cursor(self) -> tuple[datetime, int]:
+        """Keyset position of this row (pass as `after` to get the next page)."""
+        return (self.start_time, self.session_id)
+
+
+def _prefix_upper_bound(prefix: str) -> str:
+    """Smallest string greater than every string starting with prefix."""
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
 
 class DatabaseManager:
     """
@@ -27,17 +89,44 @@ class DatabaseManager:
     maintaining connection pooling and transaction management.
     """
 
-    def __init__(self, db_path: str = "data/tosca.db") -> None:
+    def __init__(
+        self,
+        db_path: str = "data/tosca.db",
+        synchronous: str = "NORMAL",
+        cache_size_mb: int = 16,
+        mmap_size_mb: int = 64,
+        temp_store_memory: bool = True,
+        checkpoint_interval_s: float = 30.0,
+    ) -> None:
         """
         Initialize database manager.
 
         Args:
             db_path: Path to SQLite database file
+            synchronous: SQLite synchronous level (OFF, NORMAL, FULL, EXTRA)
+            cache_size_mb: Page cache per connection (MB)
+            mmap_size_mb: Memory-mapped I/O size (MB, 0 = disabled)
+            temp_store_memory: Keep temporary tables and indices in memory
+            checkpoint_interval_s: Background WAL checkpoint period (0 = SQLite auto-checkpoint)
         """
+        if synchronous.upper() not in SYNCHRONOUS_LEVELS:
+            raise ValueError(f"Invalid synchronous level: {synchronous}")
         self.db_path = Path(db_path)
+        self.synchronous = synchronous.upper()
+        self.cache_size_mb = cache_size_mb
+        self.mmap_size_mb = mmap_size_mb
+        self.temp_store_memory = temp_store_memory
+        self.checkpoint_interval_s = checkpoint_interval_s
         self.engine = None
         self.SessionLocal = None
 
+        # Long-lived connection for append-only writes, shared by all threads
+        self._append_conn: Optional[Connection] = None
+        self._append_lock = threading.Lock()
+
+        self._checkpoint_stop = threading.Event()
+        self._checkpoint_thread: Optional[threading.Thread] = None
+
     def initialize(self) -> None:
         """Initialize database connection and create tables if needed."""
         # Ensure data directory exists
@@ -51,12 +140,8 @@ class DatabaseManager:
             connect_args={"check_same_thread": False},  # For SQLite
         )
 
-        # Enable foreign keys and WAL mode for SQLite
-        if self.engine:
-            with self.engine.connect() as conn:
-                conn.execute(text("PRAGMA foreign_keys = ON"))
-                conn.execute(text("PRAGMA journal_mode = WAL"))
-                conn.commit()
+        # Storage profile on every new pooled connection
+        event.listen(self.engine, "connect", self._configure_connection)
 
         # Create session factory
         self.SessionLocal = sessionmaker(bind=self.engine, expire_on_commit=False)
@@ -68,7 +153,67 @@ class DatabaseManager:
         if self._is_new_database():
             self._initialize_default_data()
 
-        logger.info(f"Database initialized at {self.db_path}")
+        if self.checkpoint_interval_s > 0:
+            self._checkpoint_stop.clear()
+            self._checkpoint_thread = threading.Thread(
+                target=self._checkpoint_loop, name="db-checkpoint", daemon=True
+            )
+            self._checkpoint_thread.start()
+
+        logger.info(f"Database initialized at {self.db_path} (synchronous={self.synchronous})")
+
+    def _configure_connection(self, dbapi_connection: Any, _record: Any) -> None:
+        """Apply the storage profile to a new SQLite connection."""
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute("PRAGMA foreign_keys = ON")
+            cursor.execute("PRAGMA journal_mode = WAL")
+            cursor.execute(f"PRAGMA synchronous = {self.synchronous}")
+            cursor.execute(f"PRAGMA cache_size = {-self.cache_size_mb * 1024}")  # Negative = KiB
+            cursor.execute(f"PRAGMA mmap_size = {self.mmap_size_mb * 1024 * 1024}")
+            cursor.execute(
+                f"PRAGMA temp_store = {'MEMORY' if self.temp_store_memory else 'DEFAULT'}"
+            )
+            if self.checkpoint_interval_s > 0:
+                cursor.execute(f"PRAGMA wal_autocheckpoint = {BACKGROUND_AUTOCHECKPOINT_PAGES}")
+        finally:
+            cursor.close()
+
+    def _checkpoint_loop(self) -> None:
+        """Checkpoint the WAL periodically (checkpoint thread)."""
+        while not self._checkpoint_stop.wait(self.checkpoint_interval_s):
+            self.checkpoint()
+
+    def checkpoint(self, mode: str = "PASSIVE") -> Optional[tuple[int, int, int]]:
+        """
+        Copy committed WAL frames into the database file.
+
+        PASSIVE never waits for readers or writers; TRUNCATE (used on
+        close) also resets the WAL file to zero bytes.
+
+        Args:
+            mode: PASSIVE, FULL, RESTART or TRUNCATE
+
+        Returns:
+            (busy, wal_frames, checkpointed_frames), or None if it failed
+        """
+        if not self.engine:
+            return None
+        try:
+            with self.engine.connect() as conn:
+                row = conn.execute(text(f"PRAGMA wal_checkpoint({mode})")).one()
+                return (int(row[0]), int(row[1]), int(row[2]))
+        except Exception as e:
+            logger.warning(f"WAL checkpoint failed: {e}")
+            return None
+
+    def _append_connection(self) -> Connection:
+        """Long-lived append connection (caller holds _append_lock)."""
+        if self._append_conn is None or self._append_conn.closed:
+            if not self.engine:
+                raise RuntimeError("Database not initialized. Call initialize() first.")
+            self._append_conn = self.engine.connect()
+        return self._append_conn
 
     def _is_new_database(self) -> bool:
         """Check if database is newly created (no users)."""
@@ -121,7 +266,18 @@ class DatabaseManager:
 
     def close(self) -> None:
         """Close database connection."""
+        if self._checkpoint_thread is not None:
+            self._checkpoint_stop.set()
+            self._checkpoint_thread.join(timeout=5.0)
+            self._checkpoint_thread = None
+
+        with self._append_lock:
+            if self._append_conn is not None:
+                self._append_conn.close()
+                self._append_conn = None
+
         if self.engine:
+            self.checkpoint("TRUNCATE")
             self.engine.dispose()
             logger.info("Database connection closed")
 
@@ -192,9 +348,118 @@ class DatabaseManager:
         Returns:
             Number of sessions
         """
+        return self.get_session_counts([subject_id]).get(subject_id, 0)
+
+    def get_session_counts(self, subject_ids: Optional[Iterable[int]] = None) -> dict[int, int]:
+        """
+        Session counts for many subjects in one grouped query.
+
+        Args:
+            subject_ids: Subjects to count (None = every subject with sessions)
+
+        Returns:
+            subject_id -> session count (subjects without sessions are absent)
+        """
+        query = select(SessionModel.subject_id, func.count()).group_by(SessionModel.subject_id)
+        if subject_ids is not None:
+            query = query.where(SessionModel.subject_id.in_(list(subject_ids)))
+
         with self.get_session() as session:
-            count: int = session.query(SessionModel).filter_by(subject_id=subject_id).count()
-            return count
+            return {subject_id: count for subject_id, count in session.execute(query).all()}
+
+    def search_subjects(
+        self, query: str, limit: int = 20, include_inactive: bool = False
+    ) -> list[SubjectSummary]:
+        """
+        Incremental subject code search (for completers).
+
+        Prefix matches come first and are a range scan of the unique
+        subject_code index; if fewer than limit are found the rest are
+        filled with substring matches (case-insensitive). Only the columns
+        a lookup list shows are selected.
+
+        Args:
+            query: Text typed so far (e.g. "P-2025-00" or "0042")
+            limit: Maximum number of results
+            include_inactive: Include deactivated subjects
+
+        Returns:
+            Matching subjects, prefix matches first, each group ordered by code
+        """
+        query = query.strip()
+        if not query or limit < 1:
+            return []
+
+        columns = select(Subject.subject_id, Subject.subject_code, Subject.created_date)
+        if not include_inactive:
+            columns = columns.where(Subject.is_active.is_(True))
+
+        # Codes are stored upper case (P-YYYY-NNNN)
+        prefix = query.upper()
+        with self.get_session() as session:
+            rows = session.execute(
+                columns.where(
+                    Subject.subject_code >= prefix,
+                    Subject.subject_code < _prefix_upper_bound(prefix),
+                )
+                .order_by(Subject.subject_code)
+                .limit(limit)
+            ).all()
+            matches = [SubjectSummary(*row) for row in rows]
+
+            if len(matches) < limit:
+                rows = session.execute(
+                    columns.where(
+                        Subject.subject_code.contains(query, autoescape=True),
+                        Subject.subject_code.notin_([m.subject_code for m in matches]),
+                    )
+                    .order_by(Subject.subject_code)
+                    .limit(limit - len(matches))
+                ).all()
+                matches.extend(SubjectSummary(*row) for row in rows)
+
+        logger.debug(f"Subject search '{query}': {len(matches)} matches")
+        return matches
+
+    def get_recent_subjects(self, limit: int = 10) -> list[SubjectSummary]:
+        """
+        Most recently created active subjects.
+
+        Args:
+            limit: Maximum number of subjects
+
+        Returns:
+            Subjects, newest first
+        """
+        with self.get_session() as session:
+            rows = session.execute(
+                select(Subject.subject_id, Subject.subject_code, Subject.created_date)
+                .where(Subject.is_active.is_(True))
+                .order_by(Subject.created_date.desc())
+                .limit(limit)
+            ).all()
+            return [SubjectSummary(*row) for row in rows]
+
+    def get_last_subject_code(self, prefix: str) -> Optional[str]:
+        """
+        Highest subject code starting with prefix (index lookup).
+
+        Args:
+            prefix: Code prefix, e.g. "P-2025-"
+
+        Returns:
+            Highest matching code, or None if no code has the prefix
+        """
+        with self.get_session() as session:
+            return session.execute(
+                select(Subject.subject_code)
+                .where(
+                    Subject.subject_code >= prefix,
+                    Subject.subject_code < _prefix_upper_bound(prefix),
+                )
+                .order_by(Subject.subject_code.desc())
+                .limit(1)
+            ).scalar()
 
     def get_all_subjects(self) -> list[Subject]:
         """
@@ -237,6 +502,75 @@ class DatabaseManager:
             logger.debug(f"Retrieved {len(sessions)} sessions")
             return sessions
 
+    def get_session_summaries(
+        self,
+        subject_id: Optional[int] = None,
+        limit: int = 100,
+        after: Optional[tuple[datetime, int]] = None,
+    ) -> list[SessionSummary]:
+        """
+        One page of session history, most recent first.
+
+        Selects only the columns a history list shows (subject code and
+        technician name joined in the same query); the protocol snapshot
+        is loaded on demand with get_session_snapshot(). Pages are keyset
+        paginated on (start_time, session_id), so every page costs the
+        same regardless of how deep the user has scrolled.
+
+        Args:
+            subject_id: Optional filter by subject ID
+            limit: Maximum number of sessions in the page
+            after: Cursor of the last row of the previous page (None = first page)
+
+        Returns:
+            List of SessionSummary tuples
+        """
+        query = (
+            select(
+                SessionModel.session_id,
+                SessionModel.subject_id,
+                Subject.subject_code,
+                TechUser.full_name,
+                SessionModel.start_time,
+                SessionModel.end_time,
+                SessionModel.status,
+                SessionModel.protocol_name,
+                SessionModel.duration_seconds,
+            )
+            .outerjoin(Subject, Subject.subject_id == SessionModel.subject_id)
+            .outerjoin(TechUser, TechUser.tech_id == SessionModel.tech_id)
+        )
+
+        if subject_id is not None:
+            query = query.where(SessionModel.subject_id == subject_id)
+        if after is not None:
+            query = query.where(tuple_(SessionModel.start_time, SessionModel.session_id) < after)
+
+        query = query.order_by(SessionModel.start_time.desc(), SessionModel.session_id.desc())
+
+        with self.get_session() as session:
+            rows = session.execute(query.limit(limit)).all()
+            summaries = [SessionSummary(*row) for row in rows]
+            logger.debug(f"Retrieved {len(summaries)} session summaries")
+            return summaries
+
+    def get_session_snapshot(self, session_id: int) -> Optional[str]:
+        """
+        Protocol snapshot JSON of one session (not loaded by summaries).
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            JSON text, or None if the session has no snapshot
+        """
+        with self.get_session() as session:
+            return session.execute(
+                select(SessionModel.protocol_data_snapshot).where(
+                    SessionModel.session_id == session_id
+                )
+            ).scalar()
+
     # Technician Operations
 
     def get_technician_by_username(self, username: str) -> Optional[TechUser]:
@@ -293,24 +627,46 @@ class DatabaseManager:
             action_taken: Optional action taken
 
         Returns:
-            Created SafetyLog instance
+            Created SafetyLog instance (detached; built from the inserted values)
         """
-        with self.get_session() as session:
-            log_entry = SafetyLog(
-                timestamp=datetime.now(),
-                event_type=event_type,
-                severity=severity,
-                description=description,
-                session_id=session_id,
-                tech_id=tech_id,
-                system_state=system_state,
-                action_taken=action_taken,
-            )
-            session.add(log_entry)
-            session.commit()
-            session.refresh(log_entry)
-            logger.info(f"Safety event logged: {event_type} ({severity})")
-            return log_entry
+        values = {
+            "timestamp": datetime.now(),
+            "event_type": event_type,
+            "severity": severity,
+            "description": description,
+            "session_id": session_id,
+            "tech_id": tech_id,
+            "system_state": system_state,
+            "action_taken": action_taken,
+        }
+        result = self._append(SafetyLog, values, durable=severity.lower() in DURABLE_SEVERITIES)
+
+        logger.info(f"Safety event logged: {event_type} ({severity})")
+        return SafetyLog(log_id=result.inserted_primary_key[0], **values)
+
+    def log_safety_events(self, events: list[dict[str, Any]]) -> int:
+        """
+        Insert many safety log rows in one transaction (executemany).
+
+        Each dict holds SafetyLog column values; timestamp defaults to now.
+        The batch is committed with a full fsync if any row's severity is
+        a durable one.
+
+        Args:
+            events: Rows to insert
+
+        Returns:
+            Number of rows inserted
+        """
+        if not events:
+            return 0
+        now = datetime.now()
+        rows = [{"timestamp": now, **row} for row in events]
+        durable = any(str(row.get("severity", "")).lower() in DURABLE_SEVERITIES for row in rows)
+        self._append(SafetyLog, rows, durable=durable)
+
+        logger.debug(f"Safety events logged: {len(rows)}")
+        return len(rows)
 
     def get_safety_logs(
         self,
@@ -354,6 +710,39 @@ class DatabaseManager:
             logger.debug(f"Retrieved {len(logs)} safety logs")
             return logs
 
+    def _append(self, model: type[Base], rows: Any, durable: bool) -> CursorResult:
+        """
+        Core INSERT of one row (dict) or many (list) on the append connection.
+
+        The connection is used by one caller at a time, so the synchronous
+        level raised for a durable commit is always restored before any
+        other caller's insert.
+
+        Args:
+            model: Mapped class of the append-only table
+            rows: Column values, or a list of them (executemany)
+            durable: Commit with synchronous=FULL (fsync before returning)
+
+        Returns:
+            Insert result
+        """
+        durable = durable and self.synchronous not in ("FULL", "EXTRA")
+        with self._append_lock:
+            conn = self._append_connection()
+            if durable:
+                conn.exec_driver_sql("PRAGMA synchronous = FULL")
+            try:
+                result = conn.execute(insert(model), rows)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                if durable:
+                    conn.exec_driver_sql(f"PRAGMA synchronous = {self.synchronous}")
+                    conn.commit()
+        return result
+
     # Database Maintenance Operations
 
     def vacuum_database(self) -> tuple[bool, str, dict]:
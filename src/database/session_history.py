@@ -0,0 +1,86 @@
+"""
+Background paging of session history for TOSCA.
+
+Fetches DatabaseManager.get_session_summaries() pages on a single
+background thread, keeping the keyset cursor between pages, so a
+history view can show its first page as soon as it arrives and load
+more as the user scrolls without blocking the GUI thread.
+"""
+
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from typing import Optional
+
+from database.db_manager import DatabaseManager, SessionSummary
+
+logger = logging.getLogger(__name__)
+
+
+class SessionHistoryPager:
+    """
+    Keyset pager over session summaries.
+
+    Usage:
+        pager = SessionHistoryPager(db_manager, subject_id=3)
+        future = pager.fetch_next()
+        future.add_done_callback(...)  # Resolves to list[SessionSummary]
+    """
+
+    def __init__(
+        self, db_manager: DatabaseManager, subject_id: Optional[int] = None, page_size: int = 100
+    ) -> None:
+        """
+        Create the pager.
+
+        Args:
+            db_manager: Initialized DatabaseManager
+            subject_id: Optional filter by subject ID
+            page_size: Sessions per page
+        """
+        self.db_manager = db_manager
+        self.subject_id = subject_id
+        self.page_size = page_size
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="session-history")
+        self._cursor: Optional[tuple[datetime, int]] = None
+        self._exhausted = False
+        self._pending: Optional[Future] = None
+
+    @property
+    def exhausted(self) -> bool:
+        """True once a page shorter than page_size has been fetched."""
+        return self._exhausted
+
+    @property
+    def loading(self) -> bool:
+        """True while a page is being fetched."""
+        return self._pending is not None and not self._pending.done()
+
+    def fetch_next(self) -> Future:
+        """
+        Fetch the next page (the same future while a fetch is in progress).
+
+        Returns:
+            Future resolving to the page (empty once exhausted)
+        """
+        if self.loading:
+            return self._pending  # type: ignore[return-value]
+        self._pending = self._executor.submit(self._fetch)
+        return self._pending
+
+    def shutdown(self) -> None:
+        """Stop the fetch thread."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _fetch(self) -> list[SessionSummary]:
+        """Query one page and advance the cursor (fetch thread)."""
+        if self._exhausted:
+            return []
+        page = self.db_manager.get_session_summaries(
+            subject_id=self.subject_id, limit=self.page_size, after=self._cursor
+        )
+        if page:
+            self._cursor = page[-1].cursor
+        if len(page) < self.page_size:
+            self._exhausted = True
+        return page
@@ -0,0 +1,82 @@
+"""
+Asynchronous subject lookup for TOSCA.
+
+Runs DatabaseManager.search_subjects() on a single background thread so
+typing in a subject field never waits on SQLite. A new query supersedes
+one still waiting to run, so fast typing executes at most the running
+query plus the latest one. The recent subjects list is cached until a
+subject is added.
+"""
+
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional
+
+from database.db_manager import DatabaseManager, SubjectSummary
+
+logger = logging.getLogger(__name__)
+
+
+class SubjectSearcher:
+    """
+    Background subject search with a cached recent subjects list.
+
+    Usage:
+        searcher = SubjectSearcher(db_manager)
+        future = searcher.search("P-2025-00")
+        future.add_done_callback(...)  # Resolves to list[SubjectSummary]
+    """
+
+    def __init__(
+        self, db_manager: DatabaseManager, limit: int = 20, recent_limit: int = 10
+    ) -> None:
+        """
+        Create the searcher.
+
+        Args:
+            db_manager: Initialized DatabaseManager
+            limit: Maximum results per search
+            recent_limit: Subjects in the recent list
+        """
+        self.db_manager = db_manager
+        self.limit = limit
+        self.recent_limit = recent_limit
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="subject-search")
+        self._lock = threading.Lock()
+        self._pending: Optional[Future] = None
+        self._recent: Optional[list[SubjectSummary]] = None
+
+    def search(self, query: str) -> Future:
+        """
+        Queue a search, cancelling a previous one that has not started.
+
+        Args:
+            query: Text typed so far
+
+        Returns:
+            Future resolving to the matching subjects (cancelled if superseded)
+        """
+        with self._lock:
+            if self._pending is not None:
+                self._pending.cancel()
+            self._pending = self._executor.submit(
+                self.db_manager.search_subjects, query, self.limit
+            )
+            return self._pending
+
+    def recent(self) -> list[SubjectSummary]:
+        """Recently created subjects (queried once, then cached)."""
+        with self._lock:
+            if self._recent is None:
+                self._recent = self.db_manager.get_recent_subjects(self.recent_limit)
+            return list(self._recent)
+
+    def invalidate(self) -> None:
+        """Drop the cached recent list (call after adding a subject)."""
+        with self._lock:
+            self._recent = None
+
+    def shutdown(self) -> None:
+        """Stop the search thread (a queued search is cancelled)."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
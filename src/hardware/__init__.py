@@ -9,8 +9,18 @@ Provides unified interfaces for:
 - GPIO/safety interlocks (Arduino Nano)
 """
 
+from .connection_orchestrator import ConnectionOrchestrator, StartupReport
 from .hardware_controller_base import HardwareControllerBase
 from .laser_controller import LaserController
+from .serial_transport import SerialTransport, TransportPriority
 from .tec_controller import TECController
 
-__all__ = ["HardwareControllerBase", "LaserController", "TECController"]
+__all__ = [
+    "ConnectionOrchestrator",
+    "HardwareControllerBase",
+    "LaserController",
+    "SerialTransport",
+    "StartupReport",
+    "TransportPriority",
+    "TECController",
+]
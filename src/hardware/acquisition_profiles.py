@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""
+Module: acquisition_profiles
+Project: TOSCA Laser Control System
+
+Purpose: Named camera acquisition profiles. A profile fixes the sensor
+region of interest, binning, pixel format, frame rate, buffer count and
+GUI display scale together, so switching between the full field of view
+and a small high-rate window around the beam spot is one call
+(CameraController.apply_acquisition_profile()). Cropping the sensor
+reduces the pixels read out and sent over USB, which is what allows the
+higher frame rate.
+Safety Critical: No
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class AcquisitionProfile:
+    """Camera acquisition settings applied together."""
+
+    name: str
+    label: str
+    roi_size: Optional[tuple[int, int]] = None  # (width, height) binned pixels; None = full
+    roi_center: tuple[float, float] = (0.5, 0.5)  # ROI centre as fractions of the sensor
+    binning: int = 1
+    pixel_format: Optional[str] = None  # vmbpy PixelFormat name; None = keep current
+    frame_rate: float = 30.0  # Requested FPS (clamped to what the camera allows)
+    buffer_count: int = 5  # Driver frame buffers
+    display_scale: float = 0.25  # GUI downsampling (see CameraController.set_display_scale)
+
+    def centred_on(self, x: float, y: float) -> "AcquisitionProfile":
+        """
+        Same profile with the ROI centred elsewhere (e.g. on the beam spot).
+
+        Args:
+            x: Horizontal centre as a fraction of the sensor width
+            y: Vertical centre as a fraction of the sensor height
+
+        Returns:
+            Profile copy
+        """
+        return replace(self, roi_center=(min(max(x, 0.0), 1.0), min(max(y, 0.0), 1.0)))
+
+
+FULL_VIEW = AcquisitionProfile(
+    name="full_view",
+    label="Full view",
+    frame_rate=30.0,
+    buffer_count=5,
+    display_scale=0.25,
+)
+
+SPOT_TRACKING = AcquisitionProfile(
+    name="spot_tracking",
+    label="Spot tracking ROI",
+    roi_size=(320, 240),
+    frame_rate=200.0,
+    buffer_count=16,  # Several frames of headroom at the higher rate
+    display_scale=1.0,  # The ROI is already small
+)
+
+BINNED_PREVIEW = AcquisitionProfile(
+    name="binned_preview",
+    label="Binned preview",
+    binning=2,
+    frame_rate=60.0,
+    buffer_count=8,
+    display_scale=0.5,
+)
+
+ACQUISITION_PROFILES: dict[str, AcquisitionProfile] = {
+    profile.name: profile for profile in (FULL_VIEW, SPOT_TRACKING, BINNED_PREVIEW)
+}
+
+
+def _align(value: int, increment: int, minimum: int = 0) -> int:
+    """Round down to a multiple of the feature increment."""
+    increment = max(1, increment)
+    return max(minimum, (value // increment) * increment)
+
+
+def sensor_roi(
+    profile: AcquisitionProfile,
+    width_max: int,
+    height_max: int,
+    width_increment: int = 1,
+    height_increment: int = 1,
+    offset_x_increment: int = 1,
+    offset_y_increment: int = 1,
+) -> tuple[int, int, int, int]:
+    """
+    Sensor window for a profile, aligned to the camera's feature increments.
+
+    Args:
+        profile: Acquisition profile
+        width_max: Sensor width at the profile's binning (WidthMax)
+        height_max: Sensor height at the profile's binning (HeightMax)
+        width_increment: Width feature increment
+        height_increment: Height feature increment
+        offset_x_increment: OffsetX feature increment
+        offset_y_increment: OffsetY feature increment
+
+    Returns:
+        (offset_x, offset_y, width, height) in binned pixels
+    """
+    if profile.roi_size is None:
+        return 0, 0, width_max, height_max
+
+    width = _align(min(profile.roi_size[0], width_max), width_increment, width_increment)
+    height = _align(min(profile.roi_size[1], height_max), height_increment, height_increment)
+
+    # Centre the window, then keep it on the sensor
+    cx, cy = profile.roi_center
+    offset_x = min(max(int(cx * width_max - width / 2), 0), width_max - width)
+    offset_y = min(max(int(cy * height_max - height / 2), 0), height_max - height)
+    return (
+        _align(offset_x, offset_x_increment),
+        _align(offset_y, offset_y_increment),
+        width,
+        height,
+    )
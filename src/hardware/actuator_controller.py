@@ -9,6 +9,8 @@ Provides PyQt6-integrated actuator control with:
 - Position limits
 - Status monitoring
 - Thread-safe serial communication
+- Non-blocking motion: moves and homing complete from the Xeryon
+  communication thread when the matching STAT bits arrive (no polling)
 
 TOSCA Configuration Strategy:
 - Uses device-stored settings (manufacturer-calibrated, stored in non-volatile memory)
@@ -25,11 +27,15 @@ See: components/actuator_module/docs/XERYON_API_REFERENCE.md
 
 import logging
 import threading
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from pathlib import Path
 from typing import Any, Optional
 
 from PyQt6.QtCore import QObject, QTimer, pyqtSignal
 
+from utils.qt_timers import start_timer, stop_timer
+
 try:
     # Import Xeryon library
     import sys
@@ -38,7 +44,7 @@ try:
     if str(xeryon_path) not in sys.path:
         sys.path.insert(0, str(xeryon_path))
 
-    from Xeryon import Axis, Stage, Units, Xeryon
+    from Xeryon import Axis, MotionResult, Stage, Units, Xeryon
 
     XERYON_AVAILABLE = True
 except ImportError:
@@ -47,6 +53,8 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+HOMING_TIMEOUT_S = 60.0  # Maximum time home_and_wait() waits for the index
+
 
 class ActuatorController(QObject):
     """
@@ -66,6 +74,9 @@ class ActuatorController(QObject):
     limits_changed = pyqtSignal(float, float)  # (low_limit_um, high_limit_um)
     limit_warning = pyqtSignal(str, float)  # (direction, distance_from_limit)
 
+    # Internal: motion completion from the Xeryon communication thread -> GUI thread
+    _motion_finished = pyqtSignal(str, object)  # (kind: "home"/"move", MotionResult)
+
     def __init__(self, event_logger: Optional[Any] = None) -> None:
         super().__init__()
 
@@ -99,6 +110,13 @@ class ActuatorController(QObject):
         self.acceleration = 65500  # Default from settings_default.txt
         self.deceleration = 65500  # Default from settings_default.txt
 
+        # Motion trace capture (Xeryon high-rate logging)
+        self.is_tracing = False
+
+        # Current non-blocking motion (Future resolving to a Xeryon MotionResult)
+        self.motion_future: Optional[Future] = None
+        self._motion_finished.connect(self._handle_motion_finished)
+
         logger.info("Actuator controller initialized (thread-safe)")
 
     def __del__(self) -> None:
@@ -120,11 +138,22 @@ class ActuatorController(QObject):
         Args:
             com_port: Serial port (e.g., "COM3")
             baudrate: TOSCA uses 9600 (NOT library default 115200)
-            auto_home: Auto-home after connection
+            auto_home: Home after connecting if the encoder is not valid yet
+                (see home_and_wait(), which does not hold the lock while waiting)
 
         Returns:
-            True if connected successfully
+            True if connected successfully (also when auto-homing fails)
         """
+        if not self._open(com_port, baudrate):
+            return False
+
+        if auto_home and not self.is_homed:
+            self.home_and_wait()
+
+        return True
+
+    def _open(self, com_port: str, baudrate: int) -> bool:
+        """Open the controller, read device settings and start position monitoring."""
         with self._lock:
             try:
                 logger.info(f"Connecting to actuator on {com_port} at {baudrate} baud")
@@ -144,26 +173,7 @@ class ActuatorController(QObject):
 
                 self.is_homed = self.axis.isEncoderValid()
                 logger.info("Connected successfully")
-
-                if auto_home and not self.is_homed:
-                    self.status_changed.emit("homing")
-                    import time
-
-                    time.sleep(0.5)
-
-                    success = self.axis.findIndex(forceWaiting=True, direction=0)
-
-                    if success:
-                        self.is_homed = True
-                        logger.info("Auto-homing complete")
-                        self.status_changed.emit("ready")
-                    else:
-                        logger.warning("Auto-homing failed")
-                        self.status_changed.emit("not_homed")
-                elif self.is_homed:
-                    self.status_changed.emit("ready")
-                else:
-                    self.status_changed.emit("not_homed")
+                self.status_changed.emit("ready" if self.is_homed else "not_homed")
 
                 low_limit, high_limit = self.get_limits()
                 self.get_acceleration_settings()
@@ -181,7 +191,7 @@ class ActuatorController(QObject):
                     )
 
                 # Start position monitoring
-                self.position_timer.start()
+                start_timer(self.position_timer)
 
                 return True
 
@@ -203,11 +213,66 @@ class ActuatorController(QObject):
 
                 return False
 
+    def home_and_wait(self, timeout: float = HOMING_TIMEOUT_S) -> bool:
+        """
+        Home the actuator and wait until the index is found.
+
+        Blocking counterpart of find_index(). The lock is only held to start
+        homing and to record the result, not while waiting on the motion
+        future, so status and position queries keep working during homing.
+
+        Args:
+            timeout: Maximum time to wait for homing in seconds
+
+        Returns:
+            True if homing completed
+        """
+        with self._lock:
+            if not self.is_connected or not self.axis:
+                self.error_occurred.emit("Actuator not connected")
+                return False
+
+            try:
+                self.status_changed.emit("homing")
+                future = self.axis.findIndexAsync(direction=0)
+            except Exception as e:
+                error_msg = f"Failed to start homing: {e}"
+                logger.error(error_msg)
+                self.error_occurred.emit(error_msg)
+                self.status_changed.emit("not_homed")
+                return False
+
+        # Waits on the completion future (no polling loop, lock released)
+        try:
+            result = future.result(timeout=timeout)
+            success = bool(result)
+            if not success:
+                logger.warning(f"Homing: {result.message}")
+        except FutureTimeoutError:
+            logger.warning(f"Homing timed out after {timeout:.0f}s")
+            success = False
+
+        with self._lock:
+            if not success or not self.axis:
+                logger.warning("Homing failed")
+                self.status_changed.emit("not_homed")
+                return False
+
+            self.is_homed = True
+            logger.info("Homing complete")
+            self.status_changed.emit("ready")
+
+            # Device sends its stored settings after initialization
+            self.get_limits()
+            self.get_acceleration_settings()
+            self.limits_changed.emit(self.low_limit_um, self.high_limit_um)
+            return True
+
     def disconnect(self) -> None:
         """Disconnect from actuator."""
         with self._lock:
             # Stop position monitoring
-            self.position_timer.stop()
+            stop_timer(self.position_timer)
 
             if self.controller:
                 try:
@@ -219,6 +284,7 @@ class ActuatorController(QObject):
             self.axis = None
             self.is_connected = False
             self.is_homed = False
+            self.is_tracing = False
             self.connection_changed.emit(False)
             logger.info("Actuator disconnected")
 
@@ -281,11 +347,8 @@ class ActuatorController(QObject):
                 self.status_changed.emit("homing")
                 self.homing_progress.emit("Searching for index position...")
 
-                # Use native hardware homing feature
-                self.axis.findIndex()
-
-                # Monitor homing status
-                QTimer.singleShot(100, self._check_homing_status)
+                # Use native hardware homing feature (completes when the index is found)
+                self._track_motion("home", self.axis.findIndexAsync())
 
                 # Log event
                 if self.event_logger:
@@ -305,18 +368,35 @@ class ActuatorController(QObject):
                 self.status_changed.emit("error")
                 return False
 
-    def _check_homing_status(self) -> None:
-        """Check if homing is complete."""
+    def _track_motion(self, kind: str, future: Future) -> None:
+        """
+        Track a non-blocking Xeryon motion until it completes.
+
+        The completion callback runs on the Xeryon communication thread and is
+        forwarded to the GUI thread through the _motion_finished signal.
+
+        Args:
+            kind: "home" or "move"
+            future: Future resolving to a MotionResult
+        """
+        self.motion_future = future
+        future.add_done_callback(lambda f: self._motion_finished.emit(kind, f.result()))
+
+    def _handle_motion_finished(self, kind: str, result: Any) -> None:
+        """Handle motion completion (GUI thread)."""
+        if kind == "home":
+            self._on_homing_finished(result)
+        else:
+            self._on_move_finished(result)
+
+    def _on_homing_finished(self, result: Any) -> None:
+        """Handle homing completion."""
         if not self.axis:
             return
 
         with self._lock:
             try:
-                if self.axis.isSearchingIndex():
-                    # Still searching
-                    self.homing_progress.emit("Still searching for index...")
-                    QTimer.singleShot(200, self._check_homing_status)
-                elif self.axis.isEncoderValid():
+                if result:
                     # Homing complete
                     self.is_homed = True
                     self.homing_progress.emit("Index found - homing complete!")
@@ -350,7 +430,7 @@ class ActuatorController(QObject):
                         )
                 else:
                     # Homing failed
-                    error_msg = "Homing failed - encoder not valid"
+                    error_msg = f"Homing failed - {result.message}"
                     logger.error(error_msg)
                     self.error_occurred.emit(error_msg)
                     self.status_changed.emit("error")
@@ -390,14 +470,13 @@ class ActuatorController(QObject):
 
         with self._lock:
             try:
-                # Use native hardware absolute positioning
-                self.axis.setDPOS(position_um, self.working_units)
+                # Use native hardware absolute positioning (completes when position reached)
+                future = self.axis.setDPOSAsync(position_um, self.working_units)
 
                 self.status_changed.emit("moving")
                 logger.debug(f"Moving to position: {position_um} µm")
 
-                # Monitor position reached
-                QTimer.singleShot(100, self._check_position_reached)
+                self._track_motion("move", future)
 
                 return True
 
@@ -407,16 +486,16 @@ class ActuatorController(QObject):
                 self.error_occurred.emit(error_msg)
                 return False
 
-    def _check_position_reached(self) -> None:
-        """Check if target position has been reached."""
+    def _on_move_finished(self, result: Any) -> None:
+        """Handle position move completion."""
         if not self.axis:
             return
 
         with self._lock:
             try:
-                if self.axis.isPositionReached():
+                if result:
                     # Position reached
-                    current_pos = self.axis.getEPOS()
+                    current_pos = result.epos
                     self.position_reached.emit(current_pos)
                     self.status_changed.emit("ready")
                     logger.debug(f"Position reached: {current_pos:.1f} µm")
@@ -430,9 +509,11 @@ class ActuatorController(QObject):
                             description=f"Actuator moved to position: {current_pos:.1f} µm",
                             details={"position_um": current_pos},
                         )
-                else:
-                    # Still moving
-                    QTimer.singleShot(50, self._check_position_reached)
+                elif result.error != MotionResult.CANCELLED:
+                    error_msg = f"Position not reached: {result.message}"
+                    logger.error(error_msg)
+                    self.error_occurred.emit(error_msg)
+                    self.status_changed.emit("error")
 
             except Exception as e:
                 error_msg = f"Error checking position: {e}"
@@ -471,14 +552,13 @@ class ActuatorController(QObject):
                 return False
 
             try:
-                # Use native hardware relative positioning
-                self.axis.step(step_um)
+                # Use native hardware relative positioning (completes when position reached)
+                future = self.axis.stepAsync(step_um)
 
                 self.status_changed.emit("moving")
                 logger.debug(f"Making step: {step_um:+.1f} µm (target: {target_pos:.1f} µm)")
 
-                # Monitor position reached
-                QTimer.singleShot(100, self._check_position_reached)
+                self._track_motion("move", future)
 
                 return True
 
@@ -621,6 +701,56 @@ class ActuatorController(QObject):
                 logger.error(f"Failed to stop scan: {e}")
                 return False
 
+    def start_motion_trace(self) -> bool:
+        """
+        Start capturing a high-rate position trace.
+
+        Uses native Xeryon logging (axis.startLogging), which raises the
+        polling rate (POLI=1) until stop_motion_trace() is called.
+
+        Returns:
+            True if trace capture started
+        """
+        if not self.is_connected or not self.axis:
+            return False
+
+        with self._lock:
+            try:
+                self.axis.startLogging(increase_poli=True)
+                self.is_tracing = True
+                return True
+            except Exception as e:
+                logger.warning(f"Failed to start motion trace: {e}")
+                return False
+
+    def stop_motion_trace(self) -> Optional[tuple[Any, Any]]:
+        """
+        Stop trace capture and return the recorded samples.
+
+        Returns:
+            Tuple of (time_ms, position_um) numpy arrays, time relative to the
+            first sample, or None if no trace was running
+        """
+        if not self.is_tracing or not self.axis:
+            return None
+
+        with self._lock:
+            self.is_tracing = False
+            try:
+                logs = self.axis.endLogging(convertTimeAndEpos=True)
+            except Exception as e:
+                logger.warning(f"Failed to stop motion trace: {e}")
+                return None
+
+            time_ms = logs.get("TIME")
+            position_um = logs.get("EPOS")
+            if time_ms is None or position_um is None:
+                return None
+
+            # TIME and EPOS arrive as separate lines; trim to complete samples
+            samples = min(len(time_ms), len(position_um))
+            return (time_ms[:samples], position_um[:samples])
+
     def set_position_limits(self, low_um: float, high_um: float) -> bool:
         """
         Set position limits.
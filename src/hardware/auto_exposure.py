@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+"""
+Module: auto_exposure
+Project: TOSCA Laser Control System
+
+Purpose: Software auto-exposure / auto-gain driven by frame statistics.
+Brightness is measured inside a region of interest (the treatment spot)
+from a decimated frame with one vectorised histogram, so it is cheap
+enough to run on every frame in the camera stream thread. Feature writes
+only happen when the measured level leaves a hysteresis band around the
+target, and the controller waits a few frames after each write for the
+new exposure to reach the sensor output.
+Safety Critical: No
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Normalised region (x, y, width, height) as fractions of the frame
+Roi = tuple[float, float, float, float]
+
+DEFAULT_ROI: Roi = (0.25, 0.25, 0.5, 0.5)  # Centre of the field of view
+
+
+@dataclass
+class AutoExposureConfig:
+    """Auto-exposure controller parameters."""
+
+    target_level: float = 110.0  # Desired brightness percentile (0-255)
+    percentile: float = 50.0  # Brightness statistic (50 = median of the ROI)
+    hysteresis: float = 0.1  # Relative band around target_level with no correction
+    roi: Optional[Roi] = DEFAULT_ROI  # None = whole frame
+    decimation: int = 4  # Sample every Nth pixel in both directions
+    saturation_level: int = 250  # Pixel value counted as clipped
+    max_saturated_fraction: float = 0.02  # Above this, halve the light regardless of level
+    damping: float = 0.7  # Fraction of the log-error corrected per step (0-1]
+    max_step: float = 4.0  # Largest brightness change per step (factor)
+    settle_frames: int = 2  # Frames to skip after a write before measuring again
+    min_exposure_us: float = 20.0
+    max_exposure_us: float = 30000.0  # 30 ms keeps 30 FPS streaming
+    min_gain_db: float = 0.0
+    max_gain_db: float = 24.0
+
+
+@dataclass(frozen=True, slots=True)
+class FrameStatistics:
+    """Brightness of the auto-exposure region of one frame."""
+
+    level: float  # Configured percentile (0-255)
+    mean: float
+    saturated_fraction: float
+    samples: int
+
+
+@dataclass(frozen=True, slots=True)
+class AutoExposureStep:
+    """Camera settings to write (None = leave unchanged)."""
+
+    exposure_us: Optional[float] = None
+    gain_db: Optional[float] = None
+
+
+def _to_uint8(pixels: np.ndarray) -> np.ndarray:
+    """Scale higher bit-depth pixels to 8 bits (Mono8/RGB8 pass through)."""
+    if pixels.dtype == np.uint8:
+        return pixels
+    if pixels.dtype == np.uint16:
+        return (pixels >> 8).astype(np.uint8)
+    return np.asarray(np.clip(pixels, 0, 255), dtype=np.uint8)
+
+
+def measure_frame(
+    frame: np.ndarray,
+    roi: Optional[Roi] = DEFAULT_ROI,
+    decimation: int = 4,
+    percentile: float = 50.0,
+    saturation_level: int = 250,
+) -> FrameStatistics:
+    """
+    Brightness statistics of a frame region.
+
+    Args:
+        frame: Mono (H, W) / (H, W, 1) or colour (H, W, 3) frame
+        roi: Normalised (x, y, width, height), or None for the whole frame
+        decimation: Sample every Nth pixel in both directions
+        percentile: Percentile reported as the level
+        saturation_level: Pixel value counted as clipped
+
+    Returns:
+        Frame statistics
+    """
+    height, width = frame.shape[:2]
+    if roi is not None:
+        x, y, w, h = roi
+        x0, y0 = int(x * width), int(y * height)
+        x1, y1 = max(x0 + 1, int((x + w) * width)), max(y0 + 1, int((y + h) * height))
+        frame = frame[y0:y1, x0:x1]
+
+    step = max(1, int(decimation))
+    region = _to_uint8(frame[::step, ::step])
+    if region.ndim == 3:
+        if region.shape[2] == 1:
+            region = region[..., 0]
+        else:
+            # Channel mean as luminance (uint16 sum avoids overflow)
+            region = (region.sum(axis=2, dtype=np.uint16) // region.shape[2]).astype(np.uint8)
+
+    histogram = np.bincount(region.ravel(), minlength=256)
+    samples = int(histogram.sum())
+    if samples == 0:
+        return FrameStatistics(0.0, 0.0, 0.0, 0)
+
+    cumulative = np.cumsum(histogram)
+    level = float(np.searchsorted(cumulative, samples * percentile / 100.0))
+    mean = float(histogram @ np.arange(256)) / samples
+    saturated = float(histogram[saturation_level:].sum()) / samples
+    return FrameStatistics(level, mean, saturated, samples)
+
+
+class AutoExposureController:
+    """
+    Exposure/gain control loop fed with camera frames.
+
+    Brightness is treated as proportional to exposure time x linear gain.
+    More light is taken from exposure first (up to max_exposure_us) and
+    then from gain; less light is taken from gain first, keeping noise low.
+
+    Usage (camera stream thread):
+        step = controller.update(frame)
+        if step is not None:
+            ...  # Write step.exposure_us / step.gain_db (if not None) to the camera
+    """
+
+    def __init__(self, config: Optional[AutoExposureConfig] = None) -> None:
+        self.config = config or AutoExposureConfig()
+        self.exposure_enabled = False
+        self.gain_enabled = False
+        self.exposure_us = 10000.0  # Current camera values (seed with sync())
+        self.gain_db = 0.0
+        self.camera_max_exposure_us = math.inf  # Hardware limits (from sync())
+        self.camera_max_gain_db = math.inf
+        self.last_statistics: Optional[FrameStatistics] = None
+        self.adjustments = 0
+        self._settle_remaining = 0
+
+    @property
+    def enabled(self) -> bool:
+        """True if exposure or gain is under automatic control."""
+        return self.exposure_enabled or self.gain_enabled
+
+    def sync(
+        self,
+        exposure_us: float,
+        gain_db: float,
+        max_exposure_us: Optional[float] = None,
+        max_gain_db: Optional[float] = None,
+    ) -> None:
+        """
+        Take over the camera's current values and limits (on enable).
+
+        Args:
+            exposure_us: Current exposure time
+            gain_db: Current gain
+            max_exposure_us: Camera's maximum exposure time, if known
+            max_gain_db: Camera's maximum gain, if known
+        """
+        self.exposure_us = float(exposure_us)
+        self.gain_db = float(gain_db)
+        if max_exposure_us is not None:
+            self.camera_max_exposure_us = float(max_exposure_us)
+        if max_gain_db is not None:
+            self.camera_max_gain_db = float(max_gain_db)
+        self._settle_remaining = 0
+
+    @property
+    def max_exposure_us(self) -> float:
+        """Effective exposure limit (configured, clamped to the camera's range)."""
+        return min(self.config.max_exposure_us, self.camera_max_exposure_us)
+
+    @property
+    def max_gain_db(self) -> float:
+        """Effective gain limit (configured, clamped to the camera's range)."""
+        return min(self.config.max_gain_db, self.camera_max_gain_db)
+
+    def update(self, frame: np.ndarray) -> Optional[AutoExposureStep]:
+        """
+        Measure a frame and compute new camera settings.
+
+        Args:
+            frame: Camera frame (numpy array)
+
+        Returns:
+            Settings to write, or None if the level is within the hysteresis
+            band (or the camera is still settling)
+        """
+        if not self.enabled:
+            return None
+        if self._settle_remaining > 0:
+            self._settle_remaining -= 1
+            return None
+
+        cfg = self.config
+        stats = measure_frame(frame, cfg.roi, cfg.decimation, cfg.percentile, cfg.saturation_level)
+        self.last_statistics = stats
+        if stats.samples == 0:
+            return None
+
+        if stats.saturated_fraction > cfg.max_saturated_fraction:
+            factor = 0.5  # Clipped pixels hide the true level: back off quickly
+        else:
+            error = cfg.target_level / max(stats.level, 1.0)
+            if abs(math.log(error)) <= math.log1p(cfg.hysteresis):
+                return None
+            factor = error**cfg.damping
+        factor = min(max(factor, 1.0 / cfg.max_step), cfg.max_step)
+
+        exposure_us, gain_db = self._distribute(factor)
+        exposure_changed = abs(exposure_us - self.exposure_us) > 0.01 * self.exposure_us
+        gain_changed = abs(gain_db - self.gain_db) >= 0.1
+        if not (exposure_changed or gain_changed):
+            return None  # Already at a limit
+
+        step = AutoExposureStep(
+            exposure_us if exposure_changed else None, gain_db if gain_changed else None
+        )
+        if exposure_changed:
+            self.exposure_us = exposure_us
+        if gain_changed:
+            self.gain_db = gain_db
+        self.adjustments += 1
+        self._settle_remaining = cfg.settle_frames
+        return step
+
+    def _distribute(self, factor: float) -> tuple[float, float]:
+        """Split a brightness factor between exposure time and gain."""
+        cfg = self.config
+        exposure_us, gain_db = self.exposure_us, self.gain_db
+
+        if factor < 1.0 and self.gain_enabled and gain_db > cfg.min_gain_db:
+            # Less light: drop gain first
+            new_gain = max(cfg.min_gain_db, gain_db + 20.0 * math.log10(factor))
+            factor /= 10 ** ((new_gain - gain_db) / 20.0)
+            gain_db = new_gain
+
+        if self.exposure_enabled:
+            new_exposure = min(max(exposure_us * factor, cfg.min_exposure_us), self.max_exposure_us)
+            factor /= new_exposure / exposure_us
+            exposure_us = new_exposure
+
+        if factor > 1.0 and self.gain_enabled:
+            # More light than exposure can give: add gain
+            gain_db = min(self.max_gain_db, gain_db + 20.0 * math.log10(factor))
+
+        return exposure_us, gain_db
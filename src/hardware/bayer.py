@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""
+Module: bayer
+Project: TOSCA Laser Control System
+
+Purpose: Bayer (colour filter array) frame conversion. Live view only
+needs a fraction of the sensor resolution, so display frames are built
+directly from the raw mosaic: each 2x2 cell becomes one RGB pixel
+(superpixel, the two greens averaged) and further downsampling is plain
+decimation of those cells. No full-resolution image is interpolated on
+that path. The full-resolution demosaic is kept for consumers that need
+every pixel (still capture, recording).
+
+Pattern names follow the camera (GenICam/vmbpy): BayerRG8 means the top
+left cell is R G / G B. OpenCV names its conversion codes after the
+second row and column, so GenICam BayerRG corresponds to OpenCV BayerBG.
+Safety Critical: No
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import cv2
+import numpy as np
+
+# Pixel format name -> 2x2 cell pattern (first row, then second row)
+BAYER_PATTERNS: dict[str, str] = {
+    "BayerRG8": "RGGB",
+    "BayerGR8": "GRBG",
+    "BayerGB8": "GBRG",
+    "BayerBG8": "BGGR",
+}
+
+# Full-resolution demosaic code per pattern (see module docstring for the naming offset)
+_CV2_TO_RGB: dict[str, int] = {
+    "RGGB": cv2.COLOR_BayerBG2RGB,
+    "GRBG": cv2.COLOR_BayerGB2RGB,
+    "GBRG": cv2.COLOR_BayerGR2RGB,
+    "BGGR": cv2.COLOR_BayerRG2RGB,
+}
+
+
+def bayer_pattern(pixel_format: Any) -> Optional[str]:
+    """
+    2x2 cell pattern of a Bayer pixel format.
+
+    Args:
+        pixel_format: vmbpy PixelFormat enum or its name
+
+    Returns:
+        Pattern such as "RGGB", or None if the format is not Bayer
+    """
+    name = getattr(pixel_format, "name", pixel_format)
+    return BAYER_PATTERNS.get(str(name))
+
+
+def _cell_offsets(pattern: str) -> tuple[tuple[int, int], list[tuple[int, int]], tuple[int, int]]:
+    """(row, col) offsets of R, both Gs and B inside the 2x2 cell."""
+    positions = [(0, 0), (0, 1), (1, 0), (1, 1)]
+    red = positions[pattern.index("R")]
+    blue = positions[pattern.index("B")]
+    greens = [pos for pos, colour in zip(positions, pattern) if colour == "G"]
+    return red, greens, blue
+
+
+def demosaic(raw: np.ndarray, pattern: str) -> np.ndarray:
+    """
+    Full-resolution demosaic.
+
+    Args:
+        raw: Bayer mosaic (H, W) or (H, W, 1)
+        pattern: Cell pattern from bayer_pattern()
+
+    Returns:
+        RGB frame (H, W, 3)
+    """
+    if raw.ndim == 3:
+        raw = raw[..., 0]
+    return cv2.cvtColor(np.ascontiguousarray(raw), _CV2_TO_RGB[pattern])
+
+
+def demosaic_superpixel(raw: np.ndarray, pattern: str, scale: float = 0.5) -> np.ndarray:
+    """
+    Reduced-resolution RGB straight from the mosaic (for display).
+
+    Each 2x2 cell gives one RGB pixel (0.5 scale). For smaller scales
+    every Nth cell is used, then the result is resized to the exact
+    size when the scale is not 1 / (2 * N).
+
+    Args:
+        raw: Bayer mosaic (H, W) or (H, W, 1)
+        pattern: Cell pattern from bayer_pattern()
+        scale: Output size relative to the mosaic (<= 0.5)
+
+    Returns:
+        Contiguous RGB frame (about H * scale, W * scale, 3)
+    """
+    if raw.ndim == 3:
+        raw = raw[..., 0]
+    height, width = raw.shape
+    target = (max(1, int(width * scale)), max(1, int(height * scale)))
+
+    # Cell stride in raw pixels, the largest that does not go below the target size
+    stride = 2 * max(1, int(0.5 / scale + 1e-9))
+    raw = raw[: height - height % stride, : width - width % stride]
+
+    (ry, rx), ((g1y, g1x), (g2y, g2x)), (by, bx) = _cell_offsets(pattern)
+    rgb = np.empty((raw.shape[0] // stride, raw.shape[1] // stride, 3), dtype=raw.dtype)
+    rgb[..., 0] = raw[ry::stride, rx::stride]
+    # Average the two greens (wider accumulator avoids overflow)
+    green = raw[g1y::stride, g1x::stride].astype(np.uint32) + raw[g2y::stride, g2x::stride]
+    rgb[..., 1] = green >> 1
+    rgb[..., 2] = raw[by::stride, bx::stride]
+
+    if (rgb.shape[1], rgb.shape[0]) != target:
+        rgb = cv2.resize(rgb, target, interpolation=cv2.INTER_AREA)
+    return rgb
@@ -6,25 +6,49 @@ Project: TOSCA Laser Control System
 Purpose: Camera hardware abstraction layer for Allied Vision cameras.
 Provides PyQt6-integrated camera control with:
 - Live streaming with Qt signals
-- Exposure and gain control
+- Exposure and gain control (software auto exposure/gain on a ROI)
+- Acquisition profiles (sensor ROI, binning, pixel format, frame rate)
 - Still image capture
-- Video recording
+- Video recording with a frame -> time index (see video_index)
+- Frame ID / timestamp tracking and dropped-frame detection
 - Thread-safe camera operations
 Safety Critical: No
 """
 
+import dataclasses
+import functools
 import logging
 import os
 import threading
+import time
+from concurrent.futures import Future
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 import cv2
 import numpy as np
 from PyQt6.QtCore import QObject, QThread, pyqtSignal
 from PyQt6.QtGui import QImage, QPixmap
 
+from hardware.acquisition_profiles import (
+    ACQUISITION_PROFILES,
+    FULL_VIEW,
+    AcquisitionProfile,
+    sensor_roi,
+)
+from hardware.auto_exposure import (
+    AutoExposureConfig,
+    AutoExposureController,
+    AutoExposureStep,
+    Roi,
+)
+from hardware.bayer import bayer_pattern, demosaic, demosaic_superpixel
+from hardware.raw_recording import RAW_SUFFIX, RawFrameWriter, RawTranscoder
+from hardware.still_capture import BurstBuffer, StillCaptureWriter
+from hardware.video_index import FrameDropDetector, FrameIndexWriter, FrameInfo, frame_index_path
+from utils.instrumentation import instrumented
+
 try:
     import vmbpy
 
@@ -46,18 +70,30 @@ class CameraStreamThread(QThread):
     pixmap_ready = pyqtSignal(QPixmap)  # Emits QPixmap frames (for GUI display - FAST!)
     error_occurred = pyqtSignal(str)
     fps_update = pyqtSignal(float)
+    frames_dropped = pyqtSignal(int)  # Total dropped frames, emitted when a frame ID gap is seen
 
     def __init__(
-        self, camera: "vmbpy.Camera", controller: "CameraController", display_scale: float = 1.0
+        self,
+        camera: "vmbpy.Camera",
+        controller: "CameraController",
+        display_scale: float = 1.0,
+        buffer_count: int = 5,
     ) -> None:
         super().__init__()
         self.camera = camera
         self.controller = (
             controller  # Reference to parent controller for accessing lock and attributes
         )
+        self.buffer_count = buffer_count  # Driver frame buffers (from the acquisition profile)
         self.running = False
         self.frame_count = 0
-        self.start_time: Optional[float] = None
+        self.start_time: Optional[float] = None  # time.monotonic() when streaming started
+
+        # Frame identity and timing (camera frame ID gaps = dropped frames)
+        self.drop_detector = FrameDropDetector()
+        self.latest_frame_info: Optional[FrameInfo] = None
+        self._drops_since_recorded = 0  # Drops not yet attributed to a recorded frame
+        self.raw_frame_layout: Optional[tuple[tuple[int, ...], Any]] = None  # (shape, dtype)
 
         # Display scale for GUI frames (downsampling before transfer)
         self.display_scale = display_scale  # 1.0 = full, 0.5 = half, 0.25 = quarter
@@ -69,7 +105,7 @@ class CameraStreamThread(QThread):
 
     def _convert_pixel_format(self, frame_data: np.ndarray, pixel_format: Any) -> np.ndarray:
         """
-        Convert camera frame to RGB8 format for GUI display.
+        Convert camera frame to RGB8 format at full resolution.
 
         Args:
             frame_data: Raw frame data from camera
@@ -78,6 +114,7 @@ class CameraStreamThread(QThread):
         Returns:
             RGB8 frame data as contiguous numpy array
         """
+        pattern = bayer_pattern(pixel_format)
         try:
             if pixel_format == vmbpy.PixelFormat.Mono8:
                 return cv2.cvtColor(frame_data, cv2.COLOR_GRAY2RGB)
@@ -85,13 +122,8 @@ class CameraStreamThread(QThread):
                 return cv2.cvtColor(frame_data, cv2.COLOR_BGR2RGB)
             elif pixel_format == vmbpy.PixelFormat.Rgb8:
                 return np.ascontiguousarray(frame_data)
-            elif pixel_format in (
-                vmbpy.PixelFormat.BayerRG8,
-                vmbpy.PixelFormat.BayerGR8,
-                vmbpy.PixelFormat.BayerGB8,
-                vmbpy.PixelFormat.BayerBG8,
-            ):
-                return cv2.cvtColor(frame_data, cv2.COLOR_BayerRG2RGB)
+            elif pattern is not None:
+                return demosaic(frame_data, pattern)
             elif pixel_format == vmbpy.PixelFormat.YUV422Packed:
                 return cv2.cvtColor(frame_data, cv2.COLOR_YUV2RGB_UYVY)
             else:
@@ -126,6 +158,31 @@ class CameraStreamThread(QThread):
 
         return cv2.resize(frame_rgb, (new_width, new_height), interpolation=cv2.INTER_AREA)
 
+    def _display_frame(
+        self, frame_data: np.ndarray, pixel_format: Any, frame_rgb: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        RGB8 frame for GUI display at display_scale.
+
+        Bayer frames are built straight from the mosaic at reduced resolution
+        (2x2 superpixels, then decimation) when the display scale is 0.5 or
+        less, so live view never runs a full-resolution demosaic.
+
+        Args:
+            frame_data: Raw frame data from camera
+            pixel_format: VmbPy pixel format enum
+            frame_rgb: Full-resolution RGB8 frame, if already converted
+
+        Returns:
+            RGB8 frame at display resolution
+        """
+        pattern = bayer_pattern(pixel_format)
+        if pattern is not None and self.display_scale <= 0.5:
+            return demosaic_superpixel(frame_data, pattern, self.display_scale)
+        if frame_rgb is None:
+            frame_rgb = self._convert_pixel_format(frame_data, pixel_format)
+        return self._apply_display_scale(frame_rgb)
+
     def _create_pixmap(self, frame_rgb: np.ndarray) -> QPixmap:
         """
         Convert RGB8 numpy array to QPixmap for GUI display.
@@ -141,12 +198,35 @@ class CameraStreamThread(QThread):
         q_image = QImage(frame_rgb.data, width, height, bytes_per_line, QImage.Format.Format_RGB888)
         return QPixmap.fromImage(q_image)
 
+    def _read_frame_info(self, frame: Any, host_monotonic_ns: int) -> FrameInfo:
+        """
+        Read the camera frame ID and device timestamp, and check for dropped frames.
+
+        Args:
+            frame: VmbPy frame
+            host_monotonic_ns: time.monotonic_ns() at callback entry
+
+        Returns:
+            Frame info (callback count as ID / 0 timestamp if the camera reports none)
+        """
+        try:
+            frame_id = int(frame.get_id())
+        except Exception:
+            frame_id = self.frame_count
+        try:
+            device_timestamp_ns = int(frame.get_timestamp())
+        except Exception:
+            device_timestamp_ns = 0
+
+        dropped_before = self.drop_detector.update(frame_id)
+        return FrameInfo(frame_id, device_timestamp_ns, host_monotonic_ns, dropped_before)
+
     def _should_update_gui(self, current_time: float) -> bool:
         """
         Check if enough time has elapsed to update GUI (throttling).
 
         Args:
-            current_time: Current timestamp
+            current_time: Current time.monotonic() timestamp
 
         Returns:
             True if GUI should be updated, False to skip this frame
@@ -177,51 +257,97 @@ class CameraStreamThread(QThread):
 
     def run(self) -> None:  # noqa: C901
         """Start streaming frames."""
-        import time
-
         self.running = True
         self.frame_count = 0
-        self.start_time = time.time()
+        self.drop_detector = FrameDropDetector()
+        self._drops_since_recorded = 0
+        self.start_time = time.monotonic()
         self.last_gui_frame_time = 0.0  # Reset to ensure first frame passes
 
+        @instrumented("camera.frame_callback")
         def frame_callback(cam: Any, _stream: Any, frame: Any) -> None:
             """Callback for each frame (stream parameter unused but required by VmbPy API)."""
+            host_monotonic_ns = time.monotonic_ns()
             if not self.running:
                 logger.debug("Frame callback called but running=False")
                 return
 
             try:
                 self.frame_count += 1
-                current_time = time.time()
+                current_time = host_monotonic_ns / 1e9
+
+                frame_info = self._read_frame_info(frame, host_monotonic_ns)
+                self.latest_frame_info = frame_info
+                if frame_info.dropped_before:
+                    self._drops_since_recorded += frame_info.dropped_before
+                    logger.debug(
+                        f"{frame_info.dropped_before} frame(s) dropped before "
+                        f"frame ID {frame_info.frame_id}"
+                    )
+                    self.frames_dropped.emit(self.drop_detector.frames_dropped)
+
+                # Software auto exposure on every frame (decimated ROI statistics)
+                auto_exposure = self.controller.auto_exposure
+                if auto_exposure.enabled:
+                    step = auto_exposure.update(frame.as_numpy_ndarray())
+                    if step is not None:
+                        self.controller._apply_auto_exposure(step)
+
+                # Burst capture: every frame at full rate, copied into the preallocated buffer
+                if self.controller._burst is not None:
+                    self.controller._add_burst_frame(
+                        frame.as_numpy_ndarray(), frame.get_pixel_format(), frame_info
+                    )
+
+                # Raw recording: every frame at full rate, copied into the memory-mapped file
+                if self.controller._raw_recorder is not None:
+                    self.controller._write_raw_frame(frame.as_numpy_ndarray(), frame_info)
 
                 # Debug: Log first few frames
                 if self.frame_count <= 5:
-                    logger.info(f"Frame callback invoked: frame #{self.frame_count}")
+                    logger.info(
+                        f"Frame callback invoked: frame #{self.frame_count} "
+                        f"(camera frame ID {frame_info.frame_id})"
+                    )
 
                 # Throttle GUI updates using helper method
                 if self._should_update_gui(current_time):
                     # Convert frame to numpy array
                     frame_data = frame.as_numpy_ndarray()
                     pixel_format = frame.get_pixel_format()
+                    self.raw_frame_layout = (frame_data.shape, frame_data.dtype)
 
-                    # Convert to RGB8 using helper method
-                    frame_rgb = self._convert_pixel_format(frame_data, pixel_format)
+                    # Convert to RGB8 (Bayer: deferred, only capture/recording need full size)
+                    frame_rgb = None
+                    if bayer_pattern(pixel_format) is None:
+                        frame_rgb = self._convert_pixel_format(frame_data, pixel_format)
 
                     # Store latest frame for image capture (FULL resolution before downsampling)
                     with self.controller._lock:
-                        self.controller.latest_frame = frame_rgb.copy()
+                        if frame_rgb is None:
+                            self.controller._set_latest_raw_frame(frame_data.copy(), pixel_format)
+                        else:
+                            self.controller.latest_frame = frame_rgb.copy()
+                        self.controller.latest_frame_info = frame_info
 
                     # Write to video recorder if recording (FULL resolution)
                     with self.controller._lock:
                         if self.controller.is_recording and self.controller.video_recorder:
+                            if frame_rgb is None:
+                                frame_rgb = self._convert_pixel_format(frame_data, pixel_format)
                             frame_bgr = cv2.cvtColor(frame_rgb, cv2.COLOR_RGB2BGR)
-                            self.controller.video_recorder.write_frame(frame_bgr)
+                            # Index row counts every drop since the previous recorded frame
+                            recorded_info = dataclasses.replace(
+                                frame_info, dropped_before=self._drops_since_recorded
+                            )
+                            self.controller.video_recorder.write_frame(frame_bgr, recorded_info)
+                            self._drops_since_recorded = 0
 
-                    # Apply display downsampling using helper method
-                    frame_rgb = self._apply_display_scale(frame_rgb)
+                    # Display-resolution frame using helper method
+                    display_rgb = self._display_frame(frame_data, pixel_format, frame_rgb)
 
                     # Convert to QPixmap using helper method
-                    pixmap = self._create_pixmap(frame_rgb)
+                    pixmap = self._create_pixmap(display_rgb)
 
                     # Debug: Log first few pixmap emissions
                     if self.gui_frame_count <= 5:
@@ -240,7 +366,7 @@ class CameraStreamThread(QThread):
                     self.gui_frame_count += 1
 
                     # Log debug info using helper method
-                    self._log_debug_info(frame_rgb, pixel_format, current_time)
+                    self._log_debug_info(display_rgb, pixel_format, current_time)
 
                 # Calculate and emit camera FPS every 30 frames (real camera rate)
                 if self.frame_count % 30 == 0:
@@ -256,7 +382,7 @@ class CameraStreamThread(QThread):
                 cam.queue_frame(frame)
 
         try:
-            self.camera.start_streaming(frame_callback)
+            self.camera.start_streaming(frame_callback, buffer_count=self.buffer_count)
 
             # Keep thread alive while streaming
             while self.running:
@@ -291,6 +417,9 @@ class VideoRecorder:
         """
         Initialize video recorder with compression settings.
 
+        A frame index (<video>.frames.csv) is written next to the video with
+        the camera frame ID and timestamps of every recorded frame.
+
         Args:
             output_path: Path to output video file
             fps: Frames per second for video
@@ -309,6 +438,7 @@ class VideoRecorder:
         self.writer: Optional[cv2.VideoWriter] = None
         self.frame_count = 0
         self.actual_codec_used: str = ""
+        self.index: Optional[FrameIndexWriter] = None
 
         # Ensure output directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -319,6 +449,8 @@ class VideoRecorder:
         if not self.writer or not self.writer.isOpened():
             raise RuntimeError(f"Failed to open video writer: {output_path}")
 
+        self.index = FrameIndexWriter(frame_index_path(output_path))
+
         logger.info(
             f"Video recorder initialized: {output_path}, "
             f"codec={self.actual_codec_used}, crf={quality_crf}, fps={fps}"
@@ -408,12 +540,14 @@ class VideoRecorder:
         logger.error(f"Both {self.codec} and {self.fallback_codec} codecs failed")
         self.actual_codec_used = "none"
 
-    def write_frame(self, frame: np.ndarray) -> None:
+    def write_frame(self, frame: np.ndarray, frame_info: Optional[FrameInfo] = None) -> None:
         """
         Write frame to video.
 
         Args:
             frame: Numpy array frame (BGR format)
+            frame_info: Camera frame ID and timestamps for the frame index
+                        (host arrival time only if not given)
         """
         if self.writer and self.writer.isOpened():
             # Resize if needed
@@ -423,12 +557,17 @@ class VideoRecorder:
             self.writer.write(frame)
             self.frame_count += 1
 
+            if self.index:
+                self.index.write(frame_info or FrameInfo(-1, 0, time.monotonic_ns()))
+
     def close(self) -> None:
-        """Close video writer."""
+        """Close video writer and frame index."""
         if self.writer:
             self.writer.release()
             logger.info(f"Video saved: {self.output_path} ({self.frame_count} frames)")
             self.writer = None
+        if self.index:
+            self.index.close()
 
 
 class CameraController(QObject):
@@ -445,10 +584,25 @@ class CameraController(QObject):
     connection_changed = pyqtSignal(bool)  # True=connected, False=disconnected
     error_occurred = pyqtSignal(str)
     recording_status_changed = pyqtSignal(bool)  # True=recording, False=stopped
+    frames_dropped = pyqtSignal(int)  # Total frames dropped this stream (frame ID gaps)
+    acquisition_profile_changed = pyqtSignal(str)  # Name of the applied profile
     exposure_changed = pyqtSignal(float)  # Emits new exposure in µs (thread-safe)
     gain_changed = pyqtSignal(float)  # Emits new gain in dB (thread-safe)
+    image_captured = pyqtSignal(str)  # Path of a still image once written
+    burst_captured = pyqtSignal(list)  # Paths of a burst's images once all are written
 
-    def __init__(self, event_logger: Optional[Any] = None) -> None:
+    # Internal: still capture completion from the writer pool -> GUI thread
+    _capture_finished = pyqtSignal(str, object)  # (kind: "image"/"burst", Future)
+
+    def __init__(
+        self,
+        event_logger: Optional[Any] = None,
+        auto_exposure_config: Optional[AutoExposureConfig] = None,
+        still_writer: Optional[StillCaptureWriter] = None,
+        record_raw: bool = False,
+        raw_max_seconds: float = 120.0,
+        raw_transcoder: Optional[RawTranscoder] = None,
+    ) -> None:
         super().__init__()
 
         if not VMBPY_AVAILABLE:
@@ -467,21 +621,31 @@ class CameraController(QObject):
         self.event_logger = event_logger
         self._vmb_context_active = False  # Track VmbSystem context state
 
-        # Store latest frame for image capture
-        self.latest_frame: Optional[np.ndarray] = None
+        # Store latest frame for image capture (Bayer frames kept raw until needed)
+        self._latest_frame: Optional[np.ndarray] = None
+        self._latest_raw_frame: Optional[tuple[np.ndarray, Any]] = None
+        self.latest_frame_info: Optional[FrameInfo] = None
+
+        # Sensor ROI, binning, frame rate and buffers (see apply_acquisition_profile)
+        self.acquisition_profile: AcquisitionProfile = FULL_VIEW
 
         # Display scale for GUI frames (1.0 = full, 0.5 = half, 0.25 = quarter)
         # Lower scale = faster frame rates due to reduced transfer overhead
-        self.display_scale = 0.25  # Default to quarter resolution for 30 FPS performance
+        self.display_scale = FULL_VIEW.display_scale  # Quarter resolution for 30 FPS performance
+
+        # Software auto exposure/gain (runs in the stream thread)
+        self.auto_exposure = AutoExposureController(auto_exposure_config)
 
-        # Auto mode polling (reads hardware values when auto exposure/gain enabled)
-        from PyQt6.QtCore import QTimer
+        # Still images are converted and encoded on a worker pool (see still_capture)
+        self.still_writer = still_writer or StillCaptureWriter()
+        self._burst: Optional[tuple[BurstBuffer, Path, str]] = None  # (buffer, dir, base name)
+        self._capture_finished.connect(self._handle_capture_finished)
 
-        self._auto_polling_timer = QTimer()
-        self._auto_polling_timer.setInterval(100)  # Poll every 100ms
-        self._auto_polling_timer.timeout.connect(self._poll_auto_values)
-        self._auto_exposure_enabled = False
-        self._auto_gain_enabled = False
+        # Lossless full-rate recording (see raw_recording); record_raw selects it by default
+        self.record_raw = record_raw
+        self.raw_max_seconds = raw_max_seconds  # Preallocated length
+        self.raw_transcoder = raw_transcoder  # Background H.264 copy (None = keep raw only)
+        self._raw_recorder: Optional[RawFrameWriter] = None
 
         logger.info("Camera controller initialized (thread-safe)")
 
@@ -493,6 +657,28 @@ class CameraController(QObject):
         except Exception:
             pass  # Ignore errors during cleanup
 
+    @property
+    def latest_frame(self) -> Optional[np.ndarray]:
+        """Latest full-resolution RGB8 frame (Bayer frames are demosaiced on first access)."""
+        with self._lock:
+            if self._latest_frame is None and self._latest_raw_frame is not None:
+                frame_data, pixel_format = self._latest_raw_frame
+                self._latest_frame = demosaic(frame_data, bayer_pattern(pixel_format))
+                self._latest_raw_frame = None
+            return self._latest_frame
+
+    @latest_frame.setter
+    def latest_frame(self, frame: Optional[np.ndarray]) -> None:
+        with self._lock:
+            self._latest_frame = frame
+            self._latest_raw_frame = None
+
+    def _set_latest_raw_frame(self, frame_data: np.ndarray, pixel_format: Any) -> None:
+        """Store a raw Bayer frame as the latest frame without demosaicing it yet."""
+        with self._lock:
+            self._latest_frame = None
+            self._latest_raw_frame = (frame_data, pixel_format)
+
     def connect(self, camera_id: Optional[str] = None) -> bool:
         """
         Connect to camera.
@@ -531,24 +717,7 @@ class CameraController(QObject):
                 self.camera.__enter__()
                 self.is_connected = True
 
-                # Set explicit pixel format for predictable streaming (per Allied Vision docs)
-                try:
-                    supported_formats = self.camera.get_pixel_formats()
-                    # Prefer Bgr8 (native OpenCV format) > Rgb8 > Mono8
-                    if vmbpy.PixelFormat.Bgr8 in supported_formats:
-                        self.camera.set_pixel_format(vmbpy.PixelFormat.Bgr8)
-                        logger.info("Camera pixel format set to Bgr8 (native OpenCV format)")
-                    elif vmbpy.PixelFormat.Rgb8 in supported_formats:
-                        self.camera.set_pixel_format(vmbpy.PixelFormat.Rgb8)
-                        logger.info("Camera pixel format set to Rgb8")
-                    elif vmbpy.PixelFormat.Mono8 in supported_formats:
-                        self.camera.set_pixel_format(vmbpy.PixelFormat.Mono8)
-                        logger.info("Camera pixel format set to Mono8")
-                    else:
-                        current_fmt = self.camera.get_pixel_format()
-                        logger.warning(f"Using camera default pixel format: {current_fmt}")
-                except Exception as e:
-                    logger.error(f"Failed to set pixel format: {e}")
+                self._apply_connect_settings()
 
                 self.connection_changed.emit(True)
 
@@ -609,6 +778,33 @@ class CameraController(QObject):
 
                 return False
 
+    def _apply_connect_settings(self) -> None:
+        """Set the pixel format and apply the acquisition profile to a freshly opened camera."""
+        # Set explicit pixel format for predictable streaming (per Allied Vision docs)
+        try:
+            supported_formats = self.camera.get_pixel_formats()
+            # Prefer Bgr8 (native OpenCV format) > Rgb8 > Mono8
+            if vmbpy.PixelFormat.Bgr8 in supported_formats:
+                self.camera.set_pixel_format(vmbpy.PixelFormat.Bgr8)
+                logger.info("Camera pixel format set to Bgr8 (native OpenCV format)")
+            elif vmbpy.PixelFormat.Rgb8 in supported_formats:
+                self.camera.set_pixel_format(vmbpy.PixelFormat.Rgb8)
+                logger.info("Camera pixel format set to Rgb8")
+            elif vmbpy.PixelFormat.Mono8 in supported_formats:
+                self.camera.set_pixel_format(vmbpy.PixelFormat.Mono8)
+                logger.info("Camera pixel format set to Mono8")
+            else:
+                current_fmt = self.camera.get_pixel_format()
+                logger.warning(f"Using camera default pixel format: {current_fmt}")
+        except Exception as e:
+            logger.error(f"Failed to set pixel format: {e}")
+
+        # The camera keeps ROI/binning from earlier sessions: start from the profile
+        try:
+            self._configure_acquisition(self.acquisition_profile)
+        except Exception as e:
+            logger.warning(f"Could not apply acquisition profile on connect: {e}")
+
     def disconnect(self) -> None:
         """Disconnect from camera."""
         with self._lock:
@@ -655,18 +851,29 @@ class CameraController(QObject):
             - connected (bool): Connection status
             - streaming (bool): Streaming state
             - recording (bool): Recording state
+            - recording_format (str | None): "video" or "raw" while recording
             - camera_id (str | None): Camera identifier if connected
             - frame_rate (float | None): Current FPS if streaming
+            - last_frame_id (int | None): Camera frame ID of the latest frame
+            - frames_dropped (int): Frames dropped this stream (frame ID gaps)
+            - acquisition_profile (str): Name of the active acquisition profile
         """
         with self._lock:
             status: dict[str, Any] = {
                 "connected": self.is_connected,
                 "streaming": self.is_streaming,
                 "recording": self.is_recording,
+                "recording_format": None,
                 "camera_id": None,
                 "frame_rate": None,
+                "last_frame_id": None,
+                "frames_dropped": 0,
+                "acquisition_profile": self.acquisition_profile.name,
             }
 
+            if self.is_recording:
+                status["recording_format"] = "raw" if self._raw_recorder else "video"
+
             if self.is_connected and self.camera:
                 try:
                     status["camera_id"] = self.camera.get_id()
@@ -675,6 +882,8 @@ class CameraController(QObject):
 
             if self.is_streaming and self.stream_thread:
                 status["frame_rate"] = getattr(self.stream_thread, "current_fps", None)
+                status["last_frame_id"] = self.stream_thread.drop_detector.last_frame_id
+                status["frames_dropped"] = self.stream_thread.drop_detector.frames_dropped
 
             return status
 
@@ -694,26 +903,30 @@ class CameraController(QObject):
 
         with self._lock:
             try:
-                # Try to set camera acquisition frame rate to 30 FPS
+                # Try to set camera acquisition frame rate to the profile's rate
+                target_fps = self.acquisition_profile.frame_rate
                 fps_info = self.get_acquisition_frame_rate_info()
-                if fps_info["max_fps"] >= 30.0:
+                if fps_info["max_fps"] >= target_fps:
                     # Hardware supports desired frame rate
-                    self.set_acquisition_frame_rate(30.0)
-                    logger.info("Using hardware frame rate control (30 FPS)")
+                    self.set_acquisition_frame_rate(target_fps)
+                    logger.info(f"Using hardware frame rate control ({target_fps:.0f} FPS)")
                 else:
                     # Hardware frame rate limited, use software throttling instead
                     logger.warning(
-                        f"Camera max FPS ({fps_info['max_fps']:.2f}) < 30. "
+                        f"Camera max FPS ({fps_info['max_fps']:.2f}) < {target_fps:.0f}. "
                         f"Using software throttling instead"
                     )
 
                 # Create stream thread with display scale for pre-transfer downsampling
-                self.stream_thread = CameraStreamThread(self.camera, self, self.display_scale)
+                self.stream_thread = CameraStreamThread(
+                    self.camera, self, self.display_scale, self.acquisition_profile.buffer_count
+                )
                 # NOTE: frame_ready signal NOT connected - all frame handling done in thread's frame_callback
                 self.stream_thread.pixmap_ready.connect(
                     self.pixmap_ready.emit
                 )  # Forward QPixmap to GUI
                 self.stream_thread.fps_update.connect(self.fps_update.emit)
+                self.stream_thread.frames_dropped.connect(self.frames_dropped.emit)
                 self.stream_thread.error_occurred.connect(self.error_occurred.emit)
                 self.stream_thread.start()
 
@@ -721,7 +934,10 @@ class CameraController(QObject):
                 scale_info = (
                     f" (display scale: {self.display_scale}×)" if self.display_scale < 1.0 else ""
                 )
-                logger.info(f"Camera streaming started at 30 FPS{scale_info}")
+                logger.info(
+                    f"Camera streaming started ({self.acquisition_profile.label}, "
+                    f"{target_fps:.0f} FPS){scale_info}"
+                )
                 return True
 
             except Exception as e:
@@ -732,28 +948,37 @@ class CameraController(QObject):
 
     def stop_streaming(self) -> None:
         """Stop camera streaming."""
+        # Wait for the stream thread outside the lock: its frame callback takes
+        # the same lock, so waiting while holding it stalls the callback (and
+        # the GUI thread) until the timeout forces termination.
         with self._lock:
-            if self.stream_thread:
-                self.stream_thread.stop()
-
-                # Wait with timeout to prevent app hang on exit
-                if not self.stream_thread.wait(2000):  # 2 second timeout
-                    logger.warning(
-                        "Camera stream thread did not stop gracefully, forcing termination"
-                    )
-                    self.stream_thread.terminate()
-                    self.stream_thread.wait(500)  # Brief wait after terminate
-
-                self.stream_thread = None
+            stream_thread = self.stream_thread
+            self.stream_thread = None
+            if stream_thread:
+                stream_thread.stop()
+
+        if stream_thread:
+            # Wait with timeout to prevent app hang on exit
+            if not stream_thread.wait(2000):  # 2 second timeout
+                logger.warning("Camera stream thread did not stop gracefully, forcing termination")
+                stream_thread.terminate()
+                stream_thread.wait(500)  # Brief wait after terminate
 
+        with self._lock:
             self.is_streaming = False
-            logger.info("Camera streaming stopped")
+            burst, self._burst = self._burst, None
+        if burst is not None and burst[0].filled:
+            logger.warning(f"Streaming stopped during burst: writing {burst[0].filled} frame(s)")
+            self._submit_burst(*burst)
+        logger.info("Camera streaming stopped")
 
     def capture_image(
         self, base_filename: str, output_dir: Optional[Path] = None
     ) -> Optional[Path]:
         """
-        Capture still image from camera.
+        Capture still image from camera and wait until it is written.
+
+        Prefer capture_image_async() on the GUI thread.
 
         Args:
             base_filename: Base filename (timestamp will be appended)
@@ -762,6 +987,31 @@ class CameraController(QObject):
         Returns:
             Path to saved image, or None if failed
         """
+        future = self.capture_image_async(base_filename, output_dir)
+        if future is None:
+            return None
+        try:
+            return future.result()
+        except Exception:
+            return None  # Reported through error_occurred
+
+    def capture_image_async(
+        self, base_filename: str = "capture", output_dir: Optional[Path] = None
+    ) -> Optional[Future]:
+        """
+        Capture still image from camera without blocking.
+
+        The latest frame is leased (no copy, the lock is held only to take
+        the reference) and converted/encoded on the still writer's pool.
+        image_captured is emitted with the path once the file is written.
+
+        Args:
+            base_filename: Base filename (timestamp will be appended)
+            output_dir: Output directory for image (defaults to PROJECT_ROOT/data/images)
+
+        Returns:
+            Future resolving to the image path, or None if no frame is available
+        """
         if output_dir is None:
             output_dir = PROJECT_ROOT / "data" / "images"
 
@@ -770,57 +1020,168 @@ class CameraController(QObject):
             return None
 
         with self._lock:
-            if self.latest_frame is None:
-                self.error_occurred.emit("No frame available to capture")
-                return None
+            lease = self._lease_latest_frame()
+        if lease is None:
+            self.error_occurred.emit("No frame available to capture")
+            return None
 
-            try:
-                # Ensure output directory exists
-                output_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            output_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            error_msg = f"Failed to capture image: {e}"
+            logger.error(error_msg)
+            self.error_occurred.emit(error_msg)
+            return None
 
-                # Create timestamped filename
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"{base_filename}_{timestamp}.png"
-                output_path = output_dir / filename
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        frame, convert = lease
+        output_path = output_dir / f"{base_filename}_{timestamp}"
+        future = self.still_writer.submit(output_path, frame, convert)
+        future.add_done_callback(lambda f: self._capture_finished.emit("image", f))
+        return future
 
-                # Convert to BGR if needed (VmbPy gives RGB, OpenCV saves BGR)
-                if len(self.latest_frame.shape) == 3 and self.latest_frame.shape[2] == 3:
-                    frame_bgr = cv2.cvtColor(self.latest_frame, cv2.COLOR_RGB2BGR)
-                else:
-                    frame_bgr = self.latest_frame
+    def capture_burst(
+        self, frame_count: int, base_filename: str = "burst", output_dir: Optional[Path] = None
+    ) -> bool:
+        """
+        Capture frame_count consecutive frames at the full camera rate.
 
-                # Save image
-                cv2.imwrite(str(output_path), frame_bgr)
+        The buffer is allocated here; the stream thread only copies each
+        frame into it. Once full, the frames are written in the background
+        to their own directory (with a frame index) and burst_captured is
+        emitted with the image paths.
 
-                logger.info(f"Image captured: {output_path}")
+        Args:
+            frame_count: Number of frames
+            base_filename: Base name of the burst directory and its images
+            output_dir: Parent directory (defaults to PROJECT_ROOT/data/images)
 
-                # Log event
-                if self.event_logger:
-                    from core.event_logger import EventType
+        Returns:
+            True if the burst started
+        """
+        if output_dir is None:
+            output_dir = PROJECT_ROOT / "data" / "images"
 
-                    self.event_logger.log_event(
-                        event_type=EventType.HARDWARE_CAMERA_CAPTURE,
-                        description=f"Image captured: {filename}",
-                        details={"output_path": str(output_path)},
-                    )
+        with self._lock:
+            if not self.is_streaming or self.stream_thread is None:
+                self.error_occurred.emit("Camera not streaming")
+                return False
+            if self._burst is not None:
+                self.error_occurred.emit("Burst capture already in progress")
+                return False
+            layout = self.stream_thread.raw_frame_layout
+            if layout is None:
+                self.error_occurred.emit("No frame available to capture")
+                return False
 
-                return output_path
+        try:
+            buffer = BurstBuffer(frame_count, *layout)
+        except (ValueError, MemoryError) as e:
+            self.error_occurred.emit(f"Cannot start burst capture: {e}")
+            return False
 
-            except Exception as e:
-                error_msg = f"Failed to capture image: {e}"
-                logger.error(error_msg)
-                self.error_occurred.emit(error_msg)
-                return None
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        with self._lock:
+            self._burst = (buffer, output_dir / f"{base_filename}_{timestamp}", base_filename)
+        logger.info(f"Burst capture started: {frame_count} frames")
+        return True
+
+    def _lease_latest_frame(self) -> Optional[tuple[np.ndarray, Any]]:
+        """
+        Latest frame for a capture worker, with its conversion to RGB8.
+
+        The stream thread replaces the latest frame rather than writing into
+        it, so the reference stays valid without a copy. Caller holds _lock.
+        """
+        if self._latest_raw_frame is not None:
+            frame_data, pixel_format = self._latest_raw_frame
+            return frame_data, functools.partial(demosaic, pattern=bayer_pattern(pixel_format))
+        if self._latest_frame is not None:
+            return self._latest_frame, None
+        return None
+
+    def _add_burst_frame(self, frame_data: np.ndarray, pixel_format: Any, info: FrameInfo) -> None:
+        """Copy a stream frame into the pending burst (stream thread)."""
+        with self._lock:
+            if self._burst is None:
+                return
+            buffer = self._burst[0]
+            try:
+                full = buffer.add(frame_data, info, pixel_format)
+            except ValueError as e:
+                self._burst = None
+                self.error_occurred.emit(f"Burst capture aborted: {e}")
+                return
+            if not full:
+                return
+            burst, self._burst = self._burst, None
+        self._submit_burst(*burst)
+
+    def _submit_burst(self, buffer: BurstBuffer, directory: Path, base_name: str) -> None:
+        """Hand a captured burst to the still writer."""
+        convert = None
+        if self.stream_thread is not None:
+            convert = functools.partial(
+                self.stream_thread._convert_pixel_format, pixel_format=buffer.pixel_format
+            )
+        elif bayer_pattern(buffer.pixel_format) is not None:
+            convert = functools.partial(demosaic, pattern=bayer_pattern(buffer.pixel_format))
+        future = self.still_writer.submit_burst(directory, base_name, buffer, convert)
+        future.add_done_callback(lambda f: self._capture_finished.emit("burst", f))
+
+    def _handle_capture_finished(self, kind: str, future: Future) -> None:
+        """Report a written still image or burst (GUI thread)."""
+        error = future.exception()
+        if error is not None:
+            error_msg = f"Failed to capture {kind}: {error}"
+            logger.error(error_msg)
+            self.error_occurred.emit(error_msg)
+            return
+
+        if kind == "image":
+            output_path = future.result()
+            logger.info(f"Image captured: {output_path}")
+            description = f"Image captured: {output_path.name}"
+            details: dict[str, Any] = {"output_path": str(output_path)}
+        else:
+            paths = future.result()
+            output_dir = paths[0].parent if paths else None
+            logger.info(f"Burst captured: {len(paths)} frames in {output_dir}")
+            description = f"Burst captured: {len(paths)} frames"
+            details = {"output_dir": str(output_dir), "frames": len(paths)}
+
+        if self.event_logger:
+            from core.event_logger import EventType
+
+            self.event_logger.log_event(
+                event_type=EventType.HARDWARE_CAMERA_CAPTURE,
+                description=description,
+                details=details,
+            )
+
+        if kind == "image":
+            self.image_captured.emit(str(future.result()))
+        else:
+            self.burst_captured.emit([str(path) for path in future.result()])
 
     def start_recording(
-        self, base_filename: str = "video", output_dir: Optional[Path] = None
+        self,
+        base_filename: str = "video",
+        output_dir: Optional[Path] = None,
+        raw: Optional[bool] = None,
     ) -> bool:
         """
         Start video recording.
 
+        Video recordings are encoded as frames reach the GUI (up to the GUI
+        rate). Raw recordings keep every camera frame losslessly at full rate
+        in a memory-mapped file (transcoded afterwards if a raw_transcoder is
+        set).
+
         Args:
             base_filename: Base filename for video
             output_dir: Output directory (defaults to PROJECT_ROOT/data/videos)
+            raw: Record raw frames (None = record_raw setting)
 
         Returns:
             True if recording started
@@ -838,10 +1199,17 @@ class CameraController(QObject):
         with self._lock:
             try:
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"{base_filename}_{timestamp}.mp4"
-                output_path = output_dir / filename
-
-                self.video_recorder = VideoRecorder(output_path)
+                if self.record_raw if raw is None else raw:
+                    output_path = output_dir / f"{base_filename}_{timestamp}{RAW_SUFFIX}"
+                    self._raw_recorder = self._create_raw_recorder(output_path)
+                    details = {"output_path": str(output_path), "format": "raw"}
+                else:
+                    output_path = output_dir / f"{base_filename}_{timestamp}.mp4"
+                    self.video_recorder = self._create_video_recorder(output_path)
+                    details = {
+                        "output_path": str(output_path),
+                        "frame_index": str(self.video_recorder.index.path),
+                    }
                 self.is_recording = True
                 self.recording_status_changed.emit(True)
 
@@ -853,8 +1221,8 @@ class CameraController(QObject):
 
                     self.event_logger.log_event(
                         event_type=EventType.HARDWARE_CAMERA_RECORDING_START,
-                        description=f"Video recording started: {filename}",
-                        details={"output_path": str(output_path)},
+                        description=f"Video recording started: {output_path.name}",
+                        details=details,
                     )
 
                 return True
@@ -877,16 +1245,81 @@ class CameraController(QObject):
 
                 return False
 
+    def _create_video_recorder(self, output_path: Path) -> VideoRecorder:
+        """Encoded video recorder at the size the current acquisition profile delivers."""
+        frame_size = (1456, 1088)
+        if self.latest_frame is not None:
+            frame_size = (self.latest_frame.shape[1], self.latest_frame.shape[0])
+        return VideoRecorder(output_path, frame_size=frame_size)
+
+    def _create_raw_recorder(self, output_path: Path) -> RawFrameWriter:
+        """Raw recorder preallocated for raw_max_seconds at the profile frame rate."""
+        layout = self.stream_thread.raw_frame_layout if self.stream_thread else None
+        if layout is None:
+            raise RuntimeError("no frame received yet")
+        pixel_format = self.camera.get_pixel_format() if self.camera else ""
+        capacity = max(1, int(self.raw_max_seconds * self.acquisition_profile.frame_rate))
+        return RawFrameWriter(
+            output_path,
+            *layout,
+            capacity=capacity,
+            pixel_format=getattr(pixel_format, "name", str(pixel_format)),
+        )
+
+    def _write_raw_frame(self, frame_data: np.ndarray, info: FrameInfo) -> None:
+        """Append a stream frame to the raw recording (stream thread)."""
+        with self._lock:
+            recorder = self._raw_recorder
+            if recorder is None:
+                return
+            try:
+                if recorder.write(frame_data, info):
+                    return
+                reason = f"Raw recording full ({recorder.capacity} frames) - recording stopped"
+            except ValueError as e:
+                reason = f"Raw recording stopped: {e}"
+        logger.warning(reason)
+        self.error_occurred.emit(reason)
+        self.stop_recording()
+
+    def _transcode_raw(self, raw_path: Path) -> None:
+        """Queue a finished raw recording for background transcoding."""
+
+        def _on_done(future: Future) -> None:
+            error = future.exception()
+            if error is not None:
+                error_msg = f"Raw recording transcode failed ({raw_path.name}): {error}"
+                logger.error(error_msg)
+                self.error_occurred.emit(error_msg)
+
+        self.raw_transcoder.submit(raw_path).add_done_callback(_on_done)
+
     def stop_recording(self) -> None:
         """Stop video recording."""
         with self._lock:
             if not self.is_recording:
                 return
 
+            details: dict[str, Any] = {}
             if self.video_recorder:
                 self.video_recorder.close()
+                details = {
+                    "output_path": str(self.video_recorder.output_path),
+                    "frames": self.video_recorder.frame_count,
+                }
                 self.video_recorder = None
 
+            raw_recorder, self._raw_recorder = self._raw_recorder, None
+            if raw_recorder is not None:
+                raw_recorder.close()
+                details = {
+                    "output_path": str(raw_recorder.path),
+                    "frames": raw_recorder.frame_count,
+                    "format": "raw",
+                }
+                if self.raw_transcoder is not None and raw_recorder.frame_count:
+                    self._transcode_raw(raw_recorder.path)
+
             self.is_recording = False
             self.recording_status_changed.emit(False)
             logger.info("Video recording stopped")
@@ -898,6 +1331,7 @@ class CameraController(QObject):
                 self.event_logger.log_event(
                     event_type=EventType.HARDWARE_CAMERA_RECORDING_STOP,
                     description="Video recording stopped",
+                    details=details,
                 )
 
     def set_exposure(self, exposure_us: float) -> bool:
@@ -920,6 +1354,7 @@ class CameraController(QObject):
 
                 # Read back actual value and emit signal
                 actual_exposure = self.camera.ExposureTime.get()
+                self.auto_exposure.exposure_us = actual_exposure
                 logger.debug(f"Exposure set to {actual_exposure} us (requested: {exposure_us})")
                 self.exposure_changed.emit(actual_exposure)
                 return True
@@ -947,6 +1382,7 @@ class CameraController(QObject):
 
                 # Read back actual value and emit signal
                 actual_gain = self.camera.Gain.get()
+                self.auto_exposure.gain_db = actual_gain
                 logger.debug(f"Gain set to {actual_gain} dB (requested: {gain_db})")
                 self.gain_changed.emit(actual_gain)
                 return True
@@ -1042,6 +1478,112 @@ class CameraController(QObject):
             logger.error(f"Failed to set binning: {e}")
             return False
 
+    def apply_acquisition_profile(self, profile: Union[str, AcquisitionProfile]) -> bool:
+        """
+        Switch the camera to an acquisition profile.
+
+        Streaming is stopped while ROI, binning, pixel format and frame rate
+        are written, then restarted with the profile's buffer count and
+        display scale. If the camera rejects any setting, the previous
+        profile is restored. Use SPOT_TRACKING.centred_on(x, y) to put the
+        ROI on the beam spot.
+
+        Args:
+            profile: Profile or profile name (see ACQUISITION_PROFILES)
+
+        Returns:
+            True if the profile was applied
+        """
+        if isinstance(profile, str):
+            if profile not in ACQUISITION_PROFILES:
+                logger.error(f"Unknown acquisition profile: {profile}")
+                return False
+            profile = ACQUISITION_PROFILES[profile]
+
+        if not self.camera:
+            return False
+
+        if self.is_recording:
+            self.error_occurred.emit("Cannot change acquisition profile while recording")
+            return False
+
+        was_streaming = self.is_streaming
+        if was_streaming:
+            self.stop_streaming()
+
+        with self._lock:
+            previous = self.acquisition_profile
+            try:
+                geometry = self._configure_acquisition(profile)
+                self.acquisition_profile = profile
+                self.display_scale = profile.display_scale
+                error_msg = ""
+            except Exception as e:
+                error_msg = f"Failed to apply acquisition profile '{profile.name}': {e}"
+                self._restore_acquisition(previous)
+
+        if was_streaming:
+            self.start_streaming()
+
+        if error_msg:
+            logger.error(error_msg)
+            self.error_occurred.emit(error_msg)
+            return False
+
+        logger.info(
+            f"Acquisition profile '{profile.name}' applied: "
+            f"{geometry[2]}x{geometry[3]} at ({geometry[0]}, {geometry[1]}), "
+            f"binning {profile.binning}, {profile.frame_rate:.0f} FPS requested"
+        )
+        self.acquisition_profile_changed.emit(profile.name)
+        return True
+
+    def _restore_acquisition(self, profile: AcquisitionProfile) -> None:
+        """Put back a profile's settings after a failed switch (best effort)."""
+        try:
+            self._configure_acquisition(profile)
+        except Exception as e:
+            logger.error(f"Failed to restore acquisition profile '{profile.name}': {e}")
+
+    def _configure_acquisition(self, profile: AcquisitionProfile) -> tuple[int, int, int, int]:
+        """
+        Write a profile's sensor settings (camera must not be streaming).
+
+        Args:
+            profile: Acquisition profile
+
+        Returns:
+            Sensor window (offset_x, offset_y, width, height) in binned pixels
+        """
+        camera = self.camera
+        if not self.set_binning(profile.binning):
+            raise RuntimeError(f"Binning {profile.binning} rejected")
+
+        # Clear the offsets first so the new window always fits, then place it
+        camera.OffsetX.set(0)
+        camera.OffsetY.set(0)
+        geometry = sensor_roi(
+            profile,
+            int(camera.WidthMax.get()),
+            int(camera.HeightMax.get()),
+            camera.Width.get_increment(),
+            camera.Height.get_increment(),
+            camera.OffsetX.get_increment(),
+            camera.OffsetY.get_increment(),
+        )
+        offset_x, offset_y, width, height = geometry
+        camera.Width.set(width)
+        camera.Height.set(height)
+        camera.OffsetX.set(offset_x)
+        camera.OffsetY.set(offset_y)
+
+        if profile.pixel_format is not None:
+            camera.set_pixel_format(vmbpy.PixelFormat[profile.pixel_format])
+
+        # The maximum frame rate depends on the window, so set it last
+        self.set_acquisition_frame_rate(profile.frame_rate)
+        return geometry
+
     def get_binning(self) -> int:
         """
         Get current binning factor.
@@ -1063,8 +1605,10 @@ class CameraController(QObject):
         """
         Enable or disable auto exposure.
 
-        When enabled, starts polling to emit hardware value updates to UI.
-        Also sets auto exposure maximum limit to prevent frame drops.
+        Exposure is controlled in software from the brightness of the
+        auto-exposure ROI (see set_auto_exposure_roi()), measured on every
+        frame in the stream thread. The camera's own auto mode is switched
+        off; it does not know where the treatment spot is.
 
         Args:
             enabled: True to enable auto exposure, False to disable
@@ -1072,78 +1616,31 @@ class CameraController(QObject):
         Returns:
             True if successful
         """
-        if not self.camera:
-            return False
-
-        try:
-            mode = "Continuous" if enabled else "Off"
-            self.camera.ExposureAuto.set(mode)
-            self._auto_exposure_enabled = enabled
-            logger.debug(f"Auto exposure set to {mode}")
-
-            # Set auto exposure upper limit to prevent extreme values (frame drops)
-            if enabled:
-                # Limit to 30ms (30,000 µs) - safe for 30 FPS streaming
-                max_exposure_us = 30000.0
-                limit_set = False
-
-                # Try multiple feature names (varies by camera model and firmware)
-                limit_feature_names = [
-                    "ExposureAutoUpperLimit",  # Common on newer cameras
-                    "ExposureAutoMax",  # Alternative name
-                    "ExposureAutoLimitMax",  # Another variant
-                    "ExposureTimeUpperLimit",  # Yet another variant
-                ]
-
-                for feature_name in limit_feature_names:
-                    try:
-                        if hasattr(self.camera, feature_name):
-                            feature = getattr(self.camera, feature_name)
-                            # Get valid range to ensure we're not exceeding limits
-                            try:
-                                feat_min, feat_max = feature.get_range()
-                                clamped_value = min(max_exposure_us, feat_max)
-                                feature.set(clamped_value)
-                                logger.info(
-                                    f"Auto exposure max limited via {feature_name}: "
-                                    f"{clamped_value} µs ({clamped_value/1000:.1f}ms)"
-                                )
-                                limit_set = True
-                                break  # Success, stop trying
-                            except Exception as range_e:
-                                # Feature exists but get_range() failed, try setting anyway
-                                logger.debug(f"{feature_name}.get_range() failed: {range_e}")
-                                feature.set(max_exposure_us)
-                                logger.info(
-                                    f"Auto exposure max limited via {feature_name}: "
-                                    f"{max_exposure_us} µs (30ms) - no range check"
-                                )
-                                limit_set = True
-                                break
-                    except Exception as e:
-                        logger.debug(f"{feature_name} not available or failed: {e}")
-                        continue
-
-                if not limit_set:
-                    logger.warning(
-                        "Could not set auto exposure limit - camera may set extreme values causing frame drops. "
-                        f"Tried features: {', '.join(limit_feature_names)}. "
-                        "If camera sets high exposures (>30ms), disable auto exposure manually."
-                    )
+        with self._lock:
+            if not self.camera:
+                return False
 
-            # Start/stop polling timer based on auto mode states
-            self._update_auto_polling()
-            return True
-        except Exception as e:
-            logger.error(f"Failed to set auto exposure: {e}")
-            return False
+            try:
+                self.camera.ExposureAuto.set("Off")
+                if enabled and not self.auto_exposure.enabled:
+                    self._sync_auto_exposure()
+                self.auto_exposure.exposure_enabled = enabled
+                logger.debug(
+                    f"Auto exposure {'enabled' if enabled else 'disabled'} "
+                    f"(max {self.auto_exposure.max_exposure_us:.0f} µs)"
+                )
+                return True
+            except Exception as e:
+                logger.error(f"Failed to set auto exposure: {e}")
+                return False
 
     def set_auto_gain(self, enabled: bool) -> bool:
         """
         Enable or disable auto gain.
 
-        When enabled, starts polling to emit hardware value updates to UI.
-        Also sets auto gain maximum limit to prevent excessive noise.
+        Gain is raised only once exposure reaches its limit (and lowered
+        first), see AutoExposureController. The camera's own auto mode is
+        switched off.
 
         Args:
             enabled: True to enable auto gain, False to disable
@@ -1151,70 +1648,81 @@ class CameraController(QObject):
         Returns:
             True if successful
         """
-        if not self.camera:
-            return False
+        with self._lock:
+            if not self.camera:
+                return False
 
-        try:
-            mode = "Continuous" if enabled else "Off"
-            self.camera.GainAuto.set(mode)
-            self._auto_gain_enabled = enabled
-            logger.debug(f"Auto gain set to {mode}")
-
-            # Set auto gain upper limit to prevent excessive gain (noise)
-            if enabled:
-                # Limit to 24 dB - reasonable maximum to avoid excessive noise
-                max_gain_db = 24.0
-                limit_set = False
-
-                # Try multiple feature names (varies by camera model and firmware)
-                limit_feature_names = [
-                    "GainAutoUpperLimit",  # Common on newer cameras
-                    "GainAutoMax",  # Alternative name
-                    "GainAutoLimitMax",  # Another variant
-                    "GainUpperLimit",  # Yet another variant
-                ]
-
-                for feature_name in limit_feature_names:
-                    try:
-                        if hasattr(self.camera, feature_name):
-                            feature = getattr(self.camera, feature_name)
-                            # Get valid range to ensure we're not exceeding limits
-                            try:
-                                feat_min, feat_max = feature.get_range()
-                                clamped_value = min(max_gain_db, feat_max)
-                                feature.set(clamped_value)
-                                logger.info(
-                                    f"Auto gain max limited via {feature_name}: {clamped_value} dB"
-                                )
-                                limit_set = True
-                                break  # Success, stop trying
-                            except Exception as range_e:
-                                # Feature exists but get_range() failed, try setting anyway
-                                logger.debug(f"{feature_name}.get_range() failed: {range_e}")
-                                feature.set(max_gain_db)
-                                logger.info(
-                                    f"Auto gain max limited via {feature_name}: "
-                                    f"{max_gain_db} dB - no range check"
-                                )
-                                limit_set = True
-                                break
-                    except Exception as e:
-                        logger.debug(f"{feature_name} not available or failed: {e}")
-                        continue
-
-                if not limit_set:
-                    logger.warning(
-                        "Could not set auto gain limit - camera may use excessive gain causing noise. "
-                        f"Tried features: {', '.join(limit_feature_names)}. "
-                        "If image becomes noisy, disable auto gain manually."
-                    )
+            try:
+                self.camera.GainAuto.set("Off")
+                if enabled and not self.auto_exposure.enabled:
+                    self._sync_auto_exposure()
+                self.auto_exposure.gain_enabled = enabled
+                logger.debug(
+                    f"Auto gain {'enabled' if enabled else 'disabled'} "
+                    f"(max {self.auto_exposure.max_gain_db:.1f} dB)"
+                )
+                return True
+            except Exception as e:
+                logger.error(f"Failed to set auto gain: {e}")
+                return False
 
-            # Start/stop polling timer based on auto mode states
-            self._update_auto_polling()
-            return True
+    def set_auto_exposure_roi(self, roi: Optional[Roi]) -> bool:
+        """
+        Set the region auto exposure/gain is computed from.
+
+        Args:
+            roi: Normalised (x, y, width, height) as fractions of the frame,
+                 or None for the whole frame
+
+        Returns:
+            True if the region is valid
+        """
+        if roi is not None:
+            x, y, w, h = roi
+            if not (0.0 <= x < 1.0 and 0.0 <= y < 1.0 and w > 0.0 and h > 0.0):
+                logger.error(f"Invalid auto exposure ROI: {roi}")
+                return False
+            if x + w > 1.0 or y + h > 1.0:
+                logger.error(f"Auto exposure ROI extends beyond the frame: {roi}")
+                return False
+
+        self.auto_exposure.config.roi = roi
+        logger.info(f"Auto exposure ROI set to {roi if roi is not None else 'full frame'}")
+        return True
+
+    def _sync_auto_exposure(self) -> None:
+        """Seed the auto-exposure controller with the camera's values and limits."""
+        max_exposure_us = max_gain_db = None
+        try:
+            _, max_exposure_us = self.camera.ExposureTime.get_range()
+            _, max_gain_db = self.camera.Gain.get_range()
         except Exception as e:
-            logger.error(f"Failed to set auto gain: {e}")
-            return False
+            logger.debug(f"Exposure/gain range unavailable: {e}")
+        self.auto_exposure.sync(
+            self.camera.ExposureTime.get(), self.camera.Gain.get(), max_exposure_us, max_gain_db
+        )
+
+    def _apply_auto_exposure(self, step: AutoExposureStep) -> None:
+        """
+        Write auto exposure/gain settings (called from the stream thread).
+
+        Args:
+            step: Settings computed by the auto-exposure controller
+        """
+        with self._lock:
+            if not self.camera:
+                return
+
+            try:
+                if step.exposure_us is not None:
+                    self.camera.ExposureTime.set(step.exposure_us)
+                    self.exposure_changed.emit(step.exposure_us)
+                if step.gain_db is not None:
+                    self.camera.Gain.set(step.gain_db)
+                    self.gain_changed.emit(step.gain_db)
+            except Exception as e:
+                # Don't spam errors - auto exposure retries on the next frame
+                logger.debug(f"Auto exposure update failed (non-critical): {e}")
 
     def set_auto_white_balance(self, enabled: bool) -> bool:
         """
@@ -1267,43 +1775,6 @@ class CameraController(QObject):
 
             return True
 
-    def _update_auto_polling(self) -> None:
-        """Start or stop auto value polling based on auto mode states."""
-        should_poll = self._auto_exposure_enabled or self._auto_gain_enabled
-
-        if should_poll and not self._auto_polling_timer.isActive():
-            self._auto_polling_timer.start()
-            logger.debug("Auto value polling started (100ms interval)")
-        elif not should_poll and self._auto_polling_timer.isActive():
-            self._auto_polling_timer.stop()
-            logger.debug("Auto value polling stopped")
-
-    def _poll_auto_values(self) -> None:
-        """
-        Poll camera hardware for actual exposure/gain values during auto mode.
-
-        Called by timer every 100ms when auto exposure or auto gain is enabled.
-        Emits signals to update UI with hardware-determined values.
-        """
-        if not self.camera or not self.is_streaming:
-            return
-
-        with self._lock:
-            try:
-                # Poll exposure if auto exposure enabled
-                if self._auto_exposure_enabled:
-                    actual_exposure = self.camera.ExposureTime.get()
-                    self.exposure_changed.emit(actual_exposure)
-
-                # Poll gain if auto gain enabled
-                if self._auto_gain_enabled:
-                    actual_gain = self.camera.Gain.get()
-                    self.gain_changed.emit(actual_gain)
-
-            except Exception as e:
-                # Don't spam errors - auto polling fails gracefully
-                logger.debug(f"Auto value polling error (non-critical): {e}")
-
     def get_acquisition_frame_rate_info(self) -> dict:
         """
         Get information about camera's frame rate capabilities.
@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+"""
+Module: connection_orchestrator
+Project: TOSCA Laser Control System
+
+Purpose: Connect several hardware devices concurrently on worker threads.
+Each device's connect() runs on a thread pool; devices start as soon as the
+devices they depend on have connected, and are skipped if a dependency
+failed. Completion is marshalled back to the thread that owns the
+orchestrator (the GUI thread), so signals emitted by a dependency's
+connect() - e.g. GPIO connection_changed, which attaches the safety
+watchdog - are delivered before its dependents are started.
+Safety Critical: Yes (enforces GPIO/watchdog before laser connection)
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Callable, Optional, Sequence
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+logger = logging.getLogger(__name__)
+
+
+class DeviceState(Enum):
+    """Connection state of one device."""
+
+    PENDING = "pending"
+    CONNECTING = "connecting"
+    CONNECTED = "connected"
+    FAILED = "failed"
+    SKIPPED = "skipped"
+
+
+@dataclass
+class DeviceTiming:
+    """Startup result for one device."""
+
+    name: str
+    state: DeviceState = DeviceState.PENDING
+    start_offset_s: float = 0.0  # From orchestrator start until connect() was submitted
+    elapsed_s: float = 0.0  # Duration of connect()
+    error: str = ""
+
+
+@dataclass
+class StartupReport:
+    """Timing report for a concurrent connection run."""
+
+    devices: list[DeviceTiming] = field(default_factory=list)
+    total_s: float = 0.0
+
+    @property
+    def serial_s(self) -> float:
+        """Time the same connections would have taken one after another."""
+        return sum(device.elapsed_s for device in self.devices)
+
+    @property
+    def all_connected(self) -> bool:
+        """True if every device connected."""
+        return all(device.state == DeviceState.CONNECTED for device in self.devices)
+
+    def summary(self) -> str:
+        """Human-readable multi-line timing report."""
+        lines = [
+            f"Hardware startup: {self.total_s:.2f}s "
+            f"(sequential would take {self.serial_s:.2f}s)"
+        ]
+        for device in self.devices:
+            line = (
+                f"  {device.name:<10} {device.state.value:<10} "
+                f"start +{device.start_offset_s:.2f}s  took {device.elapsed_s:.2f}s"
+            )
+            if device.error:
+                line += f"  ({device.error})"
+            lines.append(line)
+        return "\n".join(lines)
+
+
+@dataclass
+class _Device:
+    """Registered device."""
+
+    name: str
+    connect_fn: Callable[[], bool]
+    depends_on: tuple[str, ...]
+    timing: DeviceTiming
+
+
+class ConnectionOrchestrator(QObject):
+    """
+    Connect hardware devices concurrently with dependency ordering.
+
+    Usage:
+        orchestrator = ConnectionOrchestrator()
+        orchestrator.add_device("gpio", lambda: gpio.connect(port))
+        orchestrator.add_device("laser", laser.connect, depends_on=["gpio"])
+        orchestrator.add_device("camera", camera.connect)
+        orchestrator.finished.connect(on_startup_finished)
+        orchestrator.start()
+
+    connect_fn must be thread-safe (hardware controllers serialise on their
+    own lock) and return True on success. Exceptions are reported as a
+    failed connection.
+
+    Signals:
+        device_started(str): connect() submitted for a device
+        device_finished(str, bool, float): device, success, elapsed seconds
+        device_skipped(str, str): device, reason (a dependency failed)
+        progress(int, int): devices done, total devices
+        finished(object): StartupReport once every device is done
+    """
+
+    device_started = pyqtSignal(str)
+    device_finished = pyqtSignal(str, bool, float)
+    device_skipped = pyqtSignal(str, str)
+    progress = pyqtSignal(int, int)
+    finished = pyqtSignal(object)
+
+    # Internal: worker thread -> owner thread (name, success, elapsed_s, error)
+    _device_done = pyqtSignal(str, bool, float, str)
+
+    def __init__(self, max_workers: Optional[int] = None, parent: Optional[QObject] = None) -> None:
+        """
+        Initialize orchestrator.
+
+        Args:
+            max_workers: Worker thread limit (default: one per device)
+            parent: Optional Qt parent
+        """
+        super().__init__(parent)
+        self._devices: dict[str, _Device] = {}
+        self._max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._start_time = 0.0
+        self._done_count = 0
+        self._running = False
+        self.report: Optional[StartupReport] = None
+
+        self._device_done.connect(self._handle_device_done)
+
+    @property
+    def is_running(self) -> bool:
+        """True while connections are in progress."""
+        return self._running
+
+    def add_device(
+        self, name: str, connect_fn: Callable[[], bool], depends_on: Sequence[str] = ()
+    ) -> None:
+        """
+        Register a device to connect.
+
+        Dependencies must be registered first, which also rules out cycles.
+
+        Args:
+            name: Unique device name
+            connect_fn: Blocking connect callable returning True on success
+            depends_on: Devices that must connect successfully first
+
+        Raises:
+            RuntimeError: If called while running
+            ValueError: If name is a duplicate or a dependency is unknown
+        """
+        if self._running:
+            raise RuntimeError("Cannot add devices while connecting")
+        if name in self._devices:
+            raise ValueError(f"Device '{name}' already registered")
+        unknown = [dep for dep in depends_on if dep not in self._devices]
+        if unknown:
+            raise ValueError(f"Device '{name}' depends on unregistered device(s): {unknown}")
+
+        self._devices[name] = _Device(name, connect_fn, tuple(depends_on), DeviceTiming(name))
+
+    def start(self) -> bool:
+        """
+        Start connecting all registered devices.
+
+        Returns:
+            False if already running or no devices are registered
+        """
+        if self._running or not self._devices:
+            return False
+
+        self._running = True
+        self._done_count = 0
+        self.report = None
+        for device in self._devices.values():
+            device.timing = DeviceTiming(device.name)
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._max_workers or len(self._devices),
+            thread_name_prefix="HardwareConnect",
+        )
+        self._start_time = time.perf_counter()
+        logger.info(f"Connecting {len(self._devices)} devices concurrently")
+
+        self._launch_ready()
+        return True
+
+    def _launch_ready(self) -> None:
+        """Submit devices whose dependencies are connected, skip those that can't run."""
+        for device in self._devices.values():
+            if device.timing.state != DeviceState.PENDING:
+                continue
+
+            dep_states = [self._devices[dep].timing.state for dep in device.depends_on]
+            blocked = [
+                dep
+                for dep, state in zip(device.depends_on, dep_states)
+                if state in (DeviceState.FAILED, DeviceState.SKIPPED)
+            ]
+            if blocked:
+                reason = f"dependency not connected: {', '.join(blocked)}"
+                device.timing.state = DeviceState.SKIPPED
+                device.timing.error = reason
+                device.timing.start_offset_s = time.perf_counter() - self._start_time
+                logger.warning(f"Skipping {device.name}: {reason}")
+                self.device_skipped.emit(device.name, reason)
+                self._mark_done()
+            elif all(state == DeviceState.CONNECTED for state in dep_states):
+                device.timing.state = DeviceState.CONNECTING
+                device.timing.start_offset_s = time.perf_counter() - self._start_time
+                logger.debug(f"Connecting {device.name}")
+                self.device_started.emit(device.name)
+                if self._executor is not None:
+                    self._executor.submit(self._run_connect, device.name, device.connect_fn)
+
+        if self._running and self._done_count == len(self._devices):
+            self._finish()
+
+    def _run_connect(self, name: str, connect_fn: Callable[[], bool]) -> None:
+        """Worker thread: run one blocking connect()."""
+        start = time.perf_counter()
+        error = ""
+        try:
+            success = bool(connect_fn())
+            if not success:
+                error = "connect() returned False"
+        except Exception as e:
+            logger.error(f"{name} connection raised: {e}")
+            success = False
+            error = str(e)
+        self._device_done.emit(name, success, time.perf_counter() - start, error)
+
+    def _handle_device_done(self, name: str, success: bool, elapsed_s: float, error: str) -> None:
+        """Owner thread: record a finished connect() and start dependents."""
+        device = self._devices.get(name)
+        if device is None or device.timing.state != DeviceState.CONNECTING:
+            return
+
+        device.timing.state = DeviceState.CONNECTED if success else DeviceState.FAILED
+        device.timing.elapsed_s = elapsed_s
+        device.timing.error = error
+        logger.info(f"{name} {'connected' if success else 'failed to connect'} in {elapsed_s:.2f}s")
+        self.device_finished.emit(name, success, elapsed_s)
+        self._mark_done()
+        self._launch_ready()
+
+    def _mark_done(self) -> None:
+        """Count a finished or skipped device and report progress."""
+        self._done_count += 1
+        self.progress.emit(self._done_count, len(self._devices))
+
+    def _finish(self) -> None:
+        """All devices done: build the report and release the workers."""
+        self._running = False
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+        self.report = StartupReport(
+            devices=[device.timing for device in self._devices.values()],
+            total_s=time.perf_counter() - self._start_time,
+        )
+        logger.info(self.report.summary())
+        self.finished.emit(self.report)
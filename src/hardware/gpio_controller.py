@@ -21,6 +21,25 @@ Serial Protocol (9600 baud, ASCII text commands):
 - GET_VIBRATION: Read vibration sensor
 - GET_PHOTODIODE: Read photodiode laser pickoff measurement voltage
 - GET_STATUS: Get complete system status
+
+Locking:
+- _command_lock serializes state-changing command sequences (send, verify,
+  update state) so concurrent user and protocol commands cannot interleave
+- _lock guards read-modify-write updates (e.g. vibration debouncing); it is
+  never held across serial I/O, event logging or signal emission
+- Status polls, the watchdog heartbeat and the state getters take neither
+  lock around I/O: the serial transport serializes port access
+- Cached state is published as an immutable, versioned GPIOState snapshot
+  (utils.state_snapshot), so readers get a consistent view without locking
+- _interlock_lock serializes interlock status changes; the resulting
+  signals are queued on a SignalOutbox and emitted, in order, after it is
+  released, so the safety manager (direct connection) never evaluates with
+  a GPIO lock held
+
+Status polling runs on monitor_timer (GUI thread) by default. With
+poll_in_background set before connect(), a dedicated thread polls instead,
+so interlock inputs (interlock_input, timestamped when observed) do not
+wait behind a busy GUI event loop.
 """
 
 from __future__ import annotations
@@ -28,10 +47,18 @@ from __future__ import annotations
 import logging
 import threading
 import time
-from typing import Any, Optional
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
 
 from PyQt6.QtCore import QObject, QTimer, pyqtSignal
 
+from utils.instrumentation import instrumented
+from utils.qt_timers import start_timer, stop_timer
+from utils.signal_outbox import SignalOutbox
+from utils.state_snapshot import SnapshotField, publish
+
+from .serial_transport import SerialTransport, TransportPriority, TransportTimeoutError
+
 logger = logging.getLogger(__name__)
 
 # Try to import pyserial
@@ -44,6 +71,30 @@ except ImportError:
     logger.warning("pyserial not available - GPIO features disabled")
 
 
+@dataclass(frozen=True, slots=True)
+class GPIOState:
+    """Immutable view of the GPIO controller state (see utils.state_snapshot)."""
+
+    version: int = 0
+    is_connected: bool = False
+    motor_enabled: bool = False
+    motor_speed_pwm: int = 0  # PWM value (0-153)
+    aiming_laser_enabled: bool = False
+    vibration_detected: bool = False
+    accelerometer_initialized: bool = False
+    accel_x: float = 0.0
+    accel_y: float = 0.0
+    accel_z: float = 0.0
+    vibration_level: float = 0.0
+    photodiode_voltage: float = 0.0
+    photodiode_power_mw: float = 0.0
+
+    @property
+    def safety_ok(self) -> bool:
+        """Safety interlock satisfied: motor ON and vibration detected."""
+        return self.motor_enabled and self.vibration_detected
+
+
 class GPIOController(QObject):
     """
     Arduino Nano GPIO controller with PyQt6 integration.
@@ -64,6 +115,9 @@ class GPIOController(QObject):
     # Threshold provides 5.7x safety margin above noise
     VIBRATION_THRESHOLD_G = 0.8
 
+    # Serial line timeout (per readline) used to derive per-command timeouts
+    SERIAL_READ_TIMEOUT_S = 1.0
+
     # Signals
     smoothing_motor_changed = pyqtSignal(bool)  # Motor state (on/off)
     motor_speed_changed = pyqtSignal(int)  # Motor PWM speed (0-153)
@@ -76,6 +130,22 @@ class GPIOController(QObject):
     connection_changed = pyqtSignal(bool)  # Connection status
     error_occurred = pyqtSignal(str)  # Error message
     safety_interlock_changed = pyqtSignal(bool)  # Safety OK status
+    interlock_input = pyqtSignal(bool, float)  # Safety OK status, time.monotonic() observed
+
+    # Published state (stored in the current GPIOState snapshot)
+    _snapshot = GPIOState()
+    is_connected = SnapshotField()
+    motor_enabled = SnapshotField()
+    motor_speed_pwm = SnapshotField()
+    aiming_laser_enabled = SnapshotField()
+    vibration_detected = SnapshotField()
+    accelerometer_initialized = SnapshotField()
+    accel_x = SnapshotField()
+    accel_y = SnapshotField()
+    accel_z = SnapshotField()
+    vibration_level = SnapshotField()
+    photodiode_voltage = SnapshotField()
+    photodiode_power_mw = SnapshotField()
 
     def __init__(self, event_logger: Optional[Any] = None) -> None:
         super().__init__()
@@ -86,32 +156,31 @@ class GPIOController(QObject):
         if not SERIAL_AVAILABLE:
             logger.warning("GPIO controller initialized in DISABLED mode - pyserial not available")
 
-        # Thread safety lock for serial communication (reentrant for nested calls)
-        self._lock = threading.RLock()
+        # Locks (see module docstring; reentrant for nested calls)
+        self._command_lock = threading.RLock()  # Serializes state-changing commands
+        self._lock = threading.RLock()  # Guards read-modify-write updates (short sections only)
+        self._interlock_lock = threading.RLock()  # Serializes interlock status changes
+        self._interlock_outbox = SignalOutbox()  # Interlock signals, emitted after the lock
 
         # Serial connection
         self.serial: Optional[serial.Serial] = None
         self.port: Optional[str] = None
+        self._transport: Optional[SerialTransport] = None
 
-        # State tracking
-        self.is_connected = False
-        self.motor_enabled = False
-        self.motor_speed_pwm = 0  # PWM value (0-153)
-        self.aiming_laser_enabled = False
-        self.vibration_detected = False
-        self.accelerometer_initialized = False
-        self.accel_x = 0.0
-        self.accel_y = 0.0
-        self.accel_z = 0.0
-        self.vibration_level = 0.0
-        self.photodiode_voltage = 0.0
-        self.photodiode_power_mw = 0.0
+        # State tracking (all fields start disconnected/off/zero)
+        self._snapshot = GPIOState()
+        self._last_safety_ok: Optional[bool] = None  # Last emitted interlock status
 
         # Monitoring timer
         self.monitor_timer = QTimer()
         self.monitor_timer.timeout.connect(self._update_status)
         self.monitor_timer.setInterval(100)  # Update every 100ms
 
+        # Optional dedicated polling thread (replaces monitor_timer when enabled)
+        self.poll_in_background = False
+        self._poll_thread: Optional[threading.Thread] = None
+        self._poll_stop = threading.Event()
+
         # Calibration constants
         self.photodiode_voltage_to_power = 400.0  # mW per volt (2000mW / 5V)
         self.vibration_debounce_count = 0
@@ -144,131 +213,227 @@ class GPIOController(QObject):
             logger.warning("Cannot connect - pyserial not available")
             return False
 
-        with self._lock:
+        error_msg = ""
+        with self._command_lock:
             try:
-                # Open serial connection
-                self.serial = serial.Serial(
-                    port=port,
-                    baudrate=9600,
-                    timeout=1.0,  # 1 second timeout for reads
-                    write_timeout=1.0,
-                )
-                self.port = port
+                self._open_connection(port)
+            except Exception as e:
+                error_msg = f"Arduino connection failed: {e}"
+                logger.error(error_msg)
+                self._close_connection()
 
-                # Wait for Arduino to reset (DTR toggling resets Arduino)
-                time.sleep(2.0)
+        # Signals and audit log outside the critical section
+        if error_msg:
+            self.error_occurred.emit(error_msg)
 
-                # Clear any startup messages from serial buffer
-                self.serial.reset_input_buffer()
-                self.serial.reset_output_buffer()
+            if self.event_logger:
+                from core.event_logger import EventSeverity, EventType
 
-                logger.info(f"Serial port opened: {port} at 9600 baud")
+                self.event_logger.log_event(
+                    event_type=EventType.HARDWARE_ERROR,
+                    description=error_msg,
+                    severity=EventSeverity.WARNING,
+                    details={"device": "Arduino Nano", "port": port},
+                )
 
-                # Verify firmware responds (use multi-line to handle full status response)
-                response = self._send_command("GET_STATUS", multi_line=True)
-                if "STATUS:" not in response:
-                    raise RuntimeError(f"Invalid firmware response: {response}")
+            return False
 
-                logger.info("Arduino watchdog firmware detected")
+        self.connection_changed.emit(True)
 
-                self.is_connected = True
-                self.connection_changed.emit(True)
+        if self.event_logger:
+            from core.event_logger import EventType
 
-                # Log event
-                if self.event_logger:
-                    from core.event_logger import EventType
+            self.event_logger.log_hardware_event(
+                event_type=EventType.HARDWARE_GPIO_CONNECT,
+                description=f"Arduino GPIO connected on {port}",
+                device_name="Arduino Nano (Watchdog Firmware)",
+            )
 
-                    self.event_logger.log_hardware_event(
-                        event_type=EventType.HARDWARE_GPIO_CONNECT,
-                        description=f"Arduino GPIO connected on {port}",
-                        device_name="Arduino Nano (Watchdog Firmware)",
-                    )
+        # Start monitoring
+        self._start_polling()
+        logger.info("GPIO controller connected successfully")
+        return True
 
-                # Start monitoring
-                self.monitor_timer.start()
-                logger.info("GPIO controller connected successfully")
+    def _open_connection(self, port: str) -> None:
+        """
+        Open the port, verify the firmware and initialize the accelerometer.
 
-                # Auto-initialize accelerometer (force I2C re-scan)
-                # Arduino only scans for accelerometer once during setup()
-                # If device wasn't ready then, it stays undetected
-                # Sending ACCEL_INIT forces re-scan and initialization
-                try:
-                    logger.info("Initializing accelerometer...")
-                    init_response = self._send_command("ACCEL_INIT")
-                    if "OK:ACCEL_INITIALIZED" in init_response:
-                        logger.info("Accelerometer initialized successfully")
-                    elif "ERROR:NO_ACCEL_FOUND" in init_response:
-                        logger.warning(
-                            "No accelerometer detected on I2C bus - "
-                            "check hardware connections (SDA=A4, SCL=A5)"
-                        )
-                    else:
-                        logger.warning(f"Unexpected accelerometer init response: {init_response}")
-                except Exception as e:
-                    logger.warning(f"Accelerometer initialization failed: {e}")
-                    # Don't fail connection if accelerometer init fails
-
-                return True
+        Caller must hold _command_lock.
 
-            except Exception as e:
-                error_msg = f"Arduino connection failed: {e}"
-                logger.error(error_msg)
-                self.error_occurred.emit(error_msg)
-
-                # Clean up on failure
-                if self.serial:
-                    try:
-                        self.serial.close()
-                    except Exception:
-                        pass
-                    self.serial = None
-
-                # Log error event
-                if self.event_logger:
-                    from core.event_logger import EventSeverity, EventType
-
-                    self.event_logger.log_event(
-                        event_type=EventType.HARDWARE_ERROR,
-                        description=error_msg,
-                        severity=EventSeverity.WARNING,
-                        details={"device": "Arduino Nano", "port": port},
-                    )
+        Args:
+            port: Serial port
 
-                return False
+        Raises:
+            Exception: If the port cannot be opened or the firmware does not respond
+        """
+        # Open serial connection
+        self.serial = serial.Serial(
+            port=port,
+            baudrate=9600,
+            timeout=self.SERIAL_READ_TIMEOUT_S,
+            write_timeout=1.0,
+        )
+        self.port = port
+
+        # Wait for Arduino to reset (DTR toggling resets Arduino)
+        time.sleep(2.0)
+
+        # Clear any startup messages from serial buffer
+        self.serial.reset_input_buffer()
+        self.serial.reset_output_buffer()
+
+        logger.info(f"Serial port opened: {port} at 9600 baud")
+
+        # All port I/O goes through the transport's I/O thread
+        # Buffers are flushed before every command to prevent response misalignment
+        self._transport = SerialTransport(
+            self.serial,
+            name="gpio",
+            flush_before_send=True,
+            command_key=lambda cmd: cmd.split(":", 1)[0],
+        )
+        self._transport.start()
+
+        # Verify firmware responds (use multi-line to handle full status response)
+        response = self._send_command("GET_STATUS", multi_line=True)
+        if "STATUS:" not in response:
+            raise RuntimeError(f"Invalid firmware response: {response}")
+
+        logger.info("Arduino watchdog firmware detected")
+
+        self._last_safety_ok = None  # Re-announce interlock status after (re)connect
+        self.is_connected = True
+
+        # Auto-initialize accelerometer (force I2C re-scan)
+        # Arduino only scans for accelerometer once during setup()
+        # If device wasn't ready then, it stays undetected
+        # Sending ACCEL_INIT forces re-scan and initialization
+        try:
+            logger.info("Initializing accelerometer...")
+            init_response = self._send_command("ACCEL_INIT")
+            if "OK:ACCEL_INITIALIZED" in init_response:
+                logger.info("Accelerometer initialized successfully")
+            elif "ERROR:NO_ACCEL_FOUND" in init_response:
+                logger.warning(
+                    "No accelerometer detected on I2C bus - "
+                    "check hardware connections (SDA=A4, SCL=A5)"
+                )
+            else:
+                logger.warning(f"Unexpected accelerometer init response: {init_response}")
+        except Exception as e:
+            logger.warning(f"Accelerometer initialization failed: {e}")
+            # Don't fail connection if accelerometer init fails
+
+    def _close_connection(self) -> None:
+        """Stop the transport and close the port (caller must hold _command_lock)."""
+        if self._transport:
+            self._transport.stop()
+            self._transport = None
+        if self.serial:
+            try:
+                self.serial.close()
+            except Exception as e:
+                logger.warning(f"Error closing serial connection: {e}")
+            self.serial = None
 
-    def disconnect(self) -> None:
-        """Disconnect from Arduino."""
         with self._lock:
-            self.stop_smoothing_motor()
-            self.stop_aiming_laser()
-            self.monitor_timer.stop()
-
-            if self.serial:
-                try:
-                    self.serial.close()
-                except Exception as e:
-                    logger.warning(f"Error closing serial connection: {e}")
-                self.serial = None
-
             self.port = None
             self.is_connected = False
-            self.connection_changed.emit(False)
-            logger.info("GPIO controller disconnected")
 
-            # Log event
-            if self.event_logger:
-                from core.event_logger import EventType
+    def _start_polling(self) -> None:
+        """Start status polling on the timer or, if enabled, the polling thread."""
+        if not self.poll_in_background:
+            start_timer(self.monitor_timer)
+            return
 
-                self.event_logger.log_hardware_event(
-                    event_type=EventType.HARDWARE_GPIO_DISCONNECT,
-                    description="Arduino GPIO disconnected",
-                    device_name="Arduino Nano",
-                )
+        interval_s = self.monitor_timer.interval() / 1000.0
+        self._poll_stop.clear()
+        self._poll_thread = threading.Thread(
+            target=self._poll_loop, args=(interval_s,), name="GPIOPoll", daemon=True
+        )
+        self._poll_thread.start()
+
+    def _stop_polling(self) -> None:
+        """Stop status polling (waits for the polling thread to exit)."""
+        stop_timer(self.monitor_timer)
+        self._poll_stop.set()
+        if self._poll_thread and self._poll_thread is not threading.current_thread():
+            self._poll_thread.join(timeout=5.0)
+        self._poll_thread = None
+
+    def _poll_loop(self, interval_s: float) -> None:
+        """
+        Poll sensors until stopped (polling thread).
+
+        Args:
+            interval_s: Delay between polls in seconds
+        """
+        while not self._poll_stop.wait(interval_s):
+            self._update_status()
+
+    def disconnect(self) -> None:
+        """Disconnect from Arduino."""
+        # Stop polling first so no poll is in flight when the port closes
+        self._stop_polling()
+        errors: list[str] = []
+        with self._command_lock:
+            motor_stopped = self._send_before_close(
+                self._send_motor_off, "Failed to stop motor", errors
+            )
+            laser_stopped = self._send_before_close(
+                self._send_aiming_laser_off, "Failed to disable aiming laser", errors
+            )
+            self._close_connection()
+
+        for error_msg in errors:
+            self.error_occurred.emit(error_msg)
+        if motor_stopped:
+            self._announce_motor_stopped()
+        if laser_stopped:
+            self._announce_aiming_laser_off()
+        self.connection_changed.emit(False)
+        logger.info("GPIO controller disconnected")
+
+        # Log event
+        if self.event_logger:
+            from core.event_logger import EventType
+
+            self.event_logger.log_hardware_event(
+                event_type=EventType.HARDWARE_GPIO_DISCONNECT,
+                description="Arduino GPIO disconnected",
+                device_name="Arduino Nano",
+            )
+
+    def _send_before_close(self, send: Callable[[], None], error: str, errors: list[str]) -> bool:
+        """
+        Send one shutdown command for disconnect() (caller must hold _command_lock).
+
+        Args:
+            send: _send_* helper to run
+            error: Message prefix if the command fails
+            errors: Failure messages, emitted by the caller once the lock is released
+
+        Returns:
+            True if the command was sent and acknowledged
+        """
+        if not self.is_connected:
+            return False
+        try:
+            send()
+            return True
+        except Exception as e:
+            error_msg = f"{error}: {e}"
+            logger.error(error_msg)
+            errors.append(error_msg)
+            return False
 
     def get_status(self) -> dict[str, Any]:
         """
         Get current GPIO status and state information.
 
+        Lock-free: built from one immutable state snapshot, so the fields are
+        mutually consistent and callers never wait behind serial I/O.
+
         Returns:
             Dictionary containing:
             - connected (bool): Connection status
@@ -279,30 +444,43 @@ class GPIOController(QObject):
             - photodiode_power_mw (float): Calculated power in mW
             - safety_ok (bool): Overall safety interlock status
         """
-        with self._lock:
-            safety_ok = self.motor_enabled and self.vibration_detected
-            return {
-                "connected": self.is_connected,
-                "motor_enabled": self.motor_enabled,
-                "vibration_detected": self.vibration_detected,
-                "aiming_laser_enabled": self.aiming_laser_enabled,
-                "photodiode_voltage": self.photodiode_voltage,
-                "photodiode_power_mw": self.photodiode_power_mw,
-                "safety_ok": safety_ok,
-            }
-
-    def _send_command(  # noqa: C901
+        snapshot = self._snapshot
+        return {
+            "connected": snapshot.is_connected,
+            "motor_enabled": snapshot.motor_enabled,
+            "vibration_detected": snapshot.vibration_detected,
+            "aiming_laser_enabled": snapshot.aiming_laser_enabled,
+            "photodiode_voltage": snapshot.photodiode_voltage,
+            "photodiode_power_mw": snapshot.photodiode_power_mw,
+            "safety_ok": snapshot.safety_ok,
+        }
+
+    @property
+    def snapshot(self) -> GPIOState:
+        """Current immutable GPIO state (lock-free; compare versions to detect change)."""
+        return self._snapshot
+
+    @staticmethod
+    def _is_multi_line_terminator(line: str) -> bool:
+        """Last line of a multi-line response (e.g. GET_STATUS)."""
+        return line.startswith("OK:") or line == "-----------------------------------"
+
+    @instrumented("gpio._send_command")
+    def _send_command(
         self,
         command: str,
         expect_response: bool = True,
         expected_prefix: Optional[str] = None,
         multi_line: bool = False,
         timeout_lines: int = 20,
+        priority: TransportPriority = TransportPriority.COMMAND,
     ) -> str:
         """
-        Send command to Arduino and read response with buffer flushing.
+        Send command to Arduino and read response via the serial transport.
 
-        FIX: Flushes serial buffers before sending to prevent response misalignment.
+        Serial buffers are flushed by the transport before each command to prevent
+        response misalignment. Requests are served in priority order, so SAFETY
+        commands (WDT_RESET) never wait behind queued sensor polls.
 
         Args:
             command: Command string (e.g., "WDT_RESET", "MOTOR_ON")
@@ -310,6 +488,7 @@ class GPIOController(QObject):
             expected_prefix: Expected response prefix for validation (e.g., "OK:", "VIBRATION:")
             multi_line: Whether to read multiple lines until terminator
             timeout_lines: Maximum lines to read for multi-line responses (safety limit)
+            priority: Transport queue lane for this command
 
         Returns:
             Response string from Arduino (or empty if no response expected)
@@ -317,88 +496,73 @@ class GPIOController(QObject):
         Raises:
             RuntimeError: If serial communication fails or response validation fails
         """
-        if not self.serial or not self.serial.is_open:
+        if not self.serial or not self.serial.is_open or self._transport is None:
             raise RuntimeError("Serial port not open")
 
-        with self._lock:
-            try:
-                # FIX 1: Clear any stale data from serial buffers BEFORE sending command
-                # This prevents reading old responses from previous commands
-                self.serial.reset_input_buffer()
-                self.serial.reset_output_buffer()
-
-                # Send command with newline terminator
-                cmd_bytes = (command + "\n").encode("utf-8")
-                self.serial.write(cmd_bytes)
-
-                # Selective logging: Skip routine monitoring commands to reduce log spam
-                is_routine = command in ["GET_PHOTODIODE", "GET_VIBRATION", "GET_MOTOR_STATUS"]
-                if not is_routine:
-                    logger.debug(f"Sent: {command}")
-
-                if not expect_response:
-                    return ""
-
-                # Read response
-                if multi_line:
-                    # FIX 3: Handle multi-line responses (e.g., GET_STATUS)
-                    lines = []
-                    for _ in range(timeout_lines):
-                        line = self.serial.readline().decode("utf-8").strip()
-                        if line:
-                            if not is_routine:
-                                logger.debug(f"Received: {line}")
-                            lines.append(line)
-                            # Stop at terminator
-                            if (
-                                line.startswith("OK:")
-                                or line == "-----------------------------------"
-                            ):
-                                break
-                    response = "\n".join(lines)
-                else:
-                    # Single line response (default)
-                    response: str = self.serial.readline().decode("utf-8").strip()
-                    if not is_routine:
-                        logger.debug(f"Received: {response}")
-
-                # FIX 4: Validate response matches expected format
-                if expected_prefix and not response.startswith(expected_prefix):
-                    logger.warning(
-                        f"Response validation failed: "
-                        f"expected '{expected_prefix}', got '{response}'"
-                    )
-                    # Don't raise error, just warn - allows graceful degradation
-                    # Could add retry logic here if needed
-
-                return response
+        # One readline timeout per expected line, plus margin for queueing
+        lines = timeout_lines if multi_line else 1
+        timeout_s = lines * self.SERIAL_READ_TIMEOUT_S + 1.0
 
-            except serial.SerialTimeoutException:
-                raise RuntimeError(f"Serial timeout sending command: {command}")
-            except Exception as e:
-                raise RuntimeError(f"Serial error: {e}")
+        try:
+            response = self._transport.request(
+                command,
+                expect_response=expect_response,
+                multi_line=multi_line,
+                is_terminator=self._is_multi_line_terminator,
+                max_lines=timeout_lines,
+                priority=priority,
+                timeout_s=timeout_s,
+            )
+        except (serial.SerialTimeoutException, TransportTimeoutError):
+            raise RuntimeError(f"Serial timeout sending command: {command}")
+        except Exception as e:
+            raise RuntimeError(f"Serial error: {e}")
+
+        # Selective logging: Skip routine monitoring commands to reduce log spam
+        is_routine = command in ["GET_PHOTODIODE", "GET_VIBRATION", "GET_MOTOR_STATUS"]
+        if not is_routine:
+            logger.debug(f"Sent: {command}")
+            if expect_response:
+                logger.debug(f"Received: {response}")
+
+        # Validate response matches expected format
+        if expected_prefix and not response.startswith(expected_prefix):
+            logger.warning(
+                f"Response validation failed: expected '{expected_prefix}', got '{response}'"
+            )
+            # Don't raise error, just warn - allows graceful degradation
+
+        return response
 
     def send_watchdog_heartbeat(self) -> bool:
         """
         Send heartbeat pulse to hardware watchdog timer.
 
-        Called by SafetyWatchdog every 500ms. Must be sent or
+        Called by SafetyWatchdog's heartbeat thread every 500ms. Must be sent or
         hardware watchdog will timeout after 1000ms and trigger
         emergency shutdown.
 
+        Does not take the controller lock: the heartbeat touches no controller
+        state, and the transport's SAFETY lane serves it ahead of any queued
+        sensor polls or motor/aiming commands. Worst-case delay is one
+        in-flight transaction.
+
         Returns:
             True if heartbeat sent successfully, False on error
         """
         if not self.is_connected or not self.serial:
             return False
 
-        with self._lock:
-            try:
-                response = self._send_command("WDT_RESET", expected_prefix="OK:WDT_RESET")
-                return "OK:WDT_RESET" in response
-            except Exception as e:
-                logger.error(f"Watchdog heartbeat failed: {e}")
-                return False
+        try:
+            response = self._send_command(
+                "WDT_RESET",
+                expected_prefix="OK:WDT_RESET",
+                priority=TransportPriority.SAFETY,
+            )
+            return "OK:WDT_RESET" in response
+        except Exception as e:
+            logger.error(f"Watchdog heartbeat failed: {e}")
+            return False
 
     def start_smoothing_motor(self) -> bool:
         """
@@ -411,37 +575,36 @@ class GPIOController(QObject):
             self.error_occurred.emit("GPIO not connected")
             return False
 
-        with self._lock:
-            try:
+        try:
+            with self._command_lock:
                 # Use default motor speed (100 PWM = ~2.0V)
                 response = self._send_command("MOTOR_SPEED:100", expected_prefix="OK:MOTOR_SPEED:")
+                if "OK:MOTOR_SPEED:" not in response:
+                    raise RuntimeError(f"Unexpected response: {response}")
+
+                publish(self, motor_enabled=True, motor_speed_pwm=100)
 
-                if "OK:MOTOR_SPEED:" in response:
-                    self.motor_enabled = True
-                    self.motor_speed_pwm = 100
-                    self.smoothing_motor_changed.emit(True)
-                    self.motor_speed_changed.emit(100)
-                    logger.info("Smoothing motor started at PWM 100")
+        except Exception as e:
+            error_msg = f"Failed to start motor: {e}"
+            logger.error(error_msg)
+            self.error_occurred.emit(error_msg)
+            return False
 
-                    # Log event
-                    if self.event_logger:
-                        from core.event_logger import EventType
+        self.smoothing_motor_changed.emit(True)
+        self.motor_speed_changed.emit(100)
+        logger.info("Smoothing motor started at PWM 100")
 
-                        self.event_logger.log_event(
-                            event_type=EventType.SAFETY_GPIO_OK,
-                            description="Smoothing motor started",
-                        )
+        # Log event
+        if self.event_logger:
+            from core.event_logger import EventType
 
-                    self._update_safety_status()
-                    return True
-                else:
-                    raise RuntimeError(f"Unexpected response: {response}")
+            self.event_logger.log_event(
+                event_type=EventType.SAFETY_GPIO_OK,
+                description="Smoothing motor started",
+            )
 
-            except Exception as e:
-                error_msg = f"Failed to start motor: {e}"
-                logger.error(error_msg)
-                self.error_occurred.emit(error_msg)
-                return False
+        self._update_safety_status()
+        return True
 
     def stop_smoothing_motor(self) -> bool:
         """
@@ -453,36 +616,43 @@ class GPIOController(QObject):
         if not self.is_connected:
             return False
 
-        with self._lock:
-            try:
-                response = self._send_command("MOTOR_OFF", expected_prefix="OK:MOTOR_OFF")
-
-                if "OK:MOTOR_OFF" in response:
-                    self.motor_enabled = False
-                    self.motor_speed_pwm = 0
-                    self.smoothing_motor_changed.emit(False)
-                    self.motor_speed_changed.emit(0)
-                    logger.info("Smoothing motor stopped")
-
-                    # Log event
-                    if self.event_logger:
-                        from core.event_logger import EventType
-
-                        self.event_logger.log_event(
-                            event_type=EventType.SAFETY_GPIO_FAIL,
-                            description="Smoothing motor stopped (safety interlock inactive)",
-                        )
-
-                    self._update_safety_status()
-                    return True
-                else:
-                    raise RuntimeError(f"Unexpected response: {response}")
+        try:
+            with self._command_lock:
+                self._send_motor_off()
 
-            except Exception as e:
-                error_msg = f"Failed to stop motor: {e}"
-                logger.error(error_msg)
-                self.error_occurred.emit(error_msg)
-                return False
+        except Exception as e:
+            error_msg = f"Failed to stop motor: {e}"
+            logger.error(error_msg)
+            self.error_occurred.emit(error_msg)
+            return False
+
+        self._announce_motor_stopped()
+        return True
+
+    def _send_motor_off(self) -> None:
+        """Switch the motor off and update cached state (caller must hold _command_lock)."""
+        response = self._send_command("MOTOR_OFF", expected_prefix="OK:MOTOR_OFF")
+        if "OK:MOTOR_OFF" not in response:
+            raise RuntimeError(f"Unexpected response: {response}")
+
+        publish(self, motor_enabled=False, motor_speed_pwm=0)
+
+    def _announce_motor_stopped(self) -> None:
+        """Emit signals and log the motor stop (no lock held)."""
+        self.smoothing_motor_changed.emit(False)
+        self.motor_speed_changed.emit(0)
+        logger.info("Smoothing motor stopped")
+
+        # Log event
+        if self.event_logger:
+            from core.event_logger import EventType
+
+            self.event_logger.log_event(
+                event_type=EventType.SAFETY_GPIO_FAIL,
+                description="Smoothing motor stopped (safety interlock inactive)",
+            )
+
+        self._update_safety_status()
 
     def set_motor_speed(self, pwm: int) -> bool:
         """
@@ -506,40 +676,37 @@ class GPIOController(QObject):
         # Clamp PWM to safe range
         pwm = max(0, min(153, pwm))
 
-        with self._lock:
-            try:
+        try:
+            with self._command_lock:
                 if pwm == 0:
                     # Stop motor
                     response = self._send_command("MOTOR_OFF", expected_prefix="OK:MOTOR_OFF")
-                    if "OK:MOTOR_OFF" in response:
-                        self.motor_enabled = False
-                        self.motor_speed_pwm = 0
-                        self.motor_speed_changed.emit(0)
-                        self.smoothing_motor_changed.emit(False)
-                        logger.info("Motor stopped (PWM=0)")
-                        return True
+                    if "OK:MOTOR_OFF" not in response:
+                        return False
                 else:
                     # Set motor speed
                     response = self._send_command(
                         f"MOTOR_SPEED:{pwm}", expected_prefix="OK:MOTOR_SPEED:"
                     )
-
-                    if f"OK:MOTOR_SPEED:{pwm}" in response:
-                        self.motor_enabled = True
-                        self.motor_speed_pwm = pwm
-                        self.motor_speed_changed.emit(pwm)
-                        self.smoothing_motor_changed.emit(True)
-                        voltage = (pwm / 255.0) * 5.0
-                        logger.info(f"Motor speed set to PWM {pwm} ({voltage:.2f}V)")
-                        return True
-                    else:
+                    if f"OK:MOTOR_SPEED:{pwm}" not in response:
                         raise RuntimeError(f"Unexpected response: {response}")
 
-            except Exception as e:
-                error_msg = f"Failed to set motor speed: {e}"
-                logger.error(error_msg)
-                self.error_occurred.emit(error_msg)
-                return False
+                publish(self, motor_enabled=pwm > 0, motor_speed_pwm=pwm)
+
+        except Exception as e:
+            error_msg = f"Failed to set motor speed: {e}"
+            logger.error(error_msg)
+            self.error_occurred.emit(error_msg)
+            return False
+
+        self.motor_speed_changed.emit(pwm)
+        self.smoothing_motor_changed.emit(pwm > 0)
+        if pwm == 0:
+            logger.info("Motor stopped (PWM=0)")
+        else:
+            voltage = (pwm / 255.0) * 5.0
+            logger.info(f"Motor speed set to PWM {pwm} ({voltage:.2f}V)")
+        return True
 
     def init_accelerometer(self) -> bool:
         """
@@ -555,24 +722,24 @@ class GPIOController(QObject):
             self.error_occurred.emit("GPIO not connected")
             return False
 
-        with self._lock:
-            try:
+        try:
+            with self._command_lock:
                 response = self._send_command("ACCEL_INIT")
+                initialized = "OK:ACCEL_INITIALIZED" in response or "0x68" in response
+                self.accelerometer_initialized = initialized
 
-                if "OK:ACCEL_INITIALIZED" in response or "0x68" in response:
-                    self.accelerometer_initialized = True
-                    logger.info("Accelerometer (MPU6050) initialized at 0x68")
-                    return True
-                else:
-                    self.accelerometer_initialized = False
-                    raise RuntimeError(f"Accelerometer not found: {response}")
+            if not initialized:
+                raise RuntimeError(f"Accelerometer not found: {response}")
 
-            except Exception as e:
-                error_msg = f"Failed to initialize accelerometer: {e}"
-                logger.error(error_msg)
-                self.error_occurred.emit(error_msg)
-                self.accelerometer_initialized = False
-                return False
+            logger.info("Accelerometer (MPU6050) initialized at 0x68")
+            return True
+
+        except Exception as e:
+            error_msg = f"Failed to initialize accelerometer: {e}"
+            logger.error(error_msg)
+            self.accelerometer_initialized = False
+            self.error_occurred.emit(error_msg)
+            return False
 
     def get_acceleration(self) -> tuple[float, float, float] | None:
         """
@@ -584,28 +751,25 @@ class GPIOController(QObject):
         if not self.is_connected or not self.accelerometer_initialized:
             return None
 
-        with self._lock:
-            try:
-                response = self._send_command("GET_ACCEL")
+        try:
+            response = self._send_command("GET_ACCEL")
 
-                # Parse response: "ACCEL:X,Y,Z"
-                for line in response.split("\n"):
-                    if "ACCEL:" in line:
-                        data = line.split("ACCEL:")[1].strip()
-                        x, y, z = map(float, data.split(","))
+            # Parse response: "ACCEL:X,Y,Z"
+            for line in response.split("\n"):
+                if "ACCEL:" in line:
+                    data = line.split("ACCEL:")[1].strip()
+                    x, y, z = map(float, data.split(","))
 
-                        self.accel_x = x
-                        self.accel_y = y
-                        self.accel_z = z
-                        self.accelerometer_data_changed.emit(x, y, z)
+                    publish(self, accel_x=x, accel_y=y, accel_z=z)
+                    self.accelerometer_data_changed.emit(x, y, z)
 
-                        return (x, y, z)
+                    return (x, y, z)
 
-                return None
+            return None
 
-            except Exception as e:
-                logger.error(f"Failed to read acceleration: {e}")
-                return None
+        except Exception as e:
+            logger.error(f"Failed to read acceleration: {e}")
+            return None
 
     def get_vibration_level(self) -> float | None:
         """
@@ -617,25 +781,24 @@ class GPIOController(QObject):
         if not self.is_connected or not self.accelerometer_initialized:
             return None
 
-        with self._lock:
-            try:
-                response = self._send_command("GET_VIBRATION_LEVEL")
+        try:
+            response = self._send_command("GET_VIBRATION_LEVEL")
 
-                # Parse response: "VIBRATION:magnitude"
-                for line in response.split("\n"):
-                    if "VIBRATION:" in line:
-                        vib = float(line.split("VIBRATION:")[1].strip())
+            # Parse response: "VIBRATION:magnitude"
+            for line in response.split("\n"):
+                if "VIBRATION:" in line:
+                    vib = float(line.split("VIBRATION:")[1].strip())
 
-                        self.vibration_level = vib
-                        self.vibration_level_changed.emit(vib)
+                    self.vibration_level = vib
+                    self.vibration_level_changed.emit(vib)
 
-                        return vib
+                    return vib
 
-                return None
+            return None
 
-            except Exception as e:
-                logger.error(f"Failed to read vibration level: {e}")
-                return None
+        except Exception as e:
+            logger.error(f"Failed to read vibration level: {e}")
+            return None
 
     def start_aiming_laser(self) -> bool:
         """
@@ -648,33 +811,33 @@ class GPIOController(QObject):
             self.error_occurred.emit("GPIO not connected")
             return False
 
-        with self._lock:
-            try:
+        try:
+            with self._command_lock:
                 response = self._send_command("LASER_ON", expected_prefix="OK:LASER_ON")
+                if "OK:LASER_ON" not in response:
+                    raise RuntimeError(f"Unexpected response: {response}")
 
-                if "OK:LASER_ON" in response:
-                    self.aiming_laser_enabled = True
-                    self.aiming_laser_changed.emit(True)
-                    logger.info("Aiming laser enabled")
+                self.aiming_laser_enabled = True
 
-                    if self.event_logger:
-                        from core.event_logger import EventType
+        except Exception as e:
+            error_msg = f"Failed to enable aiming laser: {e}"
+            logger.error(error_msg)
+            self.error_occurred.emit(error_msg)
+            return False
 
-                        self.event_logger.log_event(
-                            event_type=EventType.TREATMENT_LASER_ON,
-                            description="Aiming laser enabled",
-                            details={"laser_type": "aiming"},
-                        )
+        self.aiming_laser_changed.emit(True)
+        logger.info("Aiming laser enabled")
 
-                    return True
-                else:
-                    raise RuntimeError(f"Unexpected response: {response}")
+        if self.event_logger:
+            from core.event_logger import EventType
 
-            except Exception as e:
-                error_msg = f"Failed to enable aiming laser: {e}"
-                logger.error(error_msg)
-                self.error_occurred.emit(error_msg)
-                return False
+            self.event_logger.log_event(
+                event_type=EventType.TREATMENT_LASER_ON,
+                description="Aiming laser enabled",
+                details={"laser_type": "aiming"},
+            )
+
+        return True
 
     def stop_aiming_laser(self) -> bool:
         """
@@ -686,33 +849,40 @@ class GPIOController(QObject):
         if not self.is_connected:
             return False
 
-        with self._lock:
-            try:
-                response = self._send_command("LASER_OFF", expected_prefix="OK:LASER_OFF")
+        try:
+            with self._command_lock:
+                self._send_aiming_laser_off()
 
-                if "OK:LASER_OFF" in response:
-                    self.aiming_laser_enabled = False
-                    self.aiming_laser_changed.emit(False)
-                    logger.info("Aiming laser disabled")
+        except Exception as e:
+            error_msg = f"Failed to disable aiming laser: {e}"
+            logger.error(error_msg)
+            self.error_occurred.emit(error_msg)
+            return False
 
-                    if self.event_logger:
-                        from core.event_logger import EventType
+        self._announce_aiming_laser_off()
+        return True
 
-                        self.event_logger.log_event(
-                            event_type=EventType.TREATMENT_LASER_OFF,
-                            description="Aiming laser disabled",
-                            details={"laser_type": "aiming"},
-                        )
+    def _send_aiming_laser_off(self) -> None:
+        """Switch the aiming laser off and update cached state (caller must hold _command_lock)."""
+        response = self._send_command("LASER_OFF", expected_prefix="OK:LASER_OFF")
+        if "OK:LASER_OFF" not in response:
+            raise RuntimeError(f"Unexpected response: {response}")
 
-                    return True
-                else:
-                    raise RuntimeError(f"Unexpected response: {response}")
+        self.aiming_laser_enabled = False
 
-            except Exception as e:
-                error_msg = f"Failed to disable aiming laser: {e}"
-                logger.error(error_msg)
-                self.error_occurred.emit(error_msg)
-                return False
+    def _announce_aiming_laser_off(self) -> None:
+        """Emit signals and log the aiming laser switching off (no lock held)."""
+        self.aiming_laser_changed.emit(False)
+        logger.info("Aiming laser disabled")
+
+        if self.event_logger:
+            from core.event_logger import EventType
+
+            self.event_logger.log_event(
+                event_type=EventType.TREATMENT_LASER_OFF,
+                description="Aiming laser disabled",
+                details={"laser_type": "aiming"},
+            )
 
     def reinitialize_accelerometer(self) -> bool:
         """
@@ -734,126 +904,174 @@ class GPIOController(QObject):
             logger.warning("Cannot reinitialize accelerometer: GPIO not connected")
             return False
 
-        with self._lock:
-            try:
+        try:
+            with self._command_lock:
                 logger.info("Manually reinitializing accelerometer...")
                 response = self._send_command("ACCEL_INIT")
 
-                if "OK:ACCEL_INITIALIZED" in response:
-                    logger.info("Accelerometer reinitialized successfully")
-                    return True
-                elif "ERROR:NO_ACCEL_FOUND" in response:
-                    logger.warning(
-                        "No accelerometer detected on I2C bus - "
-                        "check hardware connections (SDA=A4, SCL=A5)"
-                    )
-                    return False
-                else:
-                    logger.warning(f"Unexpected accelerometer init response: {response}")
-                    return False
+        except Exception as e:
+            error_msg = f"Accelerometer reinitialization failed: {e}"
+            logger.error(error_msg)
+            self.error_occurred.emit(error_msg)
+            return False
 
-            except Exception as e:
-                error_msg = f"Accelerometer reinitialization failed: {e}"
-                logger.error(error_msg)
-                self.error_occurred.emit(error_msg)
-                return False
+        if "OK:ACCEL_INITIALIZED" in response:
+            logger.info("Accelerometer reinitialized successfully")
+            return True
+        elif "ERROR:NO_ACCEL_FOUND" in response:
+            logger.warning(
+                "No accelerometer detected on I2C bus - "
+                "check hardware connections (SDA=A4, SCL=A5)"
+            )
+            return False
+        else:
+            logger.warning(f"Unexpected accelerometer init response: {response}")
+            return False
 
+    @instrumented("gpio._update_status")
     def _update_status(self) -> None:  # noqa: C901
-        """Update all sensor readings (called by timer)."""
+        """
+        Update all sensor readings (called by timer or polling thread).
+
+        Takes no lock around serial I/O (the transport serializes the port
+        and serves user commands first); the controller lock only covers
+        the state update, and signals are emitted after it is released and
+        only for values that changed.
+        """
         if not self.is_connected:
             return
 
-        with self._lock:
-            try:
-                # Read vibration level from accelerometer
-                response = self._send_command("GET_VIBRATION_LEVEL", expected_prefix="VIBRATION:")
-                if "VIBRATION:" in response:
-                    try:
-                        value_str = response.split(":")[1].strip()
-                        vibration_magnitude = float(value_str)
-                        self.vibration_level = vibration_magnitude
-                        self.vibration_level_changed.emit(vibration_magnitude)
-
-                        # Detect vibration above calibrated threshold
-                        current_vibration = vibration_magnitude > self.VIBRATION_THRESHOLD_G
-
-                        # Debounce vibration detection
-                        if current_vibration:
-                            self.vibration_debounce_count += 1
-                            if self.vibration_debounce_count >= self.vibration_debounce_threshold:
-                                if not self.vibration_detected:
-                                    self.vibration_detected = True
-                                    self.smoothing_vibration_changed.emit(True)
-                                    logger.debug(f"Vibration detected: {vibration_magnitude:.3f}g")
-                    except (ValueError, IndexError) as e:
-                        logger.debug(f"Failed to parse vibration value: {e}")
-                else:
+        try:
+            # Read vibration level from accelerometer
+            response = self._send_command(
+                "GET_VIBRATION_LEVEL",
+                expected_prefix="VIBRATION:",
+                priority=TransportPriority.POLL,
+            )
+            vibration_magnitude: Optional[float] = None
+            if "VIBRATION:" in response:
+                try:
+                    vibration_magnitude = float(response.split(":")[1].strip())
+                except (ValueError, IndexError) as e:
+                    logger.debug(f"Failed to parse vibration value: {e}")
+            observed_at = time.monotonic()  # Interlock input timestamp
+
+            with self._lock:
+                previous = self._snapshot
+                vibration_detected = previous.vibration_detected
+                if vibration_magnitude is not None:
+                    # Detect vibration above calibrated threshold, debounced
+                    if vibration_magnitude > self.VIBRATION_THRESHOLD_G:
+                        self.vibration_debounce_count += 1
+                        if self.vibration_debounce_count >= self.vibration_debounce_threshold:
+                            vibration_detected = True
+                    publish(
+                        self,
+                        vibration_level=vibration_magnitude,
+                        vibration_detected=vibration_detected,
+                    )
+                elif "VIBRATION:" not in response:
                     # Reset debounce counter if no vibration
                     if self.vibration_debounce_count > 0:
                         self.vibration_debounce_count -= 1
-                        if self.vibration_debounce_count == 0 and self.vibration_detected:
-                            self.vibration_detected = False
-                            self.smoothing_vibration_changed.emit(False)
-                            logger.debug("Vibration stopped (debounced)")
-
-                # Update safety interlock status
-                self._update_safety_status()
-
-                # Read photodiode laser pickoff measurement voltage
-                response = self._send_command(
-                    "GET_PHOTODIODE", expected_prefix="photodiode laser pickoff measurement:"
-                )
-                if "photodiode laser pickoff measurement:" in response:
-                    voltage_str = response.split(":")[1].strip()
-                    self.photodiode_voltage = float(voltage_str)
-                    self.photodiode_voltage_changed.emit(self.photodiode_voltage)
-
-                    # Calculate laser power (mW)
-                    self.photodiode_power_mw = (
-                        self.photodiode_voltage * self.photodiode_voltage_to_power
-                    )
-                    self.photodiode_power_changed.emit(self.photodiode_power_mw)
-
-            except Exception as e:
-                logger.error(f"Error reading sensors: {e}")
-
-    def _update_safety_status(self) -> None:
+                        if self.vibration_debounce_count == 0:
+                            vibration_detected = False
+                    self.vibration_detected = vibration_detected
+
+            if vibration_magnitude is not None and vibration_magnitude != previous.vibration_level:
+                self.vibration_level_changed.emit(vibration_magnitude)
+            if vibration_detected != previous.vibration_detected:
+                self.smoothing_vibration_changed.emit(vibration_detected)
+                if vibration_detected:
+                    logger.debug(f"Vibration detected: {vibration_magnitude:.3f}g")
+                else:
+                    logger.debug("Vibration stopped (debounced)")
+
+            # Update safety interlock status
+            self._update_safety_status(observed_at)
+
+            # Read photodiode laser pickoff measurement voltage ("PHOTODIODE:v")
+            response = self._send_command(
+                "GET_PHOTODIODE",
+                expected_prefix="PHOTODIODE:",
+                priority=TransportPriority.POLL,
+            )
+            if response.startswith("PHOTODIODE:"):
+                voltage = float(response.split(":")[1].strip())
+                # Calculate laser power (mW)
+                power_mw = voltage * self.photodiode_voltage_to_power
+                if publish(self, photodiode_voltage=voltage, photodiode_power_mw=power_mw):
+                    self.photodiode_voltage_changed.emit(voltage)
+                    self.photodiode_power_changed.emit(power_mw)
+
+        except Exception as e:
+            logger.error(f"Error reading sensors: {e}")
+
+    def _update_safety_status(self, observed_at: Optional[float] = None) -> None:
         """
         Update safety interlock status.
 
         Safety OK when:
         - Motor is ON
         - Vibration is detected (motor is working)
+
+        Emits safety_interlock_changed and interlock_input only when the
+        status differs from the last emitted value (always once after
+        connecting).
+
+        Args:
+            observed_at: time.monotonic() when the inputs were read (default: now)
         """
-        safety_ok = self.motor_enabled and self.vibration_detected
-        self.safety_interlock_changed.emit(safety_ok)
+        observed_at = time.monotonic() if observed_at is None else observed_at
+        with self._interlock_lock:
+            safety_ok = self._snapshot.safety_ok
+            if safety_ok == self._last_safety_ok:
+                return
+            self._last_safety_ok = safety_ok
+            self._interlock_outbox.queue(self.interlock_input, safety_ok, observed_at)
+            self._interlock_outbox.queue(self.safety_interlock_changed, safety_ok)
+        self._interlock_outbox.flush()
 
     def get_safety_status(self) -> bool:
         """
-        Get current safety interlock status.
+        Get current safety interlock status (lock-free read of cached state).
 
         Returns:
             True if safety conditions met
         """
-        with self._lock:
-            return self.motor_enabled and self.vibration_detected
+        return self._snapshot.safety_ok
 
     def get_photodiode_voltage(self) -> float:
         """
         Get current photodiode laser pickoff measurement voltage.
 
+        Lock-free: returns the value cached by the last status poll.
+
         Returns:
             Voltage in V (0-5V)
         """
-        with self._lock:
-            return self.photodiode_voltage
+        return self.photodiode_voltage
 
     def get_photodiode_power(self) -> float:
         """
         Get calculated laser power from photodiode laser pickoff measurement.
 
+        Lock-free: returns the value cached by the last status poll.
+
         Returns:
             Power in mW
         """
-        with self._lock:
-            return self.photodiode_power_mw
+        return self.photodiode_power_mw
+
+    def get_latency_statistics(self) -> dict[str, Any]:
+        """
+        Get serial command latency statistics from the transport.
+
+        Returns:
+            Per-command latency histograms (see SerialTransport.get_latency_statistics),
+            or an empty dict when not connected
+        """
+        transport = self._transport
+        if transport is None:
+            return {}
+        return transport.get_latency_statistics()
@@ -8,20 +8,40 @@ Provides PyQt6-integrated laser control with:
 - Safety limits
 - Status monitoring
 - Thread-safe serial communication
+- Lock-free, versioned state snapshots (LaserState)
 
 Note: TEC temperature control is handled by separate TECController.
 """
 
 import logging
 import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
 from typing import Any, Optional
 
 import serial
 from PyQt6.QtCore import QObject, QTimer, pyqtSignal
 
+from utils.instrumentation import instrumented
+from utils.qt_timers import start_timer, stop_timer
+from utils.state_snapshot import SnapshotField
+
+from .serial_transport import SerialTransport, TransportPriority
+
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class LaserState:
+    """Immutable view of the laser controller state (see utils.state_snapshot)."""
+
+    version: int = 0
+    is_connected: bool = False
+    is_output_enabled: bool = False
+    current_setpoint_ma: float = 0.0
+    power_setpoint_mw: float = 0.0
+
+
 class LaserController(QObject):
     """
     Arroyo laser driver controller with PyQt6 integration.
@@ -39,25 +59,40 @@ class LaserController(QObject):
     status_changed = pyqtSignal(str)  # Status description
     limit_warning = pyqtSignal(str)  # Limit warning message
 
+    # Internal: status poll responses from the transport I/O thread (queued delivery)
+    _poll_response = pyqtSignal(str, str)  # (command, response)
+
+    # Published state (stored in the current LaserState snapshot)
+    _snapshot = LaserState()
+    is_connected = SnapshotField()
+    is_output_enabled = SnapshotField()
+    current_setpoint_ma = SnapshotField()
+    power_setpoint_mw = SnapshotField()
+
     def __init__(self, event_logger: Optional[Any] = None) -> None:
         super().__init__()
 
         self.ser: Optional[serial.Serial] = None
-        self.is_connected = False
-        self.is_output_enabled = False
+        self._snapshot = LaserState()  # Disconnected, output off, zero setpoints
         self.event_logger = event_logger
 
-        # Thread safety lock for serial communication (reentrant for nested calls)
+        # Serial transport (owns port I/O on its own thread while connected)
+        self._transport: Optional[SerialTransport] = None
+        self._pending_polls: list[Future] = []
+
+        # Locks (reentrant for nested calls): _command_lock serializes state-changing
+        # command sequences; _lock guards read-modify-write state updates and is never
+        # held across serial I/O, event logging or signal emission. Polls take neither
+        # around I/O (the serial transport serializes port access) and getters read the
+        # immutable state snapshot.
+        self._command_lock = threading.RLock()
         self._lock = threading.RLock()
 
         # Monitoring timer
         self.monitor_timer = QTimer()
         self.monitor_timer.timeout.connect(self._update_status)
         self.monitor_timer.setInterval(500)  # Update every 500ms
-
-        # Settings
-        self.current_setpoint_ma = 0.0
-        self.power_setpoint_mw = 0.0
+        self._poll_response.connect(self._handle_poll_response)
 
         # Safety limits (will be read from device)
         self.max_current_ma = 2000.0
@@ -84,7 +119,9 @@ class LaserController(QObject):
         Returns:
             True if connected successfully
         """
-        with self._lock:
+        error: Optional[serial.SerialException] = None
+        unexpected_error: Optional[Exception] = None
+        with self._command_lock:
             try:
                 self.ser = serial.Serial(
                     port=com_port,
@@ -96,92 +133,114 @@ class LaserController(QObject):
                     write_timeout=1.0,
                 )
 
-                if self.ser.is_open:
-                    # Test connection with ID query
-                    response = self._write_command("*IDN?")
-                    if response:
-                        logger.info(f"Connected to: {response}")
-                        self.is_connected = True
-                        self.connection_changed.emit(True)
-                        self.status_changed.emit("connected")
-
-                        # Log event
-                        if self.event_logger:
-                            from core.event_logger import EventType
-
-                            self.event_logger.log_hardware_event(
-                                event_type=EventType.HARDWARE_LASER_CONNECT,
-                                description=f"Laser connected: {response.strip()}",
-                                device_name="Arroyo Laser Driver",
-                            )
-
-                        # Read initial limits
-                        self._read_limits()
-
-                        # Start monitoring
-                        self.monitor_timer.start()
-
-                        return True
-                    else:
-                        logger.error("No response from laser driver")
-                        self.ser.close()
-                        return False
-                else:
+                if not self.ser.is_open:
                     logger.error(f"Failed to open {com_port}")
                     return False
 
-            except serial.SerialException as e:
-                logger.error(f"Serial connection error: {e}")
-                self.error_occurred.emit(f"Connection failed: {e}")
+                self._transport = SerialTransport(self.ser, name="laser", line_ending=b"\r\n")
+                self._transport.start()
+
+                # Test connection with ID query
+                response = self._write_command("*IDN?")
+                if not response:
+                    logger.error("No response from laser driver")
+                    self._abort_connect()
+                    return False
 
-                # Log error event
-                if self.event_logger:
-                    from core.event_logger import EventSeverity, EventType
+                logger.info(f"Connected to: {response}")
+                with self._lock:
+                    self.is_connected = True
 
-                    self.event_logger.log_event(
-                        event_type=EventType.HARDWARE_ERROR,
-                        description=f"Laser connection failed: {e}",
-                        severity=EventSeverity.WARNING,
-                        details={"device": "Arroyo Laser Driver", "port": com_port},
-                    )
+                # Read initial limits
+                self._read_limits()
 
-                return False
+            except serial.SerialException as e:
+                logger.error(f"Serial connection error: {e}")
+                error = e
+                self._abort_connect()
             except Exception as e:
                 logger.error(f"Unexpected connection error: {e}")
-                self.error_occurred.emit(f"Connection failed: {e}")
-                return False
+                unexpected_error = e
+                self._abort_connect()
+
+        # Signals and audit log outside the critical section
+        if unexpected_error is not None:
+            self.error_occurred.emit(f"Connection failed: {unexpected_error}")
+            return False
+
+        if error is not None:
+            self.error_occurred.emit(f"Connection failed: {error}")
+
+            # Log error event
+            if self.event_logger:
+                from core.event_logger import EventSeverity, EventType
+
+                self.event_logger.log_event(
+                    event_type=EventType.HARDWARE_ERROR,
+                    description=f"Laser connection failed: {error}",
+                    severity=EventSeverity.WARNING,
+                    details={"device": "Arroyo Laser Driver", "port": com_port},
+                )
+
+            return False
+
+        self.connection_changed.emit(True)
+        self.status_changed.emit("connected")
+
+        # Log event
+        if self.event_logger:
+            from core.event_logger import EventType
+
+            self.event_logger.log_hardware_event(
+                event_type=EventType.HARDWARE_LASER_CONNECT,
+                description=f"Laser connected: {response.strip()}",
+                device_name="Arroyo Laser Driver",
+            )
+
+        # Start monitoring
+        start_timer(self.monitor_timer)
+
+        return True
 
     def disconnect(self) -> None:
         """Disconnect from laser driver."""
-        with self._lock:
-            if self.ser and self.ser.is_open:
-                # Disable output before disconnecting
-                self.set_output(False)
+        with self._command_lock:
+            if not (self.ser and self.ser.is_open):
+                return
 
-                # Stop monitoring
-                self.monitor_timer.stop()
+            # Disable output before disconnecting
+            self.set_output(False)
 
-                # Close serial port
-                self.ser.close()
+            # Stop monitoring
+            stop_timer(self.monitor_timer)
+
+            # Stop I/O thread and close serial port
+            self._stop_transport()
+            self.ser.close()
+            with self._lock:
                 self.is_connected = False
-                self.connection_changed.emit(False)
-                self.status_changed.emit("disconnected")
-                logger.info("Disconnected from laser driver")
 
-                # Log event
-                if self.event_logger:
-                    from core.event_logger import EventType
+        self.connection_changed.emit(False)
+        self.status_changed.emit("disconnected")
+        logger.info("Disconnected from laser driver")
+
+        # Log event
+        if self.event_logger:
+            from core.event_logger import EventType
 
-                    self.event_logger.log_hardware_event(
-                        event_type=EventType.HARDWARE_LASER_DISCONNECT,
-                        description="Laser disconnected",
-                        device_name="Arroyo Laser Driver",
-                    )
+            self.event_logger.log_hardware_event(
+                event_type=EventType.HARDWARE_LASER_DISCONNECT,
+                description="Laser disconnected",
+                device_name="Arroyo Laser Driver",
+            )
 
     def get_status(self) -> dict[str, Any]:
         """
         Get current laser status and state information.
 
+        Lock-free: built from one immutable state snapshot, so the fields are
+        mutually consistent and callers never wait behind serial I/O.
+
         Returns:
             Dictionary containing:
             - connected (bool): Connection status
@@ -189,47 +248,116 @@ class LaserController(QObject):
             - current_setpoint_ma (float): Current setpoint in mA
             - power_setpoint_mw (float): Power setpoint in mW
         """
-        with self._lock:
-            return {
-                "connected": self.is_connected,
-                "output_enabled": self.is_output_enabled,
-                "current_setpoint_ma": self.current_setpoint_ma,
-                "power_setpoint_mw": self.power_setpoint_mw,
-            }
-
-    def _write_command(self, command: str) -> Optional[str]:
+        snapshot = self._snapshot
+        return {
+            "connected": snapshot.is_connected,
+            "output_enabled": snapshot.is_output_enabled,
+            "current_setpoint_ma": snapshot.current_setpoint_ma,
+            "power_setpoint_mw": snapshot.power_setpoint_mw,
+        }
+
+    @property
+    def snapshot(self) -> LaserState:
+        """Current immutable laser state (lock-free; compare versions to detect change)."""
+        return self._snapshot
+
+    @instrumented("laser._write_command")
+    def _write_command(
+        self, command: str, priority: TransportPriority = TransportPriority.COMMAND
+    ) -> Optional[str]:
         """
         Send command to laser driver and return response.
 
         Args:
-            command: ASCII command string
+            command: ASCII command string (queries end with '?')
+            priority: Transport queue lane for this command
 
         Returns:
             Response string or None if error
         """
-        if not self.ser or not self.ser.is_open:
+        transport = self._transport
+        if not self.ser or not self.ser.is_open or transport is None:
             logger.error("Serial port not open")
             return None
 
-        with self._lock:
-            try:
-                # Send command
-                self.ser.write(str.encode(command) + b"\r\n")
+        try:
+            return transport.request(command, expect_response="?" in command, priority=priority)
 
-                # Read response for query commands
-                if "?" in command:
-                    response: str = self.ser.readline().decode("utf-8").strip()
-                    return response
-                return ""
+        except serial.SerialException as e:
+            logger.error(f"Serial communication error: {e}")
+            self.error_occurred.emit(f"Communication error: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Command error: {e}")
+            self.error_occurred.emit(f"Command error: {e}")
+            return None
 
-            except serial.SerialException as e:
-                logger.error(f"Serial communication error: {e}")
-                self.error_occurred.emit(f"Communication error: {e}")
-                return None
+    def _submit_poll(self, command: str) -> Optional[Future]:
+        """
+        Queue a status query without blocking the caller.
+
+        The response is delivered to _handle_poll_response() on this object's
+        thread via the queued _poll_response signal.
+
+        Args:
+            command: Query command string
+
+        Returns:
+            Future for the request, or None if the transport is unavailable
+        """
+        transport = self._transport
+        if transport is None:
+            return None
+
+        try:
+            future = transport.submit(command, priority=TransportPriority.POLL)
+        except RuntimeError as e:
+            logger.debug(f"Status poll not queued: {e}")
+            return None
+
+        def _on_done(done: Future) -> None:
+            if done.cancelled():
+                return
+            error = done.exception()
+            if error is not None:
+                logger.debug(f"Status poll {command} failed: {error}")
+                return
+            self._poll_response.emit(command, done.result())
+
+        future.add_done_callback(_on_done)
+        return future
+
+    def _abort_connect(self) -> None:
+        """Undo a failed connect(): stop the I/O thread, close the port, mark disconnected."""
+        self._stop_transport()
+        if self.ser is not None:
+            try:
+                self.ser.close()
             except Exception as e:
-                logger.error(f"Command error: {e}")
-                self.error_occurred.emit(f"Command error: {e}")
-                return None
+                logger.debug(f"Error closing port after failed connect: {e}")
+            self.ser = None
+        with self._lock:
+            self.is_connected = False
+
+    def _stop_transport(self) -> None:
+        """Stop the serial transport I/O thread (port is closed by caller)."""
+        if self._transport is not None:
+            self._transport.stop()
+            self._transport = None
+        self._pending_polls = []
+
+    def get_latency_statistics(self) -> dict[str, Any]:
+        """
+        Get serial command latency statistics from the transport.
+
+        Returns:
+            Per-command latency histograms (see SerialTransport.get_latency_statistics),
+            or an empty dict when not connected
+        """
+        transport = self._transport
+        if transport is None:
+            return {}
+        return transport.get_latency_statistics()
 
     def _read_limits(self) -> None:
         """Read safety limits from device."""
@@ -258,43 +386,44 @@ class LaserController(QObject):
             logger.error("Not connected to laser driver")
             return False
 
-        with self._lock:
-            try:
+        try:
+            with self._command_lock:
                 value = 1 if enabled else 0
-                self._write_command(f"LAS:OUT {value}")
+                # Disabling output is a safety action: jump ahead of queued polls
+                priority = TransportPriority.COMMAND if enabled else TransportPriority.SAFETY
+                self._write_command(f"LAS:OUT {value}", priority=priority)
 
                 # Verify
-                response = self._write_command("LAS:OUT?")
-                if response and int(response) == value:
-                    self.is_output_enabled = enabled
-                    self.output_changed.emit(enabled)
-                    status = "enabled" if enabled else "disabled"
-                    logger.info(f"Laser output {status}")
-
-                    # Log event
-                    if self.event_logger:
-                        from core.event_logger import EventType
-
-                        event_type = (
-                            EventType.TREATMENT_LASER_ON
-                            if enabled
-                            else EventType.TREATMENT_LASER_OFF
-                        )
-                        self.event_logger.log_event(
-                            event_type=event_type,
-                            description=f"Laser output {status}",
-                            details={"current_setpoint": self.current_setpoint_ma},
-                        )
-
-                    return True
-                else:
+                response = self._write_command("LAS:OUT?", priority=priority)
+                if not response or int(response) != value:
                     logger.error("Failed to set output")
                     return False
 
-            except Exception as e:
-                logger.error(f"Failed to set output: {e}")
-                self.error_occurred.emit(f"Output control failed: {e}")
-                return False
+                with self._lock:
+                    self.is_output_enabled = enabled
+                    current_setpoint_ma = self.current_setpoint_ma
+
+        except Exception as e:
+            logger.error(f"Failed to set output: {e}")
+            self.error_occurred.emit(f"Output control failed: {e}")
+            return False
+
+        self.output_changed.emit(enabled)
+        status = "enabled" if enabled else "disabled"
+        logger.info(f"Laser output {status}")
+
+        # Log event
+        if self.event_logger:
+            from core.event_logger import EventType
+
+            event_type = EventType.TREATMENT_LASER_ON if enabled else EventType.TREATMENT_LASER_OFF
+            self.event_logger.log_event(
+                event_type=event_type,
+                description=f"Laser output {status}",
+                details={"current_setpoint": current_setpoint_ma},
+            )
+
+        return True
 
     def set_current(self, current_ma: float) -> bool:
         """
@@ -315,39 +444,40 @@ class LaserController(QObject):
             self.limit_warning.emit(f"Current exceeds limit: {self.max_current_ma:.0f}mA")
             return False
 
-        with self._lock:
-            try:
+        try:
+            with self._command_lock:
                 # Convert mA to A for command
                 current_a = current_ma / 1000.0
                 self._write_command(f"LAS:LDI {current_a:.4f}")
 
                 # Verify
                 response = self._write_command("LAS:SET:LDI?")
-                if response:
-                    set_current = float(response) * 1000  # Convert A to mA
-                    if abs(set_current - current_ma) < 0.1:
-                        self.current_setpoint_ma = current_ma
-                        logger.info(f"Set laser current to {current_ma:.1f} mA")
+                set_current = float(response) * 1000 if response else None  # Convert A to mA
+                if set_current is None or abs(set_current - current_ma) >= 0.1:
+                    logger.error("Failed to set current")
+                    return False
 
-                        # Log event
-                        if self.event_logger:
-                            from core.event_logger import EventType
+                with self._lock:
+                    self.current_setpoint_ma = current_ma
 
-                            self.event_logger.log_event(
-                                event_type=EventType.TREATMENT_POWER_CHANGE,
-                                description=f"Laser current set to {current_ma:.1f} mA",
-                                details={"current_ma": current_ma},
-                            )
+        except Exception as e:
+            logger.error(f"Failed to set current: {e}")
+            self.error_occurred.emit(f"Current control failed: {e}")
+            return False
 
-                        return True
+        logger.info(f"Set laser current to {current_ma:.1f} mA")
 
-                logger.error("Failed to set current")
-                return False
+        # Log event
+        if self.event_logger:
+            from core.event_logger import EventType
 
-            except Exception as e:
-                logger.error(f"Failed to set current: {e}")
-                self.error_occurred.emit(f"Current control failed: {e}")
-                return False
+            self.event_logger.log_event(
+                event_type=EventType.TREATMENT_POWER_CHANGE,
+                description=f"Laser current set to {current_ma:.1f} mA",
+                details={"current_ma": current_ma},
+            )
+
+        return True
 
     def set_power(self, power_mw: float) -> bool:
         """
@@ -408,25 +538,46 @@ class LaserController(QObject):
         # This is a placeholder for future implementation
         return None
 
+    @instrumented("laser._update_status")
     def _update_status(self) -> None:
-        """Update status from device (called by timer)."""
+        """
+        Queue status queries (called by timer).
+
+        Queries run on the transport I/O thread at POLL priority, so the timer
+        never blocks on serial I/O. A new poll is skipped while the previous
+        one is still outstanding.
+        """
         if not self.is_connected:
             return
 
-        with self._lock:
-            try:
-                # Read current
-                current = self.read_current()
-                if current is not None:
-                    self.current_changed.emit(current)
-
-                # Read output state
-                response = self._write_command("LAS:OUT?")
-                if response:
-                    output_enabled = bool(int(response))
-                    if output_enabled != self.is_output_enabled:
-                        self.is_output_enabled = output_enabled
-                        self.output_changed.emit(output_enabled)
+        if any(not future.done() for future in self._pending_polls):
+            return
 
-            except Exception as e:
-                logger.error(f"Status update error: {e}")
+        futures = [self._submit_poll("LAS:LDI?"), self._submit_poll("LAS:OUT?")]
+        self._pending_polls = [future for future in futures if future is not None]
+
+    def _handle_poll_response(self, command: str, response: str) -> None:
+        """
+        Apply a status poll response (runs on the controller's thread).
+
+        Args:
+            command: Query that produced the response
+            response: Response string from the laser driver
+        """
+        if not self.is_connected or not response:
+            return
+
+        try:
+            if command == "LAS:LDI?":
+                self.current_changed.emit(float(response) * 1000)  # Convert A to mA
+
+            elif command == "LAS:OUT?":
+                output_enabled = bool(int(response))
+                with self._lock:
+                    changed = output_enabled != self.is_output_enabled
+                    self.is_output_enabled = output_enabled
+                if changed:
+                    self.output_changed.emit(output_enabled)
+
+        except Exception as e:
+            logger.error(f"Status update error: {e}")
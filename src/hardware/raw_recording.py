@@ -0,0 +1,479 @@
+# -*- coding: utf-8 -*-
+"""
+Module: raw_recording
+Project: TOSCA Laser Control System
+
+Purpose: Lossless full-rate camera recording. Raw sensor frames (no
+demosaic, no encoding) are copied into a preallocated, memory-mapped
+file, so recording costs one memcpy per frame and keeps up with the
+camera's full bandwidth. The file is self-describing:
+
+    [header, 4 KiB]  magic, frame shape/dtype, pixel format, capacity,
+                     clock anchor, committed frame count
+    [frame index]    frame ID, device/host timestamps, drops (32 B/frame)
+    [frames]         capacity x raw frame, page aligned
+
+The frame count is updated after each frame's data and index entry, so a
+file cut short by a crash is readable up to its last complete frame.
+RawRecording gives zero-copy random access by frame number;
+RawTranscoder converts finished recordings to H.264 in the background
+for review and applies the raw file retention policy.
+Safety Critical: No
+"""
+
+from __future__ import annotations
+
+import logging
+import mmap
+import os
+import struct
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Optional
+
+import cv2
+import numpy as np
+
+from hardware.bayer import bayer_pattern, demosaic
+from hardware.video_index import FrameInfo
+
+logger = logging.getLogger(__name__)
+
+RAW_SUFFIX = ".raw"
+RAW_MAGIC = b"TOSCARAW"
+RAW_VERSION = 1
+
+# magic, version, reserved, height, width, channels, dtype, pixel format,
+# capacity, anchor wall time (s), anchor monotonic time (ns)
+_HEADER = struct.Struct("<8sHHIII16s32sQdq")
+_COUNT_OFFSET = _HEADER.size  # Committed frame count (uint64) follows the fixed fields
+_HEADER_SIZE = 4096
+_PAGE = 4096
+
+INDEX_DTYPE = np.dtype(
+    [
+        ("frame_id", "<i8"),
+        ("device_timestamp_ns", "<i8"),
+        ("host_monotonic_ns", "<i8"),
+        ("dropped_before", "<i8"),
+    ]
+)
+
+
+def _frames_offset(capacity: int) -> int:
+    """Page-aligned start of the frame data."""
+    end_of_index = _HEADER_SIZE + capacity * INDEX_DTYPE.itemsize
+    return -(-end_of_index // _PAGE) * _PAGE
+
+
+def _frame_shape(shape: tuple[int, ...]) -> tuple[int, int, int]:
+    """(height, width, channels) of a camera frame shape."""
+    if len(shape) == 2:
+        return shape[0], shape[1], 1
+    return shape[0], shape[1], shape[2]
+
+
+class RawFrameWriter:
+    """
+    Append raw frames to a preallocated memory-mapped recording.
+
+    Usage:
+        writer = RawFrameWriter(path, frame.shape, frame.dtype, capacity=3600)
+        writer.write(frame, frame_info)  # False once the file is full
+        writer.close()  # Trims the unused preallocation
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        frame_shape: tuple[int, ...],
+        dtype: Any,
+        capacity: int,
+        pixel_format: str = "",
+    ) -> None:
+        """
+        Create and preallocate the recording file.
+
+        Args:
+            path: Output path (RAW_SUFFIX recommended)
+            frame_shape: Raw frame shape (H, W) or (H, W, C)
+            dtype: Raw frame dtype
+            capacity: Maximum number of frames
+            pixel_format: Camera pixel format name (needed to convert frames later)
+
+        Raises:
+            ValueError: If capacity is not positive
+            OSError: If the file cannot be created or preallocated
+        """
+        if capacity < 1:
+            raise ValueError("Raw recording capacity must be at least one frame")
+        self.path = path
+        self.frame_shape = _frame_shape(tuple(frame_shape))
+        self.dtype = np.dtype(dtype)
+        self.capacity = int(capacity)
+        self.pixel_format = pixel_format
+        self.frame_count = 0
+        self.anchor_wall_s = time.time()
+        self.anchor_monotonic_ns = time.monotonic_ns()
+
+        self._frame_bytes = int(np.prod(self.frame_shape)) * self.dtype.itemsize
+        self._frames_offset = _frames_offset(self.capacity)
+        size = self._frames_offset + self.capacity * self._frame_bytes
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._file: Optional[Any] = open(path, "w+b")
+        try:
+            self._file.write(self._header())
+            self._file.truncate(size)
+            if hasattr(os, "posix_fallocate"):
+                # Reserve the disk blocks now: running out of space mid-recording
+                # would otherwise fault on a page write
+                os.posix_fallocate(self._file.fileno(), 0, size)
+            self._mmap: Optional[mmap.mmap] = mmap.mmap(self._file.fileno(), size)
+        except Exception:
+            self._file.close()
+            path.unlink(missing_ok=True)
+            raise
+
+        self._count = np.frombuffer(self._mmap, "<u8", 1, _COUNT_OFFSET)
+        self._index = np.frombuffer(self._mmap, INDEX_DTYPE, self.capacity, _HEADER_SIZE)
+        self._frames = np.frombuffer(
+            self._mmap,
+            self.dtype,
+            self.capacity * int(np.prod(self.frame_shape)),
+            self._frames_offset,
+        ).reshape(self.capacity, *self.frame_shape)
+
+        logger.info(
+            f"Raw recording preallocated: {path} ({self.capacity} frames, "
+            f"{size / 1e9:.2f} GB, {pixel_format or 'unknown format'})"
+        )
+
+    def _header(self) -> bytes:
+        """Fixed header fields."""
+        height, width, channels = self.frame_shape
+        return _HEADER.pack(
+            RAW_MAGIC,
+            RAW_VERSION,
+            0,
+            height,
+            width,
+            channels,
+            self.dtype.str.encode("ascii"),
+            self.pixel_format.encode("ascii", "replace")[:32],
+            self.capacity,
+            self.anchor_wall_s,
+            self.anchor_monotonic_ns,
+        )
+
+    @property
+    def full(self) -> bool:
+        """True once capacity frames are written."""
+        return self.frame_count >= self.capacity
+
+    def write(self, frame: np.ndarray, info: Optional[FrameInfo] = None) -> bool:
+        """
+        Copy one raw frame into the file.
+
+        Args:
+            frame: Raw camera frame (same shape and dtype as the recording)
+            info: Camera frame ID and timestamps (host arrival time only if not given)
+
+        Returns:
+            True if written, False if the recording is full or closed
+
+        Raises:
+            ValueError: If the frame size differs from the recording's
+        """
+        if self._mmap is None or self.full:
+            return False
+        if _frame_shape(frame.shape) != self.frame_shape:
+            raise ValueError(f"frame size changed ({frame.shape} != {self.frame_shape})")
+
+        n = self.frame_count
+        self._frames[n] = frame.reshape(self.frame_shape)
+        info = info or FrameInfo(-1, 0, time.monotonic_ns())
+        self._index[n] = (
+            info.frame_id,
+            info.device_timestamp_ns,
+            info.host_monotonic_ns,
+            info.dropped_before,
+        )
+        self.frame_count = n + 1
+        self._count[0] = self.frame_count  # Commit after data and index
+        return True
+
+    def close(self) -> None:
+        """Flush, unmap and trim the file to the frames written."""
+        if self._mmap is None or self._file is None:
+            return
+        self._mmap.flush()
+        # Views must go before the mapping can be closed
+        del self._count, self._index, self._frames
+        self._mmap.close()
+        self._mmap = None
+        self._file.truncate(self._frames_offset + self.frame_count * self._frame_bytes)
+        self._file.close()
+        self._file = None
+        logger.info(f"Raw recording saved: {self.path} ({self.frame_count} frames)")
+
+
+class RawRecording:
+    """
+    Read-only, zero-copy access to a raw recording.
+
+    Usage:
+        recording = RawRecording(path)
+        frame = recording[120]  # View into the mapped file
+        info = recording.frame_info(120)
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        Map a raw recording.
+
+        Args:
+            path: Raw recording file
+
+        Raises:
+            ValueError: If the file is not a raw recording
+        """
+        self.path = path
+        data = np.memmap(path, dtype=np.uint8, mode="r")
+        fields = _HEADER.unpack_from(data, 0)
+        if fields[0] != RAW_MAGIC:
+            raise ValueError(f"Not a raw recording: {path}")
+        if fields[1] != RAW_VERSION:
+            raise ValueError(f"Unsupported raw recording version {fields[1]}: {path}")
+
+        height, width, channels = fields[3:6]
+        self.frame_shape = (height, width, channels)
+        self.dtype = np.dtype(fields[6].rstrip(b"\0").decode("ascii"))
+        self.pixel_format = fields[7].rstrip(b"\0").decode("ascii", "replace")
+        self.capacity = fields[8]
+        self.anchor_wall_s = fields[9]
+        self.anchor_monotonic_ns = fields[10]
+
+        # Count frames actually present (the file may have been cut short)
+        frame_bytes = height * width * channels * self.dtype.itemsize
+        frames_offset = _frames_offset(self.capacity)
+        committed = int(data[_COUNT_OFFSET : _COUNT_OFFSET + 8].view("<u8")[0])
+        available = max(0, (len(data) - frames_offset) // frame_bytes) if frame_bytes else 0
+        count = min(committed, available, self.capacity)
+
+        self.index = data[_HEADER_SIZE : _HEADER_SIZE + count * INDEX_DTYPE.itemsize].view(
+            INDEX_DTYPE
+        )
+        self.frames = (
+            data[frames_offset : frames_offset + count * frame_bytes]
+            .view(self.dtype)
+            .reshape(count, *self.frame_shape)
+        )
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    def __getitem__(self, frame_number: int) -> np.ndarray:
+        """Raw frame (H, W, C) as a read-only view of the file."""
+        return self.frames[frame_number]
+
+    def __enter__(self) -> "RawRecording":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Drop the mapping (unmapped once no frame views remain)."""
+        self.index = np.empty(0, INDEX_DTYPE)
+        self.frames = np.empty((0, *self.frame_shape), self.dtype)
+
+    def frame_info(self, frame_number: int) -> FrameInfo:
+        """Camera frame ID and timestamps of a frame."""
+        row = self.index[frame_number]
+        return FrameInfo(
+            int(row["frame_id"]),
+            int(row["device_timestamp_ns"]),
+            int(row["host_monotonic_ns"]),
+            int(row["dropped_before"]),
+        )
+
+    def time_of(self, frame_number: int) -> float:
+        """Wall-clock time (epoch seconds) a frame arrived."""
+        host_ns = int(self.index[frame_number]["host_monotonic_ns"])
+        return self.anchor_wall_s + (host_ns - self.anchor_monotonic_ns) / 1e9
+
+    @property
+    def frames_dropped(self) -> int:
+        """Frames the camera produced but the recording missed (frame ID gaps)."""
+        return int(self.index["dropped_before"].sum())
+
+    @property
+    def frame_rate(self) -> Optional[float]:
+        """Camera frame rate over the recording (device clock when available)."""
+        if len(self) < 2:
+            return None
+        device = self.index["device_timestamp_ns"]
+        timestamps = device if (device > 0).all() else self.index["host_monotonic_ns"]
+        duration_s = (int(timestamps[-1]) - int(timestamps[0])) / 1e9
+        if duration_s <= 0:
+            return None
+        # Count the frame intervals the camera produced, including dropped ones
+        intervals = len(self) - 1 + int(self.index["dropped_before"][1:].sum())
+        return intervals / duration_s
+
+
+def raw_to_bgr(frame: np.ndarray, pixel_format: str) -> np.ndarray:
+    """
+    Convert a raw frame to BGR8 for video encoding.
+
+    Args:
+        frame: Raw frame (H, W, C)
+        pixel_format: Camera pixel format name
+
+    Returns:
+        BGR8 frame (H, W, 3)
+    """
+    pattern = bayer_pattern(pixel_format)
+    if pattern is not None:
+        return cv2.cvtColor(demosaic(frame, pattern), cv2.COLOR_RGB2BGR)
+    if pixel_format == "YUV422Packed":
+        return cv2.cvtColor(np.ascontiguousarray(frame), cv2.COLOR_YUV2BGR_UYVY)
+    if frame.shape[2] == 1:
+        return cv2.cvtColor(np.ascontiguousarray(frame[..., 0]), cv2.COLOR_GRAY2BGR)
+    if pixel_format == "Rgb8":
+        return cv2.cvtColor(np.ascontiguousarray(frame), cv2.COLOR_RGB2BGR)
+    return np.ascontiguousarray(frame)  # Bgr8
+
+
+def transcode_raw(
+    raw_path: Path,
+    output_path: Optional[Path] = None,
+    codec: str = "H264",
+    quality_crf: int = 28,
+    fallback_codec: str = "MJPG",
+) -> Path:
+    """
+    Encode a raw recording as a video with a frame index.
+
+    The video's frame index keeps the camera frame IDs and the recording's
+    clock anchor, so event alignment works as for a live recording.
+
+    Args:
+        raw_path: Raw recording
+        output_path: Video path (defaults to the raw path with .mp4)
+        codec: Video codec (see VideoRecorder)
+        quality_crf: H.264 Constant Rate Factor
+        fallback_codec: Codec if the primary one is unavailable
+
+    Returns:
+        Path of the video
+    """
+    from hardware.camera_controller import VideoRecorder
+
+    output_path = output_path or raw_path.with_suffix(".mp4")
+    with RawRecording(raw_path) as recording:
+        height, width, _ = recording.frame_shape
+        recorder = VideoRecorder(
+            output_path,
+            # Rounded: container timebases reject rates like 199.998 (frame index has exact times)
+            fps=round(recording.frame_rate or 30.0, 2),
+            frame_size=(width, height),
+            codec=codec,
+            quality_crf=quality_crf,
+            fallback_codec=fallback_codec,
+        )
+        if recorder.index is not None:
+            recorder.index.anchor_wall_s = recording.anchor_wall_s
+            recorder.index.anchor_monotonic_ns = recording.anchor_monotonic_ns
+        try:
+            for n in range(len(recording)):
+                bgr = raw_to_bgr(recording[n], recording.pixel_format)
+                recorder.write_frame(bgr, recording.frame_info(n))
+        finally:
+            recorder.close()
+    logger.info(f"Raw recording transcoded: {raw_path} -> {output_path}")
+    return output_path
+
+
+def prune_raw_recordings(
+    directory: Path, max_age_days: float, now: Optional[float] = None
+) -> list[Path]:
+    """
+    Delete raw recordings older than max_age_days that have been transcoded.
+
+    Args:
+        directory: Directory holding raw recordings
+        max_age_days: Age (by modification time) after which raw files go
+        now: Current time (epoch seconds), for testing
+
+    Returns:
+        Deleted raw files
+    """
+    cutoff = (now if now is not None else time.time()) - max_age_days * 86400.0
+    deleted = []
+    for raw_path in sorted(directory.glob(f"*{RAW_SUFFIX}")):
+        if not raw_path.with_suffix(".mp4").exists():
+            continue  # Never delete the only copy
+        if raw_path.stat().st_mtime < cutoff:
+            raw_path.unlink()
+            deleted.append(raw_path)
+            logger.info(f"Raw recording removed by retention policy: {raw_path}")
+    return deleted
+
+
+class RawTranscoder:
+    """
+    Background H.264 transcode of finished raw recordings.
+
+    Retention: with delete_raw the raw file is removed once its video is
+    written; with retention_days, raw files in the same directory that
+    have a video and are older than that are removed after each job.
+    """
+
+    def __init__(
+        self,
+        codec: str = "H264",
+        quality_crf: int = 28,
+        fallback_codec: str = "MJPG",
+        delete_raw: bool = False,
+        retention_days: Optional[float] = None,
+    ) -> None:
+        self.codec = codec
+        self.quality_crf = quality_crf
+        self.fallback_codec = fallback_codec
+        self.delete_raw = delete_raw
+        self.retention_days = retention_days
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="raw-transcode")
+
+    def submit(self, raw_path: Path) -> Future:
+        """
+        Queue a raw recording for transcoding.
+
+        Args:
+            raw_path: Finished raw recording
+
+        Returns:
+            Future resolving to the video path
+        """
+        return self._executor.submit(self._run, raw_path)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker (queued jobs still run if wait is True)."""
+        self._executor.shutdown(wait=wait)
+
+    def _run(self, raw_path: Path) -> Path:
+        """Transcode one recording and apply retention (worker thread)."""
+        video_path = transcode_raw(
+            raw_path,
+            codec=self.codec,
+            quality_crf=self.quality_crf,
+            fallback_codec=self.fallback_codec,
+        )
+        if self.delete_raw:
+            raw_path.unlink(missing_ok=True)
+            logger.info(f"Raw recording removed after transcode: {raw_path}")
+        if self.retention_days is not None:
+            prune_raw_recordings(raw_path.parent, self.retention_days)
+        return video_path
@@ -0,0 +1,425 @@
+# -*- coding: utf-8 -*-
+"""
+Module: serial_transport
+Project: TOSCA Laser Control System
+
+Purpose: Shared serial transport for ASCII request/response instruments
+(Arroyo laser driver, Arroyo TEC, Arduino watchdog firmware).
+Safety Critical: Yes
+
+Every ASCII controller used to re-implement the same write/readline/lock
+sequence on top of pyserial. SerialTransport owns the port on a dedicated
+I/O thread and provides:
+- Request/response correlation (one transaction in flight at a time; late
+  response lines are consumed by the request that caused them)
+- Priority lanes: SAFETY requests (e.g. WDT_RESET) jump ahead of queued
+  user commands and background polls
+- Per-command timeouts for callers
+- Non-blocking submission (concurrent.futures.Future) and a blocking request()
+- Per-command latency histograms (queue wait + I/O)
+
+Note: The instruments are half-duplex, so a SAFETY request cannot interrupt a
+transaction already on the wire. Its worst-case latency is one transaction.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Callable, Optional
+
+from utils.latency_histogram import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+
+class TransportPriority(IntEnum):
+    """Request priority lanes (lower value is served first)."""
+
+    SAFETY = 0  # Watchdog heartbeat, emergency output disable
+    COMMAND = 1  # User and protocol commands
+    POLL = 2  # Background status polling
+
+
+class TransportTimeoutError(TimeoutError):
+    """Raised when a request does not complete within its timeout."""
+
+
+class TransportClosedError(RuntimeError):
+    """Raised when a request is submitted to (or pending on) a stopped transport."""
+
+
+@dataclass(order=True)
+class _Request:
+    """Queued transport request (ordered by priority, then submission order)."""
+
+    priority: int
+    sequence: int
+    command: str = field(compare=False)
+    expect_response: bool = field(compare=False)
+    multi_line: bool = field(compare=False)
+    is_terminator: Optional[Callable[[str], bool]] = field(compare=False)
+    max_lines: int = field(compare=False)
+    deadline: Optional[float] = field(compare=False)
+    submitted_at: float = field(compare=False)
+    future: Future = field(compare=False)
+
+
+def _default_command_key(command: str) -> str:
+    """Histogram key: command verb without arguments (e.g. 'LAS:LDI 0.5' -> 'LAS:LDI')."""
+    return command.split(" ", 1)[0]
+
+
+class SerialTransport:
+    """
+    Serial transport that owns one open port on a dedicated I/O thread.
+
+    The port object only needs the pyserial subset used here
+    (write, readline, reset_input_buffer, reset_output_buffer, is_open),
+    so tests can pass an in-memory fake device.
+
+    Usage:
+        transport = SerialTransport(ser, name="laser", line_ending=b"\\r\\n")
+        transport.start()
+        idn = transport.request("*IDN?")
+        future = transport.submit("LAS:LDI?", priority=TransportPriority.POLL)
+        transport.stop()
+    """
+
+    def __init__(
+        self,
+        port: Any,
+        name: str,
+        line_ending: bytes = b"\n",
+        encoding: str = "utf-8",
+        flush_before_send: bool = False,
+        default_timeout_s: float = 2.0,
+        command_key: Optional[Callable[[str], str]] = None,
+    ) -> None:
+        """
+        Initialize transport (does not start the I/O thread).
+
+        Args:
+            port: Open pyserial-compatible port
+            name: Device name used for thread name and log messages
+            line_ending: Bytes appended to every command
+            encoding: Text encoding for commands and responses
+            flush_before_send: Clear input/output buffers before each command
+                (discards stale lines left by earlier timeouts)
+            default_timeout_s: Caller timeout when a request doesn't specify one
+            command_key: Maps a command to its latency histogram key
+        """
+        self.port = port
+        self.name = name
+        self.line_ending = line_ending
+        self.encoding = encoding
+        self.flush_before_send = flush_before_send
+        self.default_timeout_s = default_timeout_s
+        self._command_key = command_key or _default_command_key
+
+        self._queue: list[_Request] = []
+        self._condition = threading.Condition()
+        self._sequence = itertools.count()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+        # Statistics
+        self._stats_lock = threading.Lock()
+        self._latency: dict[str, LatencyHistogram] = {}
+        self._queue_wait = LatencyHistogram()
+        self._timeouts = 0
+        self._errors = 0
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start the I/O thread."""
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+            self._thread = threading.Thread(
+                target=self._run, name=f"SerialTransport-{self.name}", daemon=True
+            )
+            self._thread.start()
+        logger.debug(f"Serial transport started: {self.name}")
+
+    def stop(self, timeout_s: float = 2.0) -> None:
+        """
+        Stop the I/O thread and fail any queued requests.
+
+        The port itself is not closed; the owning controller closes it.
+
+        Args:
+            timeout_s: Maximum time to wait for an in-flight transaction
+        """
+        with self._condition:
+            if not self._running:
+                return
+            self._running = False
+            pending = self._queue
+            self._queue = []
+            self._condition.notify_all()
+
+        for request in pending:
+            if request.future.set_running_or_notify_cancel():
+                request.future.set_exception(TransportClosedError(f"{self.name} transport stopped"))
+
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout_s)
+        self._thread = None
+        logger.debug(f"Serial transport stopped: {self.name}")
+
+    @property
+    def is_running(self) -> bool:
+        """True while the I/O thread accepts requests."""
+        return self._running
+
+    @property
+    def pending_count(self) -> int:
+        """Number of queued (not yet started) requests."""
+        with self._condition:
+            return len(self._queue)
+
+    # ------------------------------------------------------------------
+    # Requests
+    # ------------------------------------------------------------------
+
+    def submit(
+        self,
+        command: str,
+        expect_response: bool = True,
+        multi_line: bool = False,
+        is_terminator: Optional[Callable[[str], bool]] = None,
+        max_lines: int = 20,
+        priority: TransportPriority = TransportPriority.COMMAND,
+        timeout_s: Optional[float] = None,
+    ) -> Future:
+        """
+        Queue a command without blocking.
+
+        Args:
+            command: ASCII command (line ending is appended)
+            expect_response: Read a response after writing
+            multi_line: Read lines until is_terminator() matches or max_lines read
+            is_terminator: Predicate marking the last line of a multi-line response
+            max_lines: Safety limit for multi-line responses
+            priority: Queue lane for this request
+            timeout_s: Request is failed if still queued after this long
+
+        Returns:
+            Future resolving to the response string ("" if no response expected)
+
+        Raises:
+            TransportClosedError: If the transport is not running
+        """
+        timeout_s = self.default_timeout_s if timeout_s is None else timeout_s
+        now = time.perf_counter()
+        request = _Request(
+            priority=int(priority),
+            sequence=next(self._sequence),
+            command=command,
+            expect_response=expect_response,
+            multi_line=multi_line,
+            is_terminator=is_terminator,
+            max_lines=max_lines,
+            deadline=now + timeout_s if timeout_s > 0 else None,
+            submitted_at=now,
+            future=Future(),
+        )
+
+        with self._condition:
+            if not self._running:
+                raise TransportClosedError(f"{self.name} transport not running")
+            heapq.heappush(self._queue, request)
+            self._condition.notify()
+
+        return request.future
+
+    def request(
+        self,
+        command: str,
+        expect_response: bool = True,
+        multi_line: bool = False,
+        is_terminator: Optional[Callable[[str], bool]] = None,
+        max_lines: int = 20,
+        priority: TransportPriority = TransportPriority.COMMAND,
+        timeout_s: Optional[float] = None,
+    ) -> str:
+        """
+        Send a command and block until its response arrives.
+
+        Arguments match submit(). Exceptions raised by the port (e.g.
+        serial.SerialException) are re-raised unchanged in the caller.
+
+        Returns:
+            Response string ("" if no response expected)
+
+        Raises:
+            TransportTimeoutError: If no response within timeout_s
+            TransportClosedError: If the transport is not running
+        """
+        timeout_s = self.default_timeout_s if timeout_s is None else timeout_s
+
+        # Called from a completion callback on the I/O thread: run inline
+        # (queueing would deadlock waiting on ourselves)
+        if threading.current_thread() is self._thread:
+            return self._execute(command, expect_response, multi_line, is_terminator, max_lines)
+
+        future = self.submit(
+            command,
+            expect_response=expect_response,
+            multi_line=multi_line,
+            is_terminator=is_terminator,
+            max_lines=max_lines,
+            priority=priority,
+            timeout_s=timeout_s,
+        )
+        try:
+            result: str = future.result(timeout=timeout_s if timeout_s > 0 else None)
+            return result
+        except FutureTimeoutError:
+            # Drop it if still queued; an in-flight request keeps its response
+            future.cancel()
+            with self._stats_lock:
+                self._timeouts += 1
+            raise TransportTimeoutError(
+                f"{self.name}: no response to '{command}' within {timeout_s:.2f}s"
+            ) from None
+
+    # ------------------------------------------------------------------
+    # Statistics
+    # ------------------------------------------------------------------
+
+    def get_latency_statistics(self) -> dict[str, Any]:
+        """
+        Get per-command latency statistics.
+
+        Returns:
+            Dictionary with:
+            - commands: {command_key: histogram snapshot} (submit -> response, ms)
+            - queue_wait: histogram snapshot of time spent queued (ms)
+            - timeouts (int), errors (int), pending (int)
+        """
+        with self._stats_lock:
+            histograms = dict(self._latency)
+            timeouts = self._timeouts
+            errors = self._errors
+
+        return {
+            "commands": {key: hist.snapshot() for key, hist in histograms.items()},
+            "queue_wait": self._queue_wait.snapshot(),
+            "timeouts": timeouts,
+            "errors": errors,
+            "pending": self.pending_count,
+        }
+
+    def reset_statistics(self) -> None:
+        """Clear all latency histograms and counters."""
+        with self._stats_lock:
+            self._latency = {}
+            self._timeouts = 0
+            self._errors = 0
+        self._queue_wait.reset()
+
+    def _record_latency(self, command: str, elapsed_ms: float) -> None:
+        """Record a completed request in its command histogram."""
+        key = self._command_key(command)
+        with self._stats_lock:
+            histogram = self._latency.get(key)
+            if histogram is None:
+                histogram = LatencyHistogram()
+                self._latency[key] = histogram
+        histogram.record(elapsed_ms)
+
+    # ------------------------------------------------------------------
+    # I/O thread
+    # ------------------------------------------------------------------
+
+    def _run(self) -> None:
+        """I/O thread main loop: serve queued requests in priority order."""
+        while True:
+            with self._condition:
+                while self._running and not self._queue:
+                    self._condition.wait()
+                if not self._running:
+                    return
+                request = heapq.heappop(self._queue)
+
+            # Cancelled by a caller that already timed out
+            if not request.future.set_running_or_notify_cancel():
+                continue
+
+            started = time.perf_counter()
+            self._queue_wait.record((started - request.submitted_at) * 1000.0)
+
+            if request.deadline is not None and started > request.deadline:
+                with self._stats_lock:
+                    self._timeouts += 1
+                request.future.set_exception(
+                    TransportTimeoutError(
+                        f"{self.name}: '{request.command}' expired before it was sent"
+                    )
+                )
+                continue
+
+            try:
+                response = self._execute(
+                    request.command,
+                    request.expect_response,
+                    request.multi_line,
+                    request.is_terminator,
+                    request.max_lines,
+                )
+            except Exception as e:
+                with self._stats_lock:
+                    self._errors += 1
+                request.future.set_exception(e)
+                continue
+
+            self._record_latency(
+                request.command, (time.perf_counter() - request.submitted_at) * 1000.0
+            )
+            request.future.set_result(response)
+
+    def _execute(
+        self,
+        command: str,
+        expect_response: bool,
+        multi_line: bool,
+        is_terminator: Optional[Callable[[str], bool]],
+        max_lines: int,
+    ) -> str:
+        """Perform one write/read transaction on the port (I/O thread only)."""
+        if self.flush_before_send:
+            self.port.reset_input_buffer()
+            self.port.reset_output_buffer()
+
+        self.port.write(command.encode(self.encoding) + self.line_ending)
+
+        if not expect_response:
+            return ""
+
+        if not multi_line:
+            line: str = self.port.readline().decode(self.encoding).strip()
+            return line
+
+        lines = []
+        for _ in range(max_lines):
+            line = self.port.readline().decode(self.encoding).strip()
+            if not line:
+                continue
+            lines.append(line)
+            if is_terminator is not None and is_terminator(line):
+                break
+        return "\n".join(lines)
@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+"""
+Module: still_capture
+Project: TOSCA Laser Control System
+
+Purpose: Asynchronous still image writer. A capture request leases a
+frame the stream thread has already copied (the stream replaces its
+latest frame instead of writing into it, so the lease needs no second
+copy) and pixel conversion plus encoding run on a small worker pool,
+off the GUI thread and outside the camera lock. Burst captures copy N
+consecutive full-rate frames into a buffer allocated before the burst
+starts and are written the same way, with a frame index alongside.
+Safety Critical: No
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import cv2
+import numpy as np
+
+from hardware.video_index import FRAME_INDEX_SUFFIX, FrameIndexWriter, FrameInfo
+
+logger = logging.getLogger(__name__)
+
+# Still image format -> file suffix (PNG compressed; TIFF uncompressed; NPY raw RGB array)
+IMAGE_FORMATS: dict[str, str] = {"png": ".png", "tiff": ".tiff", "npy": ".npy"}
+
+# Converts a leased frame (e.g. a raw Bayer mosaic) to RGB8 on the worker
+FrameConverter = Callable[[np.ndarray], np.ndarray]
+
+
+def write_image(
+    path: Path, frame_rgb: np.ndarray, image_format: str = "png", png_compression: int = 1
+) -> Path:
+    """
+    Encode and write one still image.
+
+    Args:
+        path: Output path (suffix replaced by the format's suffix)
+        frame_rgb: RGB8 (H, W, 3) or mono (H, W) frame
+        image_format: "png", "tiff" or "npy"
+        png_compression: PNG zlib level (0-9, higher = smaller and slower)
+
+    Returns:
+        Path written
+
+    Raises:
+        OSError: If the image could not be written
+    """
+    path = path.with_suffix(IMAGE_FORMATS[image_format])
+    if image_format == "npy":
+        np.save(path, frame_rgb)
+        return path
+
+    frame = frame_rgb
+    if frame.ndim == 3 and frame.shape[2] == 3:
+        frame = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)  # OpenCV writes BGR
+    if image_format == "png":
+        params = [cv2.IMWRITE_PNG_COMPRESSION, int(png_compression)]
+    else:
+        params = [cv2.IMWRITE_TIFF_COMPRESSION, 1]  # 1 = no compression
+    if not cv2.imwrite(str(path), frame, params):
+        raise OSError(f"Could not write image {path}")
+    return path
+
+
+class BurstBuffer:
+    """
+    Preallocated storage for N consecutive raw stream frames.
+
+    The stream thread copies each frame into the next slot, so a burst
+    costs one memcpy per frame at full rate; nothing is allocated or
+    encoded until the buffer is full.
+    """
+
+    def __init__(self, count: int, shape: tuple[int, ...], dtype: Any) -> None:
+        """
+        Allocate the buffer.
+
+        Args:
+            count: Number of frames in the burst
+            shape: Raw frame shape (as delivered by the camera)
+            dtype: Raw frame dtype
+        """
+        if count < 1:
+            raise ValueError("Burst needs at least one frame")
+        self.frames = np.empty((count, *shape), dtype=dtype)
+        self.frames.fill(0)  # Fault the pages in now rather than during the burst
+        self.infos: list[Optional[FrameInfo]] = []
+        self.pixel_format: Any = None
+
+    @property
+    def count(self) -> int:
+        """Frames the burst holds."""
+        return len(self.frames)
+
+    @property
+    def filled(self) -> int:
+        """Frames captured so far."""
+        return len(self.infos)
+
+    @property
+    def full(self) -> bool:
+        """True once every slot holds a frame."""
+        return self.filled >= self.count
+
+    def add(
+        self, frame_data: np.ndarray, info: Optional[FrameInfo] = None, pixel_format: Any = None
+    ) -> bool:
+        """
+        Copy a frame into the next slot.
+
+        Args:
+            frame_data: Raw frame (must match the allocated shape)
+            info: Frame ID / timestamps
+            pixel_format: Camera pixel format of the frame
+
+        Returns:
+            True if the buffer is now full
+
+        Raises:
+            ValueError: If the frame size changed since the buffer was allocated
+        """
+        if self.full:
+            return True
+        if frame_data.shape != self.frames.shape[1:]:
+            raise ValueError(
+                f"frame size changed during burst ({frame_data.shape} != {self.frames.shape[1:]})"
+            )
+        np.copyto(self.frames[self.filled], frame_data)
+        self.infos.append(info)
+        self.pixel_format = pixel_format
+        return self.full
+
+
+def _gather(futures: list[Future], extra: Optional[list[Future]] = None) -> Future:
+    """Future resolving to the results of futures once they (and extra) are done."""
+    result: Future = Future()
+    pending = list(futures) + list(extra or [])
+    remaining = [len(pending)]
+    lock = threading.Lock()
+
+    def _on_done(_: Future) -> None:
+        with lock:
+            remaining[0] -= 1
+            if remaining[0]:
+                return
+        errors = [f.exception() for f in pending if f.exception() is not None]
+        if errors:
+            result.set_exception(errors[0])
+        else:
+            result.set_result([f.result() for f in futures])
+
+    if not pending:
+        result.set_result([])
+    for future in pending:
+        future.add_done_callback(_on_done)
+    return result
+
+
+class StillCaptureWriter:
+    """
+    Worker pool that converts and writes still images.
+
+    Usage:
+        writer = StillCaptureWriter(image_format="png", png_compression=1)
+        future = writer.submit(Path("data/images/capture_20250101_120000"), frame)
+        future.add_done_callback(...)  # Resolves to the written Path
+    """
+
+    def __init__(
+        self, image_format: str = "png", png_compression: int = 1, max_workers: int = 2
+    ) -> None:
+        """
+        Create the writer.
+
+        Args:
+            image_format: "png", "tiff" or "npy"
+            png_compression: PNG zlib level (0-9)
+            max_workers: Encoding threads
+        """
+        if image_format not in IMAGE_FORMATS:
+            raise ValueError(f"Unsupported image format: {image_format}")
+        self.image_format = image_format
+        self.png_compression = png_compression
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, max_workers), thread_name_prefix="still-capture"
+        )
+
+    def submit(
+        self, path: Path, frame: np.ndarray, convert: Optional[FrameConverter] = None
+    ) -> Future:
+        """
+        Queue one image.
+
+        Args:
+            path: Output path without suffix
+            frame: Leased frame (must not be modified until written)
+            convert: Conversion to RGB8 run on the worker (None = already RGB8)
+
+        Returns:
+            Future resolving to the written Path
+        """
+        return self._executor.submit(self._write, path, frame, convert)
+
+    def submit_burst(
+        self,
+        directory: Path,
+        base_name: str,
+        burst: BurstBuffer,
+        convert: Optional[FrameConverter] = None,
+    ) -> Future:
+        """
+        Queue every captured frame of a burst, plus its frame index.
+
+        Args:
+            directory: Output directory (created if needed)
+            base_name: File name prefix (frame number appended)
+            burst: Filled (or partly filled) burst buffer
+            convert: Conversion to RGB8 run on the workers
+
+        Returns:
+            Future resolving to the list of image paths, in capture order
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+        images = [
+            self.submit(directory / f"{base_name}_{i:04d}", burst.frames[i], convert)
+            for i in range(burst.filled)
+        ]
+        index_path = directory / f"{base_name}{FRAME_INDEX_SUFFIX}"
+        index = [self._executor.submit(self._write_index, index_path, burst.infos)]
+        return _gather(images, index)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the workers (queued images are still written if wait is True)."""
+        self._executor.shutdown(wait=wait)
+
+    def _write(self, path: Path, frame: np.ndarray, convert: Optional[FrameConverter]) -> Path:
+        """Convert and encode one image (worker thread)."""
+        frame_rgb = convert(frame) if convert is not None else frame
+        return write_image(path, frame_rgb, self.image_format, self.png_compression)
+
+    @staticmethod
+    def _write_index(path: Path, infos: list[Optional[FrameInfo]]) -> Path:
+        """Write the burst's frame IDs and timestamps (worker thread)."""
+        index = FrameIndexWriter(path)
+        try:
+            for info in infos:
+                if info is not None:
+                    index.write(info)
+        finally:
+            index.close()
+        return path
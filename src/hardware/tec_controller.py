@@ -14,16 +14,33 @@ Provides PyQt6-integrated TEC control with:
 
 import logging
 import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
 from typing import Any, Optional
 
 import serial
 from PyQt6.QtCore import QTimer, pyqtSignal
 
+from utils.instrumentation import instrumented
+from utils.qt_timers import start_timer, stop_timer
+from utils.state_snapshot import SnapshotField
+
 from .hardware_controller_base import HardwareControllerBase
+from .serial_transport import SerialTransport, TransportPriority
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class TECState:
+    """Immutable view of the TEC controller state (see utils.state_snapshot)."""
+
+    version: int = 0
+    is_connected: bool = False
+    is_output_enabled: bool = False
+    temperature_setpoint_c: float = 25.0
+
+
 class TECController(HardwareControllerBase):
     """
     Arroyo TEC controller with PyQt6 integration.
@@ -41,22 +58,38 @@ class TECController(HardwareControllerBase):
     status_changed = pyqtSignal(str)  # Status description
     limit_warning = pyqtSignal(str)  # Limit warning message
 
+    # Internal: status poll responses from the transport I/O thread (queued delivery)
+    _poll_response = pyqtSignal(str, str)  # (command, response)
+
+    # Published state (stored in the current TECState snapshot)
+    _snapshot = TECState()
+    is_connected = SnapshotField()
+    is_output_enabled = SnapshotField()
+    temperature_setpoint_c = SnapshotField()
+
     def __init__(self, event_logger: Optional[Any] = None) -> None:
         super().__init__(event_logger)
 
         self.ser: Optional[serial.Serial] = None
-        self.is_output_enabled = False
-
-        # Thread safety lock for serial communication (reentrant for nested calls)
+        self._snapshot = TECState()  # Disconnected, output off, 25 °C setpoint
+
+        # Serial transport (owns port I/O on its own thread while connected)
+        self._transport: Optional[SerialTransport] = None
+        self._pending_polls: list[Future] = []
+
+        # Locks (reentrant for nested calls): _command_lock serializes state-changing
+        # command sequences; _lock guards read-modify-write state updates and is never
+        # held across serial I/O, event logging or signal emission. Polls take neither
+        # around I/O (the serial transport serializes port access) and getters read the
+        # immutable state snapshot.
+        self._command_lock = threading.RLock()
         self._lock = threading.RLock()
 
         # Monitoring timer
         self.monitor_timer = QTimer()
         self.monitor_timer.timeout.connect(self._update_status)
         self.monitor_timer.setInterval(500)  # Update every 500ms
-
-        # Settings
-        self.temperature_setpoint_c = 25.0
+        self._poll_response.connect(self._handle_poll_response)
 
         # Safety limits (will be read from device)
         self.max_temperature_c = 35.0
@@ -83,7 +116,9 @@ class TECController(HardwareControllerBase):
         Returns:
             True if connected successfully
         """
-        with self._lock:
+        error: Optional[serial.SerialException] = None
+        unexpected_error: Optional[Exception] = None
+        with self._command_lock:
             try:
                 self.ser = serial.Serial(
                     port=com_port,
@@ -95,138 +130,229 @@ class TECController(HardwareControllerBase):
                     write_timeout=1.0,
                 )
 
-                if self.ser.is_open:
-                    # Test connection with ID query
-                    response = self._write_command("*IDN?")
-                    if response:
-                        logger.info(f"Connected to TEC: {response}")
-                        self.is_connected = True
-                        self.connection_changed.emit(True)
-                        self.status_changed.emit("connected")
-
-                        # Log event
-                        if self.event_logger:
-                            from core.event_logger import EventType
-
-                            self.event_logger.log_hardware_event(
-                                event_type=EventType.HARDWARE_TEC_CONNECT,
-                                description=f"TEC connected: {response.strip()}",
-                                device_name="Arroyo TEC Controller",
-                            )
-
-                        # Read initial limits
-                        self._read_limits()
-
-                        # Start monitoring
-                        self.monitor_timer.start()
-
-                        return True
-                    else:
-                        logger.error("No response from TEC controller")
-                        self.ser.close()
-                        return False
-                else:
+                if not self.ser.is_open:
                     logger.error(f"Failed to open {com_port}")
                     return False
 
-            except serial.SerialException as e:
-                logger.error(f"Serial connection error: {e}")
-                self.error_occurred.emit(f"Connection failed: {e}")
+                self._transport = SerialTransport(self.ser, name="tec", line_ending=b"\r\n")
+                self._transport.start()
 
-                # Log error event
-                if self.event_logger:
-                    from core.event_logger import EventSeverity, EventType
+                # Test connection with ID query
+                response = self._write_command("*IDN?")
+                if not response:
+                    logger.error("No response from TEC controller")
+                    self._abort_connect()
+                    return False
+
+                logger.info(f"Connected to TEC: {response}")
+                with self._lock:
+                    self.is_connected = True
 
-                    self.event_logger.log_event(
-                        event_type=EventType.HARDWARE_ERROR,
-                        description=f"TEC connection failed: {e}",
-                        severity=EventSeverity.WARNING,
-                        details={"device": "Arroyo TEC Controller", "port": com_port},
-                    )
+                # Read initial limits
+                self._read_limits()
 
-                return False
+            except serial.SerialException as e:
+                logger.error(f"Serial connection error: {e}")
+                error = e
+                self._abort_connect()
             except Exception as e:
                 logger.error(f"Unexpected connection error: {e}")
-                self.error_occurred.emit(f"Connection failed: {e}")
-                return False
+                unexpected_error = e
+                self._abort_connect()
+
+        # Signals and audit log outside the critical section
+        if unexpected_error is not None:
+            self.error_occurred.emit(f"Connection failed: {unexpected_error}")
+            return False
+
+        if error is not None:
+            self.error_occurred.emit(f"Connection failed: {error}")
+
+            # Log error event
+            if self.event_logger:
+                from core.event_logger import EventSeverity, EventType
+
+                self.event_logger.log_event(
+                    event_type=EventType.HARDWARE_ERROR,
+                    description=f"TEC connection failed: {error}",
+                    severity=EventSeverity.WARNING,
+                    details={"device": "Arroyo TEC Controller", "port": com_port},
+                )
+
+            return False
+
+        self.connection_changed.emit(True)
+        self.status_changed.emit("connected")
+
+        # Log event
+        if self.event_logger:
+            from core.event_logger import EventType
+
+            self.event_logger.log_hardware_event(
+                event_type=EventType.HARDWARE_TEC_CONNECT,
+                description=f"TEC connected: {response.strip()}",
+                device_name="Arroyo TEC Controller",
+            )
+
+        # Start monitoring
+        start_timer(self.monitor_timer)
+
+        return True
 
     def disconnect(self) -> None:
         """Disconnect from TEC controller."""
-        with self._lock:
-            if self.ser and self.ser.is_open:
-                # Disable output before disconnecting
-                self.set_output(False)
+        with self._command_lock:
+            if not (self.ser and self.ser.is_open):
+                return
 
-                # Stop monitoring
-                self.monitor_timer.stop()
+            # Disable output before disconnecting
+            self.set_output(False)
 
-                # Close serial port
-                self.ser.close()
+            # Stop monitoring
+            stop_timer(self.monitor_timer)
+
+            # Stop I/O thread and close serial port
+            self._stop_transport()
+            self.ser.close()
+            with self._lock:
                 self.is_connected = False
-                self.connection_changed.emit(False)
-                self.status_changed.emit("disconnected")
-                logger.info("Disconnected from TEC controller")
 
-                # Log event
-                if self.event_logger:
-                    from core.event_logger import EventType
+        self.connection_changed.emit(False)
+        self.status_changed.emit("disconnected")
+        logger.info("Disconnected from TEC controller")
+
+        # Log event
+        if self.event_logger:
+            from core.event_logger import EventType
 
-                    self.event_logger.log_hardware_event(
-                        event_type=EventType.HARDWARE_TEC_DISCONNECT,
-                        description="TEC disconnected",
-                        device_name="Arroyo TEC Controller",
-                    )
+            self.event_logger.log_hardware_event(
+                event_type=EventType.HARDWARE_TEC_DISCONNECT,
+                description="TEC disconnected",
+                device_name="Arroyo TEC Controller",
+            )
 
     def get_status(self) -> dict[str, Any]:
         """
         Get current TEC status and state information.
 
+        Lock-free: built from one immutable state snapshot, so the fields are
+        mutually consistent and callers never wait behind serial I/O.
+
         Returns:
             Dictionary containing:
             - connected (bool): Connection status
             - output_enabled (bool): TEC output state
             - temperature_setpoint_c (float): Temperature setpoint in °C
         """
-        with self._lock:
-            return {
-                "connected": self.is_connected,
-                "output_enabled": self.is_output_enabled,
-                "temperature_setpoint_c": self.temperature_setpoint_c,
-            }
-
-    def _write_command(self, command: str) -> Optional[str]:
+        snapshot = self._snapshot
+        return {
+            "connected": snapshot.is_connected,
+            "output_enabled": snapshot.is_output_enabled,
+            "temperature_setpoint_c": snapshot.temperature_setpoint_c,
+        }
+
+    @property
+    def snapshot(self) -> TECState:
+        """Current immutable TEC state (lock-free; compare versions to detect change)."""
+        return self._snapshot
+
+    @instrumented("tec._write_command")
+    def _write_command(
+        self, command: str, priority: TransportPriority = TransportPriority.COMMAND
+    ) -> Optional[str]:
         """
         Send command to TEC controller and return response.
 
         Args:
-            command: ASCII command string
+            command: ASCII command string (queries end with '?')
+            priority: Transport queue lane for this command
 
         Returns:
             Response string or None if error
         """
-        if not self.ser or not self.ser.is_open:
+        transport = self._transport
+        if not self.ser or not self.ser.is_open or transport is None:
             logger.error("Serial port not open")
             return None
 
-        with self._lock:
-            try:
-                # Send command
-                self.ser.write(str.encode(command) + b"\r\n")
+        try:
+            return transport.request(command, expect_response="?" in command, priority=priority)
 
-                # Read response for query commands
-                if "?" in command:
-                    response: str = self.ser.readline().decode("utf-8").strip()
-                    return response
-                return ""
+        except serial.SerialException as e:
+            logger.error(f"Serial communication error: {e}")
+            self.error_occurred.emit(f"Communication error: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Command error: {e}")
+            self.error_occurred.emit(f"Command error: {e}")
+            return None
 
-            except serial.SerialException as e:
-                logger.error(f"Serial communication error: {e}")
-                self.error_occurred.emit(f"Communication error: {e}")
-                return None
+    def _submit_poll(self, command: str) -> Optional[Future]:
+        """
+        Queue a status query without blocking the caller.
+
+        The response is delivered to _handle_poll_response() on this object's
+        thread via the queued _poll_response signal.
+
+        Args:
+            command: Query command string
+
+        Returns:
+            Future for the request, or None if the transport is unavailable
+        """
+        transport = self._transport
+        if transport is None:
+            return None
+
+        try:
+            future = transport.submit(command, priority=TransportPriority.POLL)
+        except RuntimeError as e:
+            logger.debug(f"Status poll not queued: {e}")
+            return None
+
+        def _on_done(done: Future) -> None:
+            if done.cancelled():
+                return
+            error = done.exception()
+            if error is not None:
+                logger.debug(f"Status poll {command} failed: {error}")
+                return
+            self._poll_response.emit(command, done.result())
+
+        future.add_done_callback(_on_done)
+        return future
+
+    def _abort_connect(self) -> None:
+        """Undo a failed connect(): stop the I/O thread, close the port, mark disconnected."""
+        self._stop_transport()
+        if self.ser is not None:
+            try:
+                self.ser.close()
             except Exception as e:
-                logger.error(f"Command error: {e}")
-                self.error_occurred.emit(f"Command error: {e}")
-                return None
+                logger.debug(f"Error closing port after failed connect: {e}")
+            self.ser = None
+        with self._lock:
+            self.is_connected = False
+
+    def _stop_transport(self) -> None:
+        """Stop the serial transport I/O thread (port is closed by caller)."""
+        if self._transport is not None:
+            self._transport.stop()
+            self._transport = None
+        self._pending_polls = []
+
+    def get_latency_statistics(self) -> dict[str, Any]:
+        """
+        Get serial command latency statistics from the transport.
+
+        Returns:
+            Per-command latency histograms (see SerialTransport.get_latency_statistics),
+            or an empty dict when not connected
+        """
+        transport = self._transport
+        if transport is None:
+            return {}
+        return transport.get_latency_statistics()
 
     def _read_limits(self) -> None:
         """Read safety limits from device."""
@@ -259,39 +385,44 @@ class TECController(HardwareControllerBase):
             logger.error("Not connected to TEC controller")
             return False
 
-        with self._lock:
-            try:
+        try:
+            with self._command_lock:
                 value = 1 if enabled else 0
-                self._write_command(f"TEC:OUT {value}")
+                # Disabling output is a safety action: jump ahead of queued polls
+                priority = TransportPriority.COMMAND if enabled else TransportPriority.SAFETY
+                self._write_command(f"TEC:OUT {value}", priority=priority)
 
                 # Verify
-                response = self._write_command("TEC:OUT?")
-                if response and int(response) == value:
-                    self.is_output_enabled = enabled
-                    self.output_changed.emit(enabled)
-                    status = "enabled" if enabled else "disabled"
-                    logger.info(f"TEC output {status}")
-
-                    # Log event
-                    if self.event_logger:
-                        from core.event_logger import EventType
-
-                        event_type = EventType.TEC_ENABLED if enabled else EventType.TEC_DISABLED
-                        self.event_logger.log_event(
-                            event_type=event_type,
-                            description=f"TEC output {status}",
-                            details={"temperature_setpoint": self.temperature_setpoint_c},
-                        )
-
-                    return True
-                else:
+                response = self._write_command("TEC:OUT?", priority=priority)
+                if not response or int(response) != value:
                     logger.error("Failed to set output")
                     return False
 
-            except Exception as e:
-                logger.error(f"Failed to set output: {e}")
-                self.error_occurred.emit(f"Output control failed: {e}")
-                return False
+                with self._lock:
+                    self.is_output_enabled = enabled
+                    temperature_setpoint_c = self.temperature_setpoint_c
+
+        except Exception as e:
+            logger.error(f"Failed to set output: {e}")
+            self.error_occurred.emit(f"Output control failed: {e}")
+            return False
+
+        self.output_changed.emit(enabled)
+        status = "enabled" if enabled else "disabled"
+        logger.info(f"TEC output {status}")
+
+        # Log event
+        if self.event_logger:
+            from core.event_logger import EventType
+
+            event_type = EventType.TEC_ENABLED if enabled else EventType.TEC_DISABLED
+            self.event_logger.log_event(
+                event_type=event_type,
+                description=f"TEC output {status}",
+                details={"temperature_setpoint": temperature_setpoint_c},
+            )
+
+        return True
 
     def set_temperature(self, temperature_c: float) -> bool:
         """
@@ -318,38 +449,38 @@ class TECController(HardwareControllerBase):
             )
             return False
 
-        with self._lock:
-            try:
+        try:
+            with self._command_lock:
                 self._write_command(f"TEC:T {temperature_c:.2f}")
 
                 # Verify
                 response = self._write_command("TEC:SET:T?")
-                if response:
-                    set_temp = float(response)
-                    if abs(set_temp - temperature_c) < 0.1:
-                        self.temperature_setpoint_c = temperature_c
-                        self.temperature_setpoint_changed.emit(temperature_c)
-                        logger.info(f"Set TEC temperature to {temperature_c:.1f}°C")
+                if not response or abs(float(response) - temperature_c) >= 0.1:
+                    logger.error("Failed to set temperature")
+                    return False
 
-                        # Log event
-                        if self.event_logger:
-                            from core.event_logger import EventType
+                with self._lock:
+                    self.temperature_setpoint_c = temperature_c
 
-                            self.event_logger.log_event(
-                                event_type=EventType.TEC_TEMP_CHANGE,
-                                description=f"TEC temperature set to {temperature_c:.1f}°C",
-                                details={"temperature_c": temperature_c},
-                            )
+        except Exception as e:
+            logger.error(f"Failed to set temperature: {e}")
+            self.error_occurred.emit(f"Temperature control failed: {e}")
+            return False
 
-                        return True
+        self.temperature_setpoint_changed.emit(temperature_c)
+        logger.info(f"Set TEC temperature to {temperature_c:.1f}°C")
 
-                logger.error("Failed to set temperature")
-                return False
+        # Log event
+        if self.event_logger:
+            from core.event_logger import EventType
 
-            except Exception as e:
-                logger.error(f"Failed to set temperature: {e}")
-                self.error_occurred.emit(f"Temperature control failed: {e}")
-                return False
+            self.event_logger.log_event(
+                event_type=EventType.TEC_TEMP_CHANGE,
+                description=f"TEC temperature set to {temperature_c:.1f}°C",
+                details={"temperature_c": temperature_c},
+            )
+
+        return True
 
     def read_temperature(self) -> Optional[float]:
         """
@@ -399,35 +530,54 @@ class TECController(HardwareControllerBase):
             logger.error(f"Failed to read voltage: {e}")
             return None
 
+    @instrumented("tec._update_status")
     def _update_status(self) -> None:
-        """Update status from device (called by timer)."""
+        """
+        Queue status queries (called by timer).
+
+        Queries run on the transport I/O thread at POLL priority, so the timer
+        never blocks on serial I/O. A new poll is skipped while the previous
+        one is still outstanding.
+        """
         if not self.is_connected:
             return
 
-        with self._lock:
-            try:
-                # Read temperature
-                temperature = self.read_temperature()
-                if temperature is not None:
-                    self.temperature_changed.emit(temperature)
-
-                # Read current
-                current = self.read_current()
-                if current is not None:
-                    self.current_changed.emit(current)
-
-                # Read voltage
-                voltage = self.read_voltage()
-                if voltage is not None:
-                    self.voltage_changed.emit(voltage)
-
-                # Read output state
-                response = self._write_command("TEC:OUT?")
-                if response:
-                    output_enabled = bool(int(response))
-                    if output_enabled != self.is_output_enabled:
-                        self.is_output_enabled = output_enabled
-                        self.output_changed.emit(output_enabled)
+        if any(not future.done() for future in self._pending_polls):
+            return
 
-            except Exception as e:
-                logger.error(f"Status update error: {e}")
+        futures = [
+            self._submit_poll(command) for command in ("TEC:T?", "TEC:ITE?", "TEC:V?", "TEC:OUT?")
+        ]
+        self._pending_polls = [future for future in futures if future is not None]
+
+    def _handle_poll_response(self, command: str, response: str) -> None:
+        """
+        Apply a status poll response (runs on the controller's thread).
+
+        Args:
+            command: Query that produced the response
+            response: Response string from the TEC controller
+        """
+        if not self.is_connected or not response:
+            return
+
+        try:
+            if command == "TEC:T?":
+                self.temperature_changed.emit(float(response))
+
+            elif command == "TEC:ITE?":
+                self.current_changed.emit(float(response))
+
+            elif command == "TEC:V?":
+                self.voltage_changed.emit(float(response))
+
+            elif command == "TEC:OUT?":
+                output_enabled = bool(int(response))
+                with self._lock:
+                    changed = output_enabled != self.is_output_enabled
+                    self.is_output_enabled = output_enabled
+                if changed:
+                    self.output_changed.emit(output_enabled)
+
+        except Exception as e:
+            logger.error(f"Status update error: {e}")
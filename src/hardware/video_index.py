@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+"""
+Module: video_index
+Project: TOSCA Laser Control System
+
+Purpose: Frame-level camera timestamps and the frame -> time index saved
+next to treatment videos. Every recorded frame is stored with the camera's
+frame ID, the device timestamp and the host monotonic time at which it
+arrived; host times are mapped to wall-clock time through one anchor taken
+when recording starts, so frames join against the event log (ISO wall-clock
+timestamps) and other telemetry without clock jumps inside a recording.
+Safety Critical: No (review and diagnostics only)
+"""
+
+from __future__ import annotations
+
+import bisect
+import csv
+import json
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional, Sequence, TextIO, Union
+
+logger = logging.getLogger(__name__)
+
+FRAME_INDEX_SUFFIX = ".frames.csv"
+FRAME_INDEX_COLUMNS = (
+    "video_frame",
+    "camera_frame_id",
+    "device_timestamp_ns",
+    "host_monotonic_ns",
+    "host_time",
+    "dropped_before",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class FrameInfo:
+    """Identity and timing of one camera frame."""
+
+    frame_id: int  # Camera frame counter (gaps = frames lost before reaching the host)
+    device_timestamp_ns: int  # Camera clock (0 if the camera does not report one)
+    host_monotonic_ns: int  # time.monotonic_ns() when the frame callback started
+    dropped_before: int = 0  # Frames missing between the previous frame and this one
+
+
+def frame_index_path(video_path: Path) -> Path:
+    """Index file written next to a video (session_x.mp4 -> session_x.frames.csv)."""
+    return video_path.with_suffix(FRAME_INDEX_SUFFIX)
+
+
+class FrameDropDetector:
+    """
+    Detect dropped frames from gaps in the camera frame ID.
+
+    Frame IDs count every frame the camera produced, so a jump of more
+    than one means frames were lost in the driver or transport.
+    """
+
+    def __init__(self) -> None:
+        self.last_frame_id: Optional[int] = None
+        self.frames_received = 0
+        self.frames_dropped = 0
+
+    def update(self, frame_id: int) -> int:
+        """
+        Record a received frame.
+
+        Args:
+            frame_id: Camera frame ID
+
+        Returns:
+            Number of frames missing before this one
+        """
+        missing = 0
+        if self.last_frame_id is not None and frame_id > self.last_frame_id + 1:
+            missing = frame_id - self.last_frame_id - 1
+        # A lower ID means the camera restarted its counter; start over from it
+        self.last_frame_id = frame_id
+        self.frames_received += 1
+        self.frames_dropped += missing
+        return missing
+
+
+class FrameIndexWriter:
+    """
+    Append recorded frames to a video's frame index (CSV).
+
+    The anchor pairs time.time() with time.monotonic_ns() once, when the
+    writer is created; every frame's wall-clock time is derived from it.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        Create the index file.
+
+        Args:
+            path: Index file path (see frame_index_path())
+        """
+        self.path = path
+        self.anchor_wall_s = time.time()
+        self.anchor_monotonic_ns = time.monotonic_ns()
+        self.frame_count = 0
+        self._file: Optional[TextIO] = open(path, "w", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(FRAME_INDEX_COLUMNS)
+
+    def host_time(self, host_monotonic_ns: int) -> float:
+        """Wall-clock time (epoch seconds) of a host monotonic timestamp."""
+        return self.anchor_wall_s + (host_monotonic_ns - self.anchor_monotonic_ns) / 1e9
+
+    def write(self, info: FrameInfo) -> None:
+        """
+        Append the next video frame.
+
+        Args:
+            info: Camera frame written as video frame number frame_count
+        """
+        if self._file is None:
+            return
+        self._writer.writerow(
+            (
+                self.frame_count,
+                info.frame_id,
+                info.device_timestamp_ns,
+                info.host_monotonic_ns,
+                f"{self.host_time(info.host_monotonic_ns):.6f}",
+                info.dropped_before,
+            )
+        )
+        self.frame_count += 1
+
+    def close(self) -> None:
+        """Flush and close the index file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            logger.info(f"Frame index saved: {self.path} ({self.frame_count} frames)")
+
+
+TimeLike = Union[float, datetime, str]
+
+
+def _to_epoch(value: TimeLike) -> float:
+    """Epoch seconds from epoch seconds, a datetime or an ISO timestamp (event log)."""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return float(value)
+
+
+class VideoFrameIndex:
+    """
+    Frame -> time index of a recorded video.
+
+    Usage:
+        index = VideoFrameIndex.load(frame_index_path(video_path))
+        frame = index.frame_at("2025-11-08T14:03:12.250")  # Event log timestamp
+        for event, frame in index.align_event_log(events_file, ["laser_enabled"]):
+            ...
+    """
+
+    def __init__(self, rows: Sequence[dict[str, Any]]) -> None:
+        self.camera_frame_ids = [int(row["camera_frame_id"]) for row in rows]
+        self.device_timestamps_ns = [int(row["device_timestamp_ns"]) for row in rows]
+        self.host_monotonic_ns = [int(row["host_monotonic_ns"]) for row in rows]
+        self.host_times = [float(row["host_time"]) for row in rows]
+        self.dropped_before = [int(row["dropped_before"]) for row in rows]
+
+    @classmethod
+    def load(cls, path: Path) -> "VideoFrameIndex":
+        """
+        Load an index file.
+
+        Args:
+            path: Frame index CSV (see frame_index_path())
+
+        Returns:
+            Loaded index
+        """
+        with open(path, newline="", encoding="utf-8") as f:
+            return cls(list(csv.DictReader(f)))
+
+    def __len__(self) -> int:
+        return len(self.host_times)
+
+    @property
+    def frames_dropped(self) -> int:
+        """Camera frames lost during the recording (frame ID gaps)."""
+        return sum(self.dropped_before[1:])  # Gap before the first frame predates recording
+
+    @property
+    def start_time(self) -> Optional[float]:
+        """Wall-clock time of the first frame (epoch seconds)."""
+        return self.host_times[0] if self.host_times else None
+
+    @property
+    def end_time(self) -> Optional[float]:
+        """Wall-clock time of the last frame (epoch seconds)."""
+        return self.host_times[-1] if self.host_times else None
+
+    def time_of(self, video_frame: int) -> float:
+        """Wall-clock time (epoch seconds) of a video frame."""
+        return self.host_times[video_frame]
+
+    def frame_at(self, when: TimeLike) -> Optional[int]:
+        """
+        Video frame showing the given moment.
+
+        Args:
+            when: Epoch seconds, datetime or ISO timestamp (as in the event log)
+
+        Returns:
+            Last frame captured at or before the moment, or None if it lies
+            outside the recording
+        """
+        t = _to_epoch(when)
+        if not self.host_times or t < self.host_times[0] or t > self.host_times[-1]:
+            return None
+        return bisect.bisect_right(self.host_times, t) - 1
+
+    def align_events(
+        self, events: Iterable[dict[str, Any]], event_types: Optional[Iterable[str]] = None
+    ) -> Iterator[tuple[dict[str, Any], int]]:
+        """
+        Pair events with the video frame at their timestamp.
+
+        Args:
+            events: Event dicts with an ISO "timestamp" (event log format)
+            event_types: Only these event_type values (default: all)
+
+        Yields:
+            (event, video_frame) for events that happened during the recording
+        """
+        wanted = set(event_types) if event_types is not None else None
+        for event in events:
+            if wanted is not None and event.get("event_type") not in wanted:
+                continue
+            try:
+                frame = self.frame_at(event["timestamp"])
+            except (KeyError, ValueError):
+                continue
+            if frame is not None:
+                yield event, frame
+
+    def align_event_log(
+        self, events_file: Path, event_types: Optional[Iterable[str]] = None
+    ) -> list[tuple[dict[str, Any], int]]:
+        """
+        Pair the events of a JSONL event log with video frames.
+
+        Args:
+            events_file: Event log written by EventLogger
+            event_types: Only these event_type values (default: all)
+
+        Returns:
+            List of (event, video_frame) for events during the recording
+        """
+        with open(events_file, encoding="utf-8") as f:
+            events = (json.loads(line) for line in f if line.strip())
+            return list(self.align_events(events, event_types))
@@ -249,32 +249,20 @@ class AddSubjectDialog(QDialog):
         Format: P-YYYY-NNNN (e.g., P-2025-0001)
 
         Algorithm:
-        1. Get all existing subjects for current year
-        2. Find highest sequence number
-        3. Increment by 1
-        4. Zero-pad to 4 digits
+        1. Look up the highest existing code for current year (index lookup)
+        2. Increment its sequence number by 1
+        3. Zero-pad to 4 digits
         """
         try:
             current_year = datetime.now().year
             prefix = f"P-{current_year}-"
 
-            # Get all subjects for this year
-            all_subjects = self.db_manager.get_all_subjects()
-            year_subjects = [s for s in all_subjects if s.subject_code.startswith(prefix)]
-
-            if not year_subjects:
-                # First subject of the year
-                next_number = 1
-            else:
-                # Find highest sequence number
-                sequence_numbers = []
-                for subject in year_subjects:
-                    # Extract NNNN from P-YYYY-NNNN
-                    match = re.search(r"-(\d{4})$", subject.subject_code)
-                    if match:
-                        sequence_numbers.append(int(match.group(1)))
-
-                next_number = max(sequence_numbers) + 1 if sequence_numbers else 1
+            # Zero-padded codes sort by sequence number
+            last_code = self.db_manager.get_last_subject_code(prefix)
+
+            # Extract NNNN from P-YYYY-NNNN
+            match = re.search(r"-(\d{4})$", last_code) if last_code else None
+            next_number = int(match.group(1)) + 1 if match else 1
 
             # Generate code with zero-padding
             subject_code = f"P-{current_year}-{next_number:04d}"
@@ -10,7 +10,8 @@ Safety Critical: Yes
 
 import asyncio
 import logging
-from typing import Any
+from pathlib import Path
+from typing import Any, Optional
 
 from PyQt6.QtCore import QObject, QRunnable, Qt, QThreadPool, pyqtSignal
 from PyQt6.QtGui import QCloseEvent
@@ -30,13 +31,18 @@ from core.protocol_engine import ProtocolEngine
 from core.safety import SafetyManager, SafetyState
 from core.safety_watchdog import SafetyWatchdog
 from core.session_manager import SessionManager
+from database.backup import BackupService
 from database.db_manager import DatabaseManager
+from hardware.connection_orchestrator import ConnectionOrchestrator, DeviceState, StartupReport
 from ui.dialogs.research_mode_warning_dialog import ResearchModeWarningDialog
 from ui.widgets.camera_widget import CameraWidget
+from ui.widgets.performance_dashboard_widget import PerformanceDashboardWidget
 from ui.widgets.protocol_steps_display_widget import ProtocolStepsDisplayWidget
 from ui.widgets.safety_widget import SafetyWidget
 from ui.widgets.unified_header_widget import UnifiedHeaderWidget
 from ui.widgets.unified_session_setup_widget import UnifiedSessionSetupWidget
+from utils import instrumentation
+from utils.instrumentation import GuiStallDetector
 
 logger = logging.getLogger(__name__)
 
@@ -125,11 +131,30 @@ class MainWindow(QMainWindow):
         self.setGeometry(100, 100, 1200, 900)  # Adjusted from 1400x900 for better vertical space
 
         # Initialize database and session managers
-        self.db_manager = DatabaseManager()
+        db_config = get_config().database
+        self.db_manager = DatabaseManager(
+            synchronous=db_config.synchronous,
+            cache_size_mb=db_config.cache_size_mb,
+            mmap_size_mb=db_config.mmap_size_mb,
+            temp_store_memory=db_config.temp_store_memory,
+            checkpoint_interval_s=db_config.checkpoint_interval_s,
+        )
         self.db_manager.initialize()
         self.session_manager = SessionManager(self.db_manager)
         self.event_logger = EventLogger(self.db_manager)
 
+        # Online backup of database + event logs (own thread and connection)
+        self.backup_service: Optional[BackupService] = None
+        if db_config.backup_enabled:
+            self.backup_service = BackupService(
+                self.db_manager.db_path,
+                self.event_logger.log_file.parent,
+                Path(db_config.backup_dir),
+                interval_s=db_config.backup_interval_h * 3600.0,
+                keep_databases=db_config.backup_keep,
+            )
+            self.backup_service.start()
+
         # ===================================================================
         # HARDWARE CONTROLLERS - Centralized Instantiation (Dependency Injection)
         # ===================================================================
@@ -138,16 +163,48 @@ class MainWindow(QMainWindow):
         # Benefits: Clear lifecycle management, easier testing, consistent architecture
 
         from hardware.actuator_controller import ActuatorController
+        from hardware.auto_exposure import AutoExposureConfig
         from hardware.camera_controller import CameraController
         from hardware.gpio_controller import GPIOController
         from hardware.laser_controller import LaserController
+        from hardware.raw_recording import RawTranscoder
+        from hardware.still_capture import StillCaptureWriter
         from hardware.tec_controller import TECController
 
         self.actuator_controller = ActuatorController()
         self.laser_controller = LaserController()
         self.tec_controller = TECController()
         self.gpio_controller = GPIOController()
-        self.camera_controller = CameraController(event_logger=self.event_logger)
+        camera_config = get_config().hardware.camera
+        self.camera_controller = CameraController(
+            event_logger=self.event_logger,
+            auto_exposure_config=AutoExposureConfig(
+                target_level=camera_config.auto_exposure_target,
+                percentile=camera_config.auto_exposure_percentile,
+                hysteresis=camera_config.auto_exposure_hysteresis,
+                roi=tuple(camera_config.auto_exposure_roi),
+                max_exposure_us=camera_config.auto_exposure_max_us,
+                max_gain_db=camera_config.auto_gain_max_db,
+            ),
+            still_writer=StillCaptureWriter(
+                image_format=camera_config.still_image_format,
+                png_compression=camera_config.still_png_compression,
+                max_workers=camera_config.still_capture_workers,
+            ),
+            record_raw=camera_config.video_record_raw,
+            raw_max_seconds=camera_config.raw_max_seconds,
+            raw_transcoder=(
+                RawTranscoder(
+                    codec=camera_config.video_codec,
+                    quality_crf=camera_config.video_quality_crf,
+                    fallback_codec=camera_config.video_fallback_codec,
+                    delete_raw=camera_config.raw_delete_after_transcode,
+                    retention_days=camera_config.raw_retention_days,
+                )
+                if camera_config.raw_transcode
+                else None
+            ),
+        )
 
         logger.info("All hardware controllers instantiated in MainWindow")
 
@@ -182,6 +239,17 @@ class MainWindow(QMainWindow):
         self._init_ui()
         self._init_menubar()
 
+        # Concurrent "Connect All" (created per run, see _on_connect_all_hardware)
+        self.connection_orchestrator: Optional[ConnectionOrchestrator] = None
+        if config.gui.auto_connect_hardware:
+            QTimer.singleShot(0, self._on_connect_all_hardware)
+
+        # Performance instrumentation (Developer > Performance Dashboard)
+        self.stall_detector: Optional[GuiStallDetector] = None
+        self.performance_dashboard: Optional[PerformanceDashboardWidget] = None
+        if config.diagnostics.instrumentation_enabled:
+            self._set_instrumentation_enabled(True)
+
         logger.info("Main window initialized")
 
     def _show_research_mode_warning(self) -> None:
@@ -236,6 +304,7 @@ class MainWindow(QMainWindow):
 
         # NEW: Unified header at top (replaces toolbar + right panel + status bar)
         self.unified_header = UnifiedHeaderWidget()
+        self._header_safety_version: Optional[int] = None  # Safety snapshot last shown
         main_layout.addWidget(self.unified_header)
         # Tabs (main content) - now full width without right panel
         self.tabs = QTabWidget()
@@ -491,8 +560,11 @@ class MainWindow(QMainWindow):
         )
         logger.info("Actuator connection widget added to Hardware tab grid (Row 2, Cols 2-3)")
 
-        # Initialize safety manager
-        self.safety_manager = SafetyManager()
+        # Initialize safety manager (decisions are logged with their input-to-decision latency)
+        self.safety_manager = SafetyManager(
+            event_logger=self.event_logger,
+            latency_budget_ms=get_config().safety.interlock_latency_budget_ms,
+        )
         self._connect_safety_system()
         logger.info("Safety manager initialized and connected")
 
@@ -506,7 +578,7 @@ class MainWindow(QMainWindow):
         self._wire_unified_header_signals()
 
     def _init_menubar(self) -> None:
-        """Initialize menubar with File and Developer menus."""
+        """Initialize menubar with File, Hardware and Developer menus."""
         menubar = self.menuBar()
 
         # File menu
@@ -517,6 +589,17 @@ class MainWindow(QMainWindow):
         exit_action.setShortcut("Ctrl+Q")
         exit_action.triggered.connect(self.close)
 
+        # Hardware menu
+        hardware_menu = menubar.addMenu("&Hardware")
+
+        # Connect all devices concurrently (GPIO/watchdog before laser)
+        self.connect_all_action = hardware_menu.addAction("&Connect All")
+        self.connect_all_action.setToolTip(
+            "Connect GPIO, laser, TEC, actuator and camera in parallel "
+            "(laser waits for GPIO safety watchdog)"
+        )
+        self.connect_all_action.triggered.connect(self._on_connect_all_hardware)
+
         # Developer menu
         developer_menu = menubar.addMenu("&Developer")
 
@@ -529,8 +612,69 @@ class MainWindow(QMainWindow):
         )
         self.dev_mode_action.triggered.connect(self._on_dev_mode_changed_menubar)
 
+        # Performance dashboard (GUI stalls, hot-path latency, lock waits)
+        self.performance_dashboard_action = developer_menu.addAction("Performance Dashboard")
+        self.performance_dashboard_action.setToolTip(
+            "Show system metrics, GUI thread stalls, hot-path latency and lock wait times"
+        )
+        self.performance_dashboard_action.triggered.connect(self._on_show_performance_dashboard)
+
         logger.info("Menubar initialized")
 
+    def _on_show_performance_dashboard(self) -> None:
+        """Open the performance dashboard window (created on first use)."""
+        if self.performance_dashboard is None:
+            self.performance_dashboard = PerformanceDashboardWidget(
+                db_manager=self.db_manager, stall_detector=self.stall_detector, parent=self
+            )
+            self.performance_dashboard.setWindowFlag(Qt.WindowType.Window)
+            self.performance_dashboard.setWindowTitle("TOSCA Performance Dashboard")
+            self.performance_dashboard.resize(900, 900)
+            self.performance_dashboard.instrumentation_toggled.connect(
+                self._set_instrumentation_enabled
+            )
+        self.performance_dashboard.show()
+        self.performance_dashboard.raise_()
+
+    def _set_instrumentation_enabled(self, enabled: bool) -> None:
+        """
+        Switch performance instrumentation on or off.
+
+        Enabling wraps the hardware controller locks (wait times are only
+        recorded while enabled) and starts the GUI stall detector.
+
+        Args:
+            enabled: True to start recording
+        """
+        if not enabled:
+            instrumentation.disable()
+            if self.stall_detector is not None:
+                self.stall_detector.stop()
+            return
+
+        diagnostics = get_config().diagnostics
+        instrumentation.enable(window_s=diagnostics.histogram_window_s)
+        for name, controller in (
+            ("camera", self.camera_controller),
+            ("actuator", self.actuator_controller),
+            ("laser", self.laser_controller),
+            ("tec", self.tec_controller),
+            ("gpio", self.gpio_controller),
+        ):
+            instrumentation.instrument_lock(controller, name)
+            if hasattr(controller, "_command_lock"):
+                instrumentation.instrument_lock(controller, f"{name}.command", "_command_lock")
+
+        if self.stall_detector is None:
+            self.stall_detector = GuiStallDetector(
+                threshold_ms=diagnostics.stall_threshold_ms,
+                history=diagnostics.stall_history,
+                parent=self,
+            )
+            if self.performance_dashboard is not None:
+                self.performance_dashboard.set_stall_detector(self.stall_detector)
+        self.stall_detector.start()
+
     def _wire_unified_header_signals(self) -> None:
         """Wire unified header widget signals to main window functionality."""
         # E-Stop button -> Global E-Stop handler
@@ -739,6 +883,94 @@ class MainWindow(QMainWindow):
         # Emit signal for other widgets
         self.dev_mode_changed.emit(checked)
 
+    def _on_connect_all_hardware(self) -> None:
+        """
+        Connect all hardware concurrently (Hardware > Connect All).
+
+        Each controller's blocking connect() runs on a worker thread. GPIO is
+        connected first for the laser: the laser is only started once GPIO is
+        connected and the safety watchdog heartbeat is running, and is
+        skipped if GPIO fails. Camera, actuator and TEC connect in parallel.
+        Devices that are already connected are left as they are.
+        """
+        if self.connection_orchestrator and self.connection_orchestrator.is_running:
+            logger.info("Connect All already in progress")
+            return
+
+        def connect_once(controller: Any, connect_fn: Any) -> Any:
+            return lambda: controller.is_connected or connect_fn()
+
+        gpio_port = self._selected_com_port(self.gpio_widget, get_config().hardware.gpio.com_port)
+        actuator_port = self._selected_com_port(
+            self.actuator_connection_widget, get_config().hardware.actuator.com_port
+        )
+
+        orchestrator = ConnectionOrchestrator(parent=self)
+        orchestrator.add_device(
+            "gpio",
+            connect_once(
+                self.gpio_controller, lambda: self.gpio_controller.connect(port=gpio_port)
+            ),
+        )
+        orchestrator.add_device(
+            "laser",
+            connect_once(self.laser_controller, self.laser_controller.connect),
+            depends_on=["gpio"],
+        )
+        orchestrator.add_device(
+            "tec", connect_once(self.tec_controller, self.tec_controller.connect)
+        )
+        orchestrator.add_device(
+            "actuator",
+            connect_once(
+                self.actuator_controller,
+                # No auto-homing: user must click Find Home (same as the widget)
+                lambda: self.actuator_controller.connect(actuator_port, auto_home=False),
+            ),
+        )
+        orchestrator.add_device(
+            "camera", connect_once(self.camera_controller, self.camera_controller.connect)
+        )
+
+        orchestrator.device_finished.connect(self._on_connect_all_device_finished)
+        orchestrator.progress.connect(
+            lambda done, total: self.statusBar().showMessage(
+                f"Connecting hardware... {done}/{total}", 0
+            )
+        )
+        orchestrator.finished.connect(self._on_connect_all_finished)
+
+        self.connection_orchestrator = orchestrator
+        self.connect_all_action.setEnabled(False)
+        self.statusBar().showMessage("Connecting hardware...", 0)
+        orchestrator.start()
+
+    @staticmethod
+    def _selected_com_port(widget: Any, default: str) -> str:
+        """COM port selected in a connection widget's port combo, or default."""
+        combo = getattr(widget, "com_port_combo", None)
+        if combo is None:
+            return default
+        port = combo.currentData() or combo.currentText().replace("# [DONE] ", "").strip()
+        return port or default
+
+    def _on_connect_all_device_finished(self, name: str, success: bool, _elapsed_s: float) -> None:
+        """Finish GUI-side setup for a device connected by Connect All."""
+        if name == "camera" and success and not self.camera_live_view.is_streaming:
+            self.camera_live_view.on_camera_connected()
+
+    def _on_connect_all_finished(self, report: StartupReport) -> None:
+        """Show Connect All result and log the startup timing report."""
+        self.connect_all_action.setEnabled(True)
+
+        if report.all_connected:
+            message = f"All hardware connected in {report.total_s:.1f}s"
+        else:
+            failed = [d.name for d in report.devices if d.state != DeviceState.CONNECTED]
+            message = f"Hardware connection incomplete ({', '.join(failed)} not connected)"
+        self.statusBar().showMessage(message, 10000)
+        logger.info(f"Connect All finished:\n{report.summary()}")
+
     def _update_camera_header_status(self, connected: bool) -> None:
         """Update camera section header with connection status."""
         if connected:
@@ -778,10 +1010,21 @@ class MainWindow(QMainWindow):
 
         # Connect GPIO controller safety interlock signal to safety manager (one-time connection)
         # Note: Controller exists from __init__, so connect immediately
-        self.gpio_controller.safety_interlock_changed.connect(
-            self.safety_manager.set_gpio_interlock_status
-        )
-        logger.info("GPIO controller safety interlocks -> safety manager (connected)")
+        if get_config().safety.interlock_fast_path:
+            # High-priority path: GPIO polls on its own thread and the safety manager
+            # evaluates there (direct connection), so a busy GUI thread cannot delay
+            # the decision. Safety manager signals still reach GUI receivers queued.
+            self.gpio_controller.poll_in_background = True
+            self.gpio_controller.interlock_input.connect(
+                self.safety_manager.set_gpio_interlock_status,
+                Qt.ConnectionType.DirectConnection,
+            )
+            logger.info("GPIO interlocks -> safety manager (direct, GPIO polling thread)")
+        else:
+            self.gpio_controller.safety_interlock_changed.connect(
+                self.safety_manager.set_gpio_interlock_status
+            )
+            logger.info("GPIO controller safety interlocks -> safety manager (connected)")
 
         # Connect safety manager interlock status to unified header (one-time connection)
         self.safety_manager.interlock_status_changed.connect(self._update_unified_header_interlocks)
@@ -901,8 +1144,14 @@ class MainWindow(QMainWindow):
         Update unified header interlock indicators from safety manager.
 
         Adapter method that fetches interlock status from safety manager
-        and passes it to unified header widget.
+        and passes it to unified header widget. Skipped when the safety
+        snapshot version has not changed since the last update.
         """
+        version = self.safety_manager.snapshot.version
+        if version == self._header_safety_version:
+            return
+        self._header_safety_version = version
+
         interlocks = self.safety_manager.get_interlock_status()
         self.unified_header.update_interlock_status(interlocks)
 
@@ -956,6 +1205,9 @@ class MainWindow(QMainWindow):
             actuator_controller=self.actuator_controller,
             safety_manager=self.safety_manager,
         )
+        self.line_protocol_engine.capture_motion_traces = (
+            get_config().hardware.actuator.motion_trace_capture
+        )
 
         # Connect line protocol engine callbacks for UI updates
         self.line_protocol_engine.on_line_start = self._on_protocol_line_start
@@ -1181,6 +1433,14 @@ class MainWindow(QMainWindow):
 
     def _on_protocol_execution_finished(self, success: bool, message: str) -> None:
         """Handle protocol execution completion."""
+        # Store actuator motion traces with the session data
+        session_folder = self.session_manager.get_session_folder()
+        if session_folder is not None:
+            try:
+                self.line_protocol_engine.save_motion_traces(session_folder)
+            except Exception as e:
+                logger.error(f"Failed to save motion traces: {e}")
+
         if success:
             QMessageBox.information(self, "Protocol Complete", message)
         else:
@@ -1642,8 +1902,19 @@ class MainWindow(QMainWindow):
         if hasattr(self, "actuator_connection_widget") and self.actuator_connection_widget:
             self.actuator_connection_widget.cleanup()
 
+    def _cleanup_diagnostics(self) -> None:
+        """Stop GUI stall detection and performance dashboard refresh."""
+        if self.stall_detector is not None:
+            self.stall_detector.stop()
+        if self.performance_dashboard is not None:
+            self.performance_dashboard.stop_auto_refresh()
+
     def _close_database(self) -> None:
         """Close database connection."""
+        if getattr(self, "safety_manager", None) is not None:
+            self.safety_manager.shutdown()  # Write queued safety decisions first
+        if getattr(self, "backup_service", None) is not None:
+            self.backup_service.stop()
         if hasattr(self, "db_manager") and self.db_manager:
             self.db_manager.close()
 
@@ -1655,6 +1926,7 @@ class MainWindow(QMainWindow):
         self._disable_dev_mode_on_close()
         self._log_shutdown_event()
         self._stop_safety_watchdog()
+        self._cleanup_diagnostics()
 
         # Disconnect all hardware controllers
         self._disconnect_hardware("camera_controller", self.camera_controller)
@@ -1,11 +1,15 @@
 """
 View Sessions Dialog - displays session history.
+
+Sessions are loaded a page at a time in the background (summary columns
+only) and further pages are fetched as the table is scrolled to the end.
 """
 
 import logging
+from concurrent.futures import Future
 from typing import Optional
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtWidgets import (
     QDialog,
     QHeaderView,
@@ -17,8 +21,9 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
-from database.db_manager import DatabaseManager
+from database.db_manager import DatabaseManager, SessionSummary
 from database.models import Subject
+from database.session_history import SessionHistoryPager
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +35,9 @@ class ViewSessionsDialog(QDialog):
     Shows a table of all sessions or sessions for a specific subject.
     """
 
+    # Internal: forwards fetched pages from the fetch thread to the GUI thread
+    _page_loaded = pyqtSignal(object)  # Future resolving to list[SessionSummary]
+
     def __init__(
         self,
         db_manager: DatabaseManager,
@@ -47,6 +55,10 @@ class ViewSessionsDialog(QDialog):
         super().__init__(parent)
         self.db_manager = db_manager
         self.subject = subject
+        self.pager = SessionHistoryPager(
+            db_manager, subject_id=subject.subject_id if subject else None
+        )
+        self._page_loaded.connect(self._on_page_loaded)
         self._init_ui()
         self._load_sessions()
 
@@ -61,7 +73,10 @@ class ViewSessionsDialog(QDialog):
 
         # Title label
         if self.subject:
-            title_text = f"Sessions for Subject: {self.subject.subject_code}"
+            count = self.db_manager.get_session_counts([self.subject.subject_id]).get(
+                self.subject.subject_id, 0
+            )
+            title_text = f"Sessions for Subject: {self.subject.subject_code} ({count})"
         else:
             title_text = "All Sessions"
 
@@ -90,6 +105,7 @@ class ViewSessionsDialog(QDialog):
         self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
         self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
         self.table.setAlternatingRowColors(True)
+        self.table.verticalScrollBar().valueChanged.connect(self._on_table_scrolled)
 
         layout.addWidget(self.table)
 
@@ -100,62 +116,74 @@ class ViewSessionsDialog(QDialog):
         layout.addWidget(self.close_button, alignment=Qt.AlignmentFlag.AlignCenter)
 
     def _load_sessions(self) -> None:
-        """Load sessions from database and populate table."""
+        """Fetch the next page of sessions in the background."""
+        if self.pager.exhausted or self.pager.loading:
+            return
+        self.pager.fetch_next().add_done_callback(self._page_loaded.emit)
+
+    def _on_table_scrolled(self, value: int) -> None:
+        """Load more sessions when the table is scrolled to the end."""
+        if value >= self.table.verticalScrollBar().maximum():
+            self._load_sessions()
+
+    def _on_page_loaded(self, future: Future) -> None:
+        """Append a fetched page to the table (GUI thread)."""
+        if future.cancelled():
+            return  # Dialog closed while fetching
         try:
-            # Get sessions from database
-            if self.subject:
-                sessions = self.db_manager.get_all_sessions(subject_id=self.subject.subject_id)
-            else:
-                sessions = self.db_manager.get_all_sessions()
-
-            # Set row count
-            self.table.setRowCount(len(sessions))
-
-            # Populate table
-            for row, session in enumerate(sessions):
-                # Session ID
-                self.table.setItem(row, 0, QTableWidgetItem(str(session.session_id)))
-
-                # Subject ID
-                subject_code = session.subject.subject_code if session.subject else "Unknown"
-                self.table.setItem(row, 1, QTableWidgetItem(subject_code))
-
-                # Technician
-                tech_name = session.technician.full_name if session.technician else "Unknown"
-                self.table.setItem(row, 2, QTableWidgetItem(tech_name))
-
-                # Start Time
-                start_time = (
-                    session.start_time.strftime("%Y-%m-%d %H:%M:%S") if session.start_time else ""
-                )
-                self.table.setItem(row, 3, QTableWidgetItem(start_time))
-
-                # End Time
-                end_time = (
-                    session.end_time.strftime("%Y-%m-%d %H:%M:%S")
-                    if session.end_time
-                    else "In Progress"
-                )
-                self.table.setItem(row, 4, QTableWidgetItem(end_time))
-
-                # Status
-                status = session.status or "Unknown"
-                status_item = QTableWidgetItem(status)
-
-                # Color-code status
-                if status == "completed":
-                    status_item.setBackground(Qt.GlobalColor.green)
-                elif status == "in_progress":
-                    status_item.setBackground(Qt.GlobalColor.yellow)
-                elif status == "aborted":
-                    status_item.setBackground(Qt.GlobalColor.red)
-                elif status == "paused":
-                    status_item.setBackground(Qt.GlobalColor.cyan)
-
-                self.table.setItem(row, 5, status_item)
-
-            logger.info(f"Loaded {len(sessions)} sessions")
-
+            sessions: list[SessionSummary] = future.result()
         except Exception as e:
             logger.error(f"Error loading sessions: {e}")
-            self.table.setRowCount(0)
+            return
+
+        first_row = self.table.rowCount()
+        self.table.setRowCount(first_row + len(sessions))
+        for row, session in enumerate(sessions, start=first_row):
+            self._set_row(row, session)
+        logger.info(f"Loaded {len(sessions)} sessions")
+
+        # Keep going until the table can scroll (or there is nothing left)
+        if sessions and self.table.verticalScrollBar().maximum() == 0:
+            self._load_sessions()
+
+    def _set_row(self, row: int, session: SessionSummary) -> None:
+        """Populate one table row."""
+        # Session ID
+        self.table.setItem(row, 0, QTableWidgetItem(str(session.session_id)))
+
+        # Subject ID
+        self.table.setItem(row, 1, QTableWidgetItem(session.subject_code or "Unknown"))
+
+        # Technician
+        self.table.setItem(row, 2, QTableWidgetItem(session.technician_name or "Unknown"))
+
+        # Start Time
+        start_time = session.start_time.strftime("%Y-%m-%d %H:%M:%S") if session.start_time else ""
+        self.table.setItem(row, 3, QTableWidgetItem(start_time))
+
+        # End Time
+        end_time = (
+            session.end_time.strftime("%Y-%m-%d %H:%M:%S") if session.end_time else "In Progress"
+        )
+        self.table.setItem(row, 4, QTableWidgetItem(end_time))
+
+        # Status
+        status = session.status or "Unknown"
+        status_item = QTableWidgetItem(status)
+
+        # Color-code status
+        if status == "completed":
+            status_item.setBackground(Qt.GlobalColor.green)
+        elif status == "in_progress":
+            status_item.setBackground(Qt.GlobalColor.yellow)
+        elif status == "aborted":
+            status_item.setBackground(Qt.GlobalColor.red)
+        elif status == "paused":
+            status_item.setBackground(Qt.GlobalColor.cyan)
+
+        self.table.setItem(row, 5, status_item)
+
+    def done(self, result: int) -> None:
+        """Stop the fetch thread when the dialog closes."""
+        self.pager.shutdown()
+        super().done(result)
@@ -95,6 +95,7 @@ class CameraWidget(QWidget):
         self.camera_controller.connection_changed.connect(self._on_connection_changed)
         self.camera_controller.error_occurred.connect(self._on_error)
         self.camera_controller.recording_status_changed.connect(self._on_recording_status_changed)
+        self.camera_controller.image_captured.connect(self._on_image_captured)
         # Connect camera setting signals for hardware feedback loop
         self.camera_controller.exposure_changed.connect(self._on_exposure_hardware_changed)
         self.camera_controller.gain_changed.connect(self._on_gain_hardware_changed)
@@ -412,32 +413,44 @@ class CameraWidget(QWidget):
         logger.info("Connecting to camera...")
         success = self.camera_controller.connect()
         if success:
-            # Update slider ranges from camera (only if settings controls exist)
-            if self.exposure_slider is not None:
-                exp_min, exp_max = self.camera_controller.get_exposure_range()
-                self.exposure_slider.setMinimum(int(exp_min))
-                self.exposure_slider.setMaximum(int(exp_max))
+            self.on_camera_connected()
+        else:
+            logger.error("Failed to connect camera")
 
-            if self.gain_slider is not None:
-                gain_min, gain_max = self.camera_controller.get_gain_range()
-                self.gain_slider.setMinimum(int(gain_min * 10))
-                self.gain_slider.setMaximum(int(gain_max * 10))
+        return success
 
-            # Read and display current camera settings
-            current_exposure = self.camera_controller.get_exposure()
-            current_gain = self.camera_controller.get_gain()
+    def on_camera_connected(self) -> None:
+        """
+        Public API: Sync controls with a newly connected camera and start streaming.
 
-            # Update UI with current hardware values (status labels + controls if they exist)
-            self._on_exposure_hardware_changed(current_exposure)
-            self._on_gain_hardware_changed(current_gain)
+        Called by connect_camera(), and by MainWindow after the camera was
+        connected on a worker thread (Hardware > Connect All). GUI thread only.
+        """
+        if not self.camera_controller:
+            return
 
-            # Auto-start streaming for immediate visual feedback
-            self._on_stream_clicked()  # Use existing stream button handler
-            logger.info("Camera connected successfully (streaming auto-started)")
-        else:
-            logger.error("Failed to connect camera")
+        # Update slider ranges from camera (only if settings controls exist)
+        if self.exposure_slider is not None:
+            exp_min, exp_max = self.camera_controller.get_exposure_range()
+            self.exposure_slider.setMinimum(int(exp_min))
+            self.exposure_slider.setMaximum(int(exp_max))
 
-        return success
+        if self.gain_slider is not None:
+            gain_min, gain_max = self.camera_controller.get_gain_range()
+            self.gain_slider.setMinimum(int(gain_min * 10))
+            self.gain_slider.setMaximum(int(gain_max * 10))
+
+        # Read and display current camera settings
+        current_exposure = self.camera_controller.get_exposure()
+        current_gain = self.camera_controller.get_gain()
+
+        # Update UI with current hardware values (status labels + controls if they exist)
+        self._on_exposure_hardware_changed(current_exposure)
+        self._on_gain_hardware_changed(current_gain)
+
+        # Auto-start streaming for immediate visual feedback
+        self._on_stream_clicked()  # Use existing stream button handler
+        logger.info("Camera connected successfully (streaming auto-started)")
 
     def disconnect_camera(self) -> bool:
         """
@@ -1132,16 +1145,12 @@ class CameraWidget(QWidget):
                 output_dir = self.custom_image_path
                 logger.info(f"Using custom image path: {output_dir}")
 
-            # Capture image
-            saved_path = self.camera_controller.capture_image(base_filename, output_dir)
+            # Capture image (written in the background, see _on_image_captured)
+            pending = self.camera_controller.capture_image_async(base_filename, output_dir)
 
-            if saved_path:
-                self.last_capture_label.setText(f"Saved: {saved_path}")
-                self.last_capture_label.setStyleSheet("color: green; font-size: 10px;")
-                logger.info(f"Image captured successfully: {saved_path}")
-                QMessageBox.information(
-                    self, "Image Captured", f"Image saved successfully:\n\n{saved_path}"
-                )
+            if pending is not None:
+                self.last_capture_label.setText("Saving image...")
+                self.last_capture_label.setStyleSheet("color: #666; font-size: 10px;")
             else:
                 self.last_capture_label.setText("Capture failed - check logs")
                 self.last_capture_label.setStyleSheet("color: red; font-size: 10px;")
@@ -1163,6 +1172,14 @@ class CameraWidget(QWidget):
                 self, "Capture Error", f"Unexpected error occurred:\n\n{e}\n\nCheck logs for details."
             )
 
+    def _on_image_captured(self, saved_path: str) -> None:
+        """Handle a still image written by the camera controller."""
+        logger.info(f"Image captured successfully: {saved_path}")
+        label = getattr(self, "last_capture_label", None)
+        if label:
+            label.setText(f"Saved: {saved_path}")
+            label.setStyleSheet("color: green; font-size: 10px;")
+
     def _on_record_clicked(self) -> None:
         """Handle record button click."""
         if not self.camera_controller:
@@ -33,6 +33,7 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from core.protocol_dry_run import dry_run_protocol
 from core.protocol_line import (
     DwellParams,
     HomeParams,
@@ -359,6 +360,16 @@ class LineProtocolBuilderWidget(QWidget):
         self.loop_count_spin.valueChanged.connect(self._on_metadata_changed)
         exec_layout.addWidget(self.loop_count_spin)
 
+        self.dry_run_btn = QPushButton("⏱ Dry Run")
+        self.dry_run_btn.setToolTip(
+            "Run the protocol against simulated hardware in virtual time and report "
+            "timing, laser energy and limit violations (no hardware is used)"
+        )
+        self.dry_run_btn.clicked.connect(self._on_dry_run_protocol)
+        self.dry_run_btn.setEnabled(False)
+        self.dry_run_btn.setMinimumHeight(45)
+        exec_layout.addWidget(self.dry_run_btn)
+
         self.execute_protocol_btn = QPushButton("▶▶ EXECUTE PROTOCOL ◀◀")
         self.execute_protocol_btn.setStyleSheet(
             "background-color: #2196F3; color: white; font-weight: bold; "
@@ -1401,6 +1412,23 @@ class LineProtocolBuilderWidget(QWidget):
         self.protocol_ready.emit(self.current_protocol)
         logger.info(f"Protocol ready for execution: {self.current_protocol.protocol_name}")
 
+    def _on_dry_run_protocol(self) -> None:
+        """Run the current protocol in virtual time and show the report."""
+        if self.current_protocol is None:
+            return
+
+        try:
+            report = dry_run_protocol(self.current_protocol)
+        except Exception as e:
+            logger.error(f"Dry run failed: {e}")
+            QMessageBox.critical(self, "Dry Run Error", f"Dry run failed:\n{str(e)}")
+            return
+
+        if report.passed:
+            QMessageBox.information(self, "Dry Run Passed", report.summary())
+        else:
+            QMessageBox.warning(self, "Dry Run Failed", report.summary())
+
     # ========================================================================
     # Helper Methods
     # ========================================================================
@@ -1444,6 +1472,7 @@ class LineProtocolBuilderWidget(QWidget):
 
         # Enable execute button if protocol has lines
         self.execute_protocol_btn.setEnabled(len(self.current_protocol.lines) > 0)
+        self.dry_run_btn.setEnabled(len(self.current_protocol.lines) > 0)
 
     def _update_sequence_view(self) -> None:
         """Update protocol sequence list with line summaries."""
@@ -1489,6 +1518,7 @@ class LineProtocolBuilderWidget(QWidget):
 
         # Update execute button state
         self.execute_protocol_btn.setEnabled(len(self.current_protocol.lines) > 0)
+        self.dry_run_btn.setEnabled(len(self.current_protocol.lines) > 0)
 
     def _update_total_duration(self) -> None:
         """Update total protocol duration and energy displays."""
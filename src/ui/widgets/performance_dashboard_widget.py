@@ -2,22 +2,45 @@
 Performance Monitoring Dashboard Widget.
 
 Displays system performance metrics, database statistics, log file info,
-and resource usage for maintenance and monitoring purposes.
+and resource usage for maintenance and monitoring purposes, plus the
+runtime instrumentation from utils.instrumentation: GUI-thread stalls with
+the stacks captured during them, hot-path latencies and controller lock
+wait times.
 """
 
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
-import psutil  # type: ignore[import-untyped]
 from PyQt6.QtCore import QObject, QRunnable, Qt, QThreadPool, QTimer, pyqtSignal
 from PyQt6.QtGui import QCloseEvent
-from PyQt6.QtWidgets import QGridLayout, QGroupBox, QLabel, QPushButton, QVBoxLayout, QWidget
+from PyQt6.QtWidgets import (
+    QCheckBox,
+    QGridLayout,
+    QGroupBox,
+    QHeaderView,
+    QLabel,
+    QPlainTextEdit,
+    QPushButton,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+    QWidget,
+)
 
 from database.db_manager import DatabaseManager
+from utils import instrumentation
+from utils.instrumentation import GuiStallDetector, StallReport
+
+try:
+    import psutil  # type: ignore[import-untyped]
+except ImportError:
+    psutil = None
 
 logger = logging.getLogger(__name__)
 
+LATENCY_COLUMNS = ["Metric", "Calls", "p50 (ms)", "p99 (ms)", "Max (ms)"]
+
 
 class WorkerSignals(QObject):
     """Signals for background worker threads."""
@@ -64,13 +87,22 @@ class PerformanceDashboardWidget(QWidget):
     - Database statistics (size, vacuum info)
     - Log file statistics (size, count, rotation status)
     - System resource usage (CPU, memory, disk)
+    - GUI thread responsiveness and recent stalls
+    - Hot-path latencies and lock wait times (rolling window)
     - Performance recommendations
+
+    Signals:
+        instrumentation_toggled(bool): User switched instrumentation on/off;
+            the owner installs or removes the instrumentation hooks
     """
 
+    instrumentation_toggled = pyqtSignal(bool)
+
     def __init__(
         self,
         db_manager: Optional[DatabaseManager] = None,
         log_directory: Optional[Path] = None,
+        stall_detector: Optional[GuiStallDetector] = None,
         parent: Optional[QWidget] = None,
     ) -> None:
         """
@@ -79,13 +111,16 @@ class PerformanceDashboardWidget(QWidget):
         Args:
             db_manager: Database manager for database statistics
             log_directory: Path to log files directory
+            stall_detector: GUI stall detector whose stalls are shown
             parent: Parent widget
         """
         super().__init__(parent)
         self.db_manager = db_manager
         self.log_directory = log_directory or Path("data/logs")
+        self.stall_detector: Optional[GuiStallDetector] = None
 
         self._setup_ui()
+        self.set_stall_detector(stall_detector)
         self._start_auto_refresh()
 
     def _setup_ui(self) -> None:
@@ -115,13 +150,20 @@ class PerformanceDashboardWidget(QWidget):
         metrics_layout.addWidget(self.system_panel, 1, 0)
         metrics_layout.addWidget(self.action_panel, 1, 1)
 
+        # Row 3: GUI thread; row 4: hot paths and lock waits
+        self.gui_thread_panel = self._create_gui_thread_panel()
+        self.hot_path_panel, self.hot_path_table = self._create_latency_panel("Hot Path Latency")
+        self.lock_panel, self.lock_table = self._create_latency_panel("Lock Wait Time")
+        metrics_layout.addWidget(self.gui_thread_panel, 2, 0, 1, 2)
+        metrics_layout.addWidget(self.hot_path_panel, 3, 0)
+        metrics_layout.addWidget(self.lock_panel, 3, 1)
+
         layout.addLayout(metrics_layout)
 
         # Recommendations panel
         self.recommendations_panel = self._create_recommendations_panel()
         layout.addWidget(self.recommendations_panel)
 
-        layout.addStretch()
         self.setLayout(layout)
 
         # Initial update
@@ -190,9 +232,61 @@ class PerformanceDashboardWidget(QWidget):
         refresh_button.clicked.connect(self.update_metrics)
         layout.addWidget(refresh_button)
 
+        # Instrumentation toggle
+        self.instrumentation_checkbox = QCheckBox("Enable Instrumentation")
+        self.instrumentation_checkbox.setToolTip(
+            "Time hot paths, measure lock waits and detect GUI stalls (small overhead)"
+        )
+        self.instrumentation_checkbox.setChecked(instrumentation.is_enabled())
+        self.instrumentation_checkbox.toggled.connect(self.instrumentation_toggled.emit)
+        layout.addWidget(self.instrumentation_checkbox)
+
+        reset_button = QPushButton("Reset Statistics")
+        reset_button.clicked.connect(self._on_reset_clicked)
+        layout.addWidget(reset_button)
+
         panel.setLayout(layout)
         return panel
 
+    def _create_gui_thread_panel(self) -> QGroupBox:
+        """Create GUI thread responsiveness panel."""
+        panel = QGroupBox("GUI Thread")
+        layout = QVBoxLayout()
+
+        self.stall_count_label = QLabel("Stalls: --")
+        self.lateness_label = QLabel("Event Loop Lateness: --")
+        layout.addWidget(self.stall_count_label)
+        layout.addWidget(self.lateness_label)
+
+        # Main thread stacks sampled during the most recent stalls
+        self.stall_stacks_text = QPlainTextEdit()
+        self.stall_stacks_text.setReadOnly(True)
+        self.stall_stacks_text.setMaximumBlockCount(2000)
+        self.stall_stacks_text.setStyleSheet("font-family: monospace; font-size: 8pt;")
+        self.stall_stacks_text.setPlaceholderText("No GUI stalls recorded")
+        layout.addWidget(self.stall_stacks_text)
+
+        panel.setLayout(layout)
+        return panel
+
+    def _create_latency_panel(self, title: str) -> tuple[QGroupBox, QTableWidget]:
+        """Create a panel with a latency statistics table."""
+        panel = QGroupBox(title)
+        layout = QVBoxLayout()
+
+        table = QTableWidget(0, len(LATENCY_COLUMNS))
+        table.setHorizontalHeaderLabels(LATENCY_COLUMNS)
+        table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        table.setWordWrap(False)
+        table.verticalHeader().setVisible(False)
+        header = table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        layout.addWidget(table)
+
+        panel.setLayout(layout)
+        return panel, table
+
     def _create_recommendations_panel(self) -> QGroupBox:
         """Create performance recommendations panel."""
         panel = QGroupBox("Recommendations")
@@ -208,11 +302,30 @@ class PerformanceDashboardWidget(QWidget):
         panel.setLayout(layout)
         return panel
 
+    def set_stall_detector(self, stall_detector: Optional[GuiStallDetector]) -> None:
+        """
+        Show stalls from the given detector (None to detach).
+
+        Args:
+            stall_detector: Running or stopped GUI stall detector
+        """
+        if self.stall_detector is not None:
+            self.stall_detector.stall_detected.disconnect(self._on_stall_detected)
+        self.stall_detector = stall_detector
+        if stall_detector is not None:
+            stall_detector.stall_detected.connect(self._on_stall_detected)
+        self._update_stall_stacks()
+
     def _start_auto_refresh(self) -> None:
-        """Start automatic metric refresh timer."""
+        """Start automatic metric refresh timers."""
         self.refresh_timer = QTimer()
         self.refresh_timer.timeout.connect(self.update_metrics)
         self.refresh_timer.start(5000)  # Refresh every 5 seconds
+
+        # Instrumentation is in-memory only, so it refreshes faster
+        self.instrumentation_timer = QTimer()
+        self.instrumentation_timer.timeout.connect(self._update_instrumentation_metrics)
+        self.instrumentation_timer.start(1000)
         logger.info("Performance dashboard auto-refresh started (5s interval)")
 
     def update_metrics(self) -> None:
@@ -220,6 +333,7 @@ class PerformanceDashboardWidget(QWidget):
         self._update_database_metrics()
         self._update_log_metrics()
         self._update_system_metrics()
+        self._update_instrumentation_metrics()
         self._update_recommendations()
 
     def _update_database_metrics(self) -> None:
@@ -280,9 +394,15 @@ class PerformanceDashboardWidget(QWidget):
 
     def _update_system_metrics(self) -> None:
         """Update system resource usage."""
+        if psutil is None:
+            self.cpu_label.setText("CPU: N/A (psutil not installed)")
+            self.memory_label.setText("Memory: N/A")
+            self.disk_label.setText("Disk: N/A")
+            return
+
         try:
-            # CPU usage
-            cpu_percent = psutil.cpu_percent(interval=0.1)
+            # CPU usage since the previous refresh (non-blocking)
+            cpu_percent = psutil.cpu_percent(interval=None)
             self.cpu_label.setText(f"CPU: {cpu_percent:.1f}%")
 
             # Memory usage
@@ -310,7 +430,91 @@ class PerformanceDashboardWidget(QWidget):
             logger.error(f"Error updating system metrics: {e}")
             self.cpu_label.setText("CPU: Error")
 
-    def _update_recommendations(self) -> None:
+    def _update_instrumentation_metrics(self) -> None:
+        """Update GUI thread, hot path and lock wait statistics."""
+        metrics = instrumentation.snapshot()
+
+        lateness = metrics.get("gui.event_loop_lateness")
+        if lateness:
+            self.lateness_label.setText(
+                f"Event Loop Lateness: p99 {lateness['p99_ms']:.1f} ms, "
+                f"max {lateness['max_ms']:.1f} ms"
+            )
+        elif instrumentation.is_enabled():
+            self.lateness_label.setText("Event Loop Lateness: no samples")
+        else:
+            self.lateness_label.setText("Event Loop Lateness: instrumentation disabled")
+
+        if self.stall_detector is not None:
+            stalls = metrics.get("gui.stall", {})
+            self.stall_count_label.setText(
+                f"Stalls: {self.stall_detector.stall_count} total, "
+                f"{stalls.get('count', 0)} in last {stalls.get('window_s', 0):.0f}s "
+                f"(threshold {self.stall_detector.threshold_ms:.0f} ms)"
+            )
+        else:
+            self.stall_count_label.setText("Stalls: detector not running")
+
+        hot_paths = {
+            name: stats for name, stats in metrics.items() if not name.startswith(("lock.", "gui."))
+        }
+        locks = {
+            name[len("lock.") :]: stats
+            for name, stats in metrics.items()
+            if name.startswith("lock.")
+        }
+        self._fill_latency_table(self.hot_path_table, hot_paths)
+        self._fill_latency_table(self.lock_table, locks)
+
+    @staticmethod
+    def _fill_latency_table(table: QTableWidget, metrics: dict[str, dict[str, Any]]) -> None:
+        """Fill a latency table, one row per metric."""
+        table.setRowCount(len(metrics))
+        for row, (name, stats) in enumerate(metrics.items()):
+            values = [
+                name,
+                str(stats["count"]),
+                f"{stats['p50_ms']:.2f}",
+                f"{stats['p99_ms']:.2f}",
+                f"{stats['max_ms']:.2f}",
+            ]
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                if column > 0:
+                    item.setTextAlignment(
+                        Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+                    )
+                table.setItem(row, column, item)
+
+    def _update_stall_stacks(self) -> None:
+        """Show the stacks captured during recent stalls, newest first."""
+        if self.stall_detector is None:
+            self.stall_stacks_text.clear()
+            return
+
+        blocks = []
+        for report in reversed(self.stall_detector.recent_stalls):
+            header = (
+                f"=== {report.started_at.strftime('%H:%M:%S.%f')[:-3]} "
+                f"stalled {report.duration_ms:.0f} ms ==="
+            )
+            stack = report.stacks[0] if report.stacks else "(no stack captured)\n"
+            blocks.append(f"{header}\n{stack}")
+        self.stall_stacks_text.setPlainText("\n".join(blocks))
+
+    def _on_stall_detected(self, _report: StallReport) -> None:
+        """Handle new GUI stall."""
+        self._update_stall_stacks()
+
+    def _on_reset_clicked(self) -> None:
+        """Clear instrumentation statistics and stall history."""
+        instrumentation.reset()
+        if self.stall_detector is not None:
+            self.stall_detector.recent_stalls.clear()
+        self._update_stall_stacks()
+        self._update_instrumentation_metrics()
+
+    def _update_recommendations(self) -> None:  # noqa: C901
         """Update performance recommendations based on metrics."""
         recommendations = []
 
@@ -331,20 +535,30 @@ class PerformanceDashboardWidget(QWidget):
                         f"Many log files ({len(log_files)}) - Log rotation working correctly"
                     )
 
-            # Check disk space
-            data_path = Path("data")
-            if data_path.exists():
-                disk = psutil.disk_usage(str(data_path))
-                if disk.percent > 90:
+            if psutil is not None:
+                # Check disk space
+                data_path = Path("data")
+                if data_path.exists():
+                    disk = psutil.disk_usage(str(data_path))
+                    if disk.percent > 90:
+                        recommendations.append(
+                            f"Disk space low ({100-disk.percent:.1f}% free) - Clean up old data"
+                        )
+
+                # Check memory usage
+                memory = psutil.virtual_memory()
+                if memory.percent > 80:
                     recommendations.append(
-                        f"Disk space low ({100-disk.percent:.1f}% free) - Clean up old data"
+                        f"Memory usage high ({memory.percent:.0f}%) - "
+                        "Consider restarting application"
                     )
 
-            # Check memory usage
-            memory = psutil.virtual_memory()
-            if memory.percent > 80:
+            # Check GUI responsiveness
+            lateness = instrumentation.snapshot().get("gui.event_loop_lateness")
+            if lateness and lateness["p99_ms"] > 50:
                 recommendations.append(
-                    f"Memory usage high ({memory.percent:.0f}%) - Consider restarting application"
+                    f"GUI event loop late by up to {lateness['p99_ms']:.0f}ms (p99) - "
+                    "See GUI Thread stall stacks"
                 )
 
         except Exception as e:
@@ -352,7 +566,7 @@ class PerformanceDashboardWidget(QWidget):
 
         # Update UI
         if recommendations:
-            text = "\\n".join(f"• {rec}" for rec in recommendations)
+            text = "\n".join(f"• {rec}" for rec in recommendations)
             self.recommendations_label.setText(text)
             self.recommendations_label.setStyleSheet(
                 "padding: 10px; background-color: #FFF3E0; "
@@ -450,7 +664,9 @@ class PerformanceDashboardWidget(QWidget):
         self.vacuum_button.setText("Vacuum Database")
 
     def stop_auto_refresh(self) -> None:
-        """Stop automatic metric refresh timer."""
+        """Stop automatic metric refresh timers."""
+        if hasattr(self, "instrumentation_timer"):
+            self.instrumentation_timer.stop()
         if hasattr(self, "refresh_timer") and self.refresh_timer.isActive():
             self.refresh_timer.stop()
             logger.info("Performance dashboard auto-refresh stopped")
@@ -22,9 +22,10 @@ import logging
 from pathlib import Path
 from typing import Optional
 
-from PyQt6.QtCore import pyqtSignal, pyqtSlot
+from PyQt6.QtCore import QStringListModel, Qt, pyqtSignal, pyqtSlot
 from PyQt6.QtWidgets import (
     QComboBox,
+    QCompleter,
     QDialog,
     QFileDialog,
     QGroupBox,
@@ -38,6 +39,7 @@ from PyQt6.QtWidgets import (
 
 from core.session_manager import SessionManager
 from database.db_manager import DatabaseManager
+from database.subject_search import SubjectSearcher
 from ui.design_tokens import Colors
 
 logger = logging.getLogger(__name__)
@@ -48,7 +50,7 @@ class UnifiedSessionSetupWidget(QWidget):
     Unified session setup widget for Treatment Workflow tab.
 
     Combines:
-    - Subject selection (dropdown from database)
+    - Subject selection (recent subjects dropdown, searched as the user types)
     - Technician selection (dropdown)
     - Protocol file picker (JSON files)
     - Session start/end controls
@@ -67,6 +69,9 @@ class UnifiedSessionSetupWidget(QWidget):
     session_ended = pyqtSignal()
     protocol_loaded = pyqtSignal(str)  # protocol_path
 
+    # Internal: forwards search results from the search thread to the GUI thread
+    _search_finished = pyqtSignal(str, object)  # query, list[SubjectSummary]
+
     def __init__(
         self,
         session_manager: SessionManager,
@@ -91,6 +96,10 @@ class UnifiedSessionSetupWidget(QWidget):
         self.current_session_id: Optional[int] = None
         self.session_active = False
 
+        # Subject lookup runs off the GUI thread
+        self.subject_searcher = SubjectSearcher(db_manager)
+        self._search_finished.connect(self._on_subject_search_finished)
+
         # Initialize UI
         self._init_ui()
         self._load_subjects()
@@ -135,6 +144,19 @@ class UnifiedSessionSetupWidget(QWidget):
 
         self.subject_dropdown = QComboBox()
         self.subject_dropdown.setMinimumHeight(40)  # Touch-friendly
+        self.subject_dropdown.setEditable(True)
+        self.subject_dropdown.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
+        self.subject_dropdown.lineEdit().setPlaceholderText("Search subject code...")
+
+        # Completer shows database matches; the database already filtered them
+        self.subject_completer_model = QStringListModel(self)
+        self.subject_completer = QCompleter(self.subject_completer_model, self)
+        self.subject_completer.setCompletionMode(
+            QCompleter.CompletionMode.UnfilteredPopupCompletion
+        )
+        self.subject_completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self.subject_dropdown.setCompleter(self.subject_completer)
+        self.subject_dropdown.lineEdit().textEdited.connect(self._on_subject_text_edited)
         self.subject_dropdown.setStyleSheet(f"""
             QComboBox {{
                 background-color: {Colors.BACKGROUND};
@@ -268,22 +290,56 @@ class UnifiedSessionSetupWidget(QWidget):
         logger.debug("UnifiedSessionSetupWidget UI created")
 
     def _load_subjects(self) -> None:
-        """Load subjects from database into dropdown."""
+        """Load recent subjects into dropdown (other subjects are found by search)."""
         try:
-            subjects = self.db_manager.get_all_subjects()
+            subjects = self.subject_searcher.recent()
             self.subject_dropdown.clear()
-            self.subject_dropdown.addItem("Select Subject...", None)  # Placeholder
 
             for subject in subjects:
                 # Subject model has subject_code (e.g., "P-2025-0001"), not name
-                display_text = f"{subject.subject_code}"
-                self.subject_dropdown.addItem(display_text, subject.subject_code)
+                self.subject_dropdown.addItem(subject.subject_code, subject.subject_code)
 
-            logger.info(f"Loaded {len(subjects)} subjects into dropdown")
+            self.subject_dropdown.setCurrentIndex(-1)  # Show the search placeholder
+            logger.info(f"Loaded {len(subjects)} recent subjects into dropdown")
         except Exception as e:
             logger.error(f"Failed to load subjects: {e}")
             QMessageBox.warning(self, "Database Error", f"Could not load subjects: {e}")
 
+    @pyqtSlot(str)
+    def _on_subject_text_edited(self, text: str) -> None:
+        """Search subject codes in the background as the user types."""
+        if not text.strip():
+            self.subject_completer_model.setStringList([])
+            return
+        future = self.subject_searcher.search(text)
+        future.add_done_callback(
+            lambda f: None if f.cancelled() else self._search_finished.emit(text, f)
+        )
+
+    @pyqtSlot(str, object)
+    def _on_subject_search_finished(self, query: str, future: object) -> None:
+        """Show search results in the completer (GUI thread)."""
+        if query != self.subject_dropdown.currentText():
+            return  # User kept typing; a newer search is on its way
+        try:
+            subjects = future.result()  # type: ignore[attr-defined]
+        except Exception as e:
+            logger.error(f"Subject search failed: {e}")
+            return
+        self.subject_completer_model.setStringList([s.subject_code for s in subjects])
+        if subjects and self.subject_dropdown.lineEdit().hasFocus():
+            self.subject_completer.complete()
+
+    def _selected_subject_code(self) -> Optional[str]:
+        """Subject code chosen or typed in the subject field, if it exists."""
+        code = self.subject_dropdown.currentText().strip()
+        if not code:
+            return None
+        if self.subject_dropdown.findData(code) >= 0:
+            return code
+        subject = self.db_manager.get_subject_by_code(code)
+        return subject.subject_code if subject else None
+
     def _load_technicians(self) -> None:
         """Load technicians into dropdown."""
         # Hardcoded list for now (can be moved to database later)
@@ -317,6 +373,7 @@ class UnifiedSessionSetupWidget(QWidget):
             logger.info(f"Subject created via dialog: {subject_code}")
 
             # Reload subjects dropdown to include new subject
+            self.subject_searcher.invalidate()
             self._load_subjects()
 
             # Auto-select the newly created subject
@@ -362,7 +419,7 @@ class UnifiedSessionSetupWidget(QWidget):
     def _start_session(self) -> None:
         """Start a new treatment session."""
         # Validate inputs
-        subject_id = self.subject_dropdown.currentData()
+        subject_id = self._selected_subject_code()
         technician = self.technician_dropdown.currentText()
         protocol_path = self.protocol_file_path
 
@@ -480,4 +537,6 @@ class UnifiedSessionSetupWidget(QWidget):
             except Exception as e:
                 logger.error(f"Error ending session during cleanup: {e}")
 
+        self.subject_searcher.shutdown()
+
         logger.info("UnifiedSessionSetupWidget cleanup complete")
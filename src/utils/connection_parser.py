@@ -4,18 +4,33 @@ PyQt6 Signal/Slot Connection Parser
 AST-based parser for analyzing .connect() calls in Python source code
 to map signal/slot connections across the TOSCA codebase.
 
+Directory analysis parses files in a process pool and can keep per-file
+results in an on-disk cache (keyed by path, mtime and content hash), so
+re-running the audit only re-parses files that changed.
+
 Author: TOSCA Development Team (Task 4.2)
 Created: 2025-11-01
 """
 
+import argparse
 import ast
+import hashlib
+import json
 import logging
-from dataclasses import dataclass, field
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Bump when parsing results change, so cached results are discarded
+CACHE_VERSION = 1
+
+# Below this many files to parse, a process pool costs more than it saves
+PARALLEL_MIN_FILES = 16
+
 
 # ============================================================================
 # Data Models
@@ -82,14 +97,31 @@ class ConnectionParser(ast.NodeVisitor):
         Returns:
             List of ParsedConnection objects found in the file
         """
-        self.connections = []
-        self.source_file = file_path
-
         try:
             with open(file_path, "r", encoding="utf-8") as f:
                 source_code = f.read()
-                self.source_lines = source_code.splitlines()
+        except Exception as e:
+            logger.error(f"Error parsing {file_path}: {e}")
+            return []
+
+        return self.parse_source(source_code, file_path)
+
+    def parse_source(self, source_code: str, file_path: str) -> List[ParsedConnection]:
+        """
+        Parse Python source code to extract signal/slot connections.
+
+        Args:
+            source_code: Contents of the file
+            file_path: Path reported for the connections
+
+        Returns:
+            List of ParsedConnection objects found in the source
+        """
+        self.connections = []
+        self.source_file = file_path
+        self.source_lines = source_code.splitlines()
 
+        try:
             # Parse AST
             tree = ast.parse(source_code, filename=file_path)
             self.visit(tree)
@@ -260,6 +292,160 @@ class ConnectionParser(ast.NodeVisitor):
         return ""
 
 
+# ============================================================================
+# Per-File Analysis and Cache
+# ============================================================================
+
+
+def _analyze_file_worker(file_path: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """
+    Read, hash and parse one file (runs in a worker process).
+
+    Args:
+        file_path: Path to Python file
+
+    Returns:
+        Tuple of (file_path, cache entry); the entry is None if the file could
+        not be read (no connections, nothing to cache)
+    """
+    try:
+        stat = os.stat(file_path)
+        with open(file_path, "rb") as f:
+            data = f.read()
+        source_code = data.decode("utf-8")
+    except Exception as e:
+        logger.error(f"Error parsing {file_path}: {e}")
+        return file_path, None
+
+    connections = ConnectionParser(file_path).parse_source(source_code, file_path)
+    return file_path, {
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha256": hashlib.sha256(data).hexdigest(),
+        "connections": [_connection_to_dict(conn) for conn in connections],
+    }
+
+
+def _connection_to_dict(connection: ParsedConnection) -> Dict[str, Any]:
+    """Serialize a connection for the cache (source_file is implied by the key)."""
+    data = asdict(connection)
+    del data["source_file"]
+    return data
+
+
+def _connections_from_entry(file_path: str, entry: Dict[str, Any]) -> List[ParsedConnection]:
+    """Rebuild the connections of a cache entry, reported under file_path."""
+    return [ParsedConnection(source_file=file_path, **data) for data in entry["connections"]]
+
+
+class ConnectionCache:
+    """
+    On-disk cache of per-file parse results.
+
+    Entries are keyed by resolved file path. An entry is valid while the
+    file's mtime and size are unchanged; otherwise the content hash decides
+    (a touched but unmodified file is not re-parsed).
+    """
+
+    def __init__(self, cache_file: str):
+        """
+        Load the cache (a missing, corrupt or outdated cache starts empty).
+
+        Args:
+            cache_file: Path to the JSON cache file
+        """
+        self.cache_file = Path(cache_file)
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+
+        try:
+            data = json.loads(self.cache_file.read_text(encoding="utf-8"))
+            if data.get("version") == CACHE_VERSION:
+                self.entries = data.get("files", {})
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable connection cache {cache_file}: {e}")
+
+    @staticmethod
+    def _key(file_path: str) -> str:
+        return str(Path(file_path).resolve())
+
+    def get(self, file_path: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the cached result for a file if it is still valid.
+
+        Args:
+            file_path: Path to Python file
+
+        Returns:
+            Cache entry, or None if the file must be parsed
+        """
+        key = self._key(file_path)
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        try:
+            stat = os.stat(file_path)
+            if stat.st_mtime_ns == entry["mtime_ns"] and stat.st_size == entry["size"]:
+                self.hits += 1
+                return entry
+
+            with open(file_path, "rb") as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            self.misses += 1
+            return None
+
+        if digest != entry["sha256"]:
+            self.misses += 1
+            return None
+
+        # Same content, new mtime: remember the mtime to skip hashing next time
+        entry["mtime_ns"] = stat.st_mtime_ns
+        entry["size"] = stat.st_size
+        self._dirty = True
+        self.hits += 1
+        return entry
+
+    def put(self, file_path: str, entry: Dict[str, Any]) -> None:
+        """
+        Store the result for a file.
+
+        Args:
+            file_path: Path to Python file
+            entry: Cache entry from _analyze_file_worker()
+        """
+        self.entries[self._key(file_path)] = entry
+        self._dirty = True
+
+    def prune(self) -> None:
+        """Drop entries of files that no longer exist."""
+        missing = [key for key in self.entries if not os.path.exists(key)]
+        for key in missing:
+            del self.entries[key]
+        self._dirty = self._dirty or bool(missing)
+
+    def save(self) -> None:
+        """Write the cache if it changed (atomic replace)."""
+        if not self._dirty:
+            return
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_file.with_name(self.cache_file.name + ".tmp")
+            tmp_file.write_text(
+                json.dumps({"version": CACHE_VERSION, "files": self.entries}), encoding="utf-8"
+            )
+            os.replace(tmp_file, self.cache_file)
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"Could not save connection cache {self.cache_file}: {e}")
+
+
 # ============================================================================
 # Connection Analyzer
 # ============================================================================
@@ -272,9 +458,18 @@ class ConnectionAnalyzer:
     Combines AST parsing with runtime introspection to validate connections.
     """
 
-    def __init__(self):
-        """Initialize connection analyzer."""
+    def __init__(self, cache_file: Optional[str] = None, max_workers: Optional[int] = None):
+        """
+        Initialize connection analyzer.
+
+        Args:
+            cache_file: Optional JSON file caching per-file results between runs
+            max_workers: Parser processes for directory analysis
+                (default: CPU count; 1 parses in this process)
+        """
         self.report = ConnectionReport()
+        self.cache = ConnectionCache(cache_file) if cache_file else None
+        self.max_workers = max_workers
         logger.info("ConnectionAnalyzer initialized")
 
     def analyze_directory(self, directory: str, pattern: str = "*.py") -> ConnectionReport:
@@ -294,18 +489,58 @@ class ConnectionAnalyzer:
             return self.report
 
         # Find all matching files
-        files = list(dir_path.rglob(pattern))
+        files = sorted(str(file_path) for file_path in dir_path.rglob(pattern))
         logger.info(f"Analyzing {len(files)} Python files in {directory}")
 
-        # Parse each file
+        # Reuse cached results; parse only new or changed files
+        results: Dict[str, Optional[Dict[str, Any]]] = {}
+        to_parse = []
         for file_path in files:
-            self.analyze_file(str(file_path))
+            entry = self.cache.get(file_path) if self.cache else None
+            if entry is None:
+                to_parse.append(file_path)
+            results[file_path] = entry
+
+        for file_path, entry in self._parse_files(to_parse):
+            results[file_path] = entry
+            if self.cache and entry is not None:
+                self.cache.put(file_path, entry)
+
+        # Build the report from the per-file results
+        for file_path in files:
+            entry = results[file_path]
+            connections = _connections_from_entry(file_path, entry) if entry else []
+            self._add_file_connections(file_path, connections)
+
+        if self.cache:
+            logger.info(f"Connection cache: {self.cache.hits} unchanged, {len(to_parse)} parsed")
+            self.cache.prune()
+            self.cache.save()
 
         # Generate statistics
         self._generate_statistics()
 
         return self.report
 
+    def _parse_files(self, files: List[str]) -> List[Tuple[str, Optional[Dict[str, Any]]]]:
+        """
+        Parse files, in a process pool when there are enough of them.
+
+        Args:
+            files: Paths to parse
+
+        Returns:
+            List of (file_path, cache entry) in input order
+        """
+        workers = self.max_workers or os.cpu_count() or 1
+        if workers <= 1 or len(files) < PARALLEL_MIN_FILES:
+            return [_analyze_file_worker(file_path) for file_path in files]
+
+        workers = min(workers, len(files))
+        chunksize = max(1, len(files) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_analyze_file_worker, files, chunksize=chunksize))
+
     def analyze_file(self, file_path: str) -> List[ParsedConnection]:
         """
         Analyze a single Python file for connections.
@@ -320,25 +555,45 @@ class ConnectionAnalyzer:
         connections = parser.parse_file(file_path)
 
         # Add to report
-        self.report.connections.extend(connections)
-        self.report.files_analyzed.add(file_path)
-        self.report.connections_by_file[file_path] = connections
+        self._add_file_connections(file_path, connections)
 
         # Update statistics
         self._generate_statistics()
 
         return connections
 
-    def _generate_statistics(self):
-        """Generate summary statistics for the report."""
-        self.report.total_connections = len(self.report.connections)
+    def _add_file_connections(self, file_path: str, connections: List[ParsedConnection]) -> None:
+        """
+        Add one file's connections to the report (replacing an earlier result).
 
-        # Count by connection type
-        type_counts: Dict[str, int] = {}
-        for conn in self.report.connections:
+        Type counts are updated incrementally, so building a report from
+        many per-file results stays linear.
+
+        Args:
+            file_path: Analyzed file
+            connections: Connections found in the file
+        """
+        type_counts = self.report.connections_by_type
+        previous = self.report.connections_by_file.get(file_path)
+        if previous is not None:
+            for conn in previous:
+                type_counts[conn.connection_type] -= 1
+                if type_counts[conn.connection_type] == 0:
+                    del type_counts[conn.connection_type]
+            self.report.connections = [
+                conn for conn in self.report.connections if conn.source_file != file_path
+            ]
+
+        for conn in connections:
             type_counts[conn.connection_type] = type_counts.get(conn.connection_type, 0) + 1
+        self.report.connections.extend(connections)
+        self.report.files_analyzed.add(file_path)
+        self.report.connections_by_file[file_path] = connections
 
-        self.report.connections_by_type = type_counts
+    def _generate_statistics(self):
+        """Generate summary statistics for the report."""
+        self.report.total_connections = len(self.report.connections)
+        type_counts = self.report.connections_by_type
 
         logger.info(f"Analysis complete: {self.report.total_connections} total connections")
         logger.info(f"  Files analyzed: {len(self.report.files_analyzed)}")
@@ -402,6 +657,38 @@ class ConnectionAnalyzer:
 
         return report
 
+    def generate_json_report(self, output_file: Optional[str] = None) -> str:
+        """
+        Generate JSON report of all connections.
+
+        Args:
+            output_file: Optional file path to save report
+
+        Returns:
+            JSON-formatted report string
+        """
+        data = {
+            "total_connections": self.report.total_connections,
+            "files_analyzed": len(self.report.files_analyzed),
+            "connections_by_type": dict(sorted(self.report.connections_by_type.items())),
+            "connections_by_file": {
+                file_path: [
+                    _connection_to_dict(conn)
+                    for conn in sorted(connections, key=lambda c: c.line_number)
+                ]
+                for file_path, connections in sorted(self.report.connections_by_file.items())
+            },
+        }
+        report = json.dumps(data, indent=2)
+
+        # Save to file if requested
+        if output_file:
+            with open(output_file, "w", encoding="utf-8") as f:
+                f.write(report)
+            logger.info(f"Report saved to {output_file}")
+
+        return report
+
 
 # ============================================================================
 # Convenience Functions
@@ -423,7 +710,7 @@ def parse_connections_in_file(file_path: str) -> List[ParsedConnection]:
 
 
 def analyze_project_connections(
-    project_dir: str, output_file: Optional[str] = None
+    project_dir: str, output_file: Optional[str] = None, cache_file: Optional[str] = None
 ) -> ConnectionReport:
     """
     Convenience function to analyze all connections in a project.
@@ -431,11 +718,12 @@ def analyze_project_connections(
     Args:
         project_dir: Root directory of project
         output_file: Optional path to save markdown report
+        cache_file: Optional JSON cache so unchanged files are not re-parsed
 
     Returns:
         ConnectionReport with all found connections
     """
-    analyzer = ConnectionAnalyzer()
+    analyzer = ConnectionAnalyzer(cache_file=cache_file)
     report = analyzer.analyze_directory(project_dir)
 
     if output_file:
@@ -449,18 +737,29 @@ def analyze_project_connections(
 # ============================================================================
 
 if __name__ == "__main__":
-    # Example: Analyze connections in TOSCA widgets
-    analyzer = ConnectionAnalyzer()
-    report = analyzer.analyze_directory("src/ui/widgets")
+    # Example: python src/utils/connection_parser.py src --cache .connection_cache.json
+    arg_parser = argparse.ArgumentParser(description="PyQt6 signal/slot connection audit")
+    arg_parser.add_argument("directory", nargs="?", default="src/ui/widgets")
+    arg_parser.add_argument("--cache", help="JSON cache file (re-parse changed files only)")
+    arg_parser.add_argument("--workers", type=int, help="Parser processes (default: CPU count)")
+    arg_parser.add_argument("--markdown", default="connection_report.md", help="Markdown report")
+    arg_parser.add_argument("--json", help="Also write a JSON report")
+    args = arg_parser.parse_args()
+
+    analyzer = ConnectionAnalyzer(cache_file=args.cache, max_workers=args.workers)
+    report = analyzer.analyze_directory(args.directory)
 
     # Print summary
-    print(f"\n=== Connection Analysis Summary ===")
+    print("\n=== Connection Analysis Summary ===")
     print(f"Total connections: {report.total_connections}")
     print(f"Files analyzed: {len(report.files_analyzed)}")
-    print(f"\nBy type:")
+    print("\nBy type:")
     for conn_type, count in report.connections_by_type.items():
         print(f"  {conn_type}: {count}")
 
-    # Generate markdown report
-    markdown = analyzer.generate_markdown_report("connection_report.md")
-    print(f"\nReport saved to connection_report.md")
+    # Generate reports
+    analyzer.generate_markdown_report(args.markdown)
+    print(f"\nReport saved to {args.markdown}")
+    if args.json:
+        analyzer.generate_json_report(args.json)
+        print(f"JSON report saved to {args.json}")
@@ -0,0 +1,465 @@
+# -*- coding: utf-8 -*-
+"""
+Module: instrumentation
+Project: TOSCA Laser Control System
+
+Purpose: Opt-in performance instrumentation of hot paths and the GUI thread.
+Hot paths are timed with @instrumented / timing() into rolling latency
+histograms, controller locks can be wrapped to record how long callers wait
+for them, and GuiStallDetector samples the main thread's stack whenever the
+Qt event loop falls behind. Everything is off by default; while disabled an
+instrumented call costs one module-level flag check.
+Safety Critical: No (diagnostics only)
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+from PyQt6.QtCore import QObject, Qt, QTimer, pyqtSignal
+
+from utils.latency_histogram import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Suffix of the histogram that only holds samples taken on the GUI thread
+GUI_THREAD_SUFFIX = " [GUI]"
+
+_enabled = False
+_main_thread_id = threading.main_thread().ident
+
+
+class RollingHistogram:
+    """
+    Latency histogram over a sliding time window.
+
+    The window is split into slots; each slot is a LatencyHistogram that is
+    cleared when its time comes round again, so memory stays constant and
+    old samples age out.
+    """
+
+    def __init__(
+        self, window_s: float = 60.0, slots: int = 6, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """
+        Initialize histogram.
+
+        Args:
+            window_s: Length of the window in seconds
+            slots: Number of slots the window is divided into
+            clock: Monotonic time source in seconds
+        """
+        self.window_s = window_s
+        self._slot_s = window_s / slots
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._slots = [LatencyHistogram() for _ in range(slots)]
+        self._slot_ids = [-1] * slots
+        self.total_count = 0  # All samples since creation, not just the window
+
+    def record(self, elapsed_ms: float) -> None:
+        """Record one sample in milliseconds."""
+        slot_id = int(self._clock() // self._slot_s)
+        index = slot_id % len(self._slots)
+        with self._lock:
+            if self._slot_ids[index] != slot_id:
+                self._slots[index].reset()
+                self._slot_ids[index] = slot_id
+            self._slots[index].record(elapsed_ms)
+            self.total_count += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Statistics of the samples inside the window.
+
+        Returns:
+            LatencyHistogram.snapshot() fields plus total_count and window_s
+        """
+        oldest = int(self._clock() // self._slot_s) - len(self._slots) + 1
+        merged = LatencyHistogram()
+        with self._lock:
+            for slot_id, histogram in zip(self._slot_ids, self._slots):
+                if slot_id >= oldest:
+                    merged.merge(histogram)
+            total = self.total_count
+        result = merged.snapshot()
+        result["total_count"] = total
+        result["window_s"] = self.window_s
+        return result
+
+
+class _Registry:
+    """Named rolling histograms shared by all instrumentation points."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._histograms: dict[str, RollingHistogram] = {}
+        self.window_s = 60.0
+
+    def histogram(self, name: str) -> RollingHistogram:
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(name, RollingHistogram(self.window_s))
+        return histogram
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            items = sorted(self._histograms.items())
+        return {name: histogram.snapshot() for name, histogram in items}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms = {}
+
+
+_registry = _Registry()
+
+
+def enable(window_s: Optional[float] = None) -> None:
+    """
+    Turn instrumentation on.
+
+    Args:
+        window_s: Rolling histogram window for histograms created from now on
+    """
+    global _enabled
+    if window_s is not None:
+        _registry.window_s = window_s
+    _enabled = True
+    logger.info("Performance instrumentation enabled")
+
+
+def disable() -> None:
+    """Turn instrumentation off (collected histograms are kept)."""
+    global _enabled
+    _enabled = False
+    logger.info("Performance instrumentation disabled")
+
+
+def is_enabled() -> bool:
+    """True while instrumentation is recording."""
+    return _enabled
+
+
+def record(name: str, elapsed_ms: float) -> None:
+    """
+    Record a timing sample (also under name + " [GUI]" on the GUI thread).
+
+    Args:
+        name: Metric name, e.g. "gpio._send_command"
+        elapsed_ms: Duration in milliseconds
+    """
+    _registry.histogram(name).record(elapsed_ms)
+    if threading.get_ident() == _main_thread_id:
+        _registry.histogram(name + GUI_THREAD_SUFFIX).record(elapsed_ms)
+
+
+def snapshot() -> dict[str, dict[str, Any]]:
+    """Statistics of every metric, by name."""
+    return _registry.snapshot()
+
+
+def reset() -> None:
+    """Discard all collected metrics."""
+    _registry.reset()
+
+
+def instrumented(name: str) -> Callable[[F], F]:
+    """
+    Decorator timing every call of a function while instrumentation is enabled.
+
+    Usage:
+        @instrumented("gpio._send_command")
+        def _send_command(self, ...): ...
+    """
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(name, (time.perf_counter() - start) * 1000.0)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+@contextlib.contextmanager
+def _timed_block(name: str) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, (time.perf_counter() - start) * 1000.0)
+
+
+_NULL_CONTEXT = contextlib.nullcontext()
+
+
+def timing(name: str) -> contextlib.AbstractContextManager[None]:
+    """
+    Context manager timing a block while instrumentation is enabled.
+
+    Usage:
+        with timing("camera.frame_scaling"):
+            ...
+    """
+    if not _enabled:
+        return _NULL_CONTEXT
+    return _timed_block(name)
+
+
+class InstrumentedLock:
+    """
+    Lock wrapper recording wait and hold times, per lock and per call site.
+
+    Metrics recorded while instrumentation is enabled:
+        lock.<name>.wait, lock.<name>.hold: all acquisitions of the lock
+        lock.<name>.wait @ <site>, lock.<name>.hold @ <site>: per call site,
+            where site is the acquiring function's qualified name and line
+
+    Uncontended acquisitions wait 0 ms, so the wait histogram's count is the
+    number of acquisitions and its upper percentiles show contention. Hold
+    time runs from the outermost acquire to the matching release; re-entrant
+    acquisitions of an RLock are counted as waits only. Supports the
+    `with lock:` and acquire()/release() uses of threading locks; while
+    instrumentation is disabled it only forwards the calls.
+    """
+
+    def __init__(self, lock: Any, name: str) -> None:
+        """
+        Wrap a lock.
+
+        Args:
+            lock: threading.Lock or threading.RLock to wrap
+            name: Lock owner name (e.g. "gpio")
+        """
+        self.wrapped = lock
+        self.name = name
+        self._prefix = f"lock.{name}"
+        self._held = threading.local()  # Per-thread stack of (site, acquired_at)
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        if not _enabled:
+            return bool(self.wrapped.acquire(blocking, timeout))
+        return self._acquire_recorded(blocking, timeout, sys._getframe(1))
+
+    def release(self) -> None:
+        stack = getattr(self._held, "stack", None)
+        if stack:
+            site, acquired_at = stack.pop()
+            if not stack:
+                self._record("hold", site, (time.perf_counter() - acquired_at) * 1000.0)
+        self.wrapped.release()
+
+    def __enter__(self) -> bool:
+        if not _enabled:
+            return bool(self.wrapped.acquire())
+        return self._acquire_recorded(True, -1, sys._getframe(1))
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.release()
+
+    def _acquire_recorded(self, blocking: bool, timeout: float, caller: Any) -> bool:
+        """Acquire the lock, recording the wait for the calling frame's site."""
+        code = caller.f_code
+        site = f"{getattr(code, 'co_qualname', code.co_name)}:{caller.f_lineno}"
+
+        start = time.perf_counter()
+        acquired = bool(self.wrapped.acquire(False))
+        if not acquired and blocking:
+            acquired = bool(self.wrapped.acquire(True, timeout))
+        if not acquired:
+            return False
+
+        now = time.perf_counter()
+        self._record("wait", site, (now - start) * 1000.0)
+        stack = getattr(self._held, "stack", None)
+        if stack is None:
+            stack = self._held.stack = []
+        stack.append((site, now))
+        return True
+
+    def _record(self, kind: str, site: str, elapsed_ms: float) -> None:
+        record(f"{self._prefix}.{kind}", elapsed_ms)
+        _registry.histogram(f"{self._prefix}.{kind} @ {site}").record(elapsed_ms)
+
+
+def instrument_lock(owner: Any, name: str, attribute: str = "_lock") -> InstrumentedLock:
+    """
+    Replace owner.<attribute> with an InstrumentedLock (idempotent).
+
+    Threads already holding the lock release the same underlying lock, so
+    this is safe at any time.
+
+    Args:
+        owner: Object owning the lock (e.g. a hardware controller)
+        name: Metric name suffix
+        attribute: Lock attribute name
+
+    Returns:
+        The installed wrapper
+    """
+    lock = getattr(owner, attribute)
+    if isinstance(lock, InstrumentedLock):
+        return lock
+    wrapper = InstrumentedLock(lock, name)
+    setattr(owner, attribute, wrapper)
+    return wrapper
+
+
+@dataclass
+class StallReport:
+    """One period in which the GUI event loop did not run."""
+
+    started_at: datetime
+    duration_ms: float = 0.0
+    stacks: list[str] = field(default_factory=list)  # Main thread stack samples during the stall
+
+
+class GuiStallDetector(QObject):
+    """
+    Detect GUI-thread stalls and capture what the main thread was doing.
+
+    A timer on the GUI thread stamps a heartbeat every beat_interval_ms. A
+    monitor thread checks the heartbeat; once it is more than threshold_ms
+    late, the main thread's stack is sampled (again every threshold_ms while
+    the stall lasts, up to max_stacks). When the loop resumes, the stall
+    duration is recorded as metric "gui.stall" and the report is emitted.
+    Heartbeat lateness is recorded as "gui.event_loop_lateness".
+
+    Signals:
+        stall_detected(object): StallReport, delivered on the GUI thread
+    """
+
+    stall_detected = pyqtSignal(object)
+
+    def __init__(
+        self,
+        threshold_ms: float = 100.0,
+        beat_interval_ms: int = 20,
+        history: int = 20,
+        max_stacks: int = 5,
+        parent: Optional[QObject] = None,
+    ) -> None:
+        """
+        Initialize detector (must be created on the GUI thread).
+
+        Args:
+            threshold_ms: Lateness that counts as a stall
+            beat_interval_ms: GUI heartbeat period
+            history: Number of recent stalls kept
+            max_stacks: Stack samples kept per stall
+            parent: Optional Qt parent
+        """
+        super().__init__(parent)
+        self.threshold_ms = threshold_ms
+        self.beat_interval_ms = beat_interval_ms
+        self.max_stacks = max_stacks
+        self.recent_stalls: deque[StallReport] = deque(maxlen=history)
+        self.stall_count = 0
+
+        self._last_beat = time.perf_counter()
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.setInterval(beat_interval_ms)
+        self._timer.timeout.connect(self._beat)
+        self._stop_event = threading.Event()
+        self._monitor: Optional[threading.Thread] = None
+        self._current: Optional[StallReport] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_running(self) -> bool:
+        """True while monitoring."""
+        return self._monitor is not None
+
+    def start(self) -> None:
+        """Start monitoring (call from the GUI thread)."""
+        if self._monitor is not None:
+            return
+        self._last_beat = time.perf_counter()
+        self._timer.start()
+        self._stop_event.clear()
+        self._monitor = threading.Thread(
+            target=self._monitor_loop, name="GuiStallDetector", daemon=True
+        )
+        self._monitor.start()
+        logger.info(f"GUI stall detector started (threshold {self.threshold_ms:.0f}ms)")
+
+    def stop(self) -> None:
+        """Stop monitoring."""
+        self._timer.stop()
+        self._stop_event.set()
+        if self._monitor is not None:
+            self._monitor.join(1.0)
+            self._monitor = None
+
+    def _beat(self) -> None:
+        """GUI heartbeat (timer, GUI thread)."""
+        now = time.perf_counter()
+        gap_ms = (now - self._last_beat) * 1000.0
+        self._last_beat = now
+        if _enabled:
+            _registry.histogram("gui.event_loop_lateness").record(
+                max(0.0, gap_ms - self.beat_interval_ms)
+            )
+
+        with self._lock:
+            report, self._current = self._current, None
+        if report is not None:
+            report.duration_ms = max(0.0, gap_ms - self.beat_interval_ms)
+            self.stall_count += 1
+            self.recent_stalls.append(report)
+            if _enabled:
+                _registry.histogram("gui.stall").record(report.duration_ms)
+            logger.warning(
+                f"GUI thread stalled for {report.duration_ms:.0f}ms\n"
+                + (report.stacks[0] if report.stacks else "")
+            )
+            self.stall_detected.emit(report)
+
+    def _monitor_loop(self) -> None:
+        """Sample the main thread's stack while the heartbeat is late."""
+        poll_s = min(0.01, self.threshold_ms / 4000.0)
+        next_sample_ms = 0.0
+        while not self._stop_event.wait(poll_s):
+            late_ms = (time.perf_counter() - self._last_beat) * 1000.0 - self.beat_interval_ms
+            if late_ms < self.threshold_ms:
+                next_sample_ms = self.threshold_ms
+                continue
+            if late_ms < next_sample_ms:
+                continue
+
+            stack = self._main_thread_stack()
+            with self._lock:
+                if self._current is None:
+                    self._current = StallReport(started_at=datetime.now())
+                if len(self._current.stacks) < self.max_stacks:
+                    self._current.stacks.append(stack)
+            next_sample_ms = late_ms + self.threshold_ms
+
+    @staticmethod
+    def _main_thread_stack() -> str:
+        frame = sys._current_frames().get(_main_thread_id or 0)
+        if frame is None:
+            return ""
+        return "".join(traceback.format_stack(frame))
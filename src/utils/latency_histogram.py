@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""
+Module: latency_histogram
+Project: TOSCA Laser Control System
+
+Purpose: Fixed-bucket latency histogram for hardware I/O and timing measurements.
+Records millisecond samples into logarithmically spaced buckets so that
+percentiles (p50/p99) can be reported with constant memory, regardless of
+how long the system has been running.
+Safety Critical: No (diagnostics only)
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+from typing import Any
+
+# Bucket upper edges in milliseconds (roughly 10 buckets per decade, 10 us - 10 s)
+_BUCKET_EDGES_MS: tuple[float, ...] = tuple(round(10 ** (exp / 10.0), 4) for exp in range(-20, 41))
+
+
+class LatencyHistogram:
+    """
+    Thread-safe latency histogram with logarithmic buckets.
+
+    Samples are recorded in milliseconds. Percentiles are estimated from the
+    bucket edges (resolution ~26% per bucket), while count, mean and max
+    are exact.
+
+    Usage:
+        histogram = LatencyHistogram()
+        histogram.record(elapsed_ms)
+        stats = histogram.snapshot()  # {'count': ..., 'p50_ms': ..., ...}
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counts = [0] * (len(_BUCKET_EDGES_MS) + 1)  # Last bucket = overflow
+        self._count = 0
+        self._total_ms = 0.0
+        self._max_ms = 0.0
+        self._last_ms = 0.0
+
+    def record(self, elapsed_ms: float) -> None:
+        """
+        Record a single latency sample.
+
+        Args:
+            elapsed_ms: Measured latency in milliseconds (negative values clamp to 0)
+        """
+        elapsed_ms = max(0.0, elapsed_ms)
+        index = bisect.bisect_left(_BUCKET_EDGES_MS, elapsed_ms)
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._total_ms += elapsed_ms
+            self._last_ms = elapsed_ms
+            if elapsed_ms > self._max_ms:
+                self._max_ms = elapsed_ms
+
+    def percentile(self, pct: float) -> float:
+        """
+        Estimate a percentile from the bucket counts.
+
+        Args:
+            pct: Percentile in range 0-100
+
+        Returns:
+            Upper bucket edge containing the percentile in ms (0.0 if empty)
+        """
+        with self._lock:
+            return self._percentile_locked(pct)
+
+    def _percentile_locked(self, pct: float) -> float:
+        """Percentile lookup (caller must hold self._lock)."""
+        if self._count == 0:
+            return 0.0
+
+        target = max(1, int(round(self._count * pct / 100.0)))
+        cumulative = 0
+        for index, bucket_count in enumerate(self._counts):
+            cumulative += bucket_count
+            if cumulative >= target:
+                if index >= len(_BUCKET_EDGES_MS):
+                    return self._max_ms
+                # Never report more than the exact maximum
+                return min(_BUCKET_EDGES_MS[index], self._max_ms)
+        return self._max_ms
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Get summary statistics.
+
+        Returns:
+            Dictionary with count, mean_ms, p50_ms, p90_ms, p99_ms, max_ms, last_ms
+        """
+        with self._lock:
+            mean_ms = self._total_ms / self._count if self._count else 0.0
+            return {
+                "count": self._count,
+                "mean_ms": mean_ms,
+                "p50_ms": self._percentile_locked(50.0),
+                "p90_ms": self._percentile_locked(90.0),
+                "p99_ms": self._percentile_locked(99.0),
+                "max_ms": self._max_ms,
+                "last_ms": self._last_ms,
+            }
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """
+        Add another histogram's samples to this one.
+
+        Args:
+            other: Histogram to merge (unchanged)
+        """
+        with other._lock:
+            counts = list(other._counts)
+            count, total_ms, max_ms = other._count, other._total_ms, other._max_ms
+            last_ms = other._last_ms
+        if count == 0:
+            return
+        with self._lock:
+            self._counts = [a + b for a, b in zip(self._counts, counts)]
+            self._count += count
+            self._total_ms += total_ms
+            self._max_ms = max(self._max_ms, max_ms)
+            self._last_ms = last_ms
+
+    def reset(self) -> None:
+        """Clear all recorded samples."""
+        with self._lock:
+            self._counts = [0] * (len(_BUCKET_EDGES_MS) + 1)
+            self._count = 0
+            self._total_ms = 0.0
+            self._max_ms = 0.0
+            self._last_ms = 0.0
+
+    @property
+    def count(self) -> int:
+        """Number of samples recorded."""
+        return self._count
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""
+Module: qt_timers
+Project: TOSCA Laser Control System
+
+Purpose: Start/stop QTimers safely from any thread.
+A QTimer can only be started or stopped from the thread it lives in; calls
+from other threads are ignored by Qt with a warning. Hardware controllers
+call these helpers from connect()/disconnect(), which may run on worker
+threads (see hardware.connection_orchestrator).
+Safety Critical: No
+"""
+
+from PyQt6.QtCore import QMetaObject, Qt, QThread, QTimer
+
+
+def start_timer(timer: QTimer) -> None:
+    """
+    Start a timer, queueing the start to the timer's thread if needed.
+
+    Args:
+        timer: Timer to start (uses its configured interval)
+    """
+    if QThread.currentThread() == timer.thread():
+        timer.start()
+    else:
+        QMetaObject.invokeMethod(timer, "start", Qt.ConnectionType.QueuedConnection)
+
+
+def stop_timer(timer: QTimer) -> None:
+    """
+    Stop a timer, queueing the stop to the timer's thread if needed.
+
+    Args:
+        timer: Timer to stop
+    """
+    if QThread.currentThread() == timer.thread():
+        timer.stop()
+    else:
+        QMetaObject.invokeMethod(timer, "stop", Qt.ConnectionType.QueuedConnection)
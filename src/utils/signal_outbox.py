@@ -0,0 +1,54 @@
+"""
+Ordered signal emission outside of locks.
+
+A controller that changes state under a lock must not emit its signals
+with the lock held: a directly connected receiver runs in the emitting
+thread and may call back into another controller that takes its own
+lock, which inverts lock order against a thread doing the opposite.
+
+Queue the signals while holding the lock (so queue order is the order in
+which the state changed), release the lock, then flush::
+
+    with self._lock:
+        self.state = new_state
+        self._outbox.queue(self.state_changed, new_state)
+    self._outbox.flush()
+
+One thread emits at a time. A thread that finds another one flushing
+leaves its signals to that thread, and a receiver that re-enters the
+controller has its signals emitted after it returns, so receivers always
+see the changes in order and no thread ever waits to emit.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from typing import Any
+
+
+class SignalOutbox:
+    """FIFO of pending signal emissions, flushed by one thread at a time."""
+
+    def __init__(self) -> None:
+        self._pending: deque[tuple[Any, tuple[Any, ...]]] = deque()
+        self._flushing = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def queue(self, signal: Any, *args: Any) -> None:
+        """Queue signal.emit(*args) (call with the state lock held)."""
+        self._pending.append((signal, args))
+
+    def flush(self) -> None:
+        """Emit queued signals in order (call with no lock held)."""
+        while self._pending:
+            if not self._flushing.acquire(blocking=False):
+                return  # The flushing thread emits ours too (it re-checks after releasing)
+            try:
+                while self._pending:
+                    signal, args = self._pending.popleft()
+                    signal.emit(*args)
+            finally:
+                self._flushing.release()
@@ -0,0 +1,75 @@
+"""
+Immutable, versioned state snapshots for lock-free readers.
+
+A controller keeps its published state in a frozen dataclass and swaps the
+whole object whenever a field changes. Rebinding one attribute is atomic, so
+readers on any thread get a consistent view of every field without taking a
+lock, and the version number lets subscribers skip work when nothing changed.
+
+Example::
+
+    @dataclass(frozen=True, slots=True)
+    class LaserState:
+        version: int = 0
+        is_connected: bool = False
+        is_output_enabled: bool = False
+
+    class LaserController(QObject):
+        _snapshot = LaserState()  # Immutable default, replaced on first change
+        is_connected = SnapshotField()
+        is_output_enabled = SnapshotField()
+
+        @property
+        def snapshot(self) -> LaserState:
+            return self._snapshot
+
+Existing code keeps assigning ``self.is_connected = True``; an assignment only
+publishes a new version when the value differs. Use publish() to change
+several fields in one step so readers never see a half-applied update.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import threading
+from typing import Any, Optional
+
+
+class SnapshotField:
+    """Instance attribute stored in, and published through, the owner's snapshot."""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, obj: Any, objtype: Optional[type] = None) -> Any:
+        if obj is None:
+            return self
+        return getattr(obj._snapshot, self.name)
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        publish(obj, **{self.name: value})
+
+
+def publish(owner: Any, **changes: Any) -> bool:
+    """
+    Publish a new snapshot with the given fields changed.
+
+    Writers are serialized by a small per-owner lock; readers never lock.
+
+    Args:
+        owner: Object holding the current snapshot in ``_snapshot``
+        **changes: Field values to apply
+
+    Returns:
+        True if any value changed (a new version was published)
+    """
+    lock = vars(owner).get("_snapshot_lock")
+    if lock is None:
+        lock = vars(owner).setdefault("_snapshot_lock", threading.Lock())
+
+    with lock:
+        current = owner._snapshot
+        if all(getattr(current, name) == value for name, value in changes.items()):
+            return False
+        owner._snapshot = dataclasses.replace(current, version=current.version + 1, **changes)
+        return True
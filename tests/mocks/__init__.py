@@ -1,5 +1,6 @@
 """Hardware mocks for testing TOSCA controllers."""
 
+from tests.mocks.digital_twin import DigitalTwin
 from tests.mocks.mock_actuator_controller import MockActuatorController
 from tests.mocks.mock_camera_controller import (
     MockAcquisitionMode,
@@ -11,6 +12,7 @@ from tests.mocks.mock_gpio_controller import MockGPIOController
 from tests.mocks.mock_hardware_base import MockHardwareBase
 from tests.mocks.mock_laser_controller import MockLaserController
 from tests.mocks.mock_qobject_base import FailureMode, MockQObjectBase
+from tests.mocks.mock_serial_device import MockSerialDevice, PtySerialDevice
 from tests.mocks.mock_tec_controller import MockTECController
 
 __all__ = [
@@ -25,4 +27,7 @@ __all__ = [
     "MockGPIOController",
     "MockLaserController",
     "MockTECController",
+    "MockSerialDevice",
+    "PtySerialDevice",
+    "DigitalTwin",
 ]
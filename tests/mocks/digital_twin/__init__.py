@@ -0,0 +1,32 @@
+"""Physics-based TOSCA hardware simulator (digital twin) for system and soak tests."""
+
+from tests.mocks.digital_twin.physics import (
+    ActuatorModel,
+    LaserModel,
+    MotionMode,
+    MotorModel,
+    PhotodiodeModel,
+    TECModel,
+)
+from tests.mocks.digital_twin.serial_protocols import (
+    ArduinoWatchdogProtocol,
+    ArroyoLaserProtocol,
+    ArroyoTECProtocol,
+    XeryonProtocol,
+)
+from tests.mocks.digital_twin.twin import DigitalTwin, TwinPorts
+
+__all__ = [
+    "DigitalTwin",
+    "TwinPorts",
+    "ActuatorModel",
+    "LaserModel",
+    "MotionMode",
+    "MotorModel",
+    "PhotodiodeModel",
+    "TECModel",
+    "ArduinoWatchdogProtocol",
+    "ArroyoLaserProtocol",
+    "ArroyoTECProtocol",
+    "XeryonProtocol",
+]
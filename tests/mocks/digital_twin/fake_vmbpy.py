@@ -0,0 +1,544 @@
+"""
+Fake vmbpy (Allied Vision Vimba X Python API) for the TOSCA digital twin.
+
+Implements the subset of vmbpy used by CameraController - VmbSystem,
+Camera (context manager, pixel formats, GenICam features including the
+sensor ROI, streaming with a frame callback and re-queued buffers), Frame
+and PixelFormat - so the real
+controller can be run against a simulated camera by substituting this
+module for vmbpy (see DigitalTwin.patch_vmbpy()).
+
+Frames are rendered by BeamSpotRenderer: a Gaussian spot at the actuator
+position whose brightness follows the aiming/treatment laser power,
+exposure time and gain, on a noisy background. Streaming models the
+driver's buffer pool: frames captured while every buffer is held by the
+application are dropped and counted. The maximum frame rate is limited by
+USB bandwidth, so cropping the sensor (Width/Height) or binning raises it.
+"""
+
+from __future__ import annotations
+
+import enum
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Optional, Sequence
+
+import numpy as np
+
+from tests.mocks.digital_twin.physics import ActuatorModel, LaserModel
+
+
+class VmbFeatureError(Exception):
+    """Invalid feature access (value out of range, camera closed)."""
+
+
+class VmbSystemError(Exception):
+    """VmbSystem used outside of its context."""
+
+
+class PixelFormat(enum.Enum):
+    """Pixel formats (subset)."""
+
+    Mono8 = "Mono8"
+    Bgr8 = "Bgr8"
+    Rgb8 = "Rgb8"
+    BayerRG8 = "BayerRG8"
+    BayerGR8 = "BayerGR8"
+    BayerGB8 = "BayerGB8"
+    BayerBG8 = "BayerBG8"
+    YUV422Packed = "YUV422Packed"
+
+
+class Feature:
+    """GenICam feature with get/set/get_range (range may depend on other features)."""
+
+    def __init__(
+        self,
+        camera: "Camera",
+        name: str,
+        value: Any,
+        value_range: Optional[tuple[Any, Any] | Callable[[], tuple[Any, Any]]] = None,
+        entries: Optional[Sequence[str]] = None,
+        increment: int = 1,
+        on_change: Optional[Callable[[], None]] = None,
+    ) -> None:
+        self._camera = camera
+        self.name = name
+        self._value = value
+        self._range = value_range
+        self._entries = tuple(entries) if entries else None
+        self._increment = increment
+        self._on_change = on_change
+
+    def get_name(self) -> str:
+        return self.name
+
+    def get(self) -> Any:
+        self._camera._require_open()
+        return self._value
+
+    def set(self, value: Any) -> None:
+        self._camera._require_open()
+        if self._entries is not None:
+            if str(value) not in self._entries:
+                raise VmbFeatureError(f"{self.name}: invalid entry {value!r}")
+            value = str(value)
+        elif self._range is not None:
+            low, high = self.get_range()
+            if not low <= value <= high:
+                raise VmbFeatureError(f"{self.name}: {value} outside [{low}, {high}]")
+            if isinstance(self._value, int) and value % self._increment:
+                raise VmbFeatureError(f"{self.name}: {value} not a multiple of {self._increment}")
+            value = type(self._value)(value)
+        self._value = value
+        if self._on_change is not None:
+            self._on_change()
+
+    def get_range(self) -> tuple[Any, Any]:
+        self._camera._require_open()
+        if self._range is None:
+            raise VmbFeatureError(f"{self.name} has no range")
+        return self._range() if callable(self._range) else self._range
+
+    def get_increment(self) -> int:
+        return self._increment
+
+    def get_available_entries(self) -> tuple[str, ...]:
+        return self._entries or ()
+
+
+class ReadOnlyFeature(Feature):
+    """Feature whose value is derived from other features (e.g. WidthMax)."""
+
+    def __init__(self, camera: "Camera", name: str, getter: Callable[[], Any]) -> None:
+        super().__init__(camera, name, None)
+        self._getter = getter
+
+    def get(self) -> Any:
+        self._camera._require_open()
+        return self._getter()
+
+    def set(self, value: Any) -> None:
+        raise VmbFeatureError(f"{self.name} is read-only")
+
+
+class Frame:
+    """Captured frame."""
+
+    def __init__(self, data: np.ndarray, pixel_format: PixelFormat, frame_id: int) -> None:
+        self._data = data
+        self._pixel_format = pixel_format
+        self._id = frame_id
+        self._timestamp_ns = time.monotonic_ns()
+
+    def as_numpy_ndarray(self) -> np.ndarray:
+        return self._data
+
+    def get_pixel_format(self) -> PixelFormat:
+        return self._pixel_format
+
+    def get_id(self) -> int:
+        return self._id
+
+    def get_timestamp(self) -> int:
+        return self._timestamp_ns
+
+    def get_width(self) -> int:
+        return int(self._data.shape[1])
+
+    def get_height(self) -> int:
+        return int(self._data.shape[0])
+
+
+class BeamSpotRenderer:
+    """
+    Renders the treatment/aiming beam as seen by the camera.
+
+    The actuator position maps linearly onto the sensor's X axis across the
+    field of view. Signal is power x exposure x gain; the treatment laser is
+    seen through the camera's protection filter (attenuation).
+    """
+
+    def __init__(
+        self,
+        actuator: ActuatorModel,
+        laser: LaserModel,
+        aiming_on: Callable[[], bool],
+        sensor_size: tuple[int, int] = (1456, 1088),
+        field_of_view_um: tuple[float, float] = (-2000.0, 22000.0),
+        spot_sigma_px: float = 12.0,
+        aiming_power_mw: float = 1.0,
+        treatment_attenuation: float = 1e-3,
+        counts_per_mw_ms: float = 20.0,
+        background: int = 8,
+        noise_counts: int = 3,
+        rng: Optional[np.random.Generator] = None,
+    ) -> None:
+        self.actuator = actuator
+        self.laser = laser
+        self.aiming_on = aiming_on
+        self.sensor_size = sensor_size
+        self.field_of_view_um = field_of_view_um
+        self.spot_sigma_px = spot_sigma_px
+        self.aiming_power_mw = aiming_power_mw
+        self.treatment_attenuation = treatment_attenuation
+        self.counts_per_mw_ms = counts_per_mw_ms
+        self.background = background
+        self.noise_counts = noise_counts
+        self.rng = rng or np.random.default_rng()
+        self._noise_bank: dict[tuple[int, int, int], list[np.ndarray]] = {}
+        self._noise_index = 0
+
+    def spot_center_px(self, width: int, height: int) -> tuple[float, float]:
+        """Spot center (x, y) in pixels of a width x height frame."""
+        low, high = self.field_of_view_um
+        fraction = (self.actuator.position_um - low) / (high - low)
+        return fraction * width, height / 2.0
+
+    def peak_counts(self, exposure_us: float, gain_db: float) -> float:
+        """Spot peak signal before saturation."""
+        power_mw = self.laser.optical_power_w() * 1000.0 * self.treatment_attenuation
+        if self.aiming_on():
+            power_mw += self.aiming_power_mw
+        return power_mw * (exposure_us / 1000.0) * self.counts_per_mw_ms * 10 ** (gain_db / 20.0)
+
+    def render(
+        self,
+        binning: int,
+        channels: int,
+        exposure_us: float,
+        gain_db: float,
+        roi: Optional[tuple[int, int, int, int]] = None,
+    ) -> np.ndarray:
+        """
+        Render one frame (height, width, channels) uint8.
+
+        roi is the sensor window (offset_x, offset_y, width, height) in binned
+        pixels; only that window is rendered.
+        """
+        full_width = self.sensor_size[0] // binning
+        full_height = self.sensor_size[1] // binning
+        offset_x, offset_y, width, height = roi or (0, 0, full_width, full_height)
+        frame: np.ndarray = self._background(width, height, channels).copy()
+
+        peak = self.peak_counts(exposure_us, gain_db)
+        if peak < 0.5:
+            return frame
+
+        sigma = self.spot_sigma_px / binning
+        cx, cy = self.spot_center_px(full_width, full_height)
+        cx, cy = cx - offset_x, cy - offset_y
+        # Only the patch within 4 sigma is computed
+        x0, x1 = max(0, int(cx - 4 * sigma)), min(width, int(cx + 4 * sigma) + 1)
+        y0, y1 = max(0, int(cy - 4 * sigma)), min(height, int(cy + 4 * sigma) + 1)
+        if x0 >= x1 or y0 >= y1:
+            return frame
+        gx = np.exp(-0.5 * ((np.arange(x0, x1) - cx) / sigma) ** 2)
+        gy = np.exp(-0.5 * ((np.arange(y0, y1) - cy) / sigma) ** 2)
+        spot = np.outer(gy, gx) * peak
+
+        # BGR response of a red/near-IR spot; mono sensors see the sum
+        weights = (0.25, 0.45, 1.0) if channels == 3 else (1.0,)
+        patch = frame[y0:y1, x0:x1].astype(np.float32)
+        for channel, weight in enumerate(weights):
+            patch[..., channel] += spot * weight
+        frame[y0:y1, x0:x1] = np.clip(patch, 0, 255).astype(np.uint8)
+        return frame
+
+    def _background(self, width: int, height: int, channels: int) -> np.ndarray:
+        """Dark frame with sensor noise, cycled from a small precomputed bank."""
+        key = (width, height, channels)
+        bank = self._noise_bank.get(key)
+        if bank is None:
+            bank = [
+                np.clip(
+                    self.background
+                    + self.rng.integers(
+                        -self.noise_counts, self.noise_counts + 1, (height, width, channels)
+                    ),
+                    0,
+                    255,
+                ).astype(np.uint8)
+                for _ in range(4)
+            ]
+            self._noise_bank[key] = bank
+        self._noise_index = (self._noise_index + 1) % len(bank)
+        return bank[self._noise_index]
+
+
+class Stream:
+    """Camera stream passed to frame handlers."""
+
+
+class Camera:
+    """
+    Simulated Allied Vision camera.
+
+    Frames are captured on a schedule set by the frame rate (limited by the
+    exposure time) into buffer_count buffers. The handler is called on the
+    camera's stream thread and must give each frame back with queue_frame();
+    captures that find no free buffer are dropped (dropped_frames).
+    """
+
+    MAX_FPS = 60.0  # Full sensor, USB bandwidth limited
+    MAX_ROI_FPS = 500.0  # Readout limit for small windows
+
+    def __init__(
+        self,
+        renderer: BeamSpotRenderer,
+        camera_id: str = "DEV_TWIN_1800U158C",
+        pixel_formats: Sequence[PixelFormat] = (
+            PixelFormat.Bgr8,
+            PixelFormat.Rgb8,
+            PixelFormat.Mono8,
+        ),
+    ) -> None:
+        self.renderer = renderer
+        self._id = camera_id
+        self._pixel_formats = tuple(pixel_formats)
+        self._pixel_format = self._pixel_formats[0]
+        self._open_count = 0
+
+        auto_entries = ("Off", "Once", "Continuous")
+        self.ExposureTime = Feature(self, "ExposureTime", 10000.0, (20.0, 1_000_000.0))
+        self.Gain = Feature(self, "Gain", 0.0, (0.0, 24.0))
+        self.ExposureAuto = Feature(self, "ExposureAuto", "Off", entries=auto_entries)
+        self.GainAuto = Feature(self, "GainAuto", "Off", entries=auto_entries)
+        self.BalanceWhiteAuto = Feature(self, "BalanceWhiteAuto", "Off", entries=auto_entries)
+        self.BinningHorizontal = Feature(
+            self, "BinningHorizontal", 1, (1, 8), on_change=self._fit_roi
+        )
+        self.BinningVertical = Feature(self, "BinningVertical", 1, (1, 8), on_change=self._fit_roi)
+
+        # Sensor ROI in binned pixels (ranges follow binning and the other ROI features)
+        sensor_width, sensor_height = renderer.sensor_size
+        self.WidthMax = ReadOnlyFeature(self, "WidthMax", self._width_max)
+        self.HeightMax = ReadOnlyFeature(self, "HeightMax", self._height_max)
+        self.Width = Feature(
+            self,
+            "Width",
+            sensor_width,
+            lambda: (8, self._width_max() - self.OffsetX._value),
+            increment=8,
+        )
+        self.Height = Feature(
+            self,
+            "Height",
+            sensor_height,
+            lambda: (8, self._height_max() - self.OffsetY._value),
+            increment=2,
+        )
+        self.OffsetX = Feature(
+            self, "OffsetX", 0, lambda: (0, self._width_max() - self.Width._value), increment=8
+        )
+        self.OffsetY = Feature(
+            self, "OffsetY", 0, lambda: (0, self._height_max() - self.Height._value), increment=2
+        )
+
+        self.AcquisitionFrameRateEnable = Feature(self, "AcquisitionFrameRateEnable", False)
+        self.AcquisitionFrameRate = Feature(
+            self, "AcquisitionFrameRate", 30.0, lambda: (0.5, self.max_frame_rate())
+        )
+
+        self.frames_captured = 0
+        self.frames_delivered = 0
+        self.dropped_frames = 0
+        self._free_buffers = 0
+        self._buffer_lock = threading.Lock()
+        self._stream_thread: Optional[threading.Thread] = None
+        self._streaming = False
+
+    # Context / identity
+
+    def __enter__(self) -> "Camera":
+        self._open_count += 1
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._open_count = max(0, self._open_count - 1)
+        if self._open_count == 0:
+            self.stop_streaming()
+
+    def _require_open(self) -> None:
+        if self._open_count == 0:
+            raise VmbFeatureError("Camera is not open")
+
+    def get_id(self) -> str:
+        return self._id
+
+    def get_name(self) -> str:
+        return "Allied Vision 1800 U-158c (twin)"
+
+    # Pixel formats
+
+    def get_pixel_formats(self) -> tuple[PixelFormat, ...]:
+        return self._pixel_formats
+
+    def get_pixel_format(self) -> PixelFormat:
+        return self._pixel_format
+
+    def set_pixel_format(self, pixel_format: PixelFormat) -> None:
+        self._require_open()
+        if pixel_format not in self._pixel_formats:
+            raise VmbFeatureError(f"Unsupported pixel format {pixel_format}")
+        self._pixel_format = pixel_format
+
+    # Sensor ROI
+
+    def _width_max(self) -> int:
+        return self.renderer.sensor_size[0] // int(self.BinningHorizontal._value)
+
+    def _height_max(self) -> int:
+        return self.renderer.sensor_size[1] // int(self.BinningVertical._value)
+
+    def _fit_roi(self) -> None:
+        """Shrink the window to the sensor after a binning change (as the camera does)."""
+        self.Width._value = min(self.Width._value, self._width_max())
+        self.Height._value = min(self.Height._value, self._height_max())
+        self.OffsetX._value = min(self.OffsetX._value, self._width_max() - self.Width._value)
+        self.OffsetY._value = min(self.OffsetY._value, self._height_max() - self.Height._value)
+
+    def roi(self) -> tuple[int, int, int, int]:
+        """Current sensor window (offset_x, offset_y, width, height) in binned pixels."""
+        return (
+            int(self.OffsetX._value),
+            int(self.OffsetY._value),
+            int(self.Width._value),
+            int(self.Height._value),
+        )
+
+    def max_frame_rate(self) -> float:
+        """Bandwidth limit: fewer pixels per frame allow proportionally more frames."""
+        sensor_pixels = self.renderer.sensor_size[0] * self.renderer.sensor_size[1]
+        pixels = int(self.Width._value) * int(self.Height._value)
+        return min(self.MAX_ROI_FPS, self.MAX_FPS * sensor_pixels / max(pixels, 1))
+
+    # Streaming
+
+    @property
+    def frame_rate(self) -> float:
+        """Effective frame rate (frame rate setting, exposure and bandwidth limits)."""
+        limit = min(1e6 / float(self.ExposureTime._value), self.max_frame_rate())
+        if self.AcquisitionFrameRateEnable._value:
+            return min(float(self.AcquisitionFrameRate._value), limit)
+        return min(self.MAX_FPS, limit)
+
+    def is_streaming(self) -> bool:
+        return self._streaming
+
+    def start_streaming(
+        self, handler: Callable[["Camera", Stream, Frame], None], buffer_count: int = 5
+    ) -> None:
+        self._require_open()
+        if self._streaming:
+            raise VmbFeatureError("Camera is already streaming")
+        self._free_buffers = buffer_count
+        self._streaming = True
+        self._stream_thread = threading.Thread(
+            target=self._stream, args=(handler,), name="TwinCameraStream", daemon=True
+        )
+        self._stream_thread.start()
+
+    def stop_streaming(self) -> None:
+        self._streaming = False
+        thread = self._stream_thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(2.0)
+        self._stream_thread = None
+
+    def queue_frame(self, frame: Frame) -> None:
+        """Give a frame's buffer back to the driver."""
+        with self._buffer_lock:
+            self._free_buffers += 1
+
+    def _capture(self) -> Optional[Frame]:
+        """Capture into a free buffer, or count a dropped frame."""
+        with self._buffer_lock:
+            if self._free_buffers <= 0:
+                self.dropped_frames += 1
+                return None
+            self._free_buffers -= 1
+        self.frames_captured += 1
+        # Like the real sensor, frame IDs also count frames dropped for lack of a buffer
+        frame_id = self.frames_captured + self.dropped_frames
+        channels = 1 if self._pixel_format == PixelFormat.Mono8 else 3
+        data = self.renderer.render(
+            int(self.BinningHorizontal._value),
+            channels,
+            float(self.ExposureTime._value),
+            float(self.Gain._value),
+            self.roi(),
+        )
+        if self._pixel_format == PixelFormat.Rgb8:
+            data = np.ascontiguousarray(data[..., ::-1])
+        return Frame(data, self._pixel_format, frame_id)
+
+    def _stream(self, handler: Callable[["Camera", Stream, Frame], None]) -> None:
+        """Stream thread: capture on schedule, deliver to the handler."""
+        stream = Stream()
+        pending: deque[Frame] = deque()
+        next_capture = time.monotonic()
+        while self._streaming:
+            now = time.monotonic()
+            if now < next_capture and not pending:
+                time.sleep(min(next_capture - now, 0.05))
+                continue
+
+            # Every capture that came due (e.g. while the handler was busy)
+            period = 1.0 / self.frame_rate
+            due = 0
+            while next_capture <= now:
+                due += 1
+                next_capture += period
+            for _ in range(due):
+                frame = self._capture()
+                if frame is not None:
+                    pending.append(frame)
+
+            if pending:
+                frame = pending.popleft()
+                self.frames_delivered += 1
+                handler(self, stream, frame)
+
+
+class VmbSystem:
+    """Vimba system singleton listing the simulated cameras."""
+
+    _instance: Optional["VmbSystem"] = None
+
+    def __init__(self) -> None:
+        self._cameras: list[Camera] = []
+        self._context_count = 0
+
+    @classmethod
+    def get_instance(cls) -> "VmbSystem":
+        if cls._instance is None:
+            cls._instance = VmbSystem()
+        return cls._instance
+
+    def set_cameras(self, cameras: Sequence[Camera]) -> None:
+        """Replace the detected cameras (twin setup)."""
+        self._cameras = list(cameras)
+
+    def __enter__(self) -> "VmbSystem":
+        self._context_count += 1
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._context_count = max(0, self._context_count - 1)
+
+    def _require_context(self) -> None:
+        if self._context_count == 0:
+            raise VmbSystemError("Called outside of VmbSystem context")
+
+    def get_all_cameras(self) -> tuple[Camera, ...]:
+        self._require_context()
+        return tuple(self._cameras)
+
+    def get_camera_by_id(self, camera_id: str) -> Camera:
+        self._require_context()
+        for camera in self._cameras:
+            if camera.get_id() == camera_id:
+                return camera
+        raise VmbSystemError(f"No camera with id '{camera_id}'")
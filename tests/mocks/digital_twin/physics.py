@@ -0,0 +1,484 @@
+"""
+Physical models behind the TOSCA digital twin.
+
+Each model integrates its state lazily up to the current clock time whenever
+it is read or commanded, so there is no physics thread and a test can drive
+the models with its own clock. All models are thread-safe: the serial device
+threads, the camera stream thread and the test thread read them concurrently.
+
+Models:
+- ActuatorModel: linear stage with trapezoidal velocity profile, index search,
+  scanning and hard end stops
+- LaserModel: diode driver current with threshold/slope efficiency and heat load
+- PhotodiodeModel: laser pickoff voltage through a calibration curve, with
+  noise and 10-bit ADC quantisation
+- TECModel: first-order thermal mass with a PI-regulated thermoelectric cooler
+  and the laser's heat load
+- MotorModel: smoothing motor spin-up and rotating-imbalance vibration
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from enum import Enum
+from typing import Callable, Optional, Sequence
+
+import numpy as np
+
+Clock = Callable[[], float]
+
+
+class _IntegratedModel:
+    """Base for models integrated in bounded steps up to the current clock time."""
+
+    MAX_STEP_S = 0.002
+    MAX_STEPS_PER_UPDATE = 2000  # Long idle gaps are integrated with coarser steps
+
+    def __init__(self, clock: Optional[Clock] = None) -> None:
+        self.clock: Clock = clock or time.monotonic
+        self._lock = threading.RLock()
+        self._last_update = self.clock()
+
+    def update(self) -> None:
+        """Advance the model to the current clock time."""
+        with self._lock:
+            now = self.clock()
+            remaining = now - self._last_update
+            self._last_update = now
+            if remaining <= 0:
+                return
+            step = max(self.MAX_STEP_S, remaining / self.MAX_STEPS_PER_UPDATE)
+            while remaining > 1e-12:
+                dt = min(step, remaining)
+                self._step(dt)
+                remaining -= dt
+
+    def _step(self, dt: float) -> None:
+        raise NotImplementedError
+
+
+class MotionMode(Enum):
+    """What the actuator's motion controller is doing."""
+
+    IDLE = "idle"
+    POSITION = "position"  # Closed-loop move to a target (DPOS)
+    INDEX = "index"  # Searching the encoder index (INDX)
+    SCAN = "scan"  # Constant-velocity scan until stopped or an end stop (SCAN/MOVE)
+    STOPPING = "stopping"  # Decelerating to rest (STOP)
+
+
+class ActuatorModel(_IntegratedModel):
+    """
+    Linear stage with velocity/acceleration limits.
+
+    Positions are in the stage frame (µm); the encoder reads positions
+    relative to the power-up position until the index has been found, and
+    relative to the index afterwards.
+    """
+
+    def __init__(
+        self,
+        clock: Optional[Clock] = None,
+        encoder_resolution_um: float = 1.25,
+        low_end_um: float = -45000.0,
+        high_end_um: float = 45000.0,
+        index_um: float = 0.0,
+        start_um: float = 2500.0,
+        speed_um_per_s: float = 1000.0,
+        acceleration_um_per_s2: float = 200000.0,
+    ) -> None:
+        super().__init__(clock)
+        self.encoder_resolution_um = encoder_resolution_um
+        self.low_end_um = low_end_um
+        self.high_end_um = high_end_um
+        self.index_um = index_um
+        self.speed_um_per_s = speed_um_per_s
+        self.acceleration_um_per_s2 = acceleration_um_per_s2
+
+        self.position_um = start_um
+        self.velocity_um_per_s = 0.0
+        self.mode = MotionMode.IDLE
+        self.target_um = start_um
+        self.scan_direction = 0
+        self.enabled = True
+        self.encoder_valid = False
+        self.position_reached = False
+        self._encoder_origin_um = start_um
+
+    # Commands (encoder units are counts relative to the encoder origin)
+
+    def move_to_counts(self, counts: int) -> None:
+        """Start a closed-loop move (DPOS)."""
+        with self._lock:
+            self.update()
+            self.target_um = self._encoder_origin_um + counts * self.encoder_resolution_um
+            self.mode = MotionMode.POSITION
+            self.position_reached = False
+
+    def find_index(self) -> None:
+        """Start the index search (INDX)."""
+        with self._lock:
+            self.update()
+            self.target_um = self.index_um
+            self.mode = MotionMode.INDEX
+            self.position_reached = False
+
+    def scan(self, direction: int) -> None:
+        """Scan at set speed towards an end stop; direction 0 stops (SCAN/MOVE)."""
+        with self._lock:
+            self.update()
+            if direction == 0:
+                self.mode = MotionMode.STOPPING
+            else:
+                self.scan_direction = 1 if direction > 0 else -1
+                self.mode = MotionMode.SCAN
+            self.position_reached = False
+
+    def stop(self) -> None:
+        """Decelerate to rest (STOP)."""
+        self.scan(0)
+
+    # Readings
+
+    @property
+    def encoder_counts(self) -> int:
+        """Encoder position (EPOS)."""
+        with self._lock:
+            self.update()
+            return int(
+                round((self.position_um - self._encoder_origin_um) / self.encoder_resolution_um)
+            )
+
+    @property
+    def at_low_end(self) -> bool:
+        return self.position_um <= self.low_end_um
+
+    @property
+    def at_high_end(self) -> bool:
+        return self.position_um >= self.high_end_um
+
+    def status_bits(self) -> int:
+        """Xeryon STAT register for the current state."""
+        with self._lock:
+            self.update()
+            bits = {
+                5: self.enabled,  # Motor on
+                6: self.mode in (MotionMode.POSITION, MotionMode.INDEX),  # Closed loop
+                8: self.encoder_valid,
+                9: self.mode == MotionMode.INDEX,  # Searching index
+                10: self.position_reached,
+                13: self.mode == MotionMode.SCAN,
+                14: self.at_low_end,
+                15: self.at_high_end,
+            }
+            return sum(1 << bit for bit, value in bits.items() if value)
+
+    # Dynamics
+
+    def _step(self, dt: float) -> None:
+        if not self.enabled or self.mode == MotionMode.IDLE:
+            self.velocity_um_per_s = 0.0
+            return
+
+        accel = self.acceleration_um_per_s2
+        if self.mode == MotionMode.SCAN:
+            desired = self.scan_direction * self.speed_um_per_s
+        elif self.mode == MotionMode.STOPPING:
+            desired = 0.0
+        else:
+            remaining = self.target_um - self.position_um
+            # Fastest speed from which the stage can still stop at the target
+            reachable = math.sqrt(2.0 * accel * abs(remaining))
+            desired = math.copysign(min(self.speed_um_per_s, reachable), remaining)
+
+        delta_v = desired - self.velocity_um_per_s
+        max_delta = accel * dt
+        self.velocity_um_per_s += max(-max_delta, min(max_delta, delta_v))
+        previous = self.position_um
+        self.position_um += self.velocity_um_per_s * dt
+
+        if self.mode in (MotionMode.POSITION, MotionMode.INDEX):
+            # Settle on the target once the step reaches or crosses it
+            crossed = (previous - self.target_um) * (self.position_um - self.target_um) <= 0
+            if crossed and abs(self.velocity_um_per_s) <= max_delta * 2 + 1e-9:
+                self._settle()
+        elif self.mode == MotionMode.STOPPING and self.velocity_um_per_s == 0.0:
+            self.mode = MotionMode.IDLE
+
+        if self.position_um <= self.low_end_um or self.position_um >= self.high_end_um:
+            self.position_um = min(max(self.position_um, self.low_end_um), self.high_end_um)
+            self.velocity_um_per_s = 0.0
+            if self.mode != MotionMode.POSITION:
+                self.mode = MotionMode.IDLE
+
+    def _settle(self) -> None:
+        self.position_um = self.target_um
+        self.velocity_um_per_s = 0.0
+        if self.mode == MotionMode.INDEX:
+            self.encoder_valid = True
+            self._encoder_origin_um = self.index_um
+        self.mode = MotionMode.IDLE
+        self.position_reached = True
+
+
+class LaserModel(_IntegratedModel):
+    """
+    Laser diode on a constant-current driver.
+
+    Optical power follows the diode's L-I curve above threshold; everything
+    else the driver delivers (forward voltage x current) is heat for the TEC.
+    """
+
+    def __init__(
+        self,
+        clock: Optional[Clock] = None,
+        current_limit_a: float = 2.0,
+        threshold_current_a: float = 0.1,
+        slope_efficiency_w_per_a: float = 1.1,
+        forward_voltage_v: float = 2.0,
+        rise_time_s: float = 0.005,
+        current_noise_a: float = 0.0005,
+        rng: Optional[np.random.Generator] = None,
+    ) -> None:
+        super().__init__(clock)
+        self.current_limit_a = current_limit_a
+        self.threshold_current_a = threshold_current_a
+        self.slope_efficiency_w_per_a = slope_efficiency_w_per_a
+        self.forward_voltage_v = forward_voltage_v
+        self.rise_time_s = rise_time_s
+        self.current_noise_a = current_noise_a
+        self.rng = rng or np.random.default_rng()
+
+        self.setpoint_a = 0.0
+        self.output_enabled = False
+        self.current_a = 0.0
+
+    def set_current(self, amps: float) -> None:
+        """Set drive current setpoint (clamped to the limit, like the driver)."""
+        with self._lock:
+            self.update()
+            self.setpoint_a = min(max(0.0, amps), self.current_limit_a)
+
+    def set_output(self, enabled: bool) -> None:
+        """Enable or disable the output."""
+        with self._lock:
+            self.update()
+            self.output_enabled = enabled
+
+    def measured_current_a(self) -> float:
+        """Drive current as read back by the driver (with noise)."""
+        with self._lock:
+            self.update()
+            if self.current_a <= 0.0:
+                return 0.0
+            return max(0.0, self.current_a + self.rng.normal(0.0, self.current_noise_a))
+
+    def optical_power_w(self) -> float:
+        """Emitted optical power."""
+        with self._lock:
+            self.update()
+            return self.slope_efficiency_w_per_a * max(
+                0.0, self.current_a - self.threshold_current_a
+            )
+
+    def heat_load_w(self) -> float:
+        """Electrical power not emitted as light."""
+        with self._lock:
+            self.update()
+            electrical = self.current_a * self.forward_voltage_v
+            return max(0.0, electrical - self.optical_power_w())
+
+    def _step(self, dt: float) -> None:
+        target = self.setpoint_a if self.output_enabled else 0.0
+        self.current_a += (target - self.current_a) * min(1.0, dt / self.rise_time_s)
+
+
+class PhotodiodeModel:
+    """
+    Laser pickoff photodiode read by the GPIO board's 10-bit ADC (0-5 V).
+
+    The calibration curve maps optical power (mW) to diode voltage and is
+    interpolated linearly. The default matches the GPIO controller's
+    400 mW/V conversion.
+    """
+
+    def __init__(
+        self,
+        laser: LaserModel,
+        calibration: Sequence[tuple[float, float]] = ((0.0, 0.0), (2000.0, 5.0)),
+        noise_v: float = 0.004,
+        dark_voltage_v: float = 0.0,
+        rng: Optional[np.random.Generator] = None,
+    ) -> None:
+        self.laser = laser
+        points = sorted(calibration)
+        self._power_mw = np.array([p for p, _ in points], dtype=float)
+        self._volts = np.array([v for _, v in points], dtype=float)
+        self.noise_v = noise_v
+        self.dark_voltage_v = dark_voltage_v
+        self.rng = rng or np.random.default_rng()
+
+    def ideal_voltage(self, power_mw: float) -> float:
+        """Noise-free voltage for an optical power."""
+        return float(np.interp(power_mw, self._power_mw, self._volts)) + self.dark_voltage_v
+
+    def read_voltage(self) -> float:
+        """ADC reading of the current laser power (noise, clipping and quantisation)."""
+        volts = self.ideal_voltage(self.laser.optical_power_w() * 1000.0)
+        volts += self.rng.normal(0.0, self.noise_v)
+        raw = int(round(min(max(volts, 0.0), 5.0) / 5.0 * 1023))
+        return raw / 1023.0 * 5.0
+
+
+class TECModel(_IntegratedModel):
+    """
+    Laser mount temperature regulated by a thermoelectric cooler.
+
+    A lumped thermal mass exchanges heat with ambient through a thermal
+    resistance, absorbs the laser's heat load and is pumped by the TEC,
+    whose current comes from a PI loop on the temperature error (clamped to
+    the TEC's current limit). Positive current cools.
+    """
+
+    def __init__(
+        self,
+        clock: Optional[Clock] = None,
+        laser: Optional[LaserModel] = None,
+        ambient_c: float = 22.0,
+        heat_capacity_j_per_k: float = 2.0,
+        thermal_resistance_k_per_w: float = 10.0,
+        pump_w_per_a: float = 2.0,
+        current_limit_a: float = 1.5,
+        module_resistance_ohm: float = 1.2,
+        seebeck_v_per_k: float = 0.05,
+        kp_a_per_k: float = 1.0,
+        ki_a_per_k_s: float = 0.2,
+        high_limit_c: float = 35.0,
+        low_limit_c: float = 15.0,
+    ) -> None:
+        super().__init__(clock)
+        self.laser = laser
+        self.ambient_c = ambient_c
+        self.heat_capacity_j_per_k = heat_capacity_j_per_k
+        self.thermal_resistance_k_per_w = thermal_resistance_k_per_w
+        self.pump_w_per_a = pump_w_per_a
+        self.current_limit_a = current_limit_a
+        self.module_resistance_ohm = module_resistance_ohm
+        self.seebeck_v_per_k = seebeck_v_per_k
+        self.kp_a_per_k = kp_a_per_k
+        self.ki_a_per_k_s = ki_a_per_k_s
+        self.high_limit_c = high_limit_c
+        self.low_limit_c = low_limit_c
+
+        self.temperature_c = ambient_c
+        self.setpoint_c = 25.0
+        self.output_enabled = False
+        self.current_a = 0.0
+        self._integral_a = 0.0
+
+    def set_temperature(self, celsius: float) -> None:
+        """Set temperature setpoint (clamped to the limits)."""
+        with self._lock:
+            self.update()
+            self.setpoint_c = min(max(celsius, self.low_limit_c), self.high_limit_c)
+
+    def set_output(self, enabled: bool) -> None:
+        """Enable or disable the TEC drive."""
+        with self._lock:
+            self.update()
+            self.output_enabled = enabled
+            self._integral_a = 0.0
+
+    def read(self) -> tuple[float, float, float]:
+        """(temperature °C, TEC current A, TEC voltage V)."""
+        with self._lock:
+            self.update()
+            voltage = self.current_a * self.module_resistance_ohm + self.seebeck_v_per_k * (
+                self.ambient_c - self.temperature_c
+            )
+            return self.temperature_c, self.current_a, voltage
+
+    def _step(self, dt: float) -> None:
+        if self.output_enabled:
+            error = self.temperature_c - self.setpoint_c
+            self._integral_a += self.ki_a_per_k_s * error * dt
+            # Anti-windup: the integral alone may not exceed the current limit
+            limit = self.current_limit_a
+            self._integral_a = min(max(self._integral_a, -limit), limit)
+            self.current_a = min(max(self.kp_a_per_k * error + self._integral_a, -limit), limit)
+        else:
+            self.current_a = 0.0
+
+        load_w = self.laser.heat_load_w() if self.laser is not None else 0.0
+        heat_in_w = (
+            (self.ambient_c - self.temperature_c) / self.thermal_resistance_k_per_w
+            + load_w
+            - self.pump_w_per_a * self.current_a
+        )
+        self.temperature_c += heat_in_w * dt / self.heat_capacity_j_per_k
+
+
+class MotorModel(_IntegratedModel):
+    """
+    Smoothing motor with an unbalanced rotor, read by the GPIO accelerometer.
+
+    Speed follows the PWM duty with a first-order spin-up. The imbalance
+    produces a rotating acceleration in the X/Y plane whose amplitude grows
+    with the square of speed; Z reads gravity.
+    """
+
+    PWM_MAX = 153  # Firmware clamp (3.0 V motor rating)
+
+    def __init__(
+        self,
+        clock: Optional[Clock] = None,
+        spin_up_s: float = 0.3,
+        max_rpm: float = 6000.0,
+        imbalance_g_at_max: float = 2.5,
+        noise_g: float = 0.01,
+        rng: Optional[np.random.Generator] = None,
+    ) -> None:
+        super().__init__(clock)
+        self.spin_up_s = spin_up_s
+        self.max_rpm = max_rpm
+        self.imbalance_g_at_max = imbalance_g_at_max
+        self.noise_g = noise_g
+        self.rng = rng or np.random.default_rng()
+
+        self.pwm = 0
+        self.speed_fraction = 0.0
+        self._phase = 0.0
+
+    def set_pwm(self, pwm: int) -> int:
+        """Set PWM duty (clamped like the firmware); returns the applied value."""
+        with self._lock:
+            self.update()
+            self.pwm = min(max(0, int(pwm)), self.PWM_MAX)
+            return self.pwm
+
+    @property
+    def rpm(self) -> float:
+        with self._lock:
+            self.update()
+            return self.speed_fraction * self.max_rpm
+
+    def acceleration_g(self) -> tuple[float, float, float]:
+        """Accelerometer sample (x, y, z) in g."""
+        with self._lock:
+            self.update()
+            amplitude = self.imbalance_g_at_max * self.speed_fraction**2
+            noise = self.rng.normal(0.0, self.noise_g, 3)
+            return (
+                amplitude * math.cos(self._phase) + noise[0],
+                amplitude * math.sin(self._phase) + noise[1],
+                1.0 + noise[2],
+            )
+
+    def _step(self, dt: float) -> None:
+        target = self.pwm / self.PWM_MAX
+        self.speed_fraction += (target - self.speed_fraction) * min(1.0, dt / self.spin_up_s)
+        self._phase = (self._phase + 2 * math.pi * self.speed_fraction * self.max_rpm / 60 * dt) % (
+            2 * math.pi
+        )
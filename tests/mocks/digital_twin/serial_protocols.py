@@ -0,0 +1,355 @@
+"""
+Instrument command sets of the TOSCA digital twin.
+
+Each protocol is a handler for MockSerialDevice/PtySerialDevice,
+    handler(command: str) -> str | list[str] | None,
+answering the commands the real controllers send, with readings taken from
+the physics models:
+- ArroyoLaserProtocol: Arroyo laser driver (LAS:...)
+- ArroyoTECProtocol: Arroyo TEC controller (TEC:...)
+- ArduinoWatchdogProtocol: TOSCA watchdog firmware v2 (motor, aiming laser,
+  accelerometer, photodiode, hardware watchdog)
+- XeryonProtocol: Xeryon controller settings/commands; its status frames
+  (STAT/EPOS/TIME) are streamed separately by the twin every POLI ms
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable, Optional, Union
+
+from tests.mocks.digital_twin.physics import (
+    ActuatorModel,
+    LaserModel,
+    MotorModel,
+    PhotodiodeModel,
+    TECModel,
+)
+
+Response = Union[str, list[str], None]
+
+
+def _argument(command: str) -> Optional[float]:
+    """Numeric argument of an Arroyo "CMD value" command."""
+    parts = command.split()
+    if len(parts) != 2:
+        return None
+    try:
+        return float(parts[1])
+    except ValueError:
+        return None
+
+
+class ArroyoLaserProtocol:
+    """Arroyo laser driver commands (currents in A)."""
+
+    IDN = "Arroyo Instruments,4308 LaserSource,TWIN0001,1.0"
+
+    def __init__(self, laser: LaserModel) -> None:
+        self.laser = laser
+
+    def __call__(self, command: str) -> Response:
+        command = command.strip().upper()
+        if command == "*IDN?":
+            return self.IDN
+        if command == "LAS:LIM:LDI?":
+            return f"{self.laser.current_limit_a:.4f}"
+        if command == "LAS:LDI?":
+            return f"{self.laser.measured_current_a():.4f}"
+        if command == "LAS:SET:LDI?":
+            return f"{self.laser.setpoint_a:.4f}"
+        if command == "LAS:OUT?":
+            return "1" if self.laser.output_enabled else "0"
+        if command.startswith("LAS:LDI "):
+            value = _argument(command)
+            if value is not None:
+                self.laser.set_current(value)
+            return None
+        if command.startswith("LAS:OUT "):
+            value = _argument(command)
+            if value is not None:
+                self.laser.set_output(bool(int(value)))
+            return None
+        return None  # Unknown commands are silently ignored, like the instrument
+
+
+class ArroyoTECProtocol:
+    """Arroyo TEC controller commands."""
+
+    IDN = "Arroyo Instruments,5305 TECSource,TWIN0002,1.0"
+
+    def __init__(self, tec: TECModel) -> None:
+        self.tec = tec
+
+    def __call__(self, command: str) -> Response:  # noqa: C901
+        command = command.strip().upper()
+        if command == "*IDN?":
+            return self.IDN
+        if command == "TEC:LIM:THI?":
+            return f"{self.tec.high_limit_c:.2f}"
+        if command == "TEC:LIM:TLO?":
+            return f"{self.tec.low_limit_c:.2f}"
+        if command == "TEC:T?":
+            return f"{self.tec.read()[0]:.3f}"
+        if command == "TEC:ITE?":
+            return f"{self.tec.read()[1]:.3f}"
+        if command == "TEC:V?":
+            return f"{self.tec.read()[2]:.3f}"
+        if command == "TEC:SET:T?":
+            return f"{self.tec.setpoint_c:.2f}"
+        if command == "TEC:OUT?":
+            return "1" if self.tec.output_enabled else "0"
+        if command.startswith("TEC:T "):
+            value = _argument(command)
+            if value is not None:
+                self.tec.set_temperature(value)
+            return None
+        if command.startswith("TEC:OUT "):
+            value = _argument(command)
+            if value is not None:
+                self.tec.set_output(bool(int(value)))
+            return None
+        return None
+
+
+class ArduinoWatchdogProtocol:
+    """
+    TOSCA Arduino watchdog firmware v2.
+
+    The hardware watchdog halts the board (motor and aiming laser off, no
+    further responses until power_cycle()) when heartbeats stop for longer
+    than the timeout. Opening the port cannot be observed on a pty, so the
+    watchdog is armed by the first WDT_RESET/WDT_ENABLE rather than at boot.
+    """
+
+    def __init__(
+        self,
+        motor: MotorModel,
+        photodiode: PhotodiodeModel,
+        clock: Optional[Callable[[], float]] = None,
+        watchdog_timeout_s: float = 1.0,
+        accelerometer_present: bool = True,
+        vibration_threshold_g: float = 0.1,
+    ) -> None:
+        self.motor = motor
+        self.photodiode = photodiode
+        self.clock = clock or time.monotonic
+        self.watchdog_timeout_s = watchdog_timeout_s
+        self.accelerometer_present = accelerometer_present
+        self.vibration_threshold_g = vibration_threshold_g
+
+        self.aiming_laser_on = False
+        self.watchdog_enabled = False
+        self.halted = False
+        self.last_heartbeat = self.clock()
+        self._lock = threading.Lock()
+
+    def power_cycle(self) -> None:
+        """Recover from a watchdog halt (outputs stay off, watchdog disarmed)."""
+        with self._lock:
+            self.halted = False
+            self.watchdog_enabled = False
+
+    def check_watchdog(self) -> bool:
+        """Halt if the heartbeat timed out; returns True while halted."""
+        with self._lock:
+            if (
+                not self.halted
+                and self.watchdog_enabled
+                and self.clock() - self.last_heartbeat > self.watchdog_timeout_s
+            ):
+                self.halted = True
+                self.motor.set_pwm(0)
+                self.aiming_laser_on = False
+            return self.halted
+
+    def vibration_magnitude_g(self) -> float:
+        """Firmware's vibration measure: |a - 1g on Z| from one sample."""
+        x, y, z = self.motor.acceleration_g()
+        return float((x * x + y * y + (z - 1.0) ** 2) ** 0.5)
+
+    def __call__(self, command: str) -> Response:  # noqa: C901
+        if self.check_watchdog():
+            return None
+        command = command.strip()
+
+        if command == "WDT_RESET":
+            with self._lock:
+                self.last_heartbeat = self.clock()
+                self.watchdog_enabled = True
+            return "OK:WDT_RESET"
+        if command == "WDT_ENABLE":
+            with self._lock:
+                self.last_heartbeat = self.clock()
+                self.watchdog_enabled = True
+            return "OK:WDT_ENABLED"
+        if command == "WDT_DISABLE":
+            with self._lock:
+                self.watchdog_enabled = False
+            return "WARNING:WDT_DISABLED"
+
+        if command.startswith("MOTOR_SPEED:"):
+            try:
+                requested = int(command[len("MOTOR_SPEED:") :])
+            except ValueError:
+                requested = 0
+            applied = self.motor.set_pwm(requested)
+            lines = ["WARNING:PWM_CLAMPED_TO_MAX"] if requested > applied else []
+            return lines + [f"OK:MOTOR_SPEED:{applied}"]
+        if command == "MOTOR_OFF":
+            self.motor.set_pwm(0)
+            return "OK:MOTOR_OFF"
+        if command == "GET_MOTOR_SPEED":
+            return f"MOTOR_SPEED:{self.motor.pwm}"
+
+        if command == "LASER_ON":
+            self.aiming_laser_on = True
+            return "OK:LASER_ON"
+        if command == "LASER_OFF":
+            self.aiming_laser_on = False
+            return "OK:LASER_OFF"
+
+        if command == "ACCEL_INIT":
+            return "OK:ACCEL_INITIALIZED" if self.accelerometer_present else "ERROR:NO_ACCEL_FOUND"
+        if command.startswith("ACCEL_SET_THRESHOLD:"):
+            try:
+                threshold = float(command[len("ACCEL_SET_THRESHOLD:") :])
+            except ValueError:
+                threshold = -1.0
+            if 0.0 <= threshold <= 10.0:
+                self.vibration_threshold_g = threshold
+                return f"OK:THRESHOLD_SET:{threshold:.3f}"
+            return "ERROR:THRESHOLD_OUT_OF_RANGE"
+        if command == "GET_ACCEL":
+            if not self.accelerometer_present:
+                return "ERROR:NO_ACCELEROMETER"
+            x, y, z = self.motor.acceleration_g()
+            return f"ACCEL:{x:.3f},{y:.3f},{z:.3f}"
+        if command == "GET_VIBRATION_LEVEL":
+            if not self.accelerometer_present:
+                return "ERROR:NO_ACCELEROMETER"
+            return f"VIBRATION:{self.vibration_magnitude_g():.3f}"
+
+        if command == "GET_PHOTODIODE":
+            return f"PHOTODIODE:{self.photodiode.read_voltage():.3f}"
+        if command == "GET_FOOTPEDAL":
+            return "FOOTPEDAL:0"
+        if command == "GET_STATUS":
+            return self._status()
+
+        return f"ERROR:UNKNOWN_COMMAND:{command}"
+
+    def _status(self) -> list[str]:
+        """Multi-line GET_STATUS report, terminated by OK:STATUS."""
+        pwm = self.motor.pwm
+        lines = [
+            "STATUS:",
+            f"  Motor PWM: {pwm} ({pwm / 255.0 * 5.0:.2f}V)",
+            f"  Aiming Laser: {'ON' if self.aiming_laser_on else 'OFF'}",
+        ]
+        if self.accelerometer_present:
+            x, y, z = self.motor.acceleration_g()
+            lines.append(f"  Accelerometer: 0x53 X={x:.2f}g Y={y:.2f}g Z={z:.2f}g")
+            lines.append(
+                f"  Vibration: {self.vibration_magnitude_g():.3f}g "
+                f"(threshold: {self.vibration_threshold_g:.3f}g)"
+            )
+        else:
+            lines.append("  Accelerometer: NOT_DETECTED")
+        lines += [
+            f"  Photodiode: {self.photodiode.read_voltage():.3f}V",
+            "  Footpedal: RELEASED",
+            f"  Watchdog: {'ENABLED' if self.watchdog_enabled else 'DISABLED'}",
+            f"  Last Heartbeat: {int((self.clock() - self.last_heartbeat) * 1000)}ms ago",
+            "OK:STATUS",
+        ]
+        return lines
+
+
+class XeryonProtocol:
+    """
+    Xeryon single-axis controller.
+
+    Settings ("TAG=value") are stored and reported back for "TAG=?"
+    queries; motion commands drive the actuator model. status_frame()
+    builds the periodic STAT/EPOS/TIME lines.
+    """
+
+    DEFAULT_SETTINGS = {
+        "SSPD": "1000",  # µm/s
+        "LLIM": "-36000",  # Encoder counts
+        "HLIM": "36000",
+        "PTOL": "2",
+        "PTO2": "4",
+        "ACCE": "65500",
+        "DECE": "65500",
+        "TOUT": "1000",
+        "ELIM": "0",
+        "POLI": "97",  # Status frame period in ms
+        "ENBL": "1",
+    }
+
+    def __init__(
+        self, actuator: ActuatorModel, clock: Optional[Callable[[], float]] = None
+    ) -> None:
+        self.actuator = actuator
+        self.clock = clock or time.monotonic
+        self.settings = dict(self.DEFAULT_SETTINGS)
+        self.actuator.speed_um_per_s = float(self.settings["SSPD"])
+        self._start = self.clock()
+
+    @property
+    def poll_interval_s(self) -> float:
+        """Status frame period (POLI, at least 1 ms)."""
+        try:
+            return max(1, int(self.settings["POLI"])) / 1000.0
+        except ValueError:
+            return 0.097
+
+    def status_frame(self) -> list[str]:
+        """One round of status data."""
+        ticks = int((self.clock() - self._start) * 10000) % 2**16  # 0.1 ms counter
+        return [
+            f"STAT={self.actuator.status_bits()}",
+            f"EPOS={self.actuator.encoder_counts}",
+            f"TIME={ticks}",
+        ]
+
+    def __call__(self, command: str) -> Response:  # noqa: C901
+        command = command.strip()
+        if ":" in command:  # Multi-axis "X:TAG=value"
+            command = command.split(":", 1)[1]
+        if "=" not in command:
+            return None
+        tag, value = command.split("=", 1)
+
+        if value == "?":
+            if tag in self.settings:
+                return f"{tag}={self.settings[tag]}"
+            return None
+
+        try:
+            number = int(float(value))
+        except ValueError:
+            return None
+
+        if tag == "DPOS":
+            self.actuator.move_to_counts(number)
+        elif tag == "INDX":
+            self.actuator.find_index()
+        elif tag in ("SCAN", "MOVE"):
+            self.actuator.scan(number)
+        elif tag == "STOP":
+            self.actuator.stop()
+        elif tag in ("RSET", "ENBL"):
+            self.actuator.enabled = True
+            if tag == "ENBL":
+                self.settings["ENBL"] = value
+        elif tag == "ZERO":
+            pass
+        else:
+            self.settings[tag] = value
+            if tag == "SSPD":
+                self.actuator.speed_um_per_s = float(number)
+        return None
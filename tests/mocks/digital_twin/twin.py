@@ -0,0 +1,187 @@
+"""
+TOSCA digital twin: the whole bench simulated behind real device interfaces.
+
+DigitalTwin couples the physics models (the laser heats the TEC mount, the
+photodiode sees the laser, the camera sees the actuator and both lasers)
+and exposes them the way the hardware is exposed:
+- laser, TEC, GPIO and actuator as pseudo-terminals (POSIX) answering the
+  instruments' serial protocols, so the real controllers open them with
+  serial.Serial / the Xeryon library unmodified
+- the camera through a fake vmbpy module (patch_vmbpy())
+
+Usage:
+    twin = DigitalTwin(seed=1)
+    ports = twin.start()
+    with twin.patch_vmbpy():
+        laser.connect(ports.laser)
+        actuator.connect(ports.actuator)
+        camera.connect()
+        ...
+    twin.stop()
+"""
+
+from __future__ import annotations
+
+import contextlib
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+import numpy as np
+
+from tests.mocks.digital_twin import fake_vmbpy
+from tests.mocks.digital_twin.physics import (
+    ActuatorModel,
+    Clock,
+    LaserModel,
+    MotorModel,
+    PhotodiodeModel,
+    TECModel,
+)
+from tests.mocks.digital_twin.serial_protocols import (
+    ArduinoWatchdogProtocol,
+    ArroyoLaserProtocol,
+    ArroyoTECProtocol,
+    XeryonProtocol,
+)
+from tests.mocks.mock_serial_device import PtySerialDevice
+
+
+@dataclass
+class TwinPorts:
+    """Serial port paths of the simulated instruments."""
+
+    laser: str
+    tec: str
+    gpio: str
+    actuator: str
+
+
+class DigitalTwin:
+    """
+    Simulated TOSCA bench.
+
+    The models are public attributes (actuator, laser, photodiode, tec,
+    motor, gpio, camera) so tests can inspect the physical state or inject
+    conditions, e.g. twin.tec.ambient_c = 30.0 or twin.gpio.accelerometer_present = False.
+    """
+
+    def __init__(self, seed: Optional[int] = None, clock: Optional[Clock] = None) -> None:
+        """
+        Initialize the twin (devices are not started).
+
+        Args:
+            seed: Seed for all noise sources (reproducible runs)
+            clock: Time source for the physics (default: time.monotonic)
+        """
+        rng = np.random.default_rng(seed)
+        self.clock: Clock = clock or time.monotonic
+
+        self.actuator = ActuatorModel(self.clock)
+        self.laser = LaserModel(self.clock, rng=rng)
+        self.photodiode = PhotodiodeModel(self.laser, rng=rng)
+        self.tec = TECModel(self.clock, laser=self.laser)
+        self.motor = MotorModel(self.clock, rng=rng)
+
+        self.laser_protocol = ArroyoLaserProtocol(self.laser)
+        self.tec_protocol = ArroyoTECProtocol(self.tec)
+        self.gpio = ArduinoWatchdogProtocol(self.motor, self.photodiode, self.clock)
+        self.xeryon = XeryonProtocol(self.actuator, self.clock)
+
+        self.camera = fake_vmbpy.Camera(
+            fake_vmbpy.BeamSpotRenderer(
+                self.actuator, self.laser, lambda: self.gpio.aiming_laser_on, rng=rng
+            )
+        )
+
+        self._devices: dict[str, PtySerialDevice] = {}
+        self._stream_thread: Optional[threading.Thread] = None
+        self._running = False
+        self.ports: Optional[TwinPorts] = None
+
+    def start(self) -> TwinPorts:
+        """
+        Start the serial instruments on pseudo-terminals.
+
+        Returns:
+            Port paths to pass to the controllers' connect()
+        """
+        if self.ports is not None:
+            return self.ports
+
+        self._devices = {
+            "laser": PtySerialDevice(self.laser_protocol, line_ending=b"\r\n"),
+            "tec": PtySerialDevice(self.tec_protocol, line_ending=b"\r\n"),
+            "gpio": PtySerialDevice(self.gpio),
+            "actuator": PtySerialDevice(self.xeryon),
+        }
+        paths = {name: device.start() for name, device in self._devices.items()}
+        self.ports = TwinPorts(**paths)
+
+        self._running = True
+        self._stream_thread = threading.Thread(
+            target=self._stream_actuator_status, name="TwinXeryonStatus", daemon=True
+        )
+        self._stream_thread.start()
+        return self.ports
+
+    def stop(self) -> None:
+        """Stop all devices and the camera stream."""
+        self._running = False
+        if self._stream_thread is not None:
+            self._stream_thread.join(1.0)
+            self._stream_thread = None
+        for device in self._devices.values():
+            device.stop()
+        self._devices = {}
+        self.ports = None
+        self.camera.stop_streaming()
+
+    def device(self, name: str) -> PtySerialDevice:
+        """Serial device by name ("laser", "tec", "gpio", "actuator"), e.g. for its command log."""
+        return self._devices[name]
+
+    @contextlib.contextmanager
+    def patch_vmbpy(self) -> Iterator[fake_vmbpy.VmbSystem]:
+        """
+        Substitute the fake vmbpy for the real one while the block runs.
+
+        Covers both `import vmbpy` done inside the block and modules that
+        already imported it (hardware.camera_controller).
+        """
+        system = fake_vmbpy.VmbSystem.get_instance()
+        system.set_cameras([self.camera])
+
+        camera_module = sys.modules.get("hardware.camera_controller")
+        saved_module = sys.modules.get("vmbpy")
+        saved_attr = getattr(camera_module, "vmbpy", None)
+        sys.modules["vmbpy"] = fake_vmbpy
+        if camera_module is not None:
+            camera_module.vmbpy = fake_vmbpy  # type: ignore[attr-defined]
+        try:
+            yield system
+        finally:
+            if saved_module is not None:
+                sys.modules["vmbpy"] = saved_module
+            else:
+                sys.modules.pop("vmbpy", None)
+            if camera_module is not None and saved_attr is not None:
+                camera_module.vmbpy = saved_attr  # type: ignore[attr-defined]
+            system.set_cameras([])
+
+    def _stream_actuator_status(self) -> None:
+        """Send Xeryon STAT/EPOS/TIME frames every POLI ms, like the controller."""
+        next_frame = time.monotonic()
+        while self._running:
+            device = self._devices.get("actuator")
+            if device is not None:
+                for line in self.xeryon.status_frame():
+                    device.inject(line)
+            next_frame += self.xeryon.poll_interval_s
+            delay = next_frame - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_frame = time.monotonic()  # Fell behind: don't burst to catch up
@@ -0,0 +1,236 @@
+"""
+Fake serial devices for testing ASCII-protocol controllers.
+
+Provides two stand-ins for a physical instrument on a serial line:
+- MockSerialDevice: in-memory object implementing the pyserial subset used by
+  SerialTransport (write/readline/reset buffers). Cross-platform, no OS resources.
+- PtySerialDevice: instrument emulated on a pseudo-terminal (POSIX only), so a
+  real serial.Serial(port_name) can be opened and controllers run unmodified.
+
+Both answer each received command line through a handler callable:
+    handler(command: str) -> str | list[str] | None
+"""
+
+from __future__ import annotations
+
+import os
+import select
+import sys
+import threading
+import time
+from collections import deque
+from typing import Callable, Optional, Union
+
+import serial
+
+Response = Union[str, list[str], None]
+Handler = Callable[[str], Response]
+
+
+def _normalize_response(response: Response) -> list[str]:
+    """Convert a handler result to a list of response lines."""
+    if response is None:
+        return []
+    if isinstance(response, str):
+        return [response]
+    return list(response)
+
+
+class MockSerialDevice:
+    """
+    In-memory pyserial stand-in driven by a command handler.
+
+    Commands written by the host are recorded in `commands` and answered
+    immediately (after optional response_delay_s). readline() blocks up to
+    `timeout` seconds and returns b"" on timeout, like pyserial.
+
+    Usage:
+        device = MockSerialDevice(responses={"*IDN?": "Arroyo 4300"})
+        transport = SerialTransport(device, name="test")
+    """
+
+    def __init__(
+        self,
+        handler: Optional[Handler] = None,
+        responses: Optional[dict[str, Response]] = None,
+        line_ending: bytes = b"\n",
+        timeout: float = 1.0,
+        response_delay_s: float = 0.0,
+    ) -> None:
+        self.responses: dict[str, Response] = dict(responses or {})
+        self.handler: Handler = handler or (lambda command: self.responses.get(command))
+        self.line_ending = line_ending
+        self.timeout = timeout
+        self.response_delay_s = response_delay_s
+        self.is_open = True
+
+        self.commands: list[str] = []
+        self._partial = b""
+        self._rx: deque[bytes] = deque()
+        self._condition = threading.Condition()
+
+    def write(self, data: bytes) -> int:
+        """Receive bytes from the host and queue responses for complete commands."""
+        if not self.is_open:
+            raise serial.SerialException("Port not open")
+
+        self._partial += data
+        while self.line_ending in self._partial:
+            raw, self._partial = self._partial.split(self.line_ending, 1)
+            command = raw.decode("utf-8").strip()
+            self.commands.append(command)
+
+            if self.response_delay_s > 0:
+                time.sleep(self.response_delay_s)
+
+            lines = _normalize_response(self.handler(command))
+            with self._condition:
+                for line in lines:
+                    self._rx.append(line.encode("utf-8") + b"\r\n")
+                self._condition.notify_all()
+        return len(data)
+
+    def readline(self) -> bytes:
+        """Return the next response line, or b"" after timeout."""
+        if not self.is_open:
+            raise serial.SerialException("Port not open")
+
+        with self._condition:
+            if not self._rx:
+                self._condition.wait(self.timeout)
+            if not self._rx:
+                return b""
+            return self._rx.popleft()
+
+    def inject(self, line: str) -> None:
+        """Queue an unsolicited line (e.g. a late or stale response)."""
+        with self._condition:
+            self._rx.append(line.encode("utf-8") + b"\r\n")
+            self._condition.notify_all()
+
+    def reset_input_buffer(self) -> None:
+        """Discard unread response lines."""
+        with self._condition:
+            self._rx.clear()
+
+    def reset_output_buffer(self) -> None:
+        """Discard partially written command bytes."""
+        self._partial = b""
+
+    @property
+    def in_waiting(self) -> int:
+        """Number of unread bytes."""
+        with self._condition:
+            return sum(len(line) for line in self._rx)
+
+    def close(self) -> None:
+        """Close the fake port."""
+        self.is_open = False
+        with self._condition:
+            self._condition.notify_all()
+
+
+class PtySerialDevice:
+    """
+    Instrument emulated on a pseudo-terminal (POSIX only).
+
+    The device thread reads command lines from the pty master and writes
+    handler responses back. Host code opens `port_name` with serial.Serial.
+
+    Usage:
+        device = PtySerialDevice(lambda cmd: "OK:WDT_RESET" if cmd == "WDT_RESET" else None)
+        port = device.start()
+        ser = serial.Serial(port, timeout=1.0)
+        ...
+        device.stop()
+    """
+
+    def __init__(self, handler: Handler, line_ending: bytes = b"\n") -> None:
+        if sys.platform == "win32":
+            raise RuntimeError("PtySerialDevice requires a POSIX pseudo-terminal")
+
+        self.handler = handler
+        self.line_ending = line_ending
+        self.port_name: Optional[str] = None
+        self.commands: list[str] = []
+
+        self._master_fd: Optional[int] = None
+        self._slave_fd: Optional[int] = None
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._write_lock = threading.Lock()
+
+    def start(self) -> str:
+        """
+        Create the pty and start answering commands.
+
+        Returns:
+            Device path to open with serial.Serial
+        """
+        import tty
+
+        self._master_fd, self._slave_fd = os.openpty()
+        tty.setraw(self._slave_fd)
+        # Output the host doesn't read is dropped instead of blocking the device
+        os.set_blocking(self._master_fd, False)
+        self.port_name = os.ttyname(self._slave_fd)
+
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="PtySerialDevice", daemon=True)
+        self._thread.start()
+        return self.port_name
+
+    def inject(self, line: str) -> None:
+        """Send an unsolicited line (e.g. a status frame the instrument streams)."""
+        self._write(line)
+
+    def stop(self) -> None:
+        """Stop the device thread and close the pty."""
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(1.0)
+            self._thread = None
+        with self._write_lock:
+            for fd in (self._master_fd, self._slave_fd):
+                if fd is not None:
+                    try:
+                        os.close(fd)
+                    except OSError:
+                        pass
+            self._master_fd = None
+            self._slave_fd = None
+
+    def _run(self) -> None:
+        """Device loop: read command lines, write handler responses."""
+        assert self._master_fd is not None
+        buffer = b""
+        while self._running:
+            readable, _, _ = select.select([self._master_fd], [], [], 0.05)
+            if not readable:
+                continue
+            try:
+                buffer += os.read(self._master_fd, 1024)
+            except BlockingIOError:
+                continue
+            except OSError:
+                return
+
+            while self.line_ending in buffer:
+                raw, buffer = buffer.split(self.line_ending, 1)
+                command = raw.decode("utf-8").strip()
+                if not command:
+                    continue
+                self.commands.append(command)
+                for line in _normalize_response(self.handler(command)):
+                    self._write(line)
+
+    def _write(self, line: str) -> None:
+        """Write one response line to the host (device and injecting threads)."""
+        with self._write_lock:
+            fd = self._master_fd
+            if fd is None:
+                return
+            try:
+                os.write(fd, line.encode("utf-8") + b"\r\n")
+            except OSError:  # Includes BlockingIOError when the host isn't reading
+                pass
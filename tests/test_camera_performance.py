@@ -94,59 +94,48 @@ class TestCameraPerformance:
         print(f"  Savings: {((full_bandwidth - quarter_bandwidth) / full_bandwidth * 100):.1f}%")
 
     def test_exposure_limit_clamping(self, mock_camera):
-        """Test that auto exposure limits are properly clamped to camera max."""
+        """Test that the auto exposure limit is 30ms when the camera allows more."""
         controller = CameraController()
         controller.camera = mock_camera
+        mock_camera.ExposureTime.get_range.return_value = (100.0, 50000.0)
+        mock_camera.Gain.get_range.return_value = (0.0, 48.0)
 
-        # Mock ExposureAutoMax feature
-        mock_camera.ExposureAutoMax = Mock()
-        mock_camera.ExposureAutoMax.get_range.return_value = (100.0, 50000.0)
-        mock_camera.ExposureAutoMax.set = Mock()
-
-        # Enable auto exposure (should set 30ms limit)
+        # Enable auto exposure (should keep the 30ms limit)
         controller.set_auto_exposure(True)
 
-        # Verify limit was set to 30ms (within camera's 50ms max)
-        mock_camera.ExposureAutoMax.set.assert_called_once()
-        set_value = mock_camera.ExposureAutoMax.set.call_args[0][0]
-        assert set_value == 30000.0, f"Should set 30ms limit, got {set_value}µs"
+        assert controller.auto_exposure.max_exposure_us == 30000.0
+        assert controller.auto_exposure.max_gain_db == 24.0
 
     def test_exposure_limit_clamps_to_camera_max(self, mock_camera):
         """Test that exposure limit doesn't exceed camera's maximum."""
         controller = CameraController()
         controller.camera = mock_camera
 
-        # Mock ExposureAutoMax with LOW maximum (e.g., 20ms)
-        mock_camera.ExposureAutoMax = Mock()
-        mock_camera.ExposureAutoMax.get_range.return_value = (100.0, 20000.0)
-        mock_camera.ExposureAutoMax.set = Mock()
+        # Camera with a LOW maximum (e.g., 20ms)
+        mock_camera.ExposureTime.get_range.return_value = (100.0, 20000.0)
+        mock_camera.Gain.get_range.return_value = (0.0, 12.0)
 
-        # Enable auto exposure (should clamp to 20ms, not 30ms)
+        # Enable auto exposure and gain (should clamp to 20ms / 12 dB)
         controller.set_auto_exposure(True)
+        controller.set_auto_gain(True)
 
-        # Verify limit was clamped to camera's 20ms maximum
-        mock_camera.ExposureAutoMax.set.assert_called_once()
-        set_value = mock_camera.ExposureAutoMax.set.call_args[0][0]
-        assert set_value == 20000.0, f"Should clamp to camera max 20ms, got {set_value}µs"
+        assert controller.auto_exposure.max_exposure_us == 20000.0
+        assert controller.auto_exposure.max_gain_db == 12.0
 
-    def test_multiple_feature_name_fallback(self, mock_camera):
-        """Test that multiple feature names are tried for compatibility."""
+    def test_camera_auto_modes_switched_off(self, mock_camera):
+        """Test the camera's own auto modes are off while software auto exposure runs."""
         controller = CameraController()
         controller.camera = mock_camera
+        mock_camera.ExposureTime.get_range.return_value = (100.0, 100000.0)
+        mock_camera.Gain.get_range.return_value = (0.0, 24.0)
 
-        # First 3 features don't exist, 4th one works
-        mock_camera.ExposureAutoUpperLimit = None
-        mock_camera.ExposureAutoMax = None
-        mock_camera.ExposureAutoLimitMax = None
-        mock_camera.ExposureTimeUpperLimit = Mock()
-        mock_camera.ExposureTimeUpperLimit.get_range.return_value = (100.0, 100000.0)
-        mock_camera.ExposureTimeUpperLimit.set = Mock()
-
-        # Enable auto exposure
-        controller.set_auto_exposure(True)
+        assert controller.set_auto_exposure(True)
+        assert controller.set_auto_gain(True)
 
-        # Should have tried multiple names and succeeded with 4th one
-        mock_camera.ExposureTimeUpperLimit.set.assert_called_once()
+        mock_camera.ExposureAuto.set.assert_called_once_with("Off")
+        mock_camera.GainAuto.set.assert_called_once_with("Off")
+        assert controller.auto_exposure.exposure_enabled
+        assert controller.auto_exposure.gain_enabled
 
     @pytest.mark.parametrize(
         "display_scale,expected_width,expected_height",
@@ -213,23 +202,22 @@ class TestCameraThreadSafety:
         # The lock prevents race conditions
         assert len(errors) == 0 or all("not connected" in str(e).lower() for e in errors)
 
-    def test_auto_polling_timer_starts_stops(self, qtbot):
-        """Test that auto value polling timer starts/stops correctly."""
+    def test_auto_exposure_needs_no_gui_polling(self):
+        """Test auto exposure runs in the stream thread without a GUI polling timer."""
         controller = CameraController()
+        controller.camera = Mock()
+        controller.camera.ExposureTime.get.return_value = 10000.0
+        controller.camera.ExposureTime.get_range.return_value = (100.0, 100000.0)
+        controller.camera.Gain.get.return_value = 0.0
+        controller.camera.Gain.get_range.return_value = (0.0, 24.0)
 
-        # Initially, polling timer should be stopped
-        assert not controller._auto_polling_timer.isActive()
-
-        # Enable auto exposure (should start timer)
-        controller._auto_exposure_enabled = True
-        controller._update_auto_polling()
-        assert controller._auto_polling_timer.isActive()
+        controller.set_auto_exposure(True)
+        assert controller.auto_exposure.enabled
+        assert not hasattr(controller, "_auto_polling_timer")
 
-        # Disable auto exposure (should stop timer)
-        controller._auto_exposure_enabled = False
-        controller._auto_gain_enabled = False
-        controller._update_auto_polling()
-        assert not controller._auto_polling_timer.isActive()
+        # Disable auto exposure (stream thread stops adjusting)
+        controller.set_auto_exposure(False)
+        assert not controller.auto_exposure.enabled
 
 
 class TestCameraIntegration:
@@ -7,11 +7,14 @@ and report generation.
 Created: 2025-11-01
 """
 
+import json
+import os
 from pathlib import Path
 
 import pytest
 
 from src.utils.connection_parser import (
+    PARALLEL_MIN_FILES,
     ConnectionAnalyzer,
     ConnectionParser,
     ParsedConnection,
@@ -303,6 +306,131 @@ def test_save_markdown_report(temp_python_file, simple_connection_code, tmp_path
     assert content == markdown
 
 
+def test_generate_json_report(temp_python_file, simple_connection_code):
+    """Test JSON report generation."""
+    file_path = temp_python_file(simple_connection_code)
+    analyzer = ConnectionAnalyzer()
+    analyzer.analyze_file(str(file_path))
+
+    data = json.loads(analyzer.generate_json_report())
+
+    assert data["total_connections"] == analyzer.report.total_connections
+    assert data["files_analyzed"] == 1
+    connections = data["connections_by_file"][str(file_path)]
+    assert [c["line_number"] for c in connections] == sorted(c["line_number"] for c in connections)
+    assert connections[0]["signal_name"] == "clicked"
+
+
+def test_reanalyzing_file_replaces_result(temp_python_file, simple_connection_code):
+    """Test analyzing the same file twice does not double-count its connections."""
+    file_path = temp_python_file(simple_connection_code)
+    analyzer = ConnectionAnalyzer()
+    analyzer.analyze_file(str(file_path))
+    counts = dict(analyzer.report.connections_by_type)
+
+    analyzer.analyze_file(str(file_path))
+
+    assert analyzer.report.connections_by_type == counts
+    assert analyzer.report.total_connections == sum(counts.values())
+
+
+# ============================================================================
+# Cache and Parallel Analysis Tests
+# ============================================================================
+
+
+def _write_files(directory: Path, code: str, count: int) -> list:
+    """Write count copies of code as file_NN.py."""
+    files = []
+    for index in range(count):
+        file_path = directory / f"file_{index:02d}.py"
+        file_path.write_text(code, encoding="utf-8")
+        files.append(file_path)
+    return files
+
+
+def test_cache_skips_unchanged_files(tmp_path, simple_connection_code):
+    """Test a second run reuses cached results and produces the same report."""
+    source_dir = tmp_path / "src"
+    source_dir.mkdir()
+    _write_files(source_dir, simple_connection_code, 3)
+    cache_file = tmp_path / "cache.json"
+
+    first = ConnectionAnalyzer(cache_file=str(cache_file))
+    first.analyze_directory(str(source_dir))
+    second = ConnectionAnalyzer(cache_file=str(cache_file))
+    second.analyze_directory(str(source_dir))
+
+    assert cache_file.exists()
+    assert second.cache.hits == 3
+    assert second.cache.misses == 0
+    assert second.generate_json_report() == first.generate_json_report()
+    assert second.generate_markdown_report() == first.generate_markdown_report()
+
+
+def test_cache_reparses_changed_file_only(tmp_path, simple_connection_code):
+    """Test edited files are re-parsed while touched-but-identical files are not."""
+    source_dir = tmp_path / "src"
+    source_dir.mkdir()
+    edited, touched, _ = _write_files(source_dir, simple_connection_code, 3)
+    cache_file = tmp_path / "cache.json"
+    ConnectionAnalyzer(cache_file=str(cache_file)).analyze_directory(str(source_dir))
+
+    edited.write_text(simple_connection_code + "\nx.done.connect(y.finish)\n", encoding="utf-8")
+    stat = touched.stat()
+    os.utime(touched, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+    analyzer = ConnectionAnalyzer(cache_file=str(cache_file))
+    report = analyzer.analyze_directory(str(source_dir))
+
+    assert analyzer.cache.hits == 2
+    assert analyzer.cache.misses == 1
+    assert len(report.connections_by_file[str(edited)]) == 4
+    assert len(report.connections_by_file[str(touched)]) == 3
+
+
+def test_cache_drops_deleted_files(tmp_path, simple_connection_code):
+    """Test cache entries of deleted files are pruned."""
+    source_dir = tmp_path / "src"
+    source_dir.mkdir()
+    files = _write_files(source_dir, simple_connection_code, 2)
+    cache_file = tmp_path / "cache.json"
+    ConnectionAnalyzer(cache_file=str(cache_file)).analyze_directory(str(source_dir))
+
+    files[1].unlink()
+    ConnectionAnalyzer(cache_file=str(cache_file)).analyze_directory(str(source_dir))
+
+    entries = json.loads(cache_file.read_text(encoding="utf-8"))["files"]
+    assert list(entries) == [str(files[0].resolve())]
+
+
+def test_corrupt_cache_is_ignored(tmp_path, simple_connection_code):
+    """Test an unreadable cache file is replaced instead of failing the analysis."""
+    (tmp_path / "test.py").write_text(simple_connection_code, encoding="utf-8")
+    cache_file = tmp_path / "cache.json"
+    cache_file.write_text("{not json", encoding="utf-8")
+
+    analyzer = ConnectionAnalyzer(cache_file=str(cache_file))
+    report = analyzer.analyze_directory(str(tmp_path), pattern="test.py")
+
+    assert report.total_connections == 3
+    assert json.loads(cache_file.read_text(encoding="utf-8"))["files"]
+
+
+def test_parallel_matches_sequential(tmp_path, simple_connection_code, complex_connection_code):
+    """Test process-pool analysis gives the same report as in-process parsing."""
+    _write_files(tmp_path, simple_connection_code, PARALLEL_MIN_FILES)
+    (tmp_path / "complex.py").write_text(complex_connection_code, encoding="utf-8")
+
+    sequential = ConnectionAnalyzer(max_workers=1)
+    sequential.analyze_directory(str(tmp_path))
+    parallel = ConnectionAnalyzer(max_workers=2)
+    parallel.analyze_directory(str(tmp_path))
+
+    assert parallel.report.total_connections == 3 * PARALLEL_MIN_FILES + 4
+    assert parallel.generate_json_report() == sequential.generate_json_report()
+
+
 # ============================================================================
 # Real File Tests (Integration)
 # ============================================================================
@@ -0,0 +1,186 @@
+"""
+Unit tests for the event log block index and query engine.
+
+Tests incremental indexing by EventLogger, sidecars across rotation,
+block pruning and queries spanning rotated and active files.
+"""
+
+import json
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from core.event_log_index import (  # noqa: E402
+    EventLogQuery,
+    EventQuery,
+    SegmentIndex,
+    index_path,
+)
+from core.event_logger import EventLogger, EventSeverity, EventType  # noqa: E402
+
+
+def _event(n: int, start: datetime = datetime(2025, 1, 1)) -> dict:
+    """Event n of a synthetic log (session n // 100, every 50th critical)."""
+    return {
+        "timestamp": (start + timedelta(seconds=n)).isoformat(),
+        "event_type": "laser_on" if n % 50 == 0 else "system_startup",
+        "severity": "critical" if n % 50 == 0 else "info",
+        "description": f"event {n}",
+        "session_id": n // 100,
+        "tech_id": 1,
+    }
+
+
+def _write_log(path: Path, events: range) -> None:
+    with open(path, "a", encoding="utf-8") as f:
+        for n in events:
+            f.write(json.dumps(_event(n)) + "\n")
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    """events.jsonl with 1000 events in one rotated file and 500 in the active file."""
+    _write_log(tmp_path / "events_2025-01-01_00-00-00-000000.jsonl", range(1000))
+    _write_log(tmp_path / "events.jsonl", range(1000, 1500))
+    return tmp_path / "events.jsonl"
+
+
+@pytest.fixture
+def event_logger(tmp_path):
+    """Event logger rotating every ~20KB."""
+    return EventLogger(
+        db_manager=MagicMock(),
+        log_file=tmp_path / "logs" / "events.jsonl",
+        rotation_size_mb=0.02,
+        enable_cleanup=False,
+    )
+
+
+def test_index_blocks_cover_segment(log_file):
+    """Test blocks are contiguous, cover the whole file and count every line."""
+    index = SegmentIndex.for_segment(log_file, block_bytes=4096)
+
+    assert index.size == log_file.stat().st_size
+    assert index.blocks[0].offset == 0
+    assert all(a.end == b.offset for a, b in zip(index.blocks, index.blocks[1:]))
+    assert sum(block.count for block in index.blocks) == 500
+
+
+def test_index_ignores_partial_line(tmp_path):
+    """Test a line still being written is left for the next catch-up."""
+    segment = tmp_path / "events.jsonl"
+    _write_log(segment, range(3))
+    with open(segment, "a", encoding="utf-8") as f:
+        f.write('{"timestamp": "2025')
+
+    index = SegmentIndex.for_segment(segment)
+    assert sum(block.count for block in index.blocks) == 3
+
+    with open(segment, "a", encoding="utf-8") as f:
+        f.write('-01-02T00:00:00"}\n')
+    assert index.catch_up() == 1
+
+
+def test_sidecar_round_trip(log_file):
+    """Test a saved sidecar loads with the same blocks."""
+    index = SegmentIndex.for_segment(log_file, save=True, block_bytes=4096)
+    loaded = SegmentIndex.load(log_file)
+
+    assert loaded is not None
+    assert [b.to_json() for b in loaded.blocks] == [b.to_json() for b in index.blocks]
+
+
+def test_sidecar_for_replaced_file_is_ignored(log_file):
+    """Test a sidecar covering more bytes than its file is not used."""
+    SegmentIndex.for_segment(log_file, save=True)
+    log_file.write_text("")
+
+    assert SegmentIndex.load(log_file) is None
+
+
+def test_query_matches_full_scan(log_file):
+    """Test indexed queries return exactly the events a full scan would, in order."""
+    logs = EventLogQuery(log_file)
+    everything = list(logs.query())
+    assert [e["description"] for e in everything] == [f"event {n}" for n in range(1500)]
+
+    query = EventQuery(
+        start=datetime(2025, 1, 1) + timedelta(seconds=300),
+        min_severity="warning",
+        session_ids={3, 12},
+    )
+    expected = [e for e in everything if query.matches(e)]
+    assert [e["description"] for e in logs.query(query)] == [
+        "event 300",
+        "event 350",
+        "event 1200",
+        "event 1250",
+    ]
+    assert list(logs.query(query)) == expected
+
+
+def test_query_keywords(log_file):
+    """Test EventQuery fields can be passed as keywords."""
+    logs = EventLogQuery(log_file)
+
+    assert logs.count(event_types=["laser_on"]) == 30
+    assert logs.count(session_ids=[14]) == 100
+    assert logs.count(end=datetime(2025, 1, 1, 0, 0, 9)) == 10
+
+
+def test_query_prunes_blocks(log_file):
+    """Test a selective query only scans the blocks that can match."""
+    for segment in (log_file, log_file.with_name("events_2025-01-01_00-00-00-000000.jsonl")):
+        SegmentIndex.for_segment(segment, save=True, block_bytes=2048)
+    logs = EventLogQuery(log_file)
+
+    plan = logs.plan(EventQuery(session_ids={7}))
+    scanned = sum(end - start for _, start, end in plan)
+
+    assert 0 < scanned < log_file.stat().st_size / 2
+    assert logs.count(session_ids={7}) == 100
+
+
+def test_query_builds_missing_rotated_sidecar(log_file):
+    """Test a rotated file without a sidecar is indexed and saved by the first query."""
+    rotated = log_file.with_name("events_2025-01-01_00-00-00-000000.jsonl")
+    EventLogQuery(log_file).count()
+
+    assert index_path(rotated).exists()
+    assert not index_path(log_file).exists()  # Active sidecar belongs to EventLogger
+
+
+def test_logger_indexes_incrementally(event_logger):
+    """Test the logger's in-memory index tracks every append."""
+    for i in range(20):
+        event_logger.log_event(EventType.SYSTEM_STARTUP, f"event {i}")
+
+    assert event_logger._index.size == event_logger.log_file.stat().st_size
+    assert sum(block.count for block in event_logger._index.blocks) == 20
+
+
+def test_logger_rotation_keeps_index(event_logger):
+    """Test rotated files get complete sidecars and queries span every file."""
+    event_logger.set_session(session_id=7, tech_id=1)
+    for i in range(300):
+        severity = EventSeverity.CRITICAL if i % 100 == 0 else EventSeverity.INFO
+        event_logger.log_event(EventType.SYSTEM_STARTUP, f"event {i}", severity=severity)
+
+    log_dir = event_logger.log_file.parent
+    rotated = sorted(log_dir.glob("events_*.jsonl"))
+    assert rotated
+    for segment in rotated:
+        index = SegmentIndex.load(segment)
+        assert index is not None and index.size == segment.stat().st_size
+
+    events = list(event_logger.query_events(session_ids={7}))
+    assert [e["description"] for e in events] == [f"event {i}" for i in range(300)]
+    critical = event_logger.query_events(min_severity="critical")
+    assert [e["description"] for e in critical] == ["event 0", "event 100", "event 200"]
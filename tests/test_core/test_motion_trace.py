@@ -0,0 +1,245 @@
+"""
+Tests for actuator motion trace analysis and capture during line protocols.
+
+Tests planned trajectory, tracking error, settling time and overshoot
+calculations, trace persistence, and trace capture by the line-based
+protocol engine using a mock actuator.
+"""
+
+import asyncio
+import json
+import sys
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from core.line_protocol_engine import (  # noqa: E402
+    MOTION_TRACE_SETTLE_TIME,
+    LineBasedProtocolEngine,
+)
+from core.motion_trace import (  # noqa: E402
+    MOTION_METRICS_FILENAME,
+    MOTION_TRACE_FILENAME,
+    MotionTrace,
+    analyze_motion_trace,
+    planned_trajectory,
+    save_motion_traces,
+)
+from core.protocol_line import (  # noqa: E402
+    HomeParams,
+    LineBasedProtocol,
+    MoveParams,
+    ProtocolLine,
+)
+
+
+def make_trace(position_um, time_ms=None, start_um=0.0, target_um=1000.0, speed=1000.0):
+    """Build a trace sampled every 10 ms unless times are given."""
+    position_um = np.asarray(position_um, dtype=float)
+    if time_ms is None:
+        time_ms = np.arange(position_um.size) * 10.0
+    return MotionTrace(
+        line_number=1,
+        loop_iteration=1,
+        start_um=start_um,
+        target_um=target_um,
+        speed_um_per_s=speed,
+        tolerance_um=5.0,
+        time_ms=np.asarray(time_ms, dtype=float),
+        position_um=position_um,
+    )
+
+
+class TestPlannedTrajectory:
+    """Test the constant-speed reference trajectory."""
+
+    def test_ramps_then_holds_target(self):
+        """Test planned position ramps at speed and holds at target."""
+        planned = planned_trajectory(np.array([0.0, 500.0, 1000.0, 1500.0]), 0.0, 1000.0, 1000.0)
+        assert planned.tolist() == [0.0, 500.0, 1000.0, 1000.0]
+
+    def test_negative_direction(self):
+        """Test planned trajectory for a move towards lower positions."""
+        planned = planned_trajectory(np.array([0.0, 250.0, 2000.0]), 1000.0, 0.0, 2000.0)
+        assert planned.tolist() == [1000.0, 500.0, 0.0]
+
+
+class TestAnalyzeMotionTrace:
+    """Test per-line tracking metrics."""
+
+    def test_perfect_tracking(self):
+        """Test a trace that follows the plan exactly has zero error."""
+        time_ms = np.arange(0, 1200, 10.0)
+        trace = make_trace(planned_trajectory(time_ms, 0.0, 1000.0, 1000.0), time_ms)
+
+        metrics = analyze_motion_trace(trace)
+
+        assert metrics.max_tracking_error_um == pytest.approx(0.0)
+        assert metrics.overshoot_um == 0.0
+        assert metrics.settling_time_ms == pytest.approx(1000.0, abs=10.0)
+        assert metrics.planned_duration_ms == pytest.approx(1000.0)
+
+    def test_overshoot_and_settling(self):
+        """Test overshoot past the target and settling once back in tolerance."""
+        trace = make_trace([0, 500, 1000, 1040, 1010, 1003, 1001, 1000])
+
+        metrics = analyze_motion_trace(trace)
+
+        assert metrics.overshoot_um == pytest.approx(40.0)
+        assert metrics.overshoot_percent == pytest.approx(4.0)
+        assert metrics.settling_time_ms == pytest.approx(50.0)
+        assert metrics.final_error_um == pytest.approx(0.0)
+
+    def test_overshoot_for_negative_move(self):
+        """Test overshoot is measured in the direction of travel."""
+        trace = make_trace([1000, 500, -20, 0], start_um=1000.0, target_um=0.0)
+
+        assert analyze_motion_trace(trace).overshoot_um == pytest.approx(20.0)
+
+    def test_not_settled(self):
+        """Test settling time is None when the trace ends outside tolerance."""
+        trace = make_trace([0, 300, 600, 900])
+
+        metrics = analyze_motion_trace(trace)
+
+        assert metrics.settling_time_ms is None
+        assert metrics.final_error_um == pytest.approx(-100.0)
+
+    def test_empty_trace(self):
+        """Test an empty trace gives zero metrics."""
+        metrics = analyze_motion_trace(make_trace([]))
+
+        assert metrics.samples == 0
+        assert metrics.settling_time_ms is None
+
+
+class TestSaveMotionTraces:
+    """Test persisting traces with the session data."""
+
+    def test_save_writes_npz_and_json(self, tmp_path):
+        """Test traces and metrics are written to the session folder."""
+        trace = make_trace([0, 500, 1000])
+        metrics = analyze_motion_trace(trace)
+
+        metrics_path = save_motion_traces([trace], [metrics], tmp_path)
+
+        assert metrics_path == tmp_path / MOTION_METRICS_FILENAME
+        data = json.loads(metrics_path.read_text())
+        assert data["metrics"][0]["line_number"] == 1
+        with np.load(tmp_path / MOTION_TRACE_FILENAME) as arrays:
+            assert arrays["line1_loop1_position_um"].tolist() == [0, 500, 1000]
+
+    def test_nothing_to_save(self, tmp_path):
+        """Test no files are written without traces."""
+        assert save_motion_traces([], [], tmp_path) is None
+        assert not (tmp_path / MOTION_TRACE_FILENAME).exists()
+
+
+class TestEngineTraceCapture:
+    """Test trace capture around line protocol movements."""
+
+    @pytest.fixture
+    def actuator(self):
+        """Mock actuator that returns a settled trace for each move."""
+        actuator = MagicMock()
+        actuator.set_speed.return_value = True
+        actuator.set_position.return_value = True
+        actuator.start_motion_trace.return_value = True
+        actuator.position_tolerance_um = 5.0
+        actuator.stop_motion_trace.return_value = (
+            np.array([0.0, 10.0, 20.0, 30.0]),
+            np.array([0.0, 50.0, 100.0, 100.0]),
+        )
+        return actuator
+
+    @pytest.mark.asyncio
+    async def test_move_records_trace_and_metrics(self, actuator, tmp_path):
+        """Test each move line produces a trace, metrics and a log entry."""
+        engine = LineBasedProtocolEngine(actuator_controller=actuator)
+        engine.capture_motion_traces = True
+        protocol = LineBasedProtocol(
+            protocol_name="Trace",
+            version="1.0",
+            lines=[ProtocolLine(line_number=1, movement=MoveParams(0.1, 5.0))],
+        )
+
+        success, _ = await engine.execute_protocol(protocol)
+
+        assert success
+        actuator.start_motion_trace.assert_called_once()
+        assert len(engine.motion_metrics) == 1
+        assert engine.motion_metrics[0].settling_time_ms == pytest.approx(20.0)
+        assert engine.get_execution_summary()["motion_metrics"][0]["line_number"] == 1
+        assert any(entry["event"] == "motion_trace" for entry in engine.execution_log)
+        assert engine.save_motion_traces(tmp_path) is not None
+
+    @pytest.mark.asyncio
+    async def test_capture_disabled_by_default(self, actuator):
+        """Test no trace is captured unless capture is turned on."""
+        engine = LineBasedProtocolEngine(actuator_controller=actuator)
+        protocol = LineBasedProtocol(
+            protocol_name="NoTrace",
+            version="1.0",
+            lines=[ProtocolLine(line_number=1, movement=MoveParams(0.1, 5.0))],
+        )
+
+        await engine.execute_protocol(protocol)
+
+        actuator.start_motion_trace.assert_not_called()
+        assert engine.motion_metrics == []
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("movement", [MoveParams(0.1, 5.0), HomeParams(5.0)])
+    async def test_failed_motion_stops_trace(self, actuator, movement):
+        """Test a move the actuator reports as failed still ends trace capture."""
+        engine = LineBasedProtocolEngine(actuator_controller=actuator)
+        engine.capture_motion_traces = True
+        result = MagicMock(message="Position not reached")
+        result.__bool__.return_value = False
+        actuator.motion_future = Future()
+        actuator.motion_future.set_result(result)
+
+        with pytest.raises(RuntimeError, match="Actuator move failed"):
+            await engine._execute_movement(movement)
+
+        actuator.stop_motion_trace.assert_called_once()
+        assert engine.motion_metrics == []
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("movement", [MoveParams(0.1, 5.0), HomeParams(5.0)])
+    async def test_cancelled_motion_stops_trace(self, actuator, movement):
+        """Test a move cancelled mid-flight (stop, E-stop, line timeout) ends trace capture."""
+        engine = LineBasedProtocolEngine(actuator_controller=actuator)
+        engine.capture_motion_traces = True
+        engine.current_position_mm = 1.0
+        actuator.motion_future = Future()  # Never completes
+
+        task = asyncio.create_task(engine._execute_movement(movement))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        actuator.stop_motion_trace.assert_called_once()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("capture, settle", [(False, 0.0), (True, MOTION_TRACE_SETTLE_TIME)])
+    async def test_line_timing(self, actuator, capture, settle):
+        """Test only traced moves wait for settling (untraced timing is the move time)."""
+        engine = LineBasedProtocolEngine(actuator_controller=actuator)
+        engine.capture_motion_traces = capture
+        move_time = 0.1 / 5.0
+
+        start = time.monotonic()
+        await engine._execute_movement(MoveParams(0.1, 5.0))
+        elapsed = time.monotonic() - start
+
+        assert move_time + settle <= elapsed < move_time + settle + 0.1
@@ -0,0 +1,215 @@
+"""
+Tests for virtual-time protocol execution.
+
+Tests the virtual-time event loop (ordering, concurrency, timeouts), the
+engine clock used for log timestamps, and dry runs of line-based and
+action-based protocols reporting timing, energy and limit violations.
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from core.line_protocol_engine import LineBasedProtocolEngine  # noqa: E402
+from core.protocol import (  # noqa: E402
+    ActionType,
+    MoveActuatorParams,
+    Protocol,
+    ProtocolAction,
+    SetLaserPowerParams,
+    WaitParams,
+)
+from core.protocol_clock import (  # noqa: E402
+    ProtocolClock,
+    VirtualClock,
+    run_in_virtual_time,
+)
+from core.protocol_dry_run import DryRunLimits, dry_run_protocol  # noqa: E402
+from core.protocol_line import (  # noqa: E402
+    DwellParams,
+    HomeParams,
+    LaserRampParams,
+    LaserSetParams,
+    LineBasedProtocol,
+    MoveParams,
+    MoveType,
+    ProtocolLine,
+)
+
+
+class TestVirtualTimeLoop:
+    """Test the virtual-time event loop."""
+
+    def test_sleeps_complete_instantly_in_order(self):
+        """Test concurrent sleeps finish in virtual-time order without real waiting."""
+        finished = []
+
+        async def task(name, delay):
+            await asyncio.sleep(delay)
+            finished.append((name, asyncio.get_running_loop().time()))
+
+        async def main():
+            await asyncio.gather(task("long", 600.0), task("short", 0.5), task("mid", 300.0))
+
+        clock = VirtualClock()
+        start = time.perf_counter()
+        run_in_virtual_time(main(), clock)
+
+        assert time.perf_counter() - start < 1.0
+        assert finished == [("short", 0.5), ("mid", 300.0), ("long", 600.0)]
+        assert clock.time() == pytest.approx(600.0)
+
+    def test_timeouts_use_virtual_time(self):
+        """Test wait_for expires at the virtual deadline."""
+
+        async def main():
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(asyncio.sleep(100.0), timeout=5.0)
+            return asyncio.get_running_loop().time()
+
+        assert run_in_virtual_time(main()) == pytest.approx(5.0)
+
+    def test_clock_now_follows_virtual_time(self):
+        """Test now() is the start time plus virtual elapsed time."""
+        clock = VirtualClock()
+        clock.advance(90.0)
+        clock.advance(-5.0)  # Ignored
+
+        assert (clock.now() - clock.start).total_seconds() == pytest.approx(90.0)
+
+    def test_engine_defaults_to_wall_clock(self):
+        """Test engines keep the wall clock unless a clock is injected."""
+        assert type(LineBasedProtocolEngine().clock) is ProtocolClock
+
+
+class TestLineProtocolDryRun:
+    """Test dry runs of line-based protocols."""
+
+    def test_long_protocol_runs_in_virtual_time(self):
+        """Test a 10+ minute protocol completes quickly with matching virtual duration."""
+        protocol = LineBasedProtocol(
+            protocol_name="Long",
+            version="1.0",
+            lines=[
+                ProtocolLine(line_number=1, movement=MoveParams(10.0, 0.1)),
+                ProtocolLine(
+                    line_number=2,
+                    laser=LaserSetParams(2.0),
+                    dwell=DwellParams(100.0),
+                ),
+                ProtocolLine(line_number=3, laser=LaserRampParams(2.0, 0.0, 100.0)),
+                ProtocolLine(line_number=4, movement=HomeParams(speed_mm_per_s=0.1)),
+            ],
+            loop_count=2,
+        )
+
+        report = dry_run_protocol(protocol)
+
+        assert report.passed, report.summary()
+        assert report.duration_s == pytest.approx(protocol.calculate_total_duration(), abs=0.5)
+        assert report.duration_s >= 600.0
+        assert report.real_time_s < 5.0
+        assert report.line_durations_s["1.1"] == pytest.approx(100.0)
+        assert report.line_durations_s["2.4"] == pytest.approx(100.0)
+
+    def test_line_timeout_is_reported(self):
+        """Test a line longer than the engine's line timeout fails the dry run."""
+        protocol = LineBasedProtocol(
+            protocol_name="TooLong",
+            version="1.0",
+            lines=[ProtocolLine(line_number=1, dwell=DwellParams(200.0))],
+        )
+
+        report = dry_run_protocol(protocol)
+
+        assert not report.success
+        assert "timed out" in report.message
+        assert report.duration_s < 200.0
+
+    def test_energy_integrates_commanded_power(self):
+        """Test energy is power integrated over virtual time."""
+        protocol = LineBasedProtocol(
+            protocol_name="Energy",
+            version="1.0",
+            lines=[
+                ProtocolLine(line_number=1, laser=LaserSetParams(2.0), dwell=DwellParams(10.0)),
+                ProtocolLine(line_number=2, laser=LaserSetParams(0.0)),
+            ],
+        )
+
+        report = dry_run_protocol(protocol)
+
+        assert report.energy_joules == pytest.approx(20.0, rel=0.02)
+        assert report.peak_power_watts == pytest.approx(2.0)
+
+    def test_relative_moves_past_range_are_reported(self):
+        """Test accumulated relative moves that leave the travel range are violations."""
+        protocol = LineBasedProtocol(
+            protocol_name="Drift",
+            version="1.0",
+            lines=[
+                ProtocolLine(
+                    line_number=1,
+                    movement=MoveParams(8.0, 5.0, MoveType.RELATIVE),
+                )
+            ],
+            loop_count=3,
+        )
+
+        report = dry_run_protocol(protocol)
+
+        assert report.success
+        assert not report.passed
+        assert [v.kind for v in report.violations] == ["position"]
+        assert report.violations[0].value == pytest.approx(24000.0)
+        assert report.violations[0].line_number == 1
+        assert "Limit violations" in report.summary()
+
+    def test_custom_limits(self):
+        """Test limits can be tightened for a dry run."""
+        protocol = LineBasedProtocol(
+            protocol_name="Power",
+            version="1.0",
+            lines=[ProtocolLine(line_number=1, laser=LaserSetParams(3.0))],
+        )
+        limits = DryRunLimits(
+            min_position_um=0.0,
+            max_position_um=20000.0,
+            max_speed_um_per_s=5000.0,
+            max_power_watts=2.5,
+        )
+
+        report = dry_run_protocol(protocol, limits)
+
+        assert [v.kind for v in report.violations] == ["power"]
+        assert report.to_dict()["passed"] is False
+
+
+class TestActionProtocolDryRun:
+    """Test dry runs of action-based protocols."""
+
+    def test_action_protocol(self):
+        """Test the action-based engine runs in virtual time too."""
+        protocol = Protocol(
+            protocol_name="Actions",
+            version="1.0",
+            actions=[
+                ProtocolAction(1, ActionType.SET_LASER_POWER, SetLaserPowerParams(1.0)),
+                ProtocolAction(2, ActionType.WAIT, WaitParams(30.0)),
+                ProtocolAction(3, ActionType.MOVE_ACTUATOR, MoveActuatorParams(2500.0, 100.0)),
+            ],
+        )
+
+        report = dry_run_protocol(protocol)
+
+        assert report.success, report.message
+        assert report.duration_s == pytest.approx(40.1, abs=0.5)
+        assert report.energy_joules == pytest.approx(40.1, rel=0.02)
+        assert report.real_time_s < 5.0
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for SafetyWatchdog heartbeat thread.
+
+Tests dedicated heartbeat timing, GUI liveness gating (a frozen GUI must
+withhold heartbeats so the hardware watchdog trips), latency/jitter
+statistics, and critical failure handling.
+
+Uses a MagicMock GPIO controller and shortened intervals.
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from core.safety_watchdog import SafetyWatchdog  # noqa: E402
+
+
+@pytest.fixture
+def gpio():
+    """Provide connected mock GPIO controller with successful heartbeats."""
+    controller = MagicMock()
+    controller.is_connected = True
+    controller.send_watchdog_heartbeat.return_value = True
+    return controller
+
+
+@pytest.fixture
+def watchdog(qtbot, gpio):
+    """Provide watchdog with shortened timing (20ms heartbeat)."""
+    wd = SafetyWatchdog(gpio_controller=gpio)
+    wd.HEARTBEAT_INTERVAL_MS = 20
+    wd.LIVENESS_INTERVAL_MS = 5
+    wd.GUI_LIVENESS_TIMEOUT_MS = 60
+    wd.liveness_timer.setInterval(5)
+    yield wd
+    wd.stop()
+
+
+class TestHeartbeatThread:
+    """Test heartbeats are sent from the dedicated thread."""
+
+    def test_heartbeats_sent_off_gui_thread(self, qtbot, watchdog, gpio):
+        """Test heartbeats run on their own thread, not the caller's."""
+        threads = []
+        gpio.send_watchdog_heartbeat.side_effect = lambda: (
+            threads.append(threading.current_thread()) or True
+        )
+
+        assert watchdog.start() is True
+        qtbot.waitUntil(lambda: watchdog.heartbeat_count >= 3, timeout=2000)
+
+        assert all(t is not threading.main_thread() for t in threads)
+
+    def test_start_requires_connected_gpio(self, qtbot, gpio):
+        """Test watchdog refuses to start without a connected GPIO controller."""
+        gpio.is_connected = False
+        wd = SafetyWatchdog(gpio_controller=gpio)
+
+        assert wd.start() is False
+        assert wd.is_running is False
+
+    def test_stop_halts_heartbeats(self, qtbot, watchdog, gpio):
+        """Test no heartbeats are sent after stop()."""
+        watchdog.start()
+        qtbot.waitUntil(lambda: watchdog.heartbeat_count >= 2, timeout=2000)
+        watchdog.stop()
+
+        calls = gpio.send_watchdog_heartbeat.call_count
+        time.sleep(0.1)
+        assert gpio.send_watchdog_heartbeat.call_count == calls
+
+
+class TestGuiLiveness:
+    """Test heartbeats stop when the GUI thread stops processing events."""
+
+    def test_frozen_gui_withholds_heartbeat(self, qtbot, watchdog, gpio):
+        """Test heartbeats stop when GUI liveness goes stale."""
+        watchdog.start()
+        qtbot.waitUntil(lambda: watchdog.heartbeat_count >= 2, timeout=2000)
+
+        # Block the GUI thread (no event processing) for longer than the liveness timeout
+        time.sleep(0.2)
+        stats = watchdog.get_statistics()
+
+        assert stats["skipped_gui_stalled"] >= 1
+
+    def test_heartbeats_resume_after_gui_recovers(self, qtbot, watchdog, gpio):
+        """Test heartbeats resume once the GUI event loop runs again."""
+        watchdog.start()
+        time.sleep(0.2)  # Simulated GUI stall
+        count_after_stall = watchdog.heartbeat_count
+
+        qtbot.waitUntil(lambda: watchdog.heartbeat_count > count_after_stall + 2, timeout=2000)
+
+    def test_liveness_timeout_keeps_freeze_to_trip_within_hardware_timeout(self):
+        """Test the liveness wait is derived so a slow but live GUI never trips the watchdog."""
+        assert (
+            SafetyWatchdog.GUI_LIVENESS_TIMEOUT_MS
+            == SafetyWatchdog.HARDWARE_TIMEOUT_MS - SafetyWatchdog.HEARTBEAT_INTERVAL_MS
+        )
+
+    def test_freeze_to_trip_within_hardware_timeout(self, qtbot, gpio):
+        """Test no heartbeat follows a freeze, so the hardware trips within its timeout of it."""
+        wd = SafetyWatchdog(gpio_controller=gpio)
+        wd.HEARTBEAT_INTERVAL_MS = 50
+        wd.HARDWARE_TIMEOUT_MS = 100
+        wd.GUI_LIVENESS_TIMEOUT_MS = wd.HARDWARE_TIMEOUT_MS - wd.HEARTBEAT_INTERVAL_MS
+        wd.LIVENESS_INTERVAL_MS = 5
+        wd.liveness_timer.setInterval(5)
+        sent = []
+        gpio.send_watchdog_heartbeat.side_effect = lambda: sent.append(time.perf_counter()) or True
+
+        wd.start()
+        try:
+            # Freeze at different points of the heartbeat cycle
+            for delay_ms in (0, 10, 20, 30, 40):
+                count = len(sent)
+                qtbot.waitUntil(lambda: len(sent) > count, timeout=2000)
+                qtbot.wait(delay_ms)
+                frozen_at = time.perf_counter()
+                time.sleep(0.3)  # GUI thread blocked: no events processed
+
+                trip_at = sent[-1] + wd.HARDWARE_TIMEOUT_MS / 1000.0
+                # Allowance for the heartbeat thread waking on the last stamp
+                assert (trip_at - frozen_at) * 1000.0 <= wd.HARDWARE_TIMEOUT_MS + 10.0
+        finally:
+            wd.stop()
+
+    def test_simulate_freeze_stops_liveness(self, qtbot, watchdog):
+        """Test simulate_freeze() makes the heartbeat thread withhold heartbeats."""
+        watchdog.start()
+        watchdog.simulate_freeze()
+
+        qtbot.waitUntil(lambda: watchdog.skipped_gui_stalled >= 1, timeout=2000)
+
+
+class TestStatistics:
+    """Test heartbeat latency and jitter statistics."""
+
+    def test_latency_and_jitter_percentiles(self, qtbot, watchdog):
+        """Test statistics expose p50/p99/max for latency and jitter."""
+        watchdog.start()
+        qtbot.waitUntil(lambda: watchdog.heartbeat_count >= 5, timeout=2000)
+
+        stats = watchdog.get_statistics()
+
+        for key in ("heartbeat_latency_ms", "heartbeat_jitter_ms"):
+            assert set(stats[key]) == {"p50", "p99", "max"}
+            assert stats[key]["p50"] <= stats[key]["p99"] <= stats[key]["max"]
+        assert stats["max_heartbeat_gap_ms"] > 0
+        assert (
+            stats["min_margin_ms"] == stats["hardware_timeout_ms"] - stats["max_heartbeat_gap_ms"]
+        )
+
+    def test_slow_heartbeat_reflected_in_latency(self, qtbot, watchdog, gpio):
+        """Test send latency captures slow heartbeat round-trips."""
+
+        def slow_heartbeat():
+            time.sleep(0.03)
+            return True
+
+        gpio.send_watchdog_heartbeat.side_effect = slow_heartbeat
+        watchdog.start()
+        qtbot.waitUntil(lambda: watchdog.heartbeat_count >= 3, timeout=2000)
+
+        assert watchdog.get_statistics()["heartbeat_latency_ms"]["max"] >= 30.0
+
+
+class TestCriticalFailure:
+    """Test repeated heartbeat failures stop the watchdog."""
+
+    def test_three_failures_trigger_timeout_signal(self, qtbot, watchdog, gpio):
+        """Test 3 consecutive failures emit watchdog_timeout_detected on the GUI thread."""
+        gpio.send_watchdog_heartbeat.return_value = False
+
+        with qtbot.waitSignal(watchdog.watchdog_timeout_detected, timeout=2000):
+            watchdog.start()
+
+        assert watchdog.is_running is False
+        assert watchdog.failed_heartbeats >= 3
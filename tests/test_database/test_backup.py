@@ -0,0 +1,182 @@
+"""
+Tests for online backup: stepped database copy under concurrent writes,
+log segment copying by hash, verification and restore.
+"""
+
+import json
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from database.backup import (  # noqa: E402
+    BackupService,
+    backup_database,
+    restore_database,
+    verify_backup,
+)
+from database.db_manager import DatabaseManager  # noqa: E402
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    """Database with a few thousand safety log rows (a few hundred pages)."""
+    db = DatabaseManager(str(tmp_path / "data" / "tosca.db"))
+    db.initialize()
+    db.log_safety_events(
+        [{"event_type": "seed", "severity": "info", "description": "x" * 200}] * 3000
+    )
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def log_dir(tmp_path):
+    """Log directory with one rotated segment and the active one."""
+    logs = tmp_path / "data" / "logs"
+    logs.mkdir(parents=True)
+    (logs / "events_2025-01-01_00-00-00-000000.jsonl").write_text('{"n": 1}\n')
+    (logs / "events.jsonl").write_text('{"n": 2}\n')
+    return logs
+
+
+def safety_log_count(db_path):
+    """Rows in safety_log of a database file."""
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM safety_log").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_stepped_copy_while_writing(db_manager, tmp_path):
+    """Test the copy completes and is consistent while another thread keeps writing."""
+    stop = threading.Event()
+    written = []
+
+    def _writer():
+        while not stop.is_set():
+            written.append(db_manager.log_safety_event("live", "info", "during backup"))
+
+    writer = threading.Thread(target=_writer)
+    writer.start()
+    try:
+        pages = backup_database(
+            db_manager.db_path, tmp_path / "copy.db", pages_per_step=16, step_pause_s=0.001
+        )
+    finally:
+        stop.set()
+        writer.join()
+
+    assert pages > 16
+    assert written  # Writer was never blocked out
+    conn = sqlite3.connect(tmp_path / "copy.db")
+    assert conn.execute("PRAGMA integrity_check").fetchone()[0] == "ok"
+    assert conn.execute("SELECT COUNT(*) FROM safety_log").fetchone()[0] >= 3001
+    conn.close()
+
+
+def test_backup_copies_database_and_logs(db_manager, log_dir, tmp_path):
+    """Test a run writes a snapshot, copies every segment and records hashes."""
+    service = BackupService(db_manager.db_path, log_dir, tmp_path / "backups")
+
+    result = service.run_once()
+
+    manifest = json.loads((tmp_path / "backups" / "manifest.json").read_text())
+    assert result.success, result.message
+    assert manifest["databases"] == [result.database_file]
+    assert sorted(result.logs_copied) == [
+        "logs/events.jsonl",
+        "logs/events_2025-01-01_00-00-00-000000.jsonl",
+    ]
+    assert safety_log_count(tmp_path / "backups" / result.database_file) == 3001
+
+
+def test_unchanged_segments_skipped(db_manager, log_dir, tmp_path):
+    """Test only the segment that changed is copied on the next run."""
+    service = BackupService(db_manager.db_path, log_dir, tmp_path / "backups")
+    service.run_once()
+    with open(log_dir / "events.jsonl", "a") as f:
+        f.write('{"n": 3}\n')
+
+    result = service.run_once()
+
+    assert result.logs_copied == ["logs/events.jsonl"]
+    assert result.logs_unchanged == 1
+    assert (tmp_path / "backups" / "logs" / "events.jsonl").read_text().count("\n") == 2
+
+
+def test_old_snapshots_pruned(db_manager, log_dir, tmp_path):
+    """Test only keep_databases snapshots are kept."""
+    service = BackupService(db_manager.db_path, log_dir, tmp_path / "backups", keep_databases=1)
+    service.run_once()
+    time.sleep(1.1)  # Snapshot names have one-second resolution
+
+    result = service.run_once()
+
+    assert [p.name for p in (tmp_path / "backups" / "db").iterdir()] == [
+        Path(result.database_file).name
+    ]
+
+
+def test_verify_detects_tampering(db_manager, log_dir, tmp_path):
+    """Test verification passes on a fresh backup and flags a changed file."""
+    backup_dir = tmp_path / "backups"
+    BackupService(db_manager.db_path, log_dir, backup_dir).run_once()
+
+    assert verify_backup(backup_dir) == (True, [])
+    (backup_dir / "logs" / "events.jsonl").write_text("tampered\n")
+    ok, problems = verify_backup(backup_dir)
+    assert not ok
+    assert problems == ["logs/events.jsonl: hash mismatch"]
+
+
+def test_restore(db_manager, log_dir, tmp_path):
+    """Test a verified snapshot restores to a usable database."""
+    backup_dir = tmp_path / "backups"
+    BackupService(db_manager.db_path, log_dir, backup_dir).run_once()
+    target = tmp_path / "restored" / "tosca.db"
+    target.parent.mkdir()
+
+    restore_database(backup_dir, target)
+
+    restored = DatabaseManager(str(target))
+    restored.initialize()
+    assert len(restored.get_safety_logs(limit=5000)) == 3001
+    restored.close()
+
+
+def test_restore_refuses_corrupt_snapshot(db_manager, log_dir, tmp_path):
+    """Test a snapshot that no longer matches its hash is not restored."""
+    backup_dir = tmp_path / "backups"
+    result = BackupService(db_manager.db_path, log_dir, backup_dir).run_once()
+    with open(backup_dir / result.database_file, "r+b") as f:
+        f.seek(8192)
+        f.write(b"\xff" * 64)
+    target = tmp_path / "target.db"
+    target.write_bytes(b"original")
+
+    with pytest.raises(ValueError):
+        restore_database(backup_dir, target)
+    assert target.read_bytes() == b"original"
+
+
+def test_scheduled_backup(db_manager, log_dir, tmp_path):
+    """Test the service backs up on its own schedule."""
+    service = BackupService(db_manager.db_path, log_dir, tmp_path / "backups", interval_s=0.1)
+    service.start()
+    try:
+        deadline = time.monotonic() + 10
+        while service.last_result is None and time.monotonic() < deadline:
+            time.sleep(0.05)
+    finally:
+        service.stop()
+
+    assert service.last_result is not None and service.last_result.success
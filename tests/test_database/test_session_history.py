@@ -0,0 +1,124 @@
+"""
+Tests for session history queries: summary projections, keyset
+pagination, grouped session counts and the background pager.
+"""
+
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from database.db_manager import DatabaseManager  # noqa: E402
+from database.models import Session  # noqa: E402
+from database.session_history import SessionHistoryPager  # noqa: E402
+
+START = datetime(2025, 6, 1, 9, 0)
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    """Database with two subjects: A has 5 sessions, B has 2 (one shares a start time)."""
+    db = DatabaseManager(str(tmp_path / "test_history.db"))
+    db.initialize()
+    subject_a = db.create_subject("P-2025-0001", tech_id=1)
+    subject_b = db.create_subject("P-2025-0002", tech_id=1)
+    with db.get_session() as session:
+        for i in range(5):
+            session.add(
+                Session(
+                    subject_id=subject_a.subject_id,
+                    tech_id=1,
+                    start_time=START + timedelta(hours=i),
+                    status="completed",
+                    protocol_name="Ramp",
+                    protocol_data_snapshot='{"steps": []}',
+                )
+            )
+        for _ in range(2):
+            session.add(
+                Session(
+                    subject_id=subject_b.subject_id,
+                    tech_id=1,
+                    start_time=START + timedelta(hours=2),  # Same start time as an A session
+                    status="aborted",
+                )
+            )
+        session.commit()
+    db.subject_a, db.subject_b = subject_a, subject_b
+    yield db
+    db.close()
+
+
+def all_pages(db_manager, **kwargs):
+    """Page through summaries with the keyset cursor."""
+    pages, after = [], None
+    while True:
+        page = db_manager.get_session_summaries(after=after, **kwargs)
+        if not page:
+            return pages
+        pages.append(page)
+        after = page[-1].cursor
+
+
+def test_summary_columns(db_manager):
+    """Test summaries carry the joined subject code and technician name."""
+    latest = db_manager.get_session_summaries(limit=1)[0]
+
+    assert latest.subject_code == "P-2025-0001"
+    assert latest.technician_name == "System Administrator"
+    assert latest.start_time == START + timedelta(hours=4)
+    assert latest.protocol_name == "Ramp"
+    assert not hasattr(latest, "protocol_data_snapshot")
+
+
+def test_snapshot_loaded_on_demand(db_manager):
+    """Test the protocol snapshot is fetched separately."""
+    latest = db_manager.get_session_summaries(limit=1)[0]
+
+    assert db_manager.get_session_snapshot(latest.session_id) == '{"steps": []}'
+
+
+def test_keyset_pages_cover_every_session_once(db_manager):
+    """Test pages are disjoint, ordered newest first, including tied start times."""
+    pages = all_pages(db_manager, limit=2)
+    rows = [row for page in pages for row in page]
+
+    assert [len(page) for page in pages] == [2, 2, 2, 1]
+    assert len({row.session_id for row in rows}) == 7
+    assert [row.cursor for row in rows] == sorted((row.cursor for row in rows), reverse=True)
+
+
+def test_summaries_filter_by_subject(db_manager):
+    """Test the subject filter applies to every page."""
+    pages = all_pages(db_manager, subject_id=db_manager.subject_b.subject_id, limit=1)
+
+    assert [row.status for page in pages for row in page] == ["aborted", "aborted"]
+
+
+def test_grouped_session_counts(db_manager):
+    """Test counts for several subjects come back from one call."""
+    subject_c = db_manager.create_subject("P-2025-0003", tech_id=1)
+    ids = [db_manager.subject_a.subject_id, db_manager.subject_b.subject_id, subject_c.subject_id]
+
+    counts = db_manager.get_session_counts(ids)
+
+    assert counts == {ids[0]: 5, ids[1]: 2}
+    assert db_manager.get_subject_session_count(subject_c.subject_id) == 0
+
+
+def test_pager_fetches_in_background_until_exhausted(db_manager):
+    """Test the pager walks the history a page at a time."""
+    pager = SessionHistoryPager(db_manager, page_size=3)
+    try:
+        sizes = []
+        while not pager.exhausted:
+            sizes.append(len(pager.fetch_next().result(5)))
+    finally:
+        pager.shutdown()
+
+    assert sizes == [3, 3, 1]
@@ -0,0 +1,124 @@
+"""
+Tests for the SQLite storage profile: per-connection pragmas, durable
+safety event commits, Core inserts on the shared append connection and
+background WAL checkpoints.
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from database.db_manager import DatabaseManager  # noqa: E402
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    """Database with the default storage profile."""
+    db = DatabaseManager(str(tmp_path / "test_profile.db"))
+    db.initialize()
+    yield db
+    db.close()
+
+
+def pragma(conn, name):
+    """Current value of a pragma on a connection."""
+    return conn.execute(text(f"PRAGMA {name}")).scalar()
+
+
+def test_profile_applied_to_every_pooled_connection(db_manager):
+    """Test pragmas are set on each new connection, not only the first."""
+    with db_manager.engine.connect() as first, db_manager.engine.connect() as second:
+        for conn in (first, second):
+            assert pragma(conn, "journal_mode") == "wal"
+            assert pragma(conn, "synchronous") == 1  # NORMAL
+            assert pragma(conn, "foreign_keys") == 1
+            assert pragma(conn, "cache_size") == -16 * 1024
+            assert pragma(conn, "temp_store") == 2  # MEMORY
+
+
+def test_invalid_synchronous_rejected(tmp_path):
+    """Test an unknown synchronous level is rejected up front."""
+    with pytest.raises(ValueError):
+        DatabaseManager(str(tmp_path / "bad.db"), synchronous="SOMETIMES")
+
+
+def test_durable_event_restores_synchronous(db_manager):
+    """Test a critical event commits with FULL and the connection returns to NORMAL."""
+    log = db_manager.log_safety_event("e_stop_pressed", "critical", "E-stop")
+
+    conn = db_manager._append_connection()
+    assert log.log_id is not None
+    assert pragma(conn, "synchronous") == 1
+    assert db_manager.get_safety_logs(limit=1)[0].log_id == log.log_id
+
+
+def test_failed_insert_rolls_back(db_manager):
+    """Test a rejected row leaves the hot connection usable."""
+    with pytest.raises(Exception):
+        db_manager.log_safety_event("bad", "warning", "bad session", session_id=999)
+
+    assert db_manager.log_safety_event("ok", "info", "after failure").log_id is not None
+    assert pragma(db_manager._append_connection(), "synchronous") == 1
+
+
+def test_bulk_insert(db_manager):
+    """Test many rows are inserted in one call."""
+    rows = [
+        {"event_type": "bulk", "severity": "info", "description": f"row {i}"} for i in range(50)
+    ]
+
+    assert db_manager.log_safety_events(rows) == 50
+    assert len(db_manager.get_safety_logs(limit=100)) == 51  # Plus the initialization entry
+
+
+def test_short_lived_threads_do_not_exhaust_pool(db_manager):
+    """Test logging from more threads than the pool holds neither blocks nor leaks."""
+    db_manager.engine.pool._timeout = 2.0  # Fail fast instead of the 30 s default
+    errors = []
+
+    def log_once(i: int) -> None:
+        try:
+            severity = "critical" if i % 2 else "info"
+            db_manager.log_safety_event("thread", severity, f"thread {i}")
+        except Exception as e:  # pragma: no cover - reported below
+            errors.append(e)
+
+    for _ in range(2):  # Threads exit between rounds; their connections must not linger
+        threads = [threading.Thread(target=log_once, args=(i,)) for i in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10.0)
+
+    assert errors == []
+    assert len(db_manager.get_safety_logs(limit=100, min_severity="info")) == 41
+    assert db_manager.engine.pool.checkedout() == 1  # Only the shared append connection
+    assert pragma(db_manager._append_connection(), "synchronous") == 1
+
+
+def test_checkpoint_moves_wal_into_database(db_manager):
+    """Test a checkpoint copies the WAL frames written so far."""
+    db_manager.log_safety_events([{"event_type": "x", "severity": "info", "description": "x"}])
+
+    busy, wal_frames, checkpointed = db_manager.checkpoint()
+
+    assert busy == 0
+    assert wal_frames > 0 and checkpointed == wal_frames
+
+
+def test_close_truncates_wal(tmp_path):
+    """Test closing checkpoints and empties the WAL file."""
+    db = DatabaseManager(str(tmp_path / "close.db"), checkpoint_interval_s=0.05)
+    db.initialize()
+    db.log_safety_event("x", "info", "x")
+    db.close()
+
+    wal = tmp_path / "close.db-wal"
+    assert not wal.exists() or wal.stat().st_size == 0
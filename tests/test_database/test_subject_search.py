@@ -0,0 +1,137 @@
+"""
+Tests for subject lookup: indexed code search, recent subjects and the
+background searcher used by the session setup completer.
+"""
+
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from sqlalchemy import text  # noqa: E402
+
+from database.db_manager import DatabaseManager  # noqa: E402
+from database.models import Subject  # noqa: E402
+from database.subject_search import SubjectSearcher  # noqa: E402
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    """Database with subjects P-2024-0001..0003 and P-2025-0001..0012."""
+    db = DatabaseManager(str(tmp_path / "test_search.db"))
+    db.initialize()
+    codes = [f"P-2024-{n:04d}" for n in range(1, 4)] + [f"P-2025-{n:04d}" for n in range(1, 13)]
+    start = datetime(2025, 1, 1)
+    with db.get_session() as session:
+        for i, code in enumerate(codes):
+            session.add(
+                Subject(subject_code=code, created_date=start + timedelta(days=i), is_active=True)
+            )
+        session.commit()
+    yield db
+    db.close()
+
+
+def test_prefix_matches_in_code_order(db_manager):
+    """Test prefix search returns codes starting with the text, in order."""
+    results = db_manager.search_subjects("P-2025-000")
+
+    assert [r.subject_code for r in results] == [f"P-2025-{n:04d}" for n in range(1, 10)]
+
+
+def test_prefix_search_is_case_insensitive(db_manager):
+    """Test lower case input matches upper case codes."""
+    assert [r.subject_code for r in db_manager.search_subjects("p-2024")] == [
+        "P-2024-0001",
+        "P-2024-0002",
+        "P-2024-0003",
+    ]
+
+
+def test_substring_matches_follow_prefix_matches(db_manager):
+    """Test substring matches fill the results after prefix matches."""
+    results = db_manager.search_subjects("0001")
+
+    assert [r.subject_code for r in results] == ["P-2024-0001", "P-2025-0001"]
+
+
+def test_search_respects_limit(db_manager):
+    """Test no more than limit results are returned."""
+    assert len(db_manager.search_subjects("P-", limit=5)) == 5
+
+
+def test_search_escapes_wildcards(db_manager):
+    """Test LIKE wildcards in the input are matched literally."""
+    assert db_manager.search_subjects("%") == []
+    assert db_manager.search_subjects("_") == []
+
+
+def test_search_excludes_inactive(db_manager):
+    """Test deactivated subjects are only found when asked for."""
+    with db_manager.get_session() as session:
+        session.execute(
+            text("UPDATE subjects SET is_active = 0 WHERE subject_code = 'P-2024-0002'")
+        )
+        session.commit()
+
+    assert [r.subject_code for r in db_manager.search_subjects("P-2024")] == [
+        "P-2024-0001",
+        "P-2024-0003",
+    ]
+    assert len(db_manager.search_subjects("P-2024", include_inactive=True)) == 3
+
+
+def test_prefix_search_uses_index(db_manager):
+    """Test the prefix query is an index range scan, not a table scan."""
+    with db_manager.engine.connect() as conn:
+        plan = conn.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT subject_code FROM subjects "
+                "WHERE subject_code >= 'P-2025' AND subject_code < 'P-2026'"
+            )
+        ).all()
+
+    assert "USING" in str(plan) and "INDEX" in str(plan)
+
+
+def test_recent_subjects_newest_first(db_manager):
+    """Test recent subjects are ordered by creation date, newest first."""
+    recent = db_manager.get_recent_subjects(limit=3)
+
+    assert [r.subject_code for r in recent] == ["P-2025-0012", "P-2025-0011", "P-2025-0010"]
+
+
+def test_last_subject_code(db_manager):
+    """Test the highest code for a prefix is found, and None for an unused prefix."""
+    assert db_manager.get_last_subject_code("P-2024-") == "P-2024-0003"
+    assert db_manager.get_last_subject_code("P-2026-") is None
+
+
+def test_searcher_runs_in_background(db_manager):
+    """Test the searcher resolves a future with the search results."""
+    searcher = SubjectSearcher(db_manager, limit=2)
+    try:
+        results = searcher.search("P-2025").result(5)
+    finally:
+        searcher.shutdown()
+
+    assert [r.subject_code for r in results] == ["P-2025-0001", "P-2025-0002"]
+
+
+def test_searcher_caches_recent_until_invalidated(db_manager):
+    """Test the recent list is cached and reloaded after invalidate()."""
+    searcher = SubjectSearcher(db_manager, recent_limit=1)
+    try:
+        assert [r.subject_code for r in searcher.recent()] == ["P-2025-0012"]
+        db_manager.create_subject("P-2025-0013", tech_id=1)
+
+        assert [r.subject_code for r in searcher.recent()] == ["P-2025-0012"]
+        searcher.invalidate()
+        assert [r.subject_code for r in searcher.recent()] == ["P-2025-0013"]
+    finally:
+        searcher.shutdown()
@@ -0,0 +1,30 @@
+"""
+Tests for the database storage profile benchmark (scripts/db_benchmark.py).
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root, src and scripts to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+sys.path.insert(0, str(project_root / "scripts"))
+
+from db_benchmark import DbBenchmarkConfig, run_benchmark  # noqa: E402
+
+
+def test_short_run_reports_every_profile(tmp_path):
+    """Test a short run measures inserts, queries and backup impact."""
+    config = DbBenchmarkConfig(
+        events=20, durable_events=5, batch_size=10, subjects=20, sessions=50, queries=5
+    )
+
+    report = run_benchmark(config, tmp_path)
+
+    assert set(report["profiles"]) == {"legacy", "tuned"}
+    assert "batched_info_per_s" in report["profiles"]["tuned"]["inserts"]
+    assert "batched_info_per_s" not in report["profiles"]["legacy"]["inserts"]
+    for result in report["profiles"].values():
+        assert all(rate > 0 for rate in result["inserts"].values())
+        assert all(stats["count"] == 5 for stats in result["queries"].values())
+    assert report["profiles"]["tuned"]["backup"]["log_event_during_backup"]["count"] == 5
@@ -252,6 +252,87 @@ class TestAdvancedThreadSafety:
         assert len(errors) == 0
         assert len(signal_emissions) > 0
 
+    def test_audit_log_and_signals_outside_state_lock(self, qtbot, controller):
+        """Test event logging and signal slots run without the state lock held."""
+        ctrl, mock_serial = controller
+        mock_serial.readline.return_value = b"OK:MOTOR_SPEED:100\n"
+        lock_free_elsewhere = []
+
+        def lock_available_to_other_thread(*args, **kwargs):
+            # A slot or logger that waits on a worker needing the lock must not deadlock
+            acquired = []
+
+            def probe_lock():
+                acquired.append(ctrl._lock.acquire(timeout=0.5))
+                if acquired[0]:
+                    ctrl._lock.release()
+
+            probe = threading.Thread(target=probe_lock)
+            probe.start()
+            probe.join()
+            lock_free_elsewhere.append(acquired[0])
+
+        ctrl.event_logger = MagicMock()
+        ctrl.event_logger.log_event.side_effect = lock_available_to_other_thread
+        ctrl.smoothing_motor_changed.connect(lock_available_to_other_thread)
+
+        assert ctrl.start_smoothing_motor() is True
+        assert lock_free_elsewhere == [True, True]
+
+    def test_disconnect_signals_outside_command_lock(self, qtbot, controller):
+        """Test disconnect emits motor/laser signals and logs after releasing _command_lock."""
+        ctrl, mock_serial = controller
+        mock_serial.readline.side_effect = [b"OK:MOTOR_OFF\n", b"OK:LASER_OFF\n"]
+        lock_free_elsewhere = []
+
+        def command_lock_available(*args, **kwargs):
+            acquired = []
+
+            def probe_lock():
+                acquired.append(ctrl._command_lock.acquire(timeout=0.5))
+                if acquired[0]:
+                    ctrl._command_lock.release()
+
+            probe = threading.Thread(target=probe_lock)
+            probe.start()
+            probe.join()
+            lock_free_elsewhere.append(acquired[0])
+
+        ctrl.event_logger = MagicMock()
+        ctrl.event_logger.log_event.side_effect = command_lock_available
+        ctrl.smoothing_motor_changed.connect(command_lock_available)
+        ctrl.aiming_laser_changed.connect(command_lock_available)
+
+        ctrl.disconnect()
+
+        assert ctrl.is_connected is False
+        assert lock_free_elsewhere == [True, True, True, True]
+
+    def test_cached_reads_do_not_wait_for_lock(self, qtbot, controller):
+        """Test cached state getters return while another thread holds the locks."""
+        ctrl, mock_serial = controller
+        ctrl.photodiode_voltage = 1.25
+        holding = threading.Event()
+        release = threading.Event()
+
+        def hold_locks():
+            with ctrl._command_lock, ctrl._lock:
+                holding.set()
+                release.wait(2.0)
+
+        holder = threading.Thread(target=hold_locks)
+        holder.start()
+        holding.wait(1.0)
+        try:
+            start = time.perf_counter()
+            assert ctrl.get_photodiode_voltage() == 1.25
+            assert ctrl.get_status()["connected"] is True
+            assert ctrl.get_safety_status() is False
+            assert time.perf_counter() - start < 0.1
+        finally:
+            release.set()
+            holder.join()
+
 
 class TestIntegration:
     """Integration tests combining multiple GPIO operations."""
@@ -352,6 +352,33 @@ class TestVibrationDetection:
         assert len(level_signals) == 1
         assert level_signals[0] == pytest.approx(1.234, abs=0.001)
 
+    def test_unchanged_readings_not_re_emitted(self, qtbot, controller):
+        """Test identical poll readings publish no new snapshot and emit no signals."""
+        ctrl, mock_serial = controller
+
+        mock_serial.readline.side_effect = cycle(
+            [
+                b"VIBRATION:0.2\n",
+                b"PHOTODIODE:1.5\n",
+            ]
+        )
+        level_signals = []
+        voltage_signals = []
+        ctrl.vibration_level_changed.connect(level_signals.append)
+        ctrl.photodiode_voltage_changed.connect(voltage_signals.append)
+
+        ctrl._update_status()
+        snapshot = ctrl.snapshot
+        ctrl._update_status()
+        ctrl._update_status()
+        qtbot.wait(10)
+
+        assert ctrl.snapshot is snapshot
+        assert snapshot.photodiode_voltage == pytest.approx(1.5)
+        assert snapshot.photodiode_power_mw == pytest.approx(600.0)
+        assert len(level_signals) == 1
+        assert len(voltage_signals) == 1
+
     def test_get_vibration_level_command(self, qtbot, controller):
         """Test get_vibration_level() sends GET_VIBRATION_LEVEL command."""
         ctrl, mock_serial = controller
@@ -0,0 +1,76 @@
+"""
+Unit tests for camera acquisition profiles.
+
+Tests the built-in profiles and how a profile's ROI is placed on the
+sensor and aligned to the camera's feature increments.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from hardware.acquisition_profiles import (  # noqa: E402
+    ACQUISITION_PROFILES,
+    FULL_VIEW,
+    SPOT_TRACKING,
+    AcquisitionProfile,
+    sensor_roi,
+)
+
+
+class TestProfiles:
+    """Test the built-in acquisition profiles."""
+
+    def test_named_profiles(self):
+        """Test the full view, spot tracking and binned preview profiles exist."""
+        assert set(ACQUISITION_PROFILES) == {"full_view", "spot_tracking", "binned_preview"}
+        assert ACQUISITION_PROFILES["binned_preview"].binning == 2
+
+    def test_spot_tracking_runs_faster_than_full_view(self):
+        """Test the ROI profile asks for a higher rate with more buffers."""
+        assert SPOT_TRACKING.frame_rate >= 4 * FULL_VIEW.frame_rate
+        assert SPOT_TRACKING.buffer_count > FULL_VIEW.buffer_count
+        assert SPOT_TRACKING.display_scale == 1.0
+
+    def test_centred_on_clamps_to_sensor(self):
+        """Test moving the ROI centre keeps it on the sensor and leaves the original alone."""
+        moved = SPOT_TRACKING.centred_on(1.5, 0.25)
+
+        assert moved.roi_center == (1.0, 0.25)
+        assert moved.roi_size == SPOT_TRACKING.roi_size
+        assert SPOT_TRACKING.roi_center == (0.5, 0.5)
+
+
+class TestSensorRoi:
+    """Test sensor window placement."""
+
+    def test_full_frame(self):
+        """Test a profile without ROI uses the whole sensor."""
+        assert sensor_roi(FULL_VIEW, 1456, 1088) == (0, 0, 1456, 1088)
+
+    def test_centred_window(self):
+        """Test the window is centred on the requested point."""
+        assert sensor_roi(SPOT_TRACKING, 1456, 1088) == (568, 424, 320, 240)
+
+    def test_window_kept_on_sensor(self):
+        """Test a window centred near the edge is shifted back onto the sensor."""
+        corner = SPOT_TRACKING.centred_on(0.99, 0.0)
+        assert sensor_roi(corner, 1456, 1088) == (1136, 0, 320, 240)
+
+    def test_increments(self):
+        """Test size and offsets are rounded down to the feature increments."""
+        profile = AcquisitionProfile("test", "Test", roi_size=(301, 203), roi_center=(0.3, 0.3))
+
+        offset_x, offset_y, width, height = sensor_roi(profile, 1456, 1088, 8, 2, 8, 2)
+
+        assert (width, height) == (296, 202)
+        assert offset_x % 8 == 0 and offset_y % 2 == 0
+        assert abs(offset_x + width / 2 - 0.3 * 1456) < 8
+
+    def test_window_larger_than_binned_sensor(self):
+        """Test a window larger than the binned sensor is limited to it."""
+        profile = AcquisitionProfile("test", "Test", roi_size=(1000, 800), binning=2)
+        assert sensor_roi(profile, 728, 544) == (0, 0, 728, 544)
@@ -0,0 +1,166 @@
+"""
+Unit tests for the software auto-exposure / auto-gain controller.
+
+Tests ROI brightness statistics, the hysteresis band, settling after a
+write and how corrections are split between exposure time and gain.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from hardware.auto_exposure import (  # noqa: E402
+    AutoExposureConfig,
+    AutoExposureController,
+    measure_frame,
+)
+
+
+def scene(exposure_us: float, gain_db: float, reflectance: float = 0.01) -> np.ndarray:
+    """Uniform mono frame whose brightness is proportional to exposure x linear gain."""
+    level = reflectance * exposure_us * 10 ** (gain_db / 20.0)
+    return np.full((120, 160), min(255.0, level), dtype=np.uint8)
+
+
+def run_loop(controller: AutoExposureController, frames: int, **scene_kwargs) -> None:
+    """Feed the controller frames rendered with the settings it writes."""
+    for _ in range(frames):
+        controller.update(scene(controller.exposure_us, controller.gain_db, **scene_kwargs))
+
+
+class TestMeasureFrame:
+    """Test brightness statistics of the auto-exposure region."""
+
+    def test_roi_only(self):
+        """Test only the region of interest is measured."""
+        frame = np.zeros((100, 200), dtype=np.uint8)
+        frame[40:60, 90:110] = 200  # Bright spot in the middle
+
+        centre = measure_frame(frame, roi=(0.45, 0.4, 0.1, 0.2), decimation=1)
+        corner = measure_frame(frame, roi=(0.0, 0.0, 0.2, 0.2), decimation=1)
+
+        assert centre.level == 200
+        assert centre.mean == pytest.approx(200.0)
+        assert corner.level == 0
+
+    def test_percentile_and_saturation(self):
+        """Test the configured percentile and the clipped-pixel fraction."""
+        frame = np.tile(np.arange(256, dtype=np.uint8), (4, 1))
+
+        stats = measure_frame(frame, roi=None, decimation=1, percentile=50.0)
+        high = measure_frame(frame, roi=None, decimation=1, percentile=99.0)
+
+        assert stats.level == pytest.approx(127, abs=1)
+        assert high.level == pytest.approx(253, abs=1)
+        assert stats.saturated_fraction == pytest.approx(6 / 256)
+        assert stats.samples == 4 * 256
+
+    def test_colour_and_decimation(self):
+        """Test colour frames use the channel mean and decimation samples fewer pixels."""
+        frame = np.zeros((64, 64, 3), dtype=np.uint8)
+        frame[..., 2] = 240  # Red (BGR)
+
+        stats = measure_frame(frame, roi=None, decimation=4)
+
+        assert stats.level == 80
+        assert stats.samples == 16 * 16
+
+
+class TestAutoExposureController:
+    """Test the exposure/gain control loop."""
+
+    def test_disabled_does_nothing(self):
+        """Test no settings are produced while auto exposure/gain are off."""
+        controller = AutoExposureController()
+        assert controller.update(scene(1000.0, 0.0)) is None
+
+    def test_within_hysteresis_no_write(self):
+        """Test a level inside the hysteresis band causes no feature write."""
+        controller = AutoExposureController(AutoExposureConfig(target_level=100, hysteresis=0.1))
+        controller.exposure_enabled = True
+        controller.sync(10000.0, 0.0)  # Level 100 with the default scene
+
+        for _ in range(10):
+            assert controller.update(scene(10500.0, 0.0)) is None  # Level 105 (+5%)
+        assert controller.adjustments == 0
+
+    def test_exposure_converges(self):
+        """Test exposure converges on the target in a few steps."""
+        controller = AutoExposureController(AutoExposureConfig(target_level=100))
+        controller.exposure_enabled = True
+        controller.sync(1000.0, 0.0)  # Level 10: far too dark
+
+        run_loop(controller, 30)
+
+        assert controller.exposure_us == pytest.approx(10000.0, rel=0.1)
+        assert controller.gain_db == 0.0
+        assert controller.adjustments <= 8
+        assert controller.update(scene(controller.exposure_us, 0.0)) is None
+
+    def test_settle_frames_skip_measurement(self):
+        """Test frames right after a write are not measured."""
+        config = AutoExposureConfig(target_level=100, settle_frames=2)
+        controller = AutoExposureController(config)
+        controller.exposure_enabled = True
+        controller.sync(1000.0, 0.0)
+
+        step = controller.update(scene(1000.0, 0.0))
+        assert step is not None and step.exposure_us > 1000.0
+        assert step.gain_db is None  # Gain not under auto control
+
+        # Stale (still dark) frames while the new exposure takes effect
+        assert controller.update(scene(1000.0, 0.0)) is None
+        assert controller.update(scene(1000.0, 0.0)) is None
+        assert controller.update(scene(1000.0, 0.0)) is not None
+
+    def test_gain_added_after_exposure_limit(self):
+        """Test gain is raised only once exposure reaches its limit."""
+        config = AutoExposureConfig(target_level=100, max_exposure_us=5000.0)
+        controller = AutoExposureController(config)
+        controller.exposure_enabled = controller.gain_enabled = True
+        controller.sync(1000.0, 0.0)
+
+        run_loop(controller, 40)
+
+        assert controller.exposure_us == 5000.0
+        assert controller.gain_db == pytest.approx(6.0, abs=1.0)  # 2x brightness
+
+    def test_gain_removed_first_when_too_bright(self):
+        """Test gain is lowered before exposure when the scene gets brighter."""
+        controller = AutoExposureController(AutoExposureConfig(target_level=100))
+        controller.exposure_enabled = controller.gain_enabled = True
+        controller.sync(10000.0, 6.0)  # Level ~200
+
+        step = controller.update(scene(10000.0, 6.0))
+
+        assert step is not None
+        assert step.gain_db < 6.0
+        assert step.exposure_us is None or step.exposure_us == pytest.approx(10000.0)
+
+    def test_saturated_region_backs_off(self):
+        """Test a clipped region halves the light even though its level looks high."""
+        controller = AutoExposureController(AutoExposureConfig(target_level=254))
+        controller.exposure_enabled = True
+        controller.sync(30000.0, 0.0)
+
+        step = controller.update(scene(30000.0, 0.0))  # Fully clipped
+
+        assert step is not None
+        assert step.exposure_us == pytest.approx(15000.0)
+
+    def test_camera_limit_clamps_exposure(self):
+        """Test the camera's maximum exposure caps the configured limit."""
+        controller = AutoExposureController(AutoExposureConfig(target_level=200))
+        controller.exposure_enabled = True
+        controller.sync(1000.0, 0.0, max_exposure_us=8000.0)
+
+        run_loop(controller, 30)
+
+        assert controller.max_exposure_us == 8000.0
+        assert controller.exposure_us == 8000.0
@@ -0,0 +1,111 @@
+"""
+Unit tests for Bayer frame conversion.
+
+Tests that every camera Bayer pattern gives the right colours, both for
+the full-resolution demosaic and the reduced-resolution display path,
+and that display frames come out at the requested size.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from hardware.bayer import (  # noqa: E402
+    BAYER_PATTERNS,
+    bayer_pattern,
+    demosaic,
+    demosaic_superpixel,
+)
+from hardware.camera_controller import CameraStreamThread  # noqa: E402
+
+RGB = (200, 120, 40)
+
+
+def mosaic(pattern: str, height: int = 16, width: int = 24, rgb=RGB) -> np.ndarray:
+    """Bayer mosaic of a uniform colour for a 2x2 cell pattern such as "RGGB"."""
+    raw = np.empty((height, width), dtype=np.uint8)
+    values = {"R": rgb[0], "G": rgb[1], "B": rgb[2]}
+    for i, colour in enumerate(pattern):
+        raw[i // 2 :: 2, i % 2 :: 2] = values[colour]
+    return raw
+
+
+class PixelFormat:
+    """Stand-in for a vmbpy PixelFormat enum member."""
+
+    def __init__(self, name):
+        self.name = name
+
+
+@pytest.mark.parametrize("pixel_format", sorted(BAYER_PATTERNS))
+class TestPatterns:
+    """Test colour reproduction for each camera Bayer format."""
+
+    def test_full_demosaic(self, pixel_format):
+        """Test the full-resolution demosaic uses the camera's pattern."""
+        raw = mosaic(bayer_pattern(pixel_format))
+
+        rgb = demosaic(raw, bayer_pattern(pixel_format))
+
+        assert rgb.shape == (16, 24, 3)
+        assert tuple(rgb[8, 12]) == RGB
+
+    def test_superpixel(self, pixel_format):
+        """Test the display path gives the same colour at half resolution."""
+        raw = mosaic(bayer_pattern(PixelFormat(pixel_format)))[..., np.newaxis]
+
+        rgb = demosaic_superpixel(raw, bayer_pattern(pixel_format))
+
+        assert rgb.shape == (8, 12, 3)
+        assert rgb.flags["C_CONTIGUOUS"]
+        assert (rgb == RGB).all()
+
+
+class TestSuperpixel:
+    """Test the reduced-resolution display path."""
+
+    def test_greens_averaged(self):
+        """Test the two green samples of a cell are averaged without overflow."""
+        raw = mosaic("RGGB", 4, 4)
+        raw[0::2, 1::2] = 255
+        raw[1::2, 0::2] = 253
+
+        assert (demosaic_superpixel(raw, "RGGB")[..., 1] == 254).all()
+
+    @pytest.mark.parametrize(
+        "scale, size",
+        [(0.5, (544, 728)), (0.25, (272, 364)), (0.125, (136, 182)), (0.3, (326, 436))],
+    )
+    def test_output_size(self, scale, size):
+        """Test display frames match the size of the old resize-after-demosaic path."""
+        raw = mosaic("BGGR", 1088, 1456)
+
+        rgb = demosaic_superpixel(raw, "BGGR", scale)
+
+        assert rgb.shape == size + (3,)
+        assert tuple(rgb[size[0] // 2, size[1] // 2]) == RGB
+
+    def test_not_bayer(self):
+        """Test non-Bayer formats have no pattern."""
+        assert bayer_pattern("Mono8") is None
+        assert bayer_pattern(PixelFormat("Rgb8")) is None
+
+
+def test_stream_thread_display_frame():
+    """Test the stream thread builds Bayer display frames without a full demosaic."""
+    thread = CameraStreamThread(camera=None, controller=None, display_scale=0.25)
+    raw = mosaic("GRBG", 64, 96)
+
+    display = thread._display_frame(raw, PixelFormat("BayerGR8"))
+    full = thread._convert_pixel_format(raw, PixelFormat("BayerGR8"))
+
+    assert display.shape == (16, 24, 3)
+    assert (display == RGB).all()
+    assert full.shape == (64, 96, 3)
+    assert tuple(full[32, 48]) == RGB
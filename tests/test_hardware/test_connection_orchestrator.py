@@ -0,0 +1,196 @@
+"""
+Test suite for the concurrent hardware connection orchestrator.
+
+Tests that devices connect in parallel on worker threads, that dependents
+wait for (and are skipped after failure of) their dependencies, that
+failures and exceptions are reported, and that controller timers can be
+started from a worker thread.
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from PyQt6.QtCore import QTimer
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from hardware.connection_orchestrator import (  # noqa: E402
+    ConnectionOrchestrator,
+    DeviceState,
+    StartupReport,
+)
+from utils.qt_timers import start_timer, stop_timer  # noqa: E402
+
+
+def slow_connect(delay_s, result=True, calls=None, name=None):
+    """Build a blocking connect() that records (name, start, end, thread)."""
+
+    def connect():
+        start = time.perf_counter()
+        time.sleep(delay_s)
+        if calls is not None:
+            calls.append((name, start, time.perf_counter(), threading.current_thread()))
+        return result
+
+    return connect
+
+
+def run(qtbot, orchestrator, timeout=5000):
+    """Start orchestrator and wait for its report."""
+    with qtbot.waitSignal(orchestrator.finished, timeout=timeout) as blocker:
+        assert orchestrator.start()
+    return blocker.args[0]
+
+
+class TestConcurrency:
+    """Test devices connect in parallel."""
+
+    def test_independent_devices_run_in_parallel(self, qtbot):
+        """Test total time is close to the slowest device, not the sum."""
+        orchestrator = ConnectionOrchestrator()
+        for name in ("camera", "actuator", "tec"):
+            orchestrator.add_device(name, slow_connect(0.3))
+
+        report = run(qtbot, orchestrator)
+
+        assert isinstance(report, StartupReport)
+        assert report.all_connected
+        assert report.serial_s >= 0.9
+        assert report.total_s < 0.75
+
+    def test_connects_off_the_calling_thread(self, qtbot):
+        """Test connect() calls run on worker threads."""
+        calls = []
+        orchestrator = ConnectionOrchestrator()
+        orchestrator.add_device("camera", slow_connect(0.0, calls=calls, name="camera"))
+
+        run(qtbot, orchestrator)
+
+        assert calls[0][3] is not threading.current_thread()
+
+
+class TestDependencies:
+    """Test dependency ordering and skipping."""
+
+    def test_dependent_starts_after_dependency(self, qtbot):
+        """Test laser connect starts only after GPIO connect finished."""
+        calls = []
+        orchestrator = ConnectionOrchestrator()
+        orchestrator.add_device("gpio", slow_connect(0.2, calls=calls, name="gpio"))
+        orchestrator.add_device(
+            "laser", slow_connect(0.0, calls=calls, name="laser"), depends_on=["gpio"]
+        )
+        orchestrator.add_device("camera", slow_connect(0.2, calls=calls, name="camera"))
+
+        report = run(qtbot, orchestrator)
+
+        timing = {name: (start, end) for name, start, end, _ in calls}
+        assert timing["laser"][0] >= timing["gpio"][1]
+        assert timing["camera"][0] < timing["gpio"][1]  # Not held back by GPIO
+        assert report.all_connected
+
+    def test_dependents_skipped_when_dependency_fails(self, qtbot):
+        """Test a failed dependency skips its dependents (transitively)."""
+        orchestrator = ConnectionOrchestrator()
+        orchestrator.add_device("gpio", slow_connect(0.0, result=False))
+        orchestrator.add_device("laser", slow_connect(0.0), depends_on=["gpio"])
+        orchestrator.add_device("aiming", slow_connect(0.0), depends_on=["laser"])
+        orchestrator.add_device("camera", slow_connect(0.0))
+        skipped = []
+        orchestrator.device_skipped.connect(lambda name, _reason: skipped.append(name))
+
+        report = run(qtbot, orchestrator)
+
+        states = {d.name: d.state for d in report.devices}
+        assert states == {
+            "gpio": DeviceState.FAILED,
+            "laser": DeviceState.SKIPPED,
+            "aiming": DeviceState.SKIPPED,
+            "camera": DeviceState.CONNECTED,
+        }
+        assert skipped == ["laser", "aiming"]
+        assert not report.all_connected
+
+    def test_unknown_dependency_rejected(self):
+        """Test dependencies must be registered first."""
+        orchestrator = ConnectionOrchestrator()
+
+        with pytest.raises(ValueError):
+            orchestrator.add_device("laser", slow_connect(0.0), depends_on=["gpio"])
+
+    def test_duplicate_device_rejected(self):
+        """Test device names are unique."""
+        orchestrator = ConnectionOrchestrator()
+        orchestrator.add_device("gpio", slow_connect(0.0))
+
+        with pytest.raises(ValueError):
+            orchestrator.add_device("gpio", slow_connect(0.0))
+
+
+class TestReporting:
+    """Test progress signals and the startup report."""
+
+    def test_exception_reported_as_failure(self, qtbot):
+        """Test an exception in connect() marks the device failed with the message."""
+
+        def broken():
+            raise OSError("could not open port 'COM99'")
+
+        orchestrator = ConnectionOrchestrator()
+        orchestrator.add_device("tec", broken)
+
+        report = run(qtbot, orchestrator)
+
+        assert report.devices[0].state == DeviceState.FAILED
+        assert "COM99" in report.devices[0].error
+        assert "COM99" in report.summary()
+
+    def test_progress_and_finished_signals(self, qtbot):
+        """Test progress counts every device and per-device results are emitted."""
+        orchestrator = ConnectionOrchestrator()
+        orchestrator.add_device("gpio", slow_connect(0.0))
+        orchestrator.add_device("camera", slow_connect(0.0, result=False))
+        progress = []
+        finished = []
+        orchestrator.progress.connect(lambda done, total: progress.append((done, total)))
+        orchestrator.device_finished.connect(
+            lambda name, success, _elapsed: finished.append((name, success))
+        )
+
+        run(qtbot, orchestrator)
+
+        assert progress[-1] == (2, 2)
+        assert sorted(finished) == [("camera", False), ("gpio", True)]
+        assert not orchestrator.is_running
+
+    def test_cannot_start_twice(self, qtbot):
+        """Test start() is refused while running."""
+        orchestrator = ConnectionOrchestrator()
+        orchestrator.add_device("camera", slow_connect(0.1))
+
+        with qtbot.waitSignal(orchestrator.finished, timeout=5000):
+            assert orchestrator.start()
+            assert orchestrator.start() is False
+
+
+class TestQtTimers:
+    """Test controller timers can be started from connect() on a worker thread."""
+
+    def test_start_and_stop_from_worker_thread(self, qtbot):
+        """Test start/stop are queued to the timer's thread."""
+        timer = QTimer()
+        timer.setInterval(10)
+
+        worker = threading.Thread(target=start_timer, args=(timer,))
+        worker.start()
+        worker.join()
+        qtbot.waitUntil(timer.isActive, timeout=1000)
+
+        worker = threading.Thread(target=stop_timer, args=(timer,))
+        worker.start()
+        worker.join()
+        qtbot.waitUntil(lambda: not timer.isActive(), timeout=1000)
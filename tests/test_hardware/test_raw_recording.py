@@ -0,0 +1,194 @@
+"""
+Unit tests for lossless raw recording.
+
+Tests the memory-mapped raw file (write, zero-copy read, truncated files),
+conversion of raw frames for encoding, background transcoding and the raw
+file retention policy.
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from hardware.raw_recording import (  # noqa: E402
+    RawFrameWriter,
+    RawRecording,
+    RawTranscoder,
+    prune_raw_recordings,
+    raw_to_bgr,
+    transcode_raw,
+)
+from hardware.video_index import FrameInfo, VideoFrameIndex, frame_index_path  # noqa: E402
+
+FRAME_PERIOD_NS = 5_000_000  # 200 FPS
+
+
+def record(path: Path, frame_ids, shape=(48, 64, 1), capacity=None, pixel_format="Mono8"):
+    """Raw recording whose frame n is filled with value n."""
+    writer = RawFrameWriter(path, shape, np.uint8, capacity or len(frame_ids), pixel_format)
+    start = time.monotonic_ns()
+    previous = None
+    for n, frame_id in enumerate(frame_ids):
+        dropped = frame_id - previous - 1 if previous is not None else 0
+        info = FrameInfo(frame_id, frame_id * FRAME_PERIOD_NS, start + n * 1000, dropped)
+        assert writer.write(np.full(shape, n, dtype=np.uint8), info)
+        previous = frame_id
+    writer.close()
+    return writer
+
+
+class TestRawFile:
+    """Test writing and reading the raw file."""
+
+    def test_round_trip(self, tmp_path):
+        """Test frames and their index are read back by frame number."""
+        path = tmp_path / "session.raw"
+        writer = record(path, [10, 11, 12, 14, 15], capacity=100)
+
+        recording = RawRecording(path)
+
+        assert len(recording) == 5
+        assert recording.frame_shape == (48, 64, 1)
+        assert recording.pixel_format == "Mono8"
+        assert int(recording[3][0, 0, 0]) == 3
+        info = recording.frame_info(3)
+        assert (info.frame_id, info.device_timestamp_ns, info.dropped_before) == (
+            14,
+            14 * FRAME_PERIOD_NS,
+            1,
+        )
+        assert recording.frames_dropped == 1
+        assert recording.frame_rate == pytest.approx(200.0)
+        assert recording.time_of(0) == pytest.approx(writer.anchor_wall_s, abs=0.01)
+
+    def test_frames_are_views(self, tmp_path):
+        """Test frame access maps the file instead of copying."""
+        path = tmp_path / "session.raw"
+        record(path, [1, 2, 3])
+
+        frame = RawRecording(path)[1]
+
+        assert not frame.flags["OWNDATA"]
+        assert not frame.flags["WRITEABLE"]
+
+    def test_unused_preallocation_trimmed(self, tmp_path):
+        """Test closing trims the file to the frames written."""
+        small = tmp_path / "small.raw"
+        large = tmp_path / "large.raw"
+        record(small, [1, 2], capacity=2)
+        record(large, [1, 2], capacity=1000)
+
+        assert os.path.getsize(large) - os.path.getsize(small) < 1000 * 32 + 4096
+
+    def test_full(self, tmp_path):
+        """Test writing stops at capacity."""
+        writer = RawFrameWriter(tmp_path / "full.raw", (4, 4), np.uint8, capacity=2)
+        frame = np.zeros((4, 4), np.uint8)
+
+        assert [writer.write(frame) for _ in range(3)] == [True, True, False]
+        writer.close()
+        assert len(RawRecording(tmp_path / "full.raw")) == 2
+
+    def test_size_change_rejected(self, tmp_path):
+        """Test a frame of a different size is rejected."""
+        writer = RawFrameWriter(tmp_path / "session.raw", (4, 4), np.uint8, capacity=2)
+        with pytest.raises(ValueError):
+            writer.write(np.zeros((8, 4), np.uint8))
+        writer.close()
+
+    def test_interrupted_recording_readable(self, tmp_path):
+        """Test a recording never closed (crash) reads up to its last committed frame."""
+        path = tmp_path / "crash.raw"
+        writer = RawFrameWriter(path, (4, 4), np.uint8, capacity=10)
+        for n in range(3):
+            writer.write(np.full((4, 4), n, np.uint8))
+        writer._mmap.flush()  # Data reaches the file; close() never runs
+
+        recording = RawRecording(path)
+
+        assert len(recording) == 3
+        assert int(recording[2][0, 0, 0]) == 2
+        writer.close()
+
+    def test_not_a_recording(self, tmp_path):
+        """Test other files are rejected."""
+        path = tmp_path / "other.raw"
+        path.write_bytes(b"\0" * 8192)
+        with pytest.raises(ValueError):
+            RawRecording(path)
+
+
+class TestConversion:
+    """Test conversion of raw frames for encoding."""
+
+    def test_bayer(self):
+        """Test Bayer frames are demosaiced with their pattern."""
+        raw = np.zeros((8, 8, 1), np.uint8)
+        raw[0::2, 0::2] = 200  # Red sites of BayerRG8
+
+        assert tuple(raw_to_bgr(raw, "BayerRG8")[4, 4]) == (0, 0, 200)
+
+    def test_rgb_and_mono(self):
+        """Test RGB frames are swapped to BGR and mono frames expanded."""
+        rgb = np.zeros((4, 4, 3), np.uint8)
+        rgb[..., 0] = 200
+
+        assert tuple(raw_to_bgr(rgb, "Rgb8")[0, 0]) == (0, 0, 200)
+        assert raw_to_bgr(np.full((4, 4, 1), 7, np.uint8), "Mono8").shape == (4, 4, 3)
+
+
+class TestTranscode:
+    """Test transcoding and retention."""
+
+    def test_transcode_keeps_frame_index(self, tmp_path):
+        """Test the video gets every frame and an index with the camera frame IDs."""
+        raw_path = tmp_path / "session.raw"
+        record(raw_path, [1, 2, 3, 5])
+
+        video_path = transcode_raw(raw_path, codec="mp4v", fallback_codec="MJPG")
+
+        capture = cv2.VideoCapture(str(video_path))
+        frames = int(capture.get(cv2.CAP_PROP_FRAME_COUNT))
+        capture.release()
+        index = VideoFrameIndex.load(frame_index_path(video_path))
+        assert video_path == tmp_path / "session.mp4"
+        assert frames == 4
+        assert index.camera_frame_ids == [1, 2, 3, 5]
+        assert index.start_time == pytest.approx(RawRecording(raw_path).time_of(0), abs=1e-3)
+
+    def test_background_transcode_deletes_raw(self, tmp_path):
+        """Test the transcoder writes the video and removes the raw file when asked."""
+        raw_path = tmp_path / "session.raw"
+        record(raw_path, [1, 2])
+        transcoder = RawTranscoder(codec="mp4v", delete_raw=True)
+
+        video_path = transcoder.submit(raw_path).result(30)
+        transcoder.shutdown()
+
+        assert video_path.exists()
+        assert not raw_path.exists()
+
+    def test_retention_only_removes_transcoded_old_files(self, tmp_path):
+        """Test retention deletes old raw files that have a video, and nothing else."""
+        for name in ("old_done", "old_pending", "new_done"):
+            (tmp_path / f"{name}.raw").write_bytes(b"raw")
+        for name in ("old_done", "new_done"):
+            (tmp_path / f"{name}.mp4").write_bytes(b"video")
+        old = time.time() - 10 * 86400
+        for name in ("old_done", "old_pending"):
+            os.utime(tmp_path / f"{name}.raw", (old, old))
+
+        deleted = prune_raw_recordings(tmp_path, max_age_days=7)
+
+        assert [p.name for p in deleted] == ["old_done.raw"]
+        assert (tmp_path / "old_pending.raw").exists()
+        assert (tmp_path / "new_done.raw").exists()
@@ -0,0 +1,266 @@
+"""
+Test suite for SerialTransport (shared ASCII serial transport).
+
+Tests request/response handling, priority lanes, per-command timeouts,
+latency statistics and controller integration using fake serial devices
+instead of physical hardware.
+"""
+
+import importlib
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import serial
+from PyQt6.QtCore import QCoreApplication
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from hardware.serial_transport import (  # noqa: E402
+    SerialTransport,
+    TransportClosedError,
+    TransportPriority,
+    TransportTimeoutError,
+)
+from tests.mocks import MockSerialDevice, PtySerialDevice  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    """Provide QCoreApplication for controller tests."""
+    app = QCoreApplication.instance()
+    if app is None:
+        app = QCoreApplication(sys.argv)
+    yield app
+
+
+@pytest.fixture
+def device():
+    """Provide in-memory fake device with a few canned responses."""
+    return MockSerialDevice(
+        responses={
+            "*IDN?": "Arroyo 4300 LaserSource",
+            "WDT_RESET": "OK:WDT_RESET",
+            "GET_STATUS": ["STATUS:", "MOTOR:OFF", "OK:STATUS"],
+        },
+        timeout=0.2,
+    )
+
+
+@pytest.fixture
+def transport(device):
+    """Provide started transport bound to the fake device."""
+    transport = SerialTransport(device, name="test")
+    transport.start()
+    yield transport
+    transport.stop()
+
+
+class TestRequests:
+    """Test basic request/response behaviour."""
+
+    def test_query_returns_response(self, transport, device):
+        """Test blocking request returns the stripped response line."""
+        assert transport.request("*IDN?") == "Arroyo 4300 LaserSource"
+        assert device.commands == ["*IDN?"]
+
+    def test_command_without_response(self, transport):
+        """Test set commands return empty string without reading."""
+        assert transport.request("LAS:OUT 0", expect_response=False) == ""
+
+    def test_multi_line_stops_at_terminator(self, transport):
+        """Test multi-line response is read up to the terminator line."""
+        response = transport.request(
+            "GET_STATUS", multi_line=True, is_terminator=lambda line: line.startswith("OK:")
+        )
+        assert response == "STATUS:\nMOTOR:OFF\nOK:STATUS"
+
+    def test_submit_returns_future(self, transport):
+        """Test non-blocking submit resolves to the response."""
+        future = transport.submit("WDT_RESET")
+        assert future.result(timeout=1.0) == "OK:WDT_RESET"
+
+    def test_port_exception_propagates_unchanged(self, transport, device):
+        """Test serial exceptions reach the caller with their original type."""
+        device.close()
+        with pytest.raises(serial.SerialException):
+            transport.request("*IDN?")
+
+    def test_flush_before_send_discards_stale_lines(self, device):
+        """Test stale input is discarded when flush_before_send is enabled."""
+        transport = SerialTransport(device, name="flush", flush_before_send=True)
+        transport.start()
+        try:
+            device.inject("STALE:RESPONSE")
+            assert transport.request("WDT_RESET") == "OK:WDT_RESET"
+        finally:
+            transport.stop()
+
+
+class TestPriorityAndTimeouts:
+    """Test priority lanes and timeout handling."""
+
+    def test_safety_request_jumps_queue(self):
+        """Test SAFETY requests are served before queued POLL requests."""
+        device = MockSerialDevice(handler=lambda cmd: f"OK:{cmd}", response_delay_s=0.05)
+        transport = SerialTransport(device, name="priority")
+        transport.start()
+        try:
+            # First request occupies the line while the rest queue up
+            first = transport.submit("BUSY")
+            time.sleep(0.01)
+            polls = [
+                transport.submit(f"POLL{i}", priority=TransportPriority.POLL) for i in range(3)
+            ]
+            heartbeat = transport.submit("WDT_RESET", priority=TransportPriority.SAFETY)
+
+            for future in [first, heartbeat, *polls]:
+                future.result(timeout=2.0)
+
+            assert device.commands[:2] == ["BUSY", "WDT_RESET"]
+        finally:
+            transport.stop()
+
+    def test_request_timeout(self):
+        """Test request raises TransportTimeoutError when the device is silent."""
+        device = MockSerialDevice(handler=lambda cmd: None, timeout=0.5)
+        transport = SerialTransport(device, name="silent")
+        transport.start()
+        try:
+            with pytest.raises(TransportTimeoutError):
+                transport.request("*IDN?", timeout_s=0.1)
+            assert transport.get_latency_statistics()["timeouts"] == 1
+        finally:
+            transport.stop()
+
+    def test_request_after_stop_raises(self, device):
+        """Test requests are rejected once the transport is stopped."""
+        transport = SerialTransport(device, name="stopped")
+        transport.start()
+        transport.stop()
+
+        with pytest.raises(TransportClosedError):
+            transport.request("*IDN?")
+
+    def test_concurrent_requests_stay_correlated(self):
+        """Test concurrent callers each receive their own response."""
+        device = MockSerialDevice(handler=lambda cmd: f"ECHO:{cmd}")
+        transport = SerialTransport(device, name="concurrent")
+        transport.start()
+        errors = []
+
+        def worker(index):
+            for n in range(20):
+                command = f"CMD{index}_{n}"
+                if transport.request(command) != f"ECHO:{command}":
+                    errors.append(command)
+
+        try:
+            threads = [threading.Thread(target=worker, args=(i,)) for i in range(5)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        finally:
+            transport.stop()
+
+        assert errors == []
+
+
+class TestLatencyStatistics:
+    """Test per-command latency histograms."""
+
+    def test_statistics_keyed_by_command_verb(self, transport):
+        """Test latency is aggregated per command without arguments."""
+        transport.request("LAS:LDI 0.5", expect_response=False)
+        transport.request("LAS:LDI 0.6", expect_response=False)
+        transport.request("*IDN?")
+
+        stats = transport.get_latency_statistics()
+
+        assert stats["commands"]["LAS:LDI"]["count"] == 2
+        assert stats["commands"]["*IDN?"]["count"] == 1
+        assert stats["commands"]["*IDN?"]["p99_ms"] >= 0.0
+        assert stats["queue_wait"]["count"] == 3
+
+    def test_reset_statistics(self, transport):
+        """Test statistics can be cleared."""
+        transport.request("*IDN?")
+        transport.reset_statistics()
+
+        assert transport.get_latency_statistics()["commands"] == {}
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Requires POSIX pseudo-terminal")
+class TestPtyDevice:
+    """Test real controllers against a pty-backed fake instrument."""
+
+    def test_laser_controller_over_pty(self, qapp):
+        """Test LaserController connects and sets current through a real serial port."""
+        from hardware.laser_controller import LaserController
+
+        state = {"current_a": 0.0}
+
+        def handler(command):
+            if command == "*IDN?":
+                return "Arroyo 4300 LaserSource"
+            if command == "LAS:LIM:LDI?":
+                return "2.0"
+            if command.startswith("LAS:LDI "):
+                state["current_a"] = float(command.split()[1])
+                return None
+            if command == "LAS:SET:LDI?":
+                return f"{state['current_a']:.4f}"
+            if command == "LAS:OUT?":
+                return "0"
+            return None
+
+        device = PtySerialDevice(handler)
+        port = device.start()
+        controller = LaserController()
+        try:
+            assert controller.connect(com_port=port) is True
+            controller.monitor_timer.stop()
+
+            assert controller.set_current(500.0) is True
+            assert controller.current_setpoint_ma == 500.0
+            assert "LAS:LDI" in controller.get_latency_statistics()["commands"]
+        finally:
+            controller.disconnect()
+            device.stop()
+
+
+class TestConnectFailure:
+    """Test a controller failing after its transport started is fully torn down."""
+
+    @pytest.mark.parametrize(
+        "module_name, class_name",
+        [
+            ("hardware.laser_controller", "LaserController"),
+            ("hardware.tec_controller", "TECController"),
+        ],
+    )
+    @pytest.mark.parametrize(
+        "exception", [RuntimeError("bad limits"), serial.SerialException("gone")]
+    )
+    def test_failure_after_start_closes_port(self, qapp, module_name, class_name, exception):
+        """Test an exception after *IDN? stops the I/O thread and closes the port."""
+        module = importlib.import_module(module_name)
+        device = MockSerialDevice(responses={"*IDN?": "Arroyo 5300"}, timeout=0.2)
+        controller = getattr(module, class_name)()
+
+        with (
+            patch.object(module.serial, "Serial", return_value=device),
+            patch.object(controller, "_read_limits", side_effect=exception),
+        ):
+            assert controller.connect(com_port="COM99") is False
+
+        assert "*IDN?" in device.commands
+        assert controller.is_connected is False
+        assert controller._transport is None
+        assert controller.ser is None
+        assert device.is_open is False
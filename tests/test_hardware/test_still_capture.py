@@ -0,0 +1,135 @@
+"""
+Unit tests for the asynchronous still capture writer.
+
+Tests image encoding in each format, the preallocated burst buffer and
+background writing of single images and bursts.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from hardware.bayer import demosaic  # noqa: E402
+from hardware.still_capture import BurstBuffer, StillCaptureWriter, write_image  # noqa: E402
+from hardware.video_index import FrameInfo, VideoFrameIndex  # noqa: E402
+
+
+def rgb_frame(height: int = 48, width: int = 64) -> np.ndarray:
+    """RGB8 frame with a distinct value per channel."""
+    frame = np.zeros((height, width, 3), dtype=np.uint8)
+    frame[..., 0], frame[..., 1], frame[..., 2] = 200, 100, 50
+    return frame
+
+
+@pytest.fixture
+def writer():
+    """Still writer shut down after the test."""
+    still_writer = StillCaptureWriter()
+    yield still_writer
+    still_writer.shutdown()
+
+
+class TestWriteImage:
+    """Test encoding a single image."""
+
+    @pytest.mark.parametrize("image_format", ["png", "tiff"])
+    def test_lossless_rgb_round_trip(self, tmp_path, image_format):
+        """Test PNG and TIFF store RGB frames losslessly (OpenCV BGR order on disk)."""
+        frame = rgb_frame()
+
+        path = write_image(tmp_path / "capture", frame, image_format)
+
+        assert path.suffix == f".{image_format}"
+        assert np.array_equal(cv2.cvtColor(cv2.imread(str(path)), cv2.COLOR_BGR2RGB), frame)
+
+    def test_npy(self, tmp_path):
+        """Test NPY stores the RGB array unchanged."""
+        frame = rgb_frame()
+
+        path = write_image(tmp_path / "capture", frame, "npy")
+
+        assert np.array_equal(np.load(path), frame)
+
+    def test_unwritable_path(self, tmp_path):
+        """Test a failed write raises instead of returning a missing path."""
+        with pytest.raises(OSError):
+            write_image(tmp_path / "missing" / "capture", rgb_frame())
+
+
+class TestBurstBuffer:
+    """Test the preallocated burst buffer."""
+
+    def test_fill(self):
+        """Test frames are copied into consecutive slots until the buffer is full."""
+        buffer = BurstBuffer(3, (4, 6), np.uint8)
+
+        results = [buffer.add(np.full((4, 6), i, np.uint8), FrameInfo(i, 0, 0)) for i in range(3)]
+
+        assert results == [False, False, True]
+        assert buffer.full and buffer.filled == 3
+        assert [int(frame[0, 0]) for frame in buffer.frames] == [0, 1, 2]
+
+    def test_frame_is_copied(self):
+        """Test the buffer does not keep a reference to the camera's frame."""
+        buffer = BurstBuffer(1, (4, 6), np.uint8)
+        camera_frame = np.ones((4, 6), np.uint8)
+
+        buffer.add(camera_frame)
+        camera_frame[:] = 9  # Camera reuses its buffer
+
+        assert (buffer.frames[0] == 1).all()
+
+    def test_size_change_rejected(self):
+        """Test a frame of a different size (profile change) is rejected."""
+        buffer = BurstBuffer(2, (4, 6), np.uint8)
+        with pytest.raises(ValueError):
+            buffer.add(np.zeros((8, 6), np.uint8))
+
+
+class TestStillCaptureWriter:
+    """Test background writing."""
+
+    def test_submit_converts_on_worker(self, tmp_path, writer):
+        """Test a leased raw frame is converted and written by the pool."""
+        raw = np.zeros((48, 64), dtype=np.uint8)
+        raw[0::2, 0::2] = 200  # RGGB mosaic: red only
+
+        path = writer.submit(tmp_path / "capture", raw, lambda f: demosaic(f, "RGGB")).result(5)
+
+        saved = cv2.imread(str(path))
+        assert path.name == "capture.png"
+        assert tuple(saved[24, 32]) == (0, 0, 200)  # BGR
+
+    def test_burst(self, tmp_path, writer):
+        """Test a burst is written as numbered images with a frame index."""
+        buffer = BurstBuffer(4, (48, 64, 3), np.uint8)
+        start = time.monotonic_ns()
+        for i in range(4):
+            buffer.add(rgb_frame(), FrameInfo(100 + i, i * 1000, start + i * 5_000_000))
+
+        paths = writer.submit_burst(tmp_path / "burst", "burst", buffer).result(5)
+        index = VideoFrameIndex.load(tmp_path / "burst" / "burst.frames.csv")
+
+        assert [p.name for p in paths] == [f"burst_{i:04d}.png" for i in range(4)]
+        assert all(p.exists() for p in paths)
+        assert index.camera_frame_ids == [100, 101, 102, 103]
+
+    def test_error_reported_through_future(self, tmp_path, writer):
+        """Test an encoding failure surfaces as the future's exception."""
+        future = writer.submit(tmp_path / "missing" / "capture", rgb_frame())
+
+        with pytest.raises(OSError):
+            future.result(5)
+
+    def test_unknown_format(self):
+        """Test an unsupported format is rejected up front."""
+        with pytest.raises(ValueError):
+            StillCaptureWriter(image_format="jpeg")
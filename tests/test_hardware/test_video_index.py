@@ -0,0 +1,178 @@
+"""
+Unit tests for frame-level camera timestamps and the video frame index.
+
+Tests frame ID gap detection, the index written next to recordings and
+aligning event log entries with video frames.
+"""
+
+import json
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from hardware.camera_controller import CameraStreamThread, VideoRecorder  # noqa: E402
+from hardware.video_index import (  # noqa: E402
+    FrameDropDetector,
+    FrameIndexWriter,
+    FrameInfo,
+    VideoFrameIndex,
+    frame_index_path,
+)
+
+
+def write_index(path: Path, frame_ids: list, interval_s: float = 0.1) -> FrameIndexWriter:
+    """Write an index with frames arriving every interval_s seconds."""
+    writer = FrameIndexWriter(path)
+    detector = FrameDropDetector()
+    for i, frame_id in enumerate(frame_ids):
+        host_ns = writer.anchor_monotonic_ns + int(i * interval_s * 1e9)
+        writer.write(FrameInfo(frame_id, frame_id * 1000, host_ns, detector.update(frame_id)))
+    writer.close()
+    return writer
+
+
+class TestFrameDropDetector:
+    """Test dropped-frame detection from frame ID gaps."""
+
+    def test_consecutive_ids_have_no_drops(self):
+        """Test consecutive frame IDs report no drops."""
+        detector = FrameDropDetector()
+        assert [detector.update(i) for i in range(5, 10)] == [0, 0, 0, 0, 0]
+        assert detector.frames_dropped == 0
+        assert detector.frames_received == 5
+
+    def test_gap_counts_missing_frames(self):
+        """Test a gap in frame IDs is counted as dropped frames."""
+        detector = FrameDropDetector()
+        missing = [detector.update(i) for i in (1, 2, 5, 6, 10)]
+
+        assert missing == [0, 0, 2, 0, 3]
+        assert detector.frames_dropped == 5
+        assert detector.last_frame_id == 10
+
+    def test_counter_reset_is_not_a_drop(self):
+        """Test a camera restarting its frame counter does not count as drops."""
+        detector = FrameDropDetector()
+        for frame_id in (100, 101, 0, 1):
+            detector.update(frame_id)
+        assert detector.frames_dropped == 0
+
+
+class TestVideoFrameIndex:
+    """Test writing and querying the frame index."""
+
+    def test_round_trip(self, tmp_path):
+        """Test the index stores camera frame IDs, timestamps and drops."""
+        path = tmp_path / "session.frames.csv"
+        writer = write_index(path, [1, 2, 3, 6, 7])
+
+        index = VideoFrameIndex.load(path)
+
+        assert len(index) == 5
+        assert index.camera_frame_ids == [1, 2, 3, 6, 7]
+        assert index.device_timestamps_ns[3] == 6000
+        assert index.dropped_before == [0, 0, 0, 2, 0]
+        assert index.frames_dropped == 2
+        assert index.start_time == pytest.approx(writer.anchor_wall_s, abs=1e-6)
+        assert index.time_of(4) - index.time_of(0) == pytest.approx(0.4, abs=1e-6)
+
+    def test_frame_at_time(self, tmp_path):
+        """Test seeking to the frame showing a given moment."""
+        path = tmp_path / "session.frames.csv"
+        write_index(path, list(range(1, 11)))
+        index = VideoFrameIndex.load(path)
+        start = index.start_time
+
+        assert index.frame_at(start) == 0
+        assert index.frame_at(start + 0.25) == 2
+        assert index.frame_at(datetime.fromtimestamp(start + 0.5)) == 5
+        assert index.frame_at(datetime.fromtimestamp(start + 0.35).isoformat()) == 3
+        assert index.frame_at(start - 1.0) is None
+        assert index.frame_at(start + 10.0) is None
+
+    def test_align_event_log(self, tmp_path):
+        """Test event log entries are paired with the frames at their timestamps."""
+        path = tmp_path / "session.frames.csv"
+        write_index(path, list(range(1, 11)))
+        index = VideoFrameIndex.load(path)
+        start = index.start_time
+
+        events = [
+            ("laser_enabled", start + 0.31),
+            ("actuator_move", start + 0.52),
+            ("laser_disabled", start + 0.73),
+            ("laser_enabled", start + 60.0),  # After the recording
+        ]
+        events_file = tmp_path / "events.jsonl"
+        with open(events_file, "w", encoding="utf-8") as f:
+            for event_type, t in events:
+                entry = {
+                    "timestamp": datetime.fromtimestamp(t).isoformat(),
+                    "event_type": event_type,
+                }
+                f.write(json.dumps(entry) + "\n")
+
+        aligned = index.align_event_log(events_file)
+        laser = index.align_event_log(events_file, ["laser_enabled", "laser_disabled"])
+
+        assert [frame for _, frame in aligned] == [3, 5, 7]
+        assert [(e["event_type"], frame) for e, frame in laser] == [
+            ("laser_enabled", 3),
+            ("laser_disabled", 7),
+        ]
+
+
+def test_video_recorder_writes_frame_index(tmp_path):
+    """Test the recorder writes one index row per recorded video frame."""
+    video_path = tmp_path / "videos" / "session.mp4"
+    recorder = VideoRecorder(output_path=video_path, fps=30.0, frame_size=(64, 48), codec="mp4v")
+    frame = np.zeros((48, 64, 3), dtype=np.uint8)
+    for frame_id in (10, 11, 14):
+        recorder.write_frame(frame, FrameInfo(frame_id, 0, time.monotonic_ns()))
+    recorder.write_frame(frame)  # No camera info: host arrival time only
+    recorder.close()
+
+    index = VideoFrameIndex.load(frame_index_path(video_path))
+
+    assert len(index) == recorder.frame_count == 4
+    assert index.camera_frame_ids == [10, 11, 14, -1]
+    assert index.host_times == sorted(index.host_times)
+
+
+class FakeFrame:
+    """Frame reporting a camera frame ID and (optionally) no device timestamp."""
+
+    def __init__(self, frame_id, timestamp_ns=None):
+        self._id = frame_id
+        self._timestamp_ns = timestamp_ns
+
+    def get_id(self):
+        return self._id
+
+    def get_timestamp(self):
+        return self._timestamp_ns
+
+
+def test_stream_thread_reads_frame_info():
+    """Test the stream thread tags frames with camera IDs and counts gaps as drops."""
+    thread = CameraStreamThread(camera=None, controller=None)
+
+    infos = [
+        thread._read_frame_info(FakeFrame(frame_id, frame_id * 33_000_000), i)
+        for i, frame_id in enumerate((7, 8, 11))
+    ]
+    no_timestamp = thread._read_frame_info(FakeFrame(12), 3)
+
+    assert [info.frame_id for info in infos] == [7, 8, 11]
+    assert infos[2].device_timestamp_ns == 11 * 33_000_000
+    assert [info.dropped_before for info in infos] == [0, 0, 2]
+    assert no_timestamp.device_timestamp_ns == 0
+    assert thread.drop_detector.frames_dropped == 2
@@ -0,0 +1,148 @@
+"""
+Test suite for Xeryon axis high-rate logging.
+
+Tests the typed-array axis log, TIME wrap-around unwrapping, vectorised
+EPOS unit conversion and the live log view. Data is fed through
+Axis.receiveData() directly, so no stage or serial port is needed.
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+# Add Xeryon library to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "components" / "actuator_module"))
+
+from Xeryon import Axis, AxisLog, Stage, Units, unwrapTime  # noqa: E402
+
+
+@pytest.fixture
+def axis():
+    """Provide axis bound to a mock Xeryon object, with logging enabled."""
+    xeryon = MagicMock()
+    axis = Axis(xeryon, "X", Stage.XLS_1250)
+    axis.isLogging = True
+    return axis
+
+
+def feed(axis, samples):
+    """Send (TIME, EPOS) update pairs through receiveData()."""
+    for time_value, epos in samples:
+        axis.receiveData(f"EPOS={epos}")
+        axis.receiveData(f"TIME={time_value}")
+
+
+class TestAxisLog:
+    """Test the typed-array log container."""
+
+    def test_append_and_view(self):
+        """Test samples are returned as numpy arrays per tag."""
+        log = AxisLog()
+        for value in (1, 2, 3):
+            log.append("EPOS", value)
+        log.append("SSPD", 0.5)
+
+        assert log.view("EPOS").tolist() == [1, 2, 3]
+        assert log.view("EPOS").dtype == np.int64
+        assert log.view("SSPD").dtype == np.float64
+        assert log.view("DPOS").size == 0
+
+    def test_view_from_index_returns_new_samples(self):
+        """Test start_index returns only samples appended since the last read."""
+        log = AxisLog()
+        for value in range(5):
+            log.append("EPOS", value)
+
+        assert log.view("EPOS", 3).tolist() == [3, 4]
+        assert log.length("EPOS") == 5
+
+    def test_view_is_a_copy(self):
+        """Test a view stays valid while logging continues."""
+        log = AxisLog()
+        log.append("EPOS", 1)
+        view = log.view("EPOS")
+        log.append("EPOS", 2)
+
+        assert view.tolist() == [1]
+
+
+class TestUnwrapTime:
+    """Test vectorised TIME conversion."""
+
+    def test_wraparound_is_unwrapped(self):
+        """Test the 16 bit TIME counter wrap-around is removed."""
+        raw = [65500, 65530, 24, 54]  # 0.1 ms ticks, wraps after the second sample
+
+        assert unwrapTime(raw).tolist() == [0.0, 3.0, 6.0, 9.0]
+
+    def test_matches_reference_loop(self):
+        """Test output matches the per-sample loop it replaces."""
+        rng = np.random.default_rng(0)
+        raw = (np.cumsum(rng.integers(1, 400, 2000)) % 2**16).tolist()
+
+        expected = [0]
+        for i in range(1, len(raw)):
+            t = raw[i]
+            if t < raw[i - 1]:
+                t += 2**16
+            expected.append(round(expected[-1] + (t - raw[i - 1]) / 10, 2))
+
+        np.testing.assert_allclose(unwrapTime(raw), expected, atol=1e-6)
+
+    def test_empty(self):
+        """Test empty input gives empty output."""
+        assert unwrapTime([]).size == 0
+
+
+class TestAxisLogging:
+    """Test logging through Axis.receiveData()."""
+
+    def test_receive_data_is_logged(self, axis):
+        """Test EPOS/TIME updates and derived SSPD are logged."""
+        feed(axis, [(100, 0), (110, 1000), (120, 2000)])
+
+        assert axis.getLogView("EPOS").tolist() == [0, 1000, 2000]
+        assert axis.getLogView("TIME").tolist() == [100, 110, 120]
+        assert axis.getLogLength("SSPD") > 0
+
+    def test_not_logged_when_disabled(self, axis):
+        """Test nothing is stored while logging is off."""
+        axis.isLogging = False
+        feed(axis, [(100, 0)])
+
+        assert axis.getLogLength("EPOS") == 0
+
+    def test_logs_are_per_axis(self):
+        """Test two axes don't share one log."""
+        first = Axis(MagicMock(), "X", Stage.XLS_1250)
+        second = Axis(MagicMock(), "Y", Stage.XLS_1250)
+        first.isLogging = True
+        feed(first, [(100, 5)])
+
+        assert second.getLogLength("EPOS") == 0
+
+    def test_end_logging_converts_time_and_epos(self, axis):
+        """Test endLogging() returns unwrapped ms timestamps and EPOS in axis units."""
+        axis.setUnits(Units.mu)
+        feed(axis, [(65530, 0), (10, 800), (20, 1600)])
+
+        logs = axis.endLogging(convertTimeAndEpos=True)
+
+        assert logs["TIME"].tolist() == [0.0, 1.6, 2.6]
+        expected_epos = [axis.convertEncoderUnitsToUnits(v, Units.mu) for v in (0, 800, 1600)]
+        np.testing.assert_allclose(logs["EPOS"], expected_epos)
+        assert axis.isLogging is False
+        assert axis.getLogLength("EPOS") == 0
+
+    def test_live_view_in_units(self, axis):
+        """Test the live view converts EPOS without stopping logging."""
+        axis.setUnits(Units.mm)
+        feed(axis, [(100, 0), (110, 1000)])
+
+        view = axis.getLogView("EPOS", start_index=1, convertTimeAndEpos=True)
+
+        assert view.tolist() == [pytest.approx(axis.convertEncoderUnitsToUnits(1000, Units.mm))]
+        assert axis.isLogging is True
@@ -0,0 +1,256 @@
+"""
+Test suite for non-blocking Xeryon motion.
+
+Tests that setDPOSAsync/stepAsync/findIndexAsync/scanUntilLimitAsync
+futures complete from status frames (STAT/EPOS updates fed through
+Axis.receiveData()), report structured errors, and that ActuatorController
+forwards completion to the GUI thread.
+"""
+
+import sys
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+# Add src and Xeryon library to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "components" / "actuator_module"))
+
+from Xeryon import Axis, MotionResult, Stage, Units  # noqa: E402
+
+# STAT bits
+ENCODER_VALID = 1 << 8
+SEARCHING_INDEX = 1 << 9
+POSITION_REACHED = 1 << 10
+AT_LEFT_END = 1 << 14
+AT_RIGHT_END = 1 << 15
+ERROR_LIMIT = 1 << 16
+
+
+@pytest.fixture
+def axis():
+    """Provide encoder-unit axis bound to a mock Xeryon object, stage at 0."""
+    axis = Axis(MagicMock(), "X", Stage.XLS_1250)
+    axis.setUnits(Units.enc)
+    axis.setSetting("PTO2", "2", doNotSendThrough=True)
+    axis.receiveData("STAT=0")
+    axis.receiveData("EPOS=0")
+    return axis
+
+
+def frame(axis, stat, epos):
+    """Send one status frame (STAT, EPOS) as the communication thread would."""
+    axis.receiveData(f"STAT={stat}")
+    axis.receiveData(f"EPOS={epos}")
+
+
+class TestSetDPOSAsync:
+    """Test non-blocking absolute moves."""
+
+    def test_returns_immediately(self, axis):
+        """Test the future is pending until the position is reached."""
+        future = axis.setDPOSAsync(1000)
+
+        assert not future.done()
+        assert axis.hasPendingMotions()
+
+    def test_completes_on_position_reached_frame(self, axis):
+        """Test the future completes in the first frame with EPOS in tolerance and bit set."""
+        future = axis.setDPOSAsync(1000)
+
+        frame(axis, 0, 500)
+        assert not future.done()
+        frame(axis, POSITION_REACHED, 999)
+
+        result = future.result(timeout=0)
+        assert result.success and bool(result)
+        assert result.epos == 999
+        assert not axis.hasPendingMotions()
+
+    def test_out_of_range_error(self, axis):
+        """Test hitting an end stop resolves with OUT_OF_RANGE instead of printing only."""
+        future = axis.setDPOSAsync(1000)
+        frame(axis, AT_RIGHT_END, 800)
+
+        result = future.result(timeout=0)
+        assert not result
+        assert result.error == MotionResult.OUT_OF_RANGE
+        assert "out or range" in result.message
+
+    def test_error_limit(self, axis):
+        """Test ELIM resolves with ERROR_LIMIT."""
+        future = axis.setDPOSAsync(1000)
+        frame(axis, ERROR_LIMIT, 100)
+
+        assert future.result(timeout=0).error == MotionResult.ERROR_LIMIT
+
+    def test_step_async_targets_relative_position(self, axis):
+        """Test stepAsync moves relative to the current position."""
+        frame(axis, POSITION_REACHED, 200)
+        future = axis.stepAsync(300)
+
+        frame(axis, POSITION_REACHED, 300)
+        assert not future.done()
+        frame(axis, POSITION_REACHED, 500)
+        assert future.result(timeout=0).success
+
+    def test_caller_cannot_cancel(self, axis):
+        """Test a pending motion can't be cancelled from the waiting side."""
+        future = axis.setDPOSAsync(1000)
+
+        assert future.cancel() is False
+
+    def test_completed_from_other_thread(self, axis):
+        """Test a waiter blocked on result() wakes when a frame arrives on another thread."""
+        future = axis.setDPOSAsync(1000)
+        feeder = threading.Timer(0.05, frame, args=(axis, POSITION_REACHED, 1000))
+        feeder.start()
+
+        assert future.result(timeout=2.0).success
+        feeder.join()
+
+
+class TestFindIndexAndScan:
+    """Test non-blocking homing and scanning."""
+
+    def test_find_index_ignores_stale_status(self, axis):
+        """Test an already valid encoder doesn't complete homing during the grace period."""
+        frame(axis, ENCODER_VALID, 0)
+        future = axis.findIndexAsync()
+
+        frame(axis, ENCODER_VALID, 0)
+        frame(axis, ENCODER_VALID, 0)
+        assert not future.done()
+
+        time.sleep(0.55)
+        frame(axis, SEARCHING_INDEX, 0)
+        assert not future.done()
+        frame(axis, ENCODER_VALID, 0)
+        assert future.result(timeout=0).success
+
+    def test_find_index_not_found(self, axis):
+        """Test search stopping without a valid encoder gives INDEX_NOT_FOUND."""
+        future = axis.findIndexAsync()
+        time.sleep(0.55)
+        frame(axis, 0, 0)
+        frame(axis, 0, 0)
+        frame(axis, 0, 0)
+
+        assert future.result(timeout=0).error == MotionResult.INDEX_NOT_FOUND
+
+    def test_scan_until_limit(self, axis):
+        """Test scan completes when the end stop in the scan direction is reached."""
+        future = axis.scanUntilLimitAsync(-1)
+
+        frame(axis, AT_RIGHT_END, 0)
+        assert not future.done()
+        frame(axis, AT_LEFT_END, -5000)
+        assert future.result(timeout=0).success
+
+    def test_cancel_motions(self, axis):
+        """Test pending motions resolve as CANCELLED."""
+        future = axis.setDPOSAsync(1000)
+        axis.cancelMotions("Movement stopped.")
+
+        result = future.result(timeout=0)
+        assert result.error == MotionResult.CANCELLED
+        assert not axis.hasPendingMotions()
+
+
+class TestActuatorControllerMotion:
+    """Test ActuatorController forwards motion completion to the GUI thread."""
+
+    @pytest.fixture
+    def controller(self, qtbot):
+        """Provide connected and homed controller with a mock axis."""
+        from hardware.actuator_controller import ActuatorController
+
+        controller = ActuatorController()
+        controller.axis = MagicMock()
+        controller.is_connected = True
+        controller.is_homed = True
+        return controller
+
+    def test_set_position_does_not_block(self, qtbot, controller):
+        """Test set_position returns before the move completes and signals on completion."""
+        future = Future()
+        future.set_running_or_notify_cancel()
+        controller.axis.setDPOSAsync.return_value = future
+
+        assert controller.set_position(1000.0) is True
+        assert controller.motion_future is future
+
+        with qtbot.waitSignal(controller.position_reached, timeout=2000) as blocker:
+            threading.Timer(
+                0.05, future.set_result, args=(MotionResult(True, epos=1000.0),)
+            ).start()
+
+        assert blocker.args == [1000.0]
+
+    def test_failed_move_reports_error(self, qtbot, controller):
+        """Test structured motion errors are emitted as error_occurred."""
+        future = Future()
+        future.set_running_or_notify_cancel()
+        controller.axis.setDPOSAsync.return_value = future
+        controller.set_position(1000.0)
+
+        with qtbot.waitSignal(controller.error_occurred, timeout=2000) as blocker:
+            future.set_result(
+                MotionResult(False, MotionResult.ERROR_LIMIT, "Position not reached. (5)")
+            )
+
+        assert "Position not reached" in blocker.args[0]
+
+    def test_connect_homes_without_holding_lock(self, qtbot):
+        """Test auto-homing in connect() waits on the future with the lock released."""
+        from hardware import actuator_controller as module
+
+        controller = module.ActuatorController()
+        axis = MagicMock()
+        axis.isEncoderValid.return_value = False
+        axis.getSetting.return_value = None
+        homing = Future()
+        homing.set_running_or_notify_cancel()
+        homing_started = threading.Event()
+
+        def find_index_async(direction=0):
+            homing_started.set()
+            return homing
+
+        axis.findIndexAsync.side_effect = find_index_async
+        lock_free = []
+
+        def query_while_homing():
+            homing_started.wait(timeout=2)
+            lock_free.append(controller._lock.acquire(timeout=1))
+            if lock_free[-1]:
+                controller._lock.release()
+            homing.set_result(MotionResult(True, epos=0.0))
+
+        prober = threading.Thread(target=query_while_homing)
+        prober.start()
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(module, "Xeryon", MagicMock())
+            module.Xeryon.return_value.addAxis.return_value = axis
+            assert controller.connect(auto_home=True) is True
+        prober.join(timeout=5)
+
+        assert lock_free == [True]
+        assert controller.is_homed is True
+        controller.disconnect()
+
+    def test_home_and_wait_timeout(self, qtbot, controller):
+        """Test homing that never completes returns False after the timeout."""
+        controller.is_homed = False
+        pending = Future()
+        pending.set_running_or_notify_cancel()
+        controller.axis.findIndexAsync.return_value = pending
+
+        start = time.monotonic()
+        assert controller.home_and_wait(timeout=0.1) is False
+        assert time.monotonic() - start < 1.0
+        assert controller.is_homed is False
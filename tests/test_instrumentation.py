@@ -0,0 +1,282 @@
+"""
+Tests for opt-in performance instrumentation (src/utils/instrumentation.py).
+
+Tests rolling histograms, the timing decorator and context manager, lock
+wait measurement and the GUI stall detector.
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from PyQt6.QtWidgets import QApplication
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from utils import instrumentation  # noqa: E402
+from utils.instrumentation import (  # noqa: E402
+    GuiStallDetector,
+    RollingHistogram,
+    instrument_lock,
+    instrumented,
+    timing,
+)
+from utils.latency_histogram import LatencyHistogram  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    """Provide QApplication for the stall detector timer."""
+    app = QApplication.instance() or QApplication([])
+    yield app
+
+
+@pytest.fixture
+def enabled():
+    """Enable instrumentation with empty statistics for one test."""
+    instrumentation.reset()
+    instrumentation.enable()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+def _process_events_for(seconds: float) -> None:
+    """Run the Qt event loop for a while."""
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        QApplication.processEvents()
+        time.sleep(0.005)
+
+
+class TestRollingHistogram:
+    """Test the time-windowed histogram."""
+
+    def test_merge_combines_samples(self):
+        """Test LatencyHistogram.merge adds counts, totals and maximum."""
+        first, second = LatencyHistogram(), LatencyHistogram()
+        first.record(1.0)
+        second.record(3.0)
+        second.record(5.0)
+
+        first.merge(second)
+        stats = first.snapshot()
+
+        assert stats["count"] == 3
+        assert stats["mean_ms"] == pytest.approx(3.0)
+        assert stats["max_ms"] == 5.0
+        assert second.count == 2
+
+    def test_old_samples_leave_window(self):
+        """Test samples older than the window are no longer reported."""
+        now = [0.0]
+        histogram = RollingHistogram(window_s=60.0, slots=6, clock=lambda: now[0])
+
+        histogram.record(100.0)
+        now[0] = 30.0
+        histogram.record(1.0)
+        assert histogram.snapshot()["count"] == 2
+
+        now[0] = 65.0  # First slot (0-10 s) has left the window
+        stats = histogram.snapshot()
+        assert stats["count"] == 1
+        assert stats["max_ms"] == 1.0
+        assert stats["total_count"] == 2
+
+        now[0] = 200.0
+        assert histogram.snapshot()["count"] == 0
+
+
+class TestTiming:
+    """Test the decorator, context manager and registry."""
+
+    def test_disabled_records_nothing(self):
+        """Test instrumented code runs normally without recording while disabled."""
+        instrumentation.reset()
+
+        @instrumented("test.disabled")
+        def add(a, b):
+            return a + b
+
+        assert add(1, 2) == 3
+        with timing("test.disabled_block"):
+            pass
+        assert instrumentation.snapshot() == {}
+
+    def test_enabled_records_calls(self, enabled):
+        """Test calls and blocks are recorded, including ones that raise."""
+
+        @instrumented("test.sleep")
+        def sleep_briefly():
+            time.sleep(0.01)
+
+        @instrumented("test.fail")
+        def fail():
+            raise ValueError("boom")
+
+        sleep_briefly()
+        with pytest.raises(ValueError):
+            fail()
+        with timing("test.block"):
+            pass
+
+        metrics = instrumentation.snapshot()
+        assert metrics["test.sleep"]["count"] == 1
+        assert metrics["test.sleep"]["max_ms"] >= 9.0
+        assert metrics["test.fail"]["count"] == 1
+        assert metrics["test.block"]["count"] == 1
+
+    def test_gui_thread_samples_tracked_separately(self, enabled):
+        """Test main-thread samples are also recorded under the [GUI] name."""
+        instrumentation.record("test.op", 1.0)
+        worker = threading.Thread(target=instrumentation.record, args=("test.op", 2.0))
+        worker.start()
+        worker.join()
+
+        metrics = instrumentation.snapshot()
+        assert metrics["test.op"]["count"] == 2
+        assert metrics["test.op" + instrumentation.GUI_THREAD_SUFFIX]["count"] == 1
+
+
+class TestInstrumentedLock:
+    """Test lock wait measurement."""
+
+    class Owner:
+        """Object with a controller-style lock."""
+
+        def __init__(self):
+            self._lock = threading.RLock()
+
+    def test_instrument_lock_is_idempotent(self):
+        """Test wrapping twice keeps a single wrapper around the original lock."""
+        owner = self.Owner()
+        original = owner._lock
+
+        wrapper = instrument_lock(owner, "owner")
+
+        assert instrument_lock(owner, "owner") is wrapper
+        assert wrapper.wrapped is original
+
+    def test_contended_wait_and_hold_are_recorded(self, enabled):
+        """Test waiting for a held lock and holding it are both recorded."""
+        owner = self.Owner()
+        instrument_lock(owner, "owner")
+        held = threading.Event()
+
+        def hold_lock():
+            with owner._lock:
+                held.set()
+                time.sleep(0.05)
+
+        holder = threading.Thread(target=hold_lock)
+        holder.start()
+        held.wait(1.0)
+        with owner._lock:
+            pass
+        holder.join()
+
+        metrics = instrumentation.snapshot()
+        assert metrics["lock.owner.wait"]["count"] == 2
+        assert metrics["lock.owner.wait"]["max_ms"] >= 30.0
+        assert metrics["lock.owner.hold"]["max_ms"] >= 45.0
+
+    def test_statistics_per_call_site(self, enabled):
+        """Test each acquiring function gets its own wait and hold histograms."""
+        owner = self.Owner()
+        instrument_lock(owner, "owner")
+
+        def poll():
+            with owner._lock:
+                pass
+
+        def command():
+            owner._lock.acquire()
+            time.sleep(0.02)
+            owner._lock.release()
+
+        poll()
+        poll()
+        command()
+
+        metrics = instrumentation.snapshot()
+        holds = [name for name in metrics if name.startswith("lock.owner.hold @ ")]
+        assert len(holds) == 2
+        # Site is "<qualified name>:<line>"; key by the function name
+        by_function = {name.split(":")[0].split(".")[-1]: name for name in holds}
+        assert metrics[by_function["poll"]]["count"] == 2
+        assert metrics[by_function["command"]]["max_ms"] >= 15.0
+
+    def test_reentrant_and_non_blocking_use(self, enabled):
+        """Test RLock re-entry counts one hold and acquire(blocking=False) still works."""
+        owner = self.Owner()
+        instrument_lock(owner, "owner")
+
+        with owner._lock:
+            with owner._lock:
+                pass
+        assert owner._lock.acquire(blocking=False)
+        owner._lock.release()
+
+        metrics = instrumentation.snapshot()
+        assert metrics["lock.owner.wait"]["count"] == 3
+        assert metrics["lock.owner.hold"]["count"] == 2
+
+    def test_toggling_while_held_is_safe(self):
+        """Test enabling or disabling while the lock is held keeps it usable."""
+        instrumentation.reset()
+        owner = self.Owner()
+        instrument_lock(owner, "owner")
+        try:
+            owner._lock.acquire()
+            instrumentation.enable()
+            with owner._lock:
+                pass
+            owner._lock.release()
+            instrumentation.disable()
+
+            assert owner._lock.acquire(blocking=False)
+            owner._lock.release()
+        finally:
+            instrumentation.disable()
+            instrumentation.reset()
+
+
+class TestGuiStallDetector:
+    """Test GUI-thread stall detection."""
+
+    def test_stall_captures_main_thread_stack(self, qapp, enabled):
+        """Test blocking the GUI thread produces a report with the blocking frame."""
+        detector = GuiStallDetector(threshold_ms=50)
+        reports = []
+        detector.stall_detected.connect(reports.append)
+        detector.start()
+        try:
+            _process_events_for(0.1)
+            self._block_gui_thread(0.2)
+            _process_events_for(0.1)
+        finally:
+            detector.stop()
+
+        assert detector.stall_count == 1
+        assert len(reports) == 1
+        assert reports[0].duration_ms >= 150.0
+        assert "_block_gui_thread" in reports[0].stacks[0]
+        assert instrumentation.snapshot()["gui.stall"]["count"] == 1
+        assert instrumentation.snapshot()["gui.event_loop_lateness"]["count"] > 3
+
+    def test_responsive_loop_has_no_stalls(self, qapp):
+        """Test an idle event loop reports no stalls."""
+        detector = GuiStallDetector(threshold_ms=100)
+        detector.start()
+        _process_events_for(0.2)
+        detector.stop()
+
+        assert detector.stall_count == 0
+        assert not detector.is_running
+
+    @staticmethod
+    def _block_gui_thread(seconds):
+        time.sleep(seconds)
@@ -0,0 +1,267 @@
+"""
+Tests for safety interlock decision latency.
+
+Tests timestamped interlock inputs, the input-to-decision latency recorded by
+SafetyManager, decision logging, evaluation from a non-GUI thread, and a
+short run of scripts/interlock_latency_benchmark.py on the digital twin.
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from PyQt6.QtWidgets import QApplication
+
+# Add project root, src and scripts to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+sys.path.insert(0, str(project_root / "scripts"))
+
+from interlock_latency_benchmark import (  # noqa: E402
+    InterlockBenchmarkConfig,
+    run_benchmark,
+)
+
+from core.event_logger import EventType  # noqa: E402
+from core.safety import SafetyManager, SafetyState  # noqa: E402
+from hardware.gpio_controller import GPIOController  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    """Provide QApplication for the benchmark run."""
+    app = QApplication.instance() or QApplication([])
+    yield app
+
+
+@pytest.fixture
+def manager():
+    """Safety manager with a valid session (GPIO interlock decides permission)."""
+    manager = SafetyManager()
+    manager.set_session_valid(True)
+    return manager
+
+
+class TestDecisionLatency:
+    """Test input-to-decision latency measurement."""
+
+    def test_transition_records_decision(self, manager):
+        """Test a permission transition is recorded with its input and latency."""
+        observed_at = time.monotonic()
+
+        manager.set_gpio_interlock_status(True, observed_at)
+
+        decision = manager.recent_decisions[-1]
+        assert decision.input_name == "gpio_interlock"
+        assert decision.input_value is True
+        assert decision.input_timestamp == observed_at
+        assert decision.previous_state == SafetyState.UNSAFE
+        assert decision.state == SafetyState.SAFE
+        assert decision.laser_enable_permitted is True
+        assert 0.0 <= decision.latency_ms < 1000.0
+
+    def test_every_evaluation_is_timed(self, manager):
+        """Test evaluations without a transition still feed the latency histogram."""
+        count = manager.decision_latency.snapshot()["count"]
+        decisions = len(manager.recent_decisions)
+
+        manager.set_power_limit_ok(False)  # UNSAFE -> UNSAFE (no transition)
+
+        assert manager.decision_latency.snapshot()["count"] == count + 1
+        assert len(manager.recent_decisions) == decisions
+
+    def test_stale_input_counts_as_budget_overrun(self, manager):
+        """Test an input observed long before evaluation exceeds the budget."""
+        manager.latency_budget_ms = 50.0
+
+        manager.set_gpio_interlock_status(True, time.monotonic() - 0.2)
+
+        stats = manager.get_latency_statistics()
+        assert manager.recent_decisions[-1].latency_ms >= 200.0
+        assert stats["budget_overruns"] == 1
+        assert stats["budget_ms"] == 50.0
+        assert stats["max_ms"] >= 200.0
+
+    def test_emergency_stop_is_timed(self, manager):
+        """Test emergency stop records a decision for its timestamp."""
+        manager.set_gpio_interlock_status(True)
+
+        manager.trigger_emergency_stop(time.monotonic())
+
+        decision = manager.recent_decisions[-1]
+        assert decision.input_name == "emergency_stop"
+        assert decision.state == SafetyState.EMERGENCY_STOP
+        assert decision.laser_enable_permitted is False
+
+
+class TestDecisionLogging:
+    """Test decisions are written to the event log."""
+
+    def test_permission_changes_logged_with_latency(self):
+        """Test permit and deny decisions are logged with input and latency details."""
+        event_logger = MagicMock()
+        manager = SafetyManager(event_logger=event_logger, latency_budget_ms=25.0)
+        manager.set_session_valid(True)
+
+        manager.set_gpio_interlock_status(True)
+        manager.set_gpio_interlock_status(False)
+        assert manager.flush_decision_log()
+
+        calls = [c.kwargs for c in event_logger.log_event.call_args_list]
+        assert [c["event_type"] for c in calls] == [
+            EventType.SAFETY_INTERLOCK_OK,
+            EventType.SAFETY_INTERLOCK_FAIL,
+        ]
+        details = calls[-1]["details"]
+        assert details["input"] == "gpio_interlock"
+        assert details["input_value"] is False
+        assert details["latency_budget_ms"] == 25.0
+        assert details["latency_ms"] >= 0.0
+        assert calls[-1]["system_state"] == "UNSAFE"
+
+    def test_no_log_without_transition(self):
+        """Test repeated inputs that do not change the decision are not logged."""
+        event_logger = MagicMock()
+        manager = SafetyManager(event_logger=event_logger)
+
+        manager.set_gpio_interlock_status(True)  # Session still invalid: stays UNSAFE
+        manager.flush_decision_log()
+
+        event_logger.log_event.assert_not_called()
+
+    def test_logging_off_the_deciding_thread(self):
+        """Test event log I/O runs on the decision log thread, not the input's thread."""
+        threads = []
+        event_logger = MagicMock()
+        event_logger.log_event.side_effect = lambda **_: threads.append(
+            threading.current_thread().name
+        )
+        manager = SafetyManager(event_logger=event_logger)
+        manager.set_session_valid(True)
+
+        manager.set_gpio_interlock_status(True)
+        manager.shutdown()
+
+        assert len(threads) == 1
+        assert threads[0].startswith("safety-decision-log")
+
+
+class TestThreadedEvaluation:
+    """Test inputs delivered from a non-GUI thread."""
+
+    def test_decision_made_on_calling_thread(self, manager):
+        """Test a direct-connected input is decided on the polling thread."""
+        worker = threading.Thread(target=manager.set_gpio_interlock_status, args=(True,))
+
+        worker.start()
+        worker.join()
+
+        # Decided before the worker returned, without running an event loop
+        assert manager.is_laser_enable_permitted() is True
+        assert manager.recent_decisions[-1].state == SafetyState.SAFE
+
+    def test_concurrent_inputs_end_consistent(self, manager):
+        """Test racing inputs leave state and permission consistent with the inputs."""
+
+        def toggle(values):
+            for value in values:
+                manager.set_gpio_interlock_status(value)
+
+        workers = [threading.Thread(target=toggle, args=([True, False] * 200,)) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        snapshot = manager.snapshot
+        assert snapshot.gpio_interlock_ok is False
+        assert snapshot.state == SafetyState.UNSAFE
+        assert snapshot.laser_enable_permitted is False
+        assert all(
+            d.laser_enable_permitted == (d.state == SafetyState.SAFE)
+            for d in manager.recent_decisions
+        )
+
+
+class TestSignalEmission:
+    """Test signals are emitted after the state locks are released."""
+
+    @staticmethod
+    def _lock_free_in_other_thread(lock) -> bool:
+        """True if another thread can take the lock (it is not held by the caller)."""
+        acquired = []
+
+        def take() -> None:
+            if lock.acquire(timeout=1.0):
+                acquired.append(True)
+                lock.release()
+
+        thread = threading.Thread(target=take)
+        thread.start()
+        thread.join()
+        return bool(acquired)
+
+    def test_safety_receivers_run_without_evaluation_lock(self, manager):
+        """Test a receiver can hand work to a thread that needs the evaluation lock."""
+        free = []
+        manager.laser_enable_changed.connect(
+            lambda _: free.append(self._lock_free_in_other_thread(manager._evaluation_lock))
+        )
+
+        manager.set_gpio_interlock_status(True)
+
+        assert free == [True]
+
+    def test_reentrant_changes_emitted_in_order(self, manager):
+        """Test a receiver changing an input sees its own transition after the current one."""
+        seen = []
+
+        def on_laser_enable(enabled: bool) -> None:
+            seen.append(enabled)
+            if enabled:
+                manager.set_power_limit_ok(False)
+
+        manager.laser_enable_changed.connect(on_laser_enable)
+
+        manager.set_gpio_interlock_status(True)
+
+        assert seen == [True, False]
+        assert manager.is_laser_enable_permitted() is False
+
+    def test_gpio_interlock_emitted_without_interlock_lock(self):
+        """Test GPIO interlock receivers (direct safety path) run with the GPIO lock free."""
+        controller = GPIOController()
+        controller.motor_enabled = True
+        controller.vibration_detected = True
+        free = []
+        controller.interlock_input.connect(
+            lambda ok, _: free.append(self._lock_free_in_other_thread(controller._interlock_lock))
+        )
+
+        controller._update_safety_status()
+
+        assert free == [True]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Requires POSIX pseudo-terminals")
+class TestInterlockBenchmark:
+    """Test a short benchmark run on the digital twin."""
+
+    def test_direct_path_within_budget(self, qapp):
+        """Test every toggle is decided and the direct path meets the budget."""
+        report = run_benchmark(
+            InterlockBenchmarkConfig(cycles=1, modes=("queued", "direct"), gui_block_ms=20.0)
+        )
+
+        for mode in ("queued", "direct"):
+            result = report["modes"][mode]
+            assert result["timeouts"] == 0
+            assert result["transitions"] == 2
+            assert result["gui_flood_ticks"] > 0
+            assert result["toggle_to_decision"]["p50_ms"] > 0
+
+        assert report["passed"] is True
+        assert report["modes"]["direct"]["input_to_decision"]["max_ms"] < 50.0
@@ -0,0 +1,489 @@
+"""
+Tests for the physics-based hardware simulator (digital twin).
+
+Tests the physical models with a manual clock (motion profile, laser/TEC
+coupling, photodiode calibration, motor vibration), the instrument command
+sets, and the unmodified laser, TEC, GPIO, actuator and camera controllers
+running against the twin's pseudo-terminals and fake vmbpy.
+"""
+
+import dataclasses
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PyQt6.QtCore import QCoreApplication
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from tests.mocks.digital_twin import (  # noqa: E402
+    ActuatorModel,
+    DigitalTwin,
+    LaserModel,
+    MotionMode,
+    MotorModel,
+    PhotodiodeModel,
+    TECModel,
+)
+from tests.mocks.digital_twin.serial_protocols import (  # noqa: E402
+    ArduinoWatchdogProtocol,
+    XeryonProtocol,
+)
+
+posix_only = pytest.mark.skipif(sys.platform == "win32", reason="Requires POSIX pseudo-terminals")
+
+
+class ManualClock:
+    """Clock advanced explicitly by the test."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    """Provide a manual clock."""
+    return ManualClock()
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    """Provide QCoreApplication for controller tests."""
+    app = QCoreApplication.instance()
+    if app is None:
+        app = QCoreApplication(sys.argv)
+    yield app
+
+
+class TestActuatorModel:
+    """Test stage dynamics."""
+
+    def test_trapezoidal_move(self, clock):
+        """Test a move accelerates, cruises at set speed and settles on target."""
+        actuator = ActuatorModel(
+            clock, start_um=0.0, speed_um_per_s=1000.0, acceleration_um_per_s2=10000.0
+        )
+        actuator.encoder_valid = True
+
+        actuator.move_to_counts(800)  # 1000 µm at 1.25 µm/count
+        clock.advance(0.05)
+        actuator.update()
+        assert actuator.velocity_um_per_s == pytest.approx(500.0, rel=0.02)  # Still accelerating
+        clock.advance(0.5)
+        actuator.update()
+        assert actuator.velocity_um_per_s == pytest.approx(1000.0)  # Cruising
+
+        clock.advance(1.0)
+        assert actuator.encoder_counts == 800
+        assert actuator.position_reached
+        assert actuator.mode == MotionMode.IDLE
+        assert actuator.status_bits() & (1 << 10)
+
+    def test_index_search_validates_encoder(self, clock):
+        """Test INDX moves to the index and re-references the encoder to it."""
+        actuator = ActuatorModel(clock, start_um=500.0, index_um=100.0)
+        assert actuator.encoder_counts == 0  # Counts from power-up position
+
+        actuator.find_index()
+        assert actuator.status_bits() & (1 << 9)  # Searching
+        clock.advance(2.0)
+        actuator.update()
+
+        assert actuator.encoder_valid
+        assert actuator.position_um == pytest.approx(100.0)
+        assert actuator.encoder_counts == 0
+        assert actuator.status_bits() & (1 << 8)
+
+    def test_move_past_end_stops_at_end(self, clock):
+        """Test out-of-range targets stop at the hard end with the end bit set."""
+        actuator = ActuatorModel(clock, start_um=0.0, high_end_um=1000.0, speed_um_per_s=5000.0)
+
+        actuator.move_to_counts(2000)  # 2500 µm
+        clock.advance(2.0)
+        actuator.update()
+
+        assert actuator.position_um == pytest.approx(1000.0)
+        assert actuator.status_bits() & (1 << 15)
+        assert not actuator.position_reached
+
+
+class TestLaserThermalModels:
+    """Test laser, photodiode and TEC coupling."""
+
+    def test_laser_power_above_threshold(self, clock):
+        """Test optical power follows the L-I curve once the current has risen."""
+        laser = LaserModel(clock, threshold_current_a=0.1, slope_efficiency_w_per_a=1.0)
+        laser.set_current(1.1)
+        clock.advance(0.1)
+        assert laser.optical_power_w() == 0.0  # Output off
+
+        laser.set_output(True)
+        clock.advance(0.1)
+        assert laser.optical_power_w() == pytest.approx(1.0, rel=1e-3)
+        assert laser.heat_load_w() == pytest.approx(1.1 * 2.0 - 1.0, rel=1e-3)
+
+    def test_photodiode_calibration_curve(self, clock):
+        """Test the photodiode reads power through the calibration curve."""
+        laser = LaserModel(clock, threshold_current_a=0.0, slope_efficiency_w_per_a=1.0)
+        photodiode = PhotodiodeModel(laser, noise_v=0.0)
+        laser.set_current(1.0)
+        laser.set_output(True)
+        clock.advance(0.1)
+
+        assert photodiode.read_voltage() == pytest.approx(2.5, abs=0.005)  # 1000 mW / 400 mW/V
+
+        photodiode = PhotodiodeModel(laser, calibration=[(0.0, 0.0), (500.0, 5.0)], noise_v=0.0)
+        assert photodiode.read_voltage() == pytest.approx(5.0)  # Saturates
+
+    def test_tec_regulates_against_laser_heat(self, clock):
+        """Test the TEC holds its setpoint while the laser heats the mount."""
+        laser = LaserModel(clock)
+        tec = TECModel(clock, laser=laser, ambient_c=22.0)
+        tec.set_temperature(25.0)
+        tec.set_output(True)
+        clock.advance(60.0)
+        assert tec.read()[0] == pytest.approx(25.0, abs=0.05)
+
+        laser.set_current(2.0)
+        laser.set_output(True)
+        clock.advance(60.0)
+        temperature, current, _ = tec.read()
+
+        assert temperature == pytest.approx(25.0, abs=0.05)
+        assert current > 0.5  # Pumping the laser's heat away
+
+    def test_tec_off_drifts_to_ambient(self, clock):
+        """Test an unregulated mount heats above ambient with the laser on."""
+        laser = LaserModel(clock)
+        tec = TECModel(clock, laser=laser, ambient_c=22.0)
+        laser.set_current(2.0)
+        laser.set_output(True)
+        clock.advance(300.0)
+
+        expected = 22.0 + laser.heat_load_w() * tec.thermal_resistance_k_per_w
+        assert tec.read()[0] == pytest.approx(expected, abs=0.1)
+
+
+class TestMotorVibration:
+    """Test smoothing motor vibration."""
+
+    def test_vibration_follows_motor_speed(self, clock):
+        """Test vibration rises above the controller threshold only when spinning."""
+        motor = MotorModel(clock, rng=np.random.default_rng(0))
+        photodiode = PhotodiodeModel(LaserModel(clock))
+        gpio = ArduinoWatchdogProtocol(motor, photodiode, clock)
+        idle = gpio.vibration_magnitude_g()
+
+        assert gpio("MOTOR_SPEED:100") == ["OK:MOTOR_SPEED:100"]
+        clock.advance(0.05)
+        spinning_up = gpio.vibration_magnitude_g()
+        clock.advance(2.0)
+        spinning = gpio.vibration_magnitude_g()
+
+        assert idle < 0.1
+        assert spinning_up < spinning
+        assert spinning > 0.8  # GPIOController.VIBRATION_THRESHOLD_G
+
+    def test_pwm_clamped_like_firmware(self, clock):
+        """Test PWM above the motor rating is clamped with a warning."""
+        gpio = ArduinoWatchdogProtocol(MotorModel(clock), PhotodiodeModel(LaserModel(clock)), clock)
+
+        assert gpio("MOTOR_SPEED:255") == ["WARNING:PWM_CLAMPED_TO_MAX", "OK:MOTOR_SPEED:153"]
+
+
+class TestProtocols:
+    """Test instrument command sets."""
+
+    def test_watchdog_halts_without_heartbeat(self, clock):
+        """Test missed heartbeats halt the board with outputs off."""
+        motor = MotorModel(clock)
+        gpio = ArduinoWatchdogProtocol(motor, PhotodiodeModel(LaserModel(clock)), clock)
+        gpio("WDT_RESET")
+        gpio("MOTOR_SPEED:100")
+        gpio("LASER_ON")
+
+        clock.advance(0.9)
+        assert gpio("WDT_RESET") == "OK:WDT_RESET"
+        clock.advance(1.1)
+
+        assert gpio("GET_STATUS") is None  # Halted: no response
+        assert motor.pwm == 0
+        assert not gpio.aiming_laser_on
+
+        gpio.power_cycle()
+        assert gpio("GET_STATUS")[0] == "STATUS:"
+
+    def test_status_report_format(self, clock):
+        """Test GET_STATUS is multi-line and ends with the controller's terminator."""
+        gpio = ArduinoWatchdogProtocol(MotorModel(clock), PhotodiodeModel(LaserModel(clock)), clock)
+
+        lines = gpio("GET_STATUS")
+
+        assert lines[0] == "STATUS:"
+        assert lines[-1] == "OK:STATUS"
+        assert gpio("GET_PHOTODIODE").startswith("PHOTODIODE:")
+
+    def test_xeryon_settings_and_frames(self, clock):
+        """Test setting queries are answered and status frames carry STAT/EPOS/TIME."""
+        xeryon = XeryonProtocol(ActuatorModel(clock, start_um=0.0), clock)
+
+        assert xeryon("SSPD=?") == "SSPD=1000"
+        xeryon("SSPD=5000")
+        assert xeryon("X:SSPD=?") == "SSPD=5000"
+        xeryon("DPOS=400")
+        clock.advance(1.0)
+
+        tags = dict(line.split("=") for line in xeryon.status_frame())
+        assert tags["EPOS"] == "400"
+        assert int(tags["STAT"]) & (1 << 10)
+        assert tags["TIME"] == str(10000)
+
+
+@posix_only
+class TestControllersAgainstTwin:
+    """Test the real controllers run unmodified against the twin."""
+
+    @pytest.fixture
+    def twin(self):
+        """Provide a started twin."""
+        twin = DigitalTwin(seed=0)
+        twin.start()
+        yield twin
+        twin.stop()
+
+    def test_laser_and_tec_controllers(self, qapp, twin):
+        """Test laser current and TEC regulation through the Arroyo protocols."""
+        from hardware.laser_controller import LaserController
+        from hardware.tec_controller import TECController
+
+        laser = LaserController()
+        tec = TECController()
+        try:
+            assert laser.connect(twin.ports.laser)
+            assert tec.connect(twin.ports.tec)
+            assert laser.max_current_ma == pytest.approx(2000.0)
+
+            assert tec.set_temperature(25.0)
+            assert tec.set_output(True)
+            assert laser.set_current(1500.0)
+            assert laser.set_output(True)
+            time.sleep(0.1)
+
+            assert twin.laser.optical_power_w() == pytest.approx(1.1 * 1.4, rel=0.01)
+            assert laser.read_current() == pytest.approx(1500.0, abs=5.0)
+            assert twin.laser.heat_load_w() > 1.0
+            assert tec.read_temperature() == pytest.approx(twin.tec.temperature_c, abs=0.01)
+        finally:
+            laser.disconnect()
+            tec.disconnect()
+
+    def test_gpio_controller_reads_vibration_and_photodiode(self, qapp, twin):
+        """Test motor vibration and the laser pickoff reach the GPIO controller."""
+        from hardware.gpio_controller import GPIOController
+
+        twin.laser.set_current(1.0)
+        twin.laser.set_output(True)
+        gpio = GPIOController()
+        try:
+            assert gpio.connect(twin.ports.gpio)
+            gpio.monitor_timer.stop()
+            assert gpio.start_smoothing_motor()
+            time.sleep(1.5)  # Spin-up
+
+            for _ in range(gpio.vibration_debounce_threshold):
+                gpio._update_status()
+
+            assert gpio.vibration_detected
+            assert gpio.photodiode_voltage == pytest.approx(
+                twin.photodiode.ideal_voltage(990.0), abs=0.02
+            )
+        finally:
+            gpio.disconnect()
+
+    def test_actuator_controller_homes_and_moves(self, qapp, twin):
+        """Test the Xeryon library homes and completes a move from streamed status."""
+        from hardware.actuator_controller import ActuatorController
+
+        twin.actuator.position_um = 300.0
+        twin.actuator._encoder_origin_um = 300.0
+        actuator = ActuatorController()
+        try:
+            assert actuator.connect(twin.ports.actuator, auto_home=True)
+            assert actuator.is_homed
+            assert twin.actuator.encoder_valid
+
+            assert actuator.set_speed(2000)
+            future = actuator.axis.setDPOSAsync(1000.0)
+            result = future.result(timeout=5.0)
+
+            assert result.success
+            assert twin.actuator.position_um == pytest.approx(1000.0, abs=1.25)
+            assert actuator.get_position() == pytest.approx(1000.0, abs=1.25)
+        finally:
+            actuator.disconnect()
+
+    def test_camera_sees_spot_at_actuator_position(self, qapp, twin):
+        """Test camera frames show the aiming beam where the actuator is."""
+        from hardware.camera_controller import CameraController
+
+        twin.actuator.position_um = 10000.0
+        twin.gpio.aiming_laser_on = True
+        with twin.patch_vmbpy():
+            camera = CameraController()
+            try:
+                assert camera.connect()
+                frames = []
+                camera.camera.start_streaming(
+                    lambda cam, _stream, frame: (
+                        frames.append(frame.as_numpy_ndarray().copy()),
+                        cam.queue_frame(frame),
+                    )
+                )
+                deadline = time.monotonic() + 2.0
+                while len(frames) < 3 and time.monotonic() < deadline:
+                    time.sleep(0.02)
+                camera.camera.stop_streaming()
+            finally:
+                camera.disconnect()
+
+        assert len(frames) >= 3
+        red = frames[-1][..., 2].astype(float)
+        y, x = np.unravel_index(np.argmax(red), red.shape)
+        expected_x = (10000.0 + 2000.0) / 24000.0 * red.shape[1]
+        assert x == pytest.approx(expected_x, abs=3)
+        assert y == pytest.approx(red.shape[0] / 2, abs=3)
+        assert red.max() > 150
+
+    def test_camera_drops_frames_when_buffers_are_held(self, twin):
+        """Test frames are dropped when the handler never re-queues buffers."""
+        with twin.patch_vmbpy() as system:
+            with system:
+                camera = system.get_all_cameras()[0]
+                with camera:
+                    camera.start_streaming(lambda cam, stream, frame: None, buffer_count=2)
+                    time.sleep(0.3)
+                    camera.stop_streaming()
+
+        assert camera.frames_delivered == 2
+        assert camera.dropped_frames > 0
+
+    def test_frame_id_gaps_reveal_dropped_frames(self, twin):
+        """Test frame IDs keep counting through drops, so gaps match the drop count."""
+        from hardware.video_index import FrameDropDetector
+
+        detector = FrameDropDetector()
+
+        def slow_handler(cam, _stream, frame):
+            detector.update(frame.get_id())
+            time.sleep(0.1)  # ~3 frame periods with the only buffer held
+            cam.queue_frame(frame)
+
+        with twin.patch_vmbpy() as system:
+            with system:
+                camera = system.get_all_cameras()[0]
+                with camera:
+                    camera.start_streaming(slow_handler, buffer_count=1)
+                    time.sleep(0.5)
+                    camera.stop_streaming()
+
+        assert detector.frames_received == camera.frames_delivered
+        assert detector.frames_dropped > 0
+        assert detector.frames_dropped <= camera.dropped_frames  # Trailing drops never show
+
+    def test_acquisition_profiles_reconfigure_sensor(self, qapp, twin):
+        """Test the spot tracking ROI raises the camera's frame rate limit and reverts."""
+        from hardware.acquisition_profiles import SPOT_TRACKING
+        from hardware.camera_controller import CameraController
+
+        with twin.patch_vmbpy():
+            camera = CameraController()
+            try:
+                assert camera.connect()
+                full_rate = camera.get_acquisition_frame_rate_info()["max_fps"]
+
+                assert camera.apply_acquisition_profile(SPOT_TRACKING.centred_on(0.25, 0.5))
+                roi = camera.camera.roi()
+                spot_rate = camera.get_acquisition_frame_rate_info()["max_fps"]
+                assert roi[2:] == SPOT_TRACKING.roi_size
+                assert roi[0] + roi[2] / 2 == pytest.approx(0.25 * 1456, abs=8)
+                assert spot_rate >= 4 * full_rate
+                assert camera.display_scale == SPOT_TRACKING.display_scale
+                assert camera.get_status()["acquisition_profile"] == "spot_tracking"
+
+                assert camera.apply_acquisition_profile("binned_preview")
+                assert camera.camera.roi() == (0, 0, 728, 544)
+
+                assert camera.apply_acquisition_profile("full_view")
+                assert camera.camera.roi() == (0, 0, 1456, 1088)
+            finally:
+                camera.disconnect()
+
+    def test_rejected_acquisition_profile_is_rolled_back(self, qapp, twin):
+        """Test a profile the camera rejects leaves the previous settings in place."""
+        from hardware.acquisition_profiles import SPOT_TRACKING
+        from hardware.camera_controller import CameraController
+
+        unsupported = dataclasses.replace(SPOT_TRACKING, name="bayer", pixel_format="BayerRG8")
+        with twin.patch_vmbpy():
+            camera = CameraController()
+            try:
+                assert camera.connect()
+                assert not camera.apply_acquisition_profile(unsupported)
+                assert not camera.apply_acquisition_profile("no_such_profile")
+
+                assert camera.camera.roi() == (0, 0, 1456, 1088)
+                assert camera.acquisition_profile.name == "full_view"
+            finally:
+                camera.disconnect()
+
+    def test_software_auto_exposure_converges_on_spot(self, twin):
+        """Test the auto-exposure loop brings the aiming spot to the target level."""
+        from hardware.auto_exposure import (
+            AutoExposureConfig,
+            AutoExposureController,
+            measure_frame,
+        )
+
+        twin.actuator.position_um = 10000.0  # Spot at the frame centre
+        twin.gpio.aiming_laser_on = True
+        config = AutoExposureConfig(
+            target_level=150.0, percentile=99.5, roi=(0.45, 0.4, 0.1, 0.2), decimation=1
+        )
+        auto_exposure = AutoExposureController(config)
+        auto_exposure.exposure_enabled = True
+        frames = []
+
+        def handler(cam, _stream, frame):
+            data = frame.as_numpy_ndarray()
+            step = auto_exposure.update(data)
+            if step is not None and step.exposure_us is not None:
+                cam.ExposureTime.set(step.exposure_us)
+            frames.append(data.copy())
+            cam.queue_frame(frame)
+
+        with twin.patch_vmbpy() as system:
+            with system:
+                camera = system.get_all_cameras()[0]
+                with camera:
+                    camera.ExposureTime.set(1000.0)
+                    auto_exposure.sync(1000.0, 0.0)
+                    camera.start_streaming(handler)
+                    deadline = time.monotonic() + 5.0
+                    while len(frames) < 40 and time.monotonic() < deadline:
+                        time.sleep(0.05)
+                    camera.stop_streaming()
+
+        level = measure_frame(frames[-1], config.roi, 1, config.percentile).level
+        assert auto_exposure.adjustments > 0
+        assert auto_exposure.exposure_us > 1000.0
+        assert level == pytest.approx(150.0, rel=0.2)
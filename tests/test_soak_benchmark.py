@@ -0,0 +1,126 @@
+"""
+Tests for the end-to-end soak benchmark (scripts/soak_benchmark.py).
+
+Tests baseline comparison, the GUI stall probe, and a short headless run
+of the full system against the digital twin.
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from PyQt6.QtWidgets import QApplication
+
+# Add project root, src and scripts to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+sys.path.insert(0, str(project_root / "scripts"))
+
+from soak_benchmark import (  # noqa: E402
+    GuiStallProbe,
+    SoakConfig,
+    _wait,
+    compare_to_baseline,
+    run_benchmark,
+)
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    """Provide QApplication (the camera controller creates QPixmaps)."""
+    app = QApplication.instance() or QApplication([])
+    yield app
+
+
+def _report(p99_ms=10.0, db_per_session=100_000, drop_rate=0.0):
+    """Minimal report with the compared metrics."""
+    return {
+        "gui_stalls": {"p99_ms": p99_ms, "max_ms": 50.0},
+        "event_log_latency": {"p99_ms": 5.0},
+        "database": {"growth_bytes_per_session": db_per_session},
+        "camera": {"drop_rate": drop_rate},
+    }
+
+
+class TestBaselineComparison:
+    """Test regression detection against a baseline report."""
+
+    def test_identical_reports_pass(self):
+        """Test no regressions are reported for the same numbers."""
+        assert compare_to_baseline(_report(), _report()) == []
+
+    def test_large_increase_is_regression(self):
+        """Test a metric growing beyond tolerance and slack is reported."""
+        regressions = compare_to_baseline(_report(p99_ms=40.0), _report(p99_ms=10.0))
+
+        assert [r["metric"] for r in regressions] == ["gui_stalls.p99_ms"]
+        assert regressions[0]["change_pct"] == pytest.approx(300.0)
+
+    def test_small_absolute_change_is_noise(self):
+        """Test relative jumps within the absolute slack are not regressions."""
+        # +100% but only 1 ms (slack 5 ms); +50 KiB DB/session is beyond its 16 KiB slack
+        regressions = compare_to_baseline(
+            _report(p99_ms=2.0, db_per_session=150_000), _report(p99_ms=1.0)
+        )
+
+        assert [r["metric"] for r in regressions] == ["database.growth_bytes_per_session"]
+
+    def test_improvements_and_missing_metrics_ignored(self):
+        """Test lower values and metrics absent from either report are not flagged."""
+        current = _report(p99_ms=1.0)
+        del current["camera"]
+
+        assert compare_to_baseline(current, _report(drop_rate=0.5)) == []
+
+
+class TestGuiStallProbe:
+    """Test GUI-thread stall measurement."""
+
+    def test_blocked_event_loop_is_recorded(self, qapp):
+        """Test blocking the GUI thread shows up as a stall in the histogram."""
+        probe = GuiStallProbe(interval_ms=10)
+        probe.start()
+        _wait(0.1)
+        time.sleep(0.12)  # Block the GUI thread
+        _wait(0.05)
+        probe.stop()
+
+        report = probe.report()
+        assert report["count"] > 3
+        assert report["max_ms"] >= 100.0
+        assert report["histogram"]["100-250ms"] == 1
+        assert sum(report["histogram"].values()) == report["count"]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Requires POSIX pseudo-terminals")
+class TestSoakRun:
+    """Test a short soak run of the whole system."""
+
+    def test_single_session_report(self, qapp, tmp_path):
+        """Test one treatment session completes and every report section is filled."""
+        report = run_benchmark(SoakConfig(sessions=1, session_seconds=2.0), tmp_path)
+
+        session = report["sessions"][0]
+        assert session["protocol_success"], session["message"]
+        assert session["events_logged"] > 0
+        assert session["db_growth_bytes"] > 0
+        assert session["frames_captured"] > 0
+
+        assert report["connect"]["total_s"] > 0
+        assert report["gui_stalls"]["count"] > 0
+        assert report["event_log_latency"]["count"] >= session["events_logged"]
+        assert report["database"]["event_file_bytes"] > 0
+        assert report["watchdog"]["heartbeat_count"] > 0
+        assert report["watchdog"]["failed_heartbeats"] == 0
+        assert report["signals"]["camera.pixmap_ready"] > 0
+        assert report["signals"]["actuator.position_changed"] > 0
+        assert any(tmp_path.glob("data/sessions/SOAK-0001/*/session_*.mp4"))
+
+        cpu = report["cpu"]
+        if cpu["available"]:
+            assert "MainThread" in cpu["threads"]
+            assert report["memory"]["rss_high_water_bytes"] >= report["memory"]["rss_start_bytes"]
+
+        json.dumps(report)  # JSON output must not fail
@@ -0,0 +1,158 @@
+"""
+Tests for immutable, versioned state snapshots (src/utils/state_snapshot.py).
+
+Tests the snapshot field descriptor and publish(), and the snapshots
+published by SafetyManager.
+"""
+
+import dataclasses
+import sys
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core.safety import SafetyManager, SafetyState  # noqa: E402
+from utils.state_snapshot import SnapshotField, publish  # noqa: E402
+
+
+@dataclass(frozen=True, slots=True)
+class PairState:
+    """Two fields that must always be updated together."""
+
+    version: int = 0
+    left: int = 0
+    right: int = 0
+
+
+class Owner:
+    """Object publishing PairState."""
+
+    _snapshot = PairState()
+    left = SnapshotField()
+    right = SnapshotField()
+
+
+class TestSnapshotField:
+    """Test attribute access through the snapshot."""
+
+    def test_assignment_publishes_new_version(self):
+        """Test assigning a field swaps in a new snapshot and bumps the version."""
+        owner = Owner()
+        before = owner._snapshot
+
+        owner.left = 5
+
+        assert owner.left == 5
+        assert owner._snapshot.version == before.version + 1
+        assert before.left == 0  # Old snapshot is untouched
+        assert Owner._snapshot.left == 0  # Class default is shared, never mutated
+
+    def test_unchanged_value_keeps_version(self):
+        """Test assigning the current value publishes nothing."""
+        owner = Owner()
+        owner.left = 5
+        snapshot = owner._snapshot
+
+        owner.left = 5
+
+        assert owner._snapshot is snapshot
+        assert publish(owner, left=5, right=0) is False
+
+    def test_snapshot_is_immutable(self):
+        """Test a published snapshot cannot be modified in place."""
+        owner = Owner()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            owner._snapshot.left = 1
+
+
+class TestPublish:
+    """Test multi-field publishing."""
+
+    def test_concurrent_readers_see_consistent_pairs(self):
+        """Test readers never observe a half-applied multi-field update."""
+        owner = Owner()
+        stop = threading.Event()
+        torn = []
+
+        def read():
+            while not stop.is_set():
+                snapshot = owner._snapshot
+                if snapshot.left != snapshot.right:
+                    torn.append(snapshot)
+
+        readers = [threading.Thread(target=read) for _ in range(2)]
+        for reader in readers:
+            reader.start()
+        for value in range(1, 2001):
+            publish(owner, left=value, right=value)
+        stop.set()
+        for reader in readers:
+            reader.join()
+
+        assert torn == []
+        assert owner._snapshot.version == 2000
+
+    def test_concurrent_writers_do_not_lose_versions(self):
+        """Test every change from concurrent writers gets its own version."""
+        owner = Owner()
+
+        def write(field):
+            for value in range(1, 501):
+                publish(owner, **{field: value})
+
+        writers = [threading.Thread(target=write, args=(f,)) for f in ("left", "right")]
+        for writer in writers:
+            writer.start()
+        for writer in writers:
+            writer.join()
+
+        assert owner._snapshot == PairState(version=1000, left=500, right=500)
+
+
+class TestSafetyManagerSnapshot:
+    """Test the SafetyManager state snapshot."""
+
+    def test_state_and_permission_published_together(self):
+        """Test satisfying the interlocks publishes SAFE with laser permission."""
+        manager = SafetyManager()
+        manager.set_session_valid(True)
+        before = manager.snapshot
+
+        manager.set_gpio_interlock_status(True)
+
+        snapshot = manager.snapshot
+        assert snapshot.version > before.version
+        assert snapshot.state == SafetyState.SAFE
+        assert snapshot.laser_enable_permitted is True
+        assert manager.get_interlock_details()["state"] == "SAFE"
+
+    def test_repeated_status_does_not_change_version(self):
+        """Test re-reporting an unchanged interlock keeps the snapshot version."""
+        manager = SafetyManager()
+        manager.set_gpio_interlock_status(True)
+        version = manager.snapshot.version
+
+        manager.set_gpio_interlock_status(True)
+        manager.set_power_limit_ok(True)
+
+        assert manager.snapshot.version == version
+
+    def test_emergency_stop_is_one_snapshot(self):
+        """Test emergency stop publishes state, flag and permission in one version."""
+        manager = SafetyManager()
+        manager.set_session_valid(True)
+        manager.set_gpio_interlock_status(True)
+        version = manager.snapshot.version
+
+        manager.trigger_emergency_stop()
+
+        snapshot = manager.snapshot
+        assert snapshot.version == version + 1
+        assert snapshot.state == SafetyState.EMERGENCY_STOP
+        assert snapshot.emergency_stop_active is True
+        assert snapshot.laser_enable_permitted is False